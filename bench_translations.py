@@ -0,0 +1,487 @@
+import argparse
+import contextlib
+import http.server
+import json
+import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+import manage_translations as mt
+
+# ==========================================
+# Synthetic data
+# ==========================================
+
+HAN_POOL = "数据目录应用迁移还原链接缓存设置运行外部存储本地文件夹权限失败成功选择扫描重签名日志大小路径工具"
+LATIN_WORDS = ["data", "folder", "app", "migrate", "restore", "link", "cache", "external", "local", "scan", "failed", "size"]
+PLACEHOLDERS = ["%@", "%lld", "%1$@", "%2$lld"]
+BENCH_LANGS = mt.LANGS + ["zh-martian"]
+DEFAULT_BASELINE_PATH = os.path.join(mt.CACHE_DIR, "bench_baseline.json")
+# A phase regresses when it is this much slower (or hungrier) than its baseline
+REGRESSION_TOLERANCE = 0.25
+
+def synthetic_key(rng, i):
+    if rng.random() < 0.8:
+        text = "".join(rng.choice(HAN_POOL) for _ in range(rng.randint(2, 14)))
+    else:
+        text = " ".join(rng.choice(LATIN_WORDS) for _ in range(rng.randint(1, 5))).capitalize()
+    if rng.random() < 0.3:
+        text += "：" + rng.choice(PLACEHOLDERS)
+    # The index keeps keys unique however small the pools are
+    return f"{text} {i}"
+
+def synthetic_catalog(n_keys, langs=None, seed=0):
+    rng = random.Random(seed)
+    langs = langs or BENCH_LANGS
+    strings = {}
+    for i in range(n_keys):
+        key = synthetic_key(rng, i)
+        locs = {}
+        for lang in langs:
+            roll = rng.random()
+            if roll < 0.15:
+                continue
+            if roll < 0.2:
+                value = key  # untranslated copy of a (possibly Han) key
+            else:
+                value = " ".join(rng.choice(LATIN_WORDS) for _ in range(rng.randint(1, 6)))
+            locs[lang] = {"stringUnit": {"state": "translated", "value": value}}
+        strings[key] = {"extractionState": "manual", "localizations": locs}
+    return {"sourceLanguage": "zh-Hans", "strings": strings, "version": "1.1"}
+
+def write_synthetic_catalog(path, n_keys, langs=None, seed=0):
+    data = synthetic_catalog(n_keys, langs, seed)
+    with open(path, "wb") as f:
+        f.write(mt.xcode_dumps(data).encode("utf-8"))
+    return data
+
+# Swift lines with a literal; {s} is a synthetic string
+SWIFT_LITERAL_LINES = [
+    '        Text("{s}")',
+    '        Button("{s}") {{ action() }}',
+    '        Label("{s}", systemImage: "folder")',
+    '        alert.messageText = "{s}".localized',
+    '        let title = String(format: "{s}".localized, name)',
+    '        AppLogger.shared.log("{s}", level: "TRACE")',
+    '        panel.prompt = "{s}".localized',
+]
+SWIFT_CODE_LINES = [
+    "        let size = try fileManager.attributesOfItem(atPath: url.path)[.size] as? Int64 ?? 0",
+    "        guard let bundle = Bundle(url: appURL) else { return nil }",
+    "        // Walk the directory tree and collect candidates",
+    "        items.sort { $0.name.localizedStandardCompare($1.name) == .orderedAscending }",
+    "        if isDirectory.boolValue && !url.lastPathComponent.hasPrefix(\".\") {",
+    "        }",
+]
+
+def synthetic_swift_tree(root, n_files, lines_per_file=400, han_density=0.05, seed=0):
+    """Writes n_files Swift files under root; han_density is the share of lines with a Chinese literal."""
+    rng = random.Random(seed)
+    for i in range(n_files):
+        directory = os.path.join(root, f"Module{i % 16}", "Views" if i % 3 else "Services")
+        os.makedirs(directory, exist_ok=True)
+        out = [f"import SwiftUI\n\nstruct Synthetic{i}View: View {{", "    var body: some View {"]
+        for _ in range(lines_per_file):
+            roll = rng.random()
+            if roll < han_density:
+                text = "".join(rng.choice(HAN_POOL) for _ in range(rng.randint(2, 12)))
+                if rng.random() < 0.3:
+                    text += "：" + rng.choice(PLACEHOLDERS)
+                out.append(rng.choice(SWIFT_LITERAL_LINES).format(s=text))
+            elif roll < han_density * 2:
+                out.append(rng.choice(SWIFT_LITERAL_LINES).format(s=" ".join(rng.sample(LATIN_WORDS, 3))))
+            else:
+                out.append(rng.choice(SWIFT_CODE_LINES))
+        out.append("    }\n}\n")
+        with open(os.path.join(directory, f"Synthetic{i}.swift"), "w", encoding="utf-8") as f:
+            f.write("\n".join(out))
+
+# ==========================================
+# Reference implementations
+# ==========================================
+
+def legacy_resolve(key, locs):
+    # The per-cell if/elif chain manage() used before resolve_key(), kept for comparison; it keeps
+    # hand-written zh-Hans values and kanji ja values like the fallback graph does
+    DICT = mt.DICT
+    locs = dict(locs)
+    resolved = {}
+    has_chinese_key = bool(re.search(r'[一-龥]', key))
+    for lang in mt.LANGS:
+        val = None
+        if key in DICT and lang in DICT[key]:
+            val = DICT[key][lang]
+        elif lang == "br":
+            source = DICT.get(key, {}).get("en") or locs.get("en", {}).get("stringUnit", {}).get("value") or key
+            val = mt.to_braille(source)
+        elif lang == "zh-Hans":
+            existing = locs.get(lang, {}).get("stringUnit", {}).get("value")
+            val = DICT.get(key, {}).get("zh-Hans") or (existing if existing and existing != key else key)
+        elif lang == "zh-Hant":
+            if key in DICT and "zh-Hant" in DICT[key]:
+                val = DICT[key]["zh-Hant"]
+            else:
+                existing = locs.get(lang, {}).get("stringUnit", {}).get("value")
+                if existing and existing != key:
+                    val = existing
+                else:
+                    val = mt.to_zh_hant(key)
+        else:
+            existing = locs.get(lang, {}).get("stringUnit", {}).get("value")
+            if existing:
+                if lang == "ja" and existing == key:
+                    val = None
+                elif lang not in ("zh-Hans", "zh-Hant", "ja") and has_chinese_key and re.search(r'[一-龥]', existing):
+                    val = None
+                else:
+                    val = existing
+            if val is None:
+                en_val = DICT.get(key, {}).get("en") or locs.get("en", {}).get("stringUnit", {}).get("value")
+                if en_val and not (has_chinese_key and re.search(r'[一-龥]', en_val)):
+                    val = en_val
+                else:
+                    val = key
+        locs[lang] = {"stringUnit": {"state": "translated", "value": val}}
+        resolved[lang] = val
+    return resolved
+
+# ==========================================
+# Benchmarks
+# ==========================================
+
+def measure(fn, trace_memory=True):
+    """Runs fn twice: once for wall/CPU time, once under tracemalloc for peak memory."""
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    result = fn()
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+    peak = None
+    if trace_memory:
+        tracemalloc.start()
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result, {"wall": wall, "cpu": cpu, "peak": peak}
+
+@contextlib.contextmanager
+def isolated_workspace(root):
+    # Points manage_translations at a scratch catalog, source tree and cache
+    saved = {name: getattr(mt, name)
+             for name in ("XCSTRINGS_PATH", "SWIFT_SCAN_DIR", "CACHE_DIR", "SCAN_CACHE_PATH", "SOURCE_INDEX_PATH",
+                          "MT_CACHE_PATH", "DICT_PATH", "DICT")}
+    mt.XCSTRINGS_PATH = os.path.join(root, "Localizable.xcstrings")
+    mt.SWIFT_SCAN_DIR = os.path.join(root, "Sources")
+    mt.CACHE_DIR = os.path.join(root, "cache")
+    mt.SCAN_CACHE_PATH = os.path.join(mt.CACHE_DIR, "swift_scan.json")
+    mt.SOURCE_INDEX_PATH = os.path.join(mt.CACHE_DIR, "source_index.sqlite")
+    mt.MT_CACHE_PATH = os.path.join(mt.CACHE_DIR, "mt_cache.sqlite")
+    mt.DICT_PATH = os.path.join(root, "dictionary.tsv")
+    mt.DICT = mt.DictionaryTable(mt.DICT_PATH, os.path.join(mt.CACHE_DIR, "dictionary.idx"))
+    try:
+        yield root
+    finally:
+        for name, value in saved.items():
+            setattr(mt, name, value)
+
+def resolve_all(catalog):
+    # What manage() does between load and write, minus fingerprints
+    mt.sync_strings(catalog, set(), None, mt.RunStats())
+    return catalog
+
+def bench_suite(sizes, swift_files, han_density, trace_memory=True, seed=0):
+    """Returns {"<phase>@<keys>": {"wall", "cpu", "peak"}} for every size."""
+    results = {}
+    for n_keys in sizes:
+        with tempfile.TemporaryDirectory(prefix="bench_translations_") as root, isolated_workspace(root):
+            write_synthetic_catalog(mt.XCSTRINGS_PATH, n_keys, seed=seed)
+            n_files = max(1, swift_files if swift_files else n_keys // 100)
+            synthetic_swift_tree(mt.SWIFT_SCAN_DIR, n_files, han_density=han_density, seed=seed)
+            phases = {}
+            (catalog, raw), phases["catalog_load"] = measure(mt.load_catalog_model, trace_memory)
+
+            def scan_cold():
+                shutil.rmtree(mt.CACHE_DIR, ignore_errors=True)
+                return mt.scan_swift_strings(executor="serial")
+            _, phases["swift_scan_cold"] = measure(scan_cold, trace_memory)
+            _, phases["swift_scan_warm"] = measure(lambda: mt.scan_swift_strings(executor="serial"), trace_memory)
+            previous_keys = list(catalog.entries)
+            resolved, phases["resolve"] = measure(lambda: resolve_all(catalog), trace_memory)
+            _, phases["catalog_dump"] = measure(lambda: mt.catalog_dumps(resolved, previous_keys), trace_memory)
+            for phase, stats in phases.items():
+                results[f"{phase}@{n_keys}"] = stats
+                peak = f"{stats['peak'] / 2**20:9.1f} MiB" if stats["peak"] is not None else "        -"
+                print(f"{n_keys:>7} keys  {phase:<16} {stats['wall']:8.3f}s wall {stats['cpu']:8.3f}s cpu {peak}")
+    return results
+
+def compare_with_baseline(results, baseline, tolerance=REGRESSION_TOLERANCE):
+    regressions = []
+    for name, stats in sorted(results.items()):
+        base = baseline.get(name)
+        if not base:
+            continue
+        for metric in ("wall", "peak"):
+            if stats.get(metric) is None or not base.get(metric):
+                continue
+            ratio = stats[metric] / base[metric]
+            if ratio > 1 + tolerance:
+                regressions.append(f"{name} {metric}: {base[metric]:.4g} -> {stats[metric]:.4g} ({ratio:.2f}x)")
+    return regressions
+
+def bench_resolver(n_keys, seed=0):
+    strings = synthetic_catalog(n_keys, seed=seed)["strings"]
+    entries = [(key, entry["localizations"]) for key, entry in strings.items()]
+    cells = len(entries) * len(mt.LANGS)
+
+    start = time.perf_counter()
+    legacy = [legacy_resolve(key, locs) for key, locs in entries]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    plan = mt.resolve_plan()
+    current = [mt.resolve_key(key, locs, plan) for key, locs in entries]
+    current_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    keys = [key for key, _ in entries]
+    existing = [{lang: loc["stringUnit"].get("value") for lang, loc in locs.items() if "stringUnit" in loc}
+                for _, locs in entries]
+    columns = mt.resolve_columns(keys, existing, plan)
+    batched_time = time.perf_counter() - start
+
+    if legacy != current:
+        raise SystemExit("resolve_key() disagrees with the legacy resolver")
+    if any(columns[lang][n] != resolved[lang] for n, resolved in enumerate(legacy) for lang in resolved):
+        raise SystemExit("resolve_columns() disagrees with the legacy resolver")
+    print(f"resolver: {n_keys} keys x {len(mt.LANGS)} languages ({cells} cells)")
+    print(f"  legacy chain   {legacy_time:8.3f}s  {legacy_time / cells * 1e9:8.0f} ns/cell")
+    print(f"  resolve_key    {current_time:8.3f}s  {current_time / cells * 1e9:8.0f} ns/cell")
+    print(f"  resolve_columns{batched_time:8.3f}s  {batched_time / cells * 1e9:8.0f} ns/cell")
+    print(f"  speed-up       {legacy_time / batched_time:8.2f}x (batched)")
+
+def bench_memory(n_segments, n_lookups, seed=0):
+    rng = random.Random(seed)
+    tm = mt.TranslationMemory()
+    keys = [synthetic_key(rng, i) for i in range(n_segments)]
+    for key in keys:
+        tm.add(key, {"en": key.upper()})
+    start = time.perf_counter()
+    tm.build()
+    build_time = time.perf_counter() - start
+
+    # Near-duplicates of stored keys (one character changed) and unrelated text
+    queries = []
+    for i in range(n_lookups):
+        key = rng.choice(keys)
+        if i % 2:
+            pos = rng.randrange(len(key))
+            key = key[:pos] + rng.choice(HAN_POOL) + key[pos + 1:]
+        else:
+            key = "".join(rng.choice(HAN_POOL) for _ in range(rng.randint(4, 20)))
+        queries.append(key)
+    start = time.perf_counter()
+    hits = sum(1 for query in queries if tm.lookup(query))
+    lookup_time = time.perf_counter() - start
+    print(f"translation memory: {n_segments} segments, {len(tm.postings)} n-grams")
+    print(f"  build          {build_time:8.3f}s")
+    print(f"  lookup         {lookup_time / n_lookups * 1e3:8.3f} ms/lookup ({hits} of {n_lookups} with matches)")
+
+class StubTranslationHandler(http.server.BaseHTTPRequestHandler):
+    # Stand-in for a translation service: answers after server.latency seconds, rejects a
+    # server.error_rate share of requests with 429, and "translates" by tagging each text
+    def do_POST(self):
+        server = self.server
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.requests += 1
+            server.texts += len(request["texts"])
+            failed = server.rng.random() < server.error_rate
+        time.sleep(server.latency)
+        if failed:
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            return
+        body = json.dumps({"translations": [f"[{request['target']}] {text}" for text in request["texts"]]}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@contextlib.contextmanager
+def stub_translation_server(latency, error_rate=0.0, seed=0):
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StubTranslationHandler)
+    server.daemon_threads = True
+    server.latency, server.error_rate = latency, error_rate
+    server.rng, server.lock = random.Random(seed), threading.Lock()
+    server.requests = server.texts = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def bench_translate(n_keys, latency, error_rate, concurrency, rate, seed=0):
+    with tempfile.TemporaryDirectory(prefix="bench_translations_") as root, isolated_workspace(root), \
+            stub_translation_server(latency, error_rate, seed) as server:
+        write_synthetic_catalog(mt.XCSTRINGS_PATH, n_keys, seed=seed)
+        catalog, _ = mt.load_catalog_model()
+        pending = mt.pending_translations(catalog)
+        cells = sum(len(langs) for langs in pending.values())
+        endpoint = f"http://127.0.0.1:{server.server_address[1]}/translate"
+        print(f"machine translation: {len(pending)} keys, {cells} cells pending, stub latency {latency * 1e3:.0f} ms, "
+              f"{error_rate:.0%} of requests answered 429")
+        for run in ("cold", "resumed"):
+            backend = mt.HttpTranslationBackend(endpoint, concurrency=concurrency)
+            cache = mt.TranslationCache()
+            stats = mt.RunStats()
+            requests, texts = server.requests, server.texts
+            start = time.perf_counter()
+            rows, rejected, failures = mt.translate_pending(pending, backend, cache, stats=stats,
+                                                            concurrency=concurrency, rate=rate, backoff=0.01)
+            elapsed = time.perf_counter() - start
+            backend.close()
+            cache.close()
+            translated = sum(len(values) for values in rows.values())
+            print(f"  {run:<8} {elapsed:8.3f}s  {server.requests - requests:6} requests for {server.texts - texts:6} texts, "
+                  f"{stats.counters.get('mt_retries', 0)} retries, {stats.counters.get('mt_cache_hits', 0)} cached, "
+                  f"{translated} cells, {len(rejected)} rejected, {len(failures)} failed batches")
+            if run == "cold":
+                distinct = stats.counters.get("mt_texts", 0)
+        print(f"  one request per cell, one at a time: ~{cells * latency:.1f}s; per distinct text: ~{distinct * latency:.1f}s")
+
+def diverge(data, rng, share, tag):
+    # A branch of data: `share` of the cells rewritten, a few keys added and deleted
+    strings = {key: {**entry, "localizations": dict(entry["localizations"])} for key, entry in data["strings"].items()}
+    keys = list(strings)
+    for key in rng.sample(keys, int(len(keys) * share)):
+        locs = strings[key]["localizations"]
+        lang = rng.choice(BENCH_LANGS)
+        locs[lang] = {"stringUnit": {"state": "translated", "value": f"{tag} {lang} {key}"}}
+    for key in rng.sample(keys, max(1, len(keys) // 1000)):
+        del strings[key]
+    for i in range(max(1, len(keys) // 1000)):
+        strings[f"{tag} 新增 {i}"] = {"extractionState": "manual", "localizations": {}}
+    return {**data, "strings": strings}
+
+def bench_merge(n_keys, share, seed=0):
+    rng = random.Random(seed)
+    base = synthetic_catalog(n_keys, seed=seed)
+    with tempfile.TemporaryDirectory(prefix="bench_translations_") as root:
+        paths = []
+        for name, data in (("base", base), ("ours", diverge(base, rng, share, "ours")),
+                           ("theirs", diverge(base, rng, share, "theirs"))):
+            path = os.path.join(root, name + ".xcstrings")
+            with open(path, "wb") as f:
+                f.write(mt.xcode_dumps(data).encode("utf-8"))
+            paths.append(path)
+        size = os.path.getsize(paths[1])
+        stats = mt.RunStats()
+        start = time.perf_counter()
+        conflicts = mt.merge_driver(*paths, stats=stats)
+        elapsed = time.perf_counter() - start
+    phases = ", ".join(f"{name} {spent['wall']:.3f}s" for name, spent in stats.phases.items())
+    print(f"merge driver: {n_keys} keys ({size / 2**20:.1f} MiB), {share:.0%} of keys edited per side")
+    print(f"  {elapsed:8.3f}s  ({phases}), {len(conflicts)} conflicts")
+
+def bench_diff(n_keys, share, seed=0):
+    rng = random.Random(seed)
+    old = synthetic_catalog(n_keys, seed=seed)
+    with tempfile.TemporaryDirectory(prefix="bench_translations_") as root:
+        paths = []
+        for name, data in (("old", old), ("new", diverge(old, rng, share, "new"))):
+            path = os.path.join(root, name + ".xcstrings")
+            with open(path, "wb") as f:
+                f.write(mt.xcode_dumps(data).encode("utf-8"))
+            paths.append(path)
+        size = os.path.getsize(paths[1])
+        print(f"diff: {n_keys} keys ({size / 2**20:.1f} MiB), {share:.0%} of keys edited")
+        for stream in (False, True):
+            start = time.perf_counter()
+            result = mt.diff_catalogs(*(mt.DiffSide(path, stream) for path in paths))
+            elapsed = time.perf_counter() - start
+            # Separate pass: tracing slows the streamed reader down several times
+            tracemalloc.start()
+            mt.diff_catalogs(*(mt.DiffSide(path, stream) for path in paths))
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"  {'streamed' if stream else 'in memory':<10} {elapsed:8.3f}s  {peak / 2**20:7.1f} MiB traced  "
+                  f"{len(result['changed'])} cells changed, {len(result['added'])} added, {len(result['removed'])} removed")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks for manage_translations.py.")
+    sub = parser.add_subparsers(dest="bench", required=True)
+    p = sub.add_parser("resolver", help="legacy per-cell chain vs. the table-driven resolver")
+    p.add_argument("--keys", type=int, default=100_000)
+    p.add_argument("--seed", type=int, default=0)
+    p = sub.add_parser("memory", help="translation memory index build time and lookup latency")
+    p.add_argument("--segments", type=int, default=200_000)
+    p.add_argument("--lookups", type=int, default=1000)
+    p.add_argument("--seed", type=int, default=0)
+    p = sub.add_parser("translate", help="machine translation against a local stand-in HTTP backend")
+    p.add_argument("--keys", type=int, default=5000)
+    p.add_argument("--latency", type=float, default=0.05, help="stub seconds per request")
+    p.add_argument("--error-rate", type=float, default=0.05, help="share of requests the stub answers with 429")
+    p.add_argument("--concurrency", type=int, default=mt.MT_CONCURRENCY)
+    p.add_argument("--rate", type=float, default=0, help="requests started per second, 0 for no limit")
+    p.add_argument("--seed", type=int, default=0)
+    p = sub.add_parser("merge", help="three-way catalog merge driver on diverged synthetic catalogs")
+    p.add_argument("--keys", type=int, default=5000)
+    p.add_argument("--share", type=float, default=0.05, help="share of keys each side edits")
+    p.add_argument("--seed", type=int, default=0)
+    p = sub.add_parser("diff", help="semantic catalog diff, in memory and streamed, on a diverged synthetic catalog")
+    p.add_argument("--keys", type=int, default=10_000)
+    p.add_argument("--share", type=float, default=0.05, help="share of keys edited")
+    p.add_argument("--seed", type=int, default=0)
+    p = sub.add_parser("suite", help="per-phase time and peak memory on synthetic catalogs and Swift trees")
+    p.add_argument("--sizes", default="1000,10000",
+                   help="comma-separated catalog sizes in keys (e.g. 1000,10000,50000,200000)")
+    p.add_argument("--swift-files", type=int, default=0, help="Swift files per tree (default: keys / 100)")
+    p.add_argument("--han-density", type=float, default=0.05, help="share of Swift lines with a Chinese literal")
+    p.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    p.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="baseline JSON to compare against")
+    p.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    p.add_argument("--tolerance", type=float, default=REGRESSION_TOLERANCE)
+    p.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    if args.bench == "resolver":
+        bench_resolver(args.keys, args.seed)
+    elif args.bench == "memory":
+        bench_memory(args.segments, args.lookups, args.seed)
+    elif args.bench == "translate":
+        bench_translate(args.keys, args.latency, args.error_rate, args.concurrency, args.rate, args.seed)
+    elif args.bench == "merge":
+        bench_merge(args.keys, args.share, args.seed)
+    elif args.bench == "diff":
+        bench_diff(args.keys, args.share, args.seed)
+    elif args.bench == "suite":
+        sizes = [int(x) for x in args.sizes.split(",") if x]
+        results = bench_suite(sizes, args.swift_files, args.han_density, not args.no_memory, args.seed)
+        if args.save_baseline:
+            os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+            with open(args.baseline, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2, sort_keys=True)
+            print(f"Baseline saved to {args.baseline}")
+        elif os.path.exists(args.baseline):
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                regressions = compare_with_baseline(results, json.load(f), args.tolerance)
+            for line in regressions:
+                print(f"REGRESSION {line}")
+            if regressions:
+                sys.exit(1)
+            print(f"No regressions against {args.baseline}")
+
+if __name__ == "__main__":
+    main()
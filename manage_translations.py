@@ -1,6 +1,31 @@
 import os
 import json
 import re
+import hashlib
+import time
+import argparse
+import fnmatch
+import unicodedata
+import struct
+import bisect
+import sys
+import resource
+import contextlib
+import cProfile
+import tracemalloc
+import select
+import ctypes
+import ctypes.util
+import codecs
+import datetime
+import sqlite3
+import math
+import collections
+import random
+from array import array
+from json.encoder import encode_basestring
+from xml.etree import ElementTree
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # ==========================================
 # 1. Config
@@ -8,6 +33,83 @@ import re
 
 XCSTRINGS_PATH = "AppPorts/Localizable.xcstrings"
 SWIFT_SCAN_DIR = "AppPorts"
+DICT_PATH = "Tools/Translations/dictionary.tsv"
+CACHE_DIR = ".translations_cache"
+DICT_INDEX_PATH = os.path.join(CACHE_DIR, "dictionary.idx")
+# zh-Hans -> zh-Hant conversion tables (zh-Hans<TAB>zh-Hant); on conflicts later tables win.
+# Characters and phrases are OpenCC's STCharacters/STPhrases, terms are the project's own
+ZH_HANT_TABLES = [
+    "Tools/Translations/zh_hant_characters.tsv",
+    "Tools/Translations/zh_hant_phrases.tsv",
+    "Tools/Translations/zh_hant_terms.tsv",
+]
+SCAN_CACHE_PATH = os.path.join(CACHE_DIR, "swift_scan.json")
+# Bump when the extraction rules change so stale cached results are discarded
+SCAN_CACHE_VERSION = 4
+RESOLVE_STATE_PATH = os.path.join(CACHE_DIR, "resolve_state.json")
+# Bump when a derivation's code changes (edits to the fallback graph itself are picked up)
+RESOLVE_STATE_VERSION = 3
+# SQLite index of every literal's file, line and call-site kind (where/keys commands)
+SOURCE_INDEX_PATH = os.path.join(CACHE_DIR, "source_index.sqlite")
+SOURCE_INDEX_VERSION = 2
+# Directories and files matching these globs (by name or path relative to SWIFT_SCAN_DIR)
+# are pruned before os.walk descends into them
+SCAN_EXCLUDE_GLOBS = [".*", "*.xcassets", "*.icon", "*.lproj", "*.xcstrings", "StubLauncherBinary", "build", "DerivedData"]
+SCAN_WORKERS = os.cpu_count() or 1
+SCAN_EXECUTOR = "process"  # "process", "thread" or "serial"
+# Below this many files to parse, pool start-up costs more than it saves
+SCAN_PARALLEL_MIN_FILES = 32
+# watch: quiet period that ends a batch of saves, and the stat interval without inotify
+WATCH_DEBOUNCE = 0.3
+WATCH_POLL_INTERVAL = 1.0
+# sync --stream reads the catalog in chunks of this many bytes and resolves this many entries per batch
+STREAM_CHUNK_SIZE = 1 << 20
+STREAM_RESOLVE_BATCH = 1024
+# split/merge: one file per language (or per module) plus catalog.json with everything else
+SHARD_DIR = "Tools/Translations/shards"
+# export/import: XLIFF files for translation vendors, one per language (<lang>.xliff)
+XLIFF_DIR = "Tools/Translations/xliff"
+XLIFF_VERSION = "1.2"
+# Keys no source references any more (sync --mark-stale): the date each was first seen missing,
+# kept in the cache directory, and how long sync --prune-stale keeps them
+STALE_KEYS_PATH = os.path.join(CACHE_DIR, "stale_keys.json")
+STALE_GRACE_DAYS = 30
+# audit: the language registry (supported locales), the files skipped (hidden ones only, like the
+# test's .skipsHiddenFiles, not SCAN_EXCLUDE_GLOBS), files whose literals are intentionally
+# not localized, files counted as UI, and keys whose translations must not be English copies
+LANGUAGE_REGISTRY_PATH = "AppPorts/Models/AppLanguageOption.swift"
+AUDIT_EXCLUDE_GLOBS = [".*"]
+AUDIT_NON_LOCALIZED_FILES = {"Models/AppLanguageOption.swift"}
+AUDIT_UI_FILES = {"ContentView.swift", "WelcomeView.swift", "Appports.swift"}
+AUDIT_UI_PREFIXES = ("Views/",)
+AUDIT_PROTECTED_KEYS = [
+    "受保护的应用",
+    "仍然迁移",
+    "以下应用来自 App Store 或归属系统（root），受系统保护：\n\n%@\n\n它们的本地副本通常无法被直接删除或替换，自动迁移可能以「权限不足」失败。\n\n建议：先在访达中手动把应用拖到外部存储（系统会要求输入管理员密码），再回到 AppPorts 为它创建链接。\n\n仍要尝试自动迁移吗？",
+    "%@：权限不足，无法删除或替换本地副本。该应用可能来自 App Store 或归属系统（root）。建议在访达中手动迁移后，再用 AppPorts 创建链接。",
+]
+# Translation memory: n-gram size of the candidate index, lowest similarity worth suggesting,
+# suggestions per language, and candidates per lookup that get an edit-distance score
+TM_NGRAM = 2
+TM_MIN_SCORE = 0.7
+TM_SUGGESTIONS = 3
+TM_CANDIDATES = 64
+# translate: machine translation of cells no DICT row or catalog value covers. Results are cached
+# in SQLite by (source, language, backend) and evicted least recently used first past the size cap
+MT_CACHE_PATH = os.path.join(CACHE_DIR, "mt_cache.sqlite")
+MT_CACHE_MAX_BYTES = 64 << 20
+MT_BACKEND = "http"
+MT_ENDPOINT_ENV = "APPPORTS_MT_ENDPOINT"
+MT_API_KEY_ENV = "APPPORTS_MT_API_KEY"
+# Texts and characters per request, requests in flight, requests started per second
+MT_BATCH_SIZE = 50
+MT_BATCH_CHARS = 5000
+MT_CONCURRENCY = 4
+MT_RATE_LIMIT = 5.0
+# Attempts per batch after the first, base of the exponential backoff in seconds, request timeout
+MT_RETRIES = 4
+MT_BACKOFF = 1.0
+MT_TIMEOUT = 30.0
 
 LANGS = [
     "en", "zh-Hans", "zh-Hant", "hi", "es", "ar", "ru", "pt", "fr", "it", "ja", 
@@ -18,1645 +120,3982 @@ LANGS = [
 # 2. Dictionary
 # ==========================================
 
-DICT = {
-    "AppPorts": {
-        "en": "AppPorts", "zh-Hans": "AppPorts", "zh-Hant": "AppPorts",
-        "hi": "AppPorts", "es": "AppPorts", "ar": "AppPorts", "ru": "AppPorts",
-        "pt": "AppPorts", "fr": "AppPorts", "it": "AppPorts", "ja": "AppPorts",
-        "eo": "AppPorts", "de": "AppPorts", "ko": "AppPorts", "tr": "AppPorts",
-        "vi": "AppPorts", "th": "AppPorts", "nl": "AppPorts", "pl": "AppPorts", "id": "AppPorts"
-    },
-    "Change Language / 切换语言": {
-        "en": "Change Language", "zh-Hans": "切换语言", "zh-Hant": "切換語言",
-        "hi": "भाषा बदलें", "es": "Cambiar idioma", "ar": "تغيير اللغة", "ru": "Сменить язык",
-        "pt": "Mudar idioma", "fr": "Changer de langue", "it": "Cambia lingua", "ja": "言語を変更",
-        "eo": "Ŝanĝi lingvon", "de": "Sprache ändern", "ko": "언어 변경", "tr": "Dili değiştir",
-        "vi": "Thay đổi ngôn ngữ", "th": "เปลี่ยนภาษา", "nl": "Taal wijzigen", "pl": "Zmień język", "id": "Ganti Bahasa"
-    },
-    "English": {
-        "en": "English", "zh-Hans": "英语", "zh-Hant": "英語",
-        "hi": "अंग्रेज़ी", "es": "Inglés", "ar": "إنجليزي", "ru": "Английский",
-        "pt": "Inglês", "fr": "Anglais", "it": "Inglese", "ja": "英語",
-        "eo": "Angla", "de": "Englisch", "ko": "영어", "tr": "İngilizce",
-        "vi": "Tiếng Anh", "th": "ภาษาอังกฤษ", "nl": "Engels", "pl": "Angielski", "id": "Inggris"
-    },
-    "Language": {
-        "en": "Language", "zh-Hans": "语言", "zh-Hant": "語言",
-        "hi": "भाषा", "es": "Idioma", "ar": "لغة", "ru": "Язык",
-        "pt": "Idioma", "fr": "Langue", "it": "Lingua", "ja": "言語",
-        "eo": "Lingvo", "de": "Sprache", "ko": "언어", "tr": "Dil",
-        "vi": "Ngôn ngữ", "th": "ภาษา", "nl": "Taal", "pl": "Język", "id": "Bahasa"
-    },
-    "语言": {
-        "en": "Language", "zh-Hans": "语言", "zh-Hant": "語言",
-        "hi": "भाषा", "es": "Idioma", "ar": "لغة", "ru": "Язык",
-        "pt": "Idioma", "fr": "Langue", "it": "Lingua", "ja": "言語",
-        "eo": "Lingvo", "de": "Sprache", "ko": "언어", "tr": "Dil",
-        "vi": "Ngôn ngữ", "th": "ภาษา", "nl": "Taal", "pl": "Język", "id": "Bahasa"
-    },
-    "Mac 本地应用": {
-        "en": "Local Apps", "zh-Hans": "Mac 本地应用", "zh-Hant": "Mac 本地應用程式",
-        "hi": "स्थानीय ऐप्स", "es": "Apps locales", "ar": "تطبيقات محلية", "ru": "Локальные приложения",
-        "pt": "Apps locais", "fr": "Applications locales", "it": "App locali", "ja": "ローカルアプリ",
-        "eo": "Lokaj Aplikaĵoj", "de": "Lokale Apps", "ko": "로컬 앱", "tr": "Yerel Uygulamalar",
-        "vi": "Ứng dụng cục bộ", "th": "แอปในเครื่อง", "nl": "Lokale apps", "pl": "Aplikacje lokalne", "id": "Aplikasi Lokal"
-    },
-    "Version %@": {
-        "en": "Version %@", "zh-Hans": "版本 %@", "zh-Hant": "版本 %@",
-        "hi": "संस्करण %@", "es": "Versión %@", "ar": "إصدار %@", "ru": "Версия %@",
-        "pt": "Versão %@", "fr": "Version %@", "it": "Versione %@", "ja": "バージョン %@",
-        "eo": "Versio %@", "de": "Version %@", "ko": "버전 %@", "tr": "Sürüm %@",
-        "vi": "Phiên bản %@", "th": "เวอร์ชัน %@", "nl": "Versie %@", "pl": "Wersja %@", "id": "Versi %@"
-    },
-
-    "个人网站": {
-        "en": "Website", "zh-Hans": "个人网站", "zh-Hant": "個人網站",
-        "hi": "वेबसाइट", "es": "Sitio web", "ar": "موقع الكتروني", "ru": "Веб-сайт",
-        "pt": "Site", "fr": "Site web", "it": "Sito web", "ja": "ウェブサイト",
-        "eo": "Retejo", "de": "Webseite", "ko": "웹사이트", "tr": "Web Sitesi",
-        "vi": "Trang web", "th": "เว็บไซต์", "nl": "Website", "pl": "Strona internetowa", "id": "Situs Web"
-    },
-    "关于 AppPorts...": {
-        "en": "About AppPorts...", "zh-Hans": "关于 AppPorts...", "zh-Hant": "關於 AppPorts...",
-        "hi": "AppPorts के बारे में...", "es": "Acerca de AppPorts...", "ar": "حول AppPorts...", "ru": "О AppPorts...",
-        "pt": "Sobre o AppPorts...", "fr": "À propos d'AppPorts...", "it": "Info su AppPorts...", "ja": "AppPortsについて...",
-        "eo": "Pri AppPorts...", "de": "Über AppPorts...", "ko": "AppPorts 정보...", "tr": "AppPorts Hakkında...",
-        "vi": "Về AppPorts...", "th": "เกี่ยวกับ AppPorts...", "nl": "Over AppPorts...", "pl": "O AppPorts...", "id": "Tentang AppPorts..."
-    },
-    "关闭": {
-        "en": "Close", "zh-Hans": "关闭", "zh-Hant": "關閉",
-        "hi": "बंद करें", "es": "Cerrar", "ar": "إغلاق", "ru": "Закрыть",
-        "pt": "Fechar", "fr": "Fermer", "it": "Chiudi", "ja": "閉じる",
-        "eo": "Fermi", "de": "Schließen", "ko": "닫기", "tr": "Kapat",
-        "vi": "Đóng", "th": "ปิด", "nl": "Sluiten", "pl": "Zamknij", "id": "Tutup"
-    },
-    "刷新列表": {
-        "en": "Refresh List", "zh-Hans": "刷新列表", "zh-Hant": "重新整理列表",
-        "hi": "सूची ताज़ा करें", "es": "Actualizar lista", "ar": "تحديث القائمة", "ru": "Обновить список",
-        "pt": "Atualizar lista", "fr": "Actualiser la liste", "it": "Aggiorna elenco", "ja": "リストを更新",
-        "eo": "Refreŝigi liston", "de": "Liste aktualisieren", "ko": "목록 새로고침", "tr": "Listeyi Yenile",
-        "vi": "Làm mới danh sách", "th": "รีเฟรชรายการ", "nl": "Lijst vernieuwen", "pl": "Odśwież listę", "id": "Segarkan Daftar"
-    },
-    "去设置授予权限": {
-        "en": "Go to Settings", "zh-Hans": "去设置授予权限", "zh-Hant": "前往設定授予權限",
-        "hi": "सेटिंग्स में जाएं", "es": "Ir a Configuración", "ar": "الذهاب إلى الإعدادات", "ru": "Перейти в настройки",
-        "pt": "Ir para Configurações", "fr": "Aller aux paramètres", "it": "Vai alle Impostazioni", "ja": "設定に移動",
-        "eo": "Iru al Agordoj", "de": "Zu den Einstellungen", "ko": "설정으로 이동", "tr": "Ayarlara Git",
-        "vi": "Đi tới Cài đặt", "th": "ไปที่การตั้งค่า", "nl": "Ga naar Instellingen", "pl": "Idź do ustawień", "id": "Buka Pengaturan"
-    },
-    "在 Finder 中显示": {
-        "en": "Show in Finder", "zh-Hans": "在 Finder 中显示", "zh-Hant": "在 Finder 中顯示",
-        "hi": "Finder में दिखाएं", "es": "Mostrar en Finder", "ar": "عرض في Finder", "ru": "Показать в Finder",
-        "pt": "Mostrar no Finder", "fr": "Afficher dans le Finder", "it": "Mostra nel Finder", "ja": "Finderで表示",
-        "eo": "Montri en Finder", "de": "Im Finder anzeigen", "ko": "Finder에서 보기", "tr": "Finder'da Göster",
-        "vi": "Hiển thị trong Finder", "th": "แสดงใน Finder", "nl": "Toon in Finder", "pl": "Pokaż w Finderze", "id": "Tampilkan di Finder"
-    },
-    "在原位置自动创建符号链接，系统和 Launchpad 依然能正常识别应用。": {
-        "en": "Automatically create symlinks in place. System and Launchpad recognize apps as normal.",
-        "zh-Hans": "在原位置自动创建符号链接，系统和 Launchpad 依然能正常识别应用。",
-        "zh-Hant": "在原位置自動建立符號連結，系統和 Launchpad 依然能正常識別應用程式。",
-        "hi": "स्वचालित रूप से सिम्लिंक बनाएं। सिस्टम और लॉन्चपैड ऐप्स को सामान्य रूप से पहचानते हैं।",
-        "es": "Crea enlaces simbólicos automáticamente. El sistema y Launchpad reconocen las apps normalmente.",
-        "ar": "إنشاء روابط رمزية تلقائيًا. يتعرف النظام و Launchpad على التطبيقات بشكل طبيعي.",
-        "ru": "Автоматически создавать символические ссылки. Система и Launchpad распознают приложения как обычно.",
-        "pt": "Cria links simbólicos automaticamente. O sistema e o Launchpad reconhecem os apps normalmente.",
-        "fr": "Créez automatiquement des liens symboliques. Le système et le Launchpad reconnaissent les applications normalement.",
-        "it": "Crea automaticamente collegamenti simbolici. Il sistema e il Launchpad riconoscono le app normalmente.",
-        "ja": "自動的にシンボリックリンクを作成します。システムとLaunchpadはアプリを正常に認識します。",
-        "eo": "Aŭtomate krei simbolajn ligilojn. Sistemo kaj Launchpad rekonas aplikaĵojn normale.",
-        "de": "Erstellt automatisch symbolische Verknüpfungen. System und Launchpad erkennen Apps normal.",
-        "ko": "제자리에 심볼릭 링크를 자동으로 생성합니다. 시스템과 Launchpad는 앱을 정상적으로 인식합니다.",
-        "tr": "Otomatik olarak sembolik linkler oluşturun. Sistem ve Launchpad uygulamaları normal olarak tanır.",
-        "vi": "Tự động tạo liên kết tượng trưng tại chỗ. Hệ thống và Launchpad nhận dạng ứng dụng bình thường.",
-        "th": "สร้าง symlink โดยอัตโนมัติในที่เดิม ระบบและ Launchpad จะจดจำแอปได้ตามปกติ",
-        "nl": "Maak automatisch symlinks aan. Systeem en Launchpad herkennen apps normaal.",
-        "pl": "Automatycznie twórz dowiązania symboliczne. System i Launchpad rozpoznają aplikacje normalnie.",
-        "id": "Secara otomatis membuat symlink di tempat. Sistem dan Launchpad mengenali aplikasi seperti biasa."
-    },
-    "外部": {
-        "en": "External", "zh-Hans": "外部", "zh-Hant": "外部",
-        "hi": "बाहरी", "es": "Externo", "ar": "خارجي", "ru": "Внешний",
-        "pt": "Externo", "fr": "Externe", "it": "Esterno", "ja": "外部",
-        "eo": "Ekstera", "de": "Extern", "ko": "외부", "tr": "Harici",
-        "vi": "Bên ngoài", "th": "ภายนอก", "nl": "Extern", "pl": "Zewnętrzny", "id": "Eksternal"
-    },
-    "外部应用库": {
-        "en": "External Drive", "zh-Hans": "外部应用库", "zh-Hant": "外部儲存",
-        "hi": "बाहरी ड्राइव", "es": "Unidad externa", "ar": "قرص خارجي", "ru": "Внешний диск",
-        "pt": "Unidade Externa", "fr": "Disque externe", "it": "Unità esterna", "ja": "外部ドライブ",
-        "eo": "Ekstera Disko", "de": "Externes Laufwerk", "ko": "외부 드라이브", "tr": "Harici Sürücü",
-        "vi": "Ổ đĩa ngoài", "th": "ไดรฟ์ภายนอก", "nl": "Externe schijf", "pl": "Dysk zewnętrzny", "id": "Drive Eksternal"
-    },
-    "好的": {
-        "en": "OK", "zh-Hans": "好的", "zh-Hant": "好",
-        "hi": "ठीक है", "es": "Aceptar", "ar": "موافق", "ru": "ОК",
-        "pt": "OK", "fr": "D'accord", "it": "OK", "ja": "OK",
-        "eo": "Bone", "de": "OK", "ko": "확인", "tr": "Tamam",
-        "vi": "OK", "th": "ตกลง", "nl": "OK", "pl": "OK", "id": "Oke"
-    },
-    "将应用迁移回本地": {
-        "en": "Migrate app back to local", "zh-Hans": "将应用迁移回本地", "zh-Hant": "將應用程式遷移回本地",
-        "hi": "ऐप को स्थानीय पर वापस माइग्रेट करें", "es": "Migrar app de vuelta a local", "ar": "نقل التطبيق مرة أخرى إلى المحلي", "ru": "Перенести приложение обратно на локальный диск",
-        "pt": "Migrar app de volta para local", "fr": "Migrer l'app vers le local", "it": "Migra app di nuovo in locale", "ja": "アプリをローカルに戻す",
-        "eo": "Reranslogi aplikaĵon al loka", "de": "App zurück nach lokal migrieren", "ko": "앱을 다시 로컬로 마이그레이션", "tr": "Uygulamayı yerele geri taşı",
-        "vi": "Di chuyển ứng dụng trở lại cục bộ", "th": "ย้ายแอปกลับไปที่เครื่อง", "nl": "Migreer app terug naar lokaal", "pl": "Przenieś aplikację z powrotem na dysk lokalny", "id": "Migrasikan aplikasi kembali ke lokal"
-    },
-    "将庞大的应用程序一键迁移至外部移动硬盘，释放宝贵的 Mac 本地空间。": {
-        "en": "One-click migrate large apps to external drive, freeing up valuable Mac space.",
-        "zh-Hans": "将庞大的应用程序一键迁移至外部移动硬盘，释放宝贵的 Mac 本地空间。",
-        "zh-Hant": "將龐大的應用程式一鍵遷移至外接硬碟，釋放寶貴的 Mac 本地空間。",
-        "hi": "बड़े ऐप्स को बाहरी ड्राइव में माइग्रेट करें और मैक स्पेस खाली करें।",
-        "es": "Migra grandes apps a una unidad externa con un solo clic, liberando espacio en tu Mac.",
-        "ar": "نقل التطبيقات الكبيرة إلى محرك أقراص خارجي بنقرة واحدة، مما يوفر مساحة Mac قيمة.",
-        "ru": "Миграция больших приложений на внешний диск в один клик, освобождая место на Mac.",
-        "pt": "Migre apps grandes para unidade externa com um clique, liberando espaço no Mac.",
-        "fr": "Migrez les grandes applications vers un disque externe en un clic, libérant de l'espace sur Mac.",
-        "it": "Migra grandi app su unità esterna con un clic, liberando spazio prezioso su Mac.",
-        "ja": "ワンクリックで大きなアプリを外部ドライブに移行し、Macのスペースを解放します。",
-        "eo": "Unuklaka migrado de grandaj aplikaĵoj al ekstera disko, liberigante valoran spacon de Mac.",
-        "de": "Migrieren Sie große Apps mit einem Klick auf ein externes Laufwerk und geben Sie wertvollen Mac-Speicherplatz frei.",
-        "ko": "원클릭으로 대용량 앱을 외부 드라이브로 마이그레이션하여 귀중한 Mac 공간을 확보하세요.",
-        "tr": "Büyük uygulamaları tek tıklamayla harici sürücüye taşıyın, değerli Mac alanını boşaltın.",
-        "vi": "Di chuyển các ứng dụng lớn sang ổ đĩa ngoài chỉ bằng một cú nhấp chuột, giải phóng không gian Mac quý giá.",
-        "th": "ย้ายแอปขนาดใหญ่ไปยังไดรฟ์ภายนอกได้ในคลิกเดียว เพิ่มพื้นที่ว่างอันมีค่าให้กับ Mac ของคุณ",
-        "nl": "Migreer grote apps met één klik naar een externe schijf en maak waardevolle Mac-ruimte vrij.",
-        "pl": "Jednym kliknięciem przenieś duże aplikacje na dysk zewnętrzny, zwalniając cenne miejsce na Macu.",
-        "id": "Migrasikan aplikasi besar ke drive eksternal dengan sekali klik, membebaskan ruang Mac yang berharga."
-    },
-    "已链接": {
-        "en": "Linked", "zh-Hans": "已链接", "zh-Hant": "已連結",
-        "hi": "लिंक किया गया", "es": "Enlazado", "ar": "مرتبط", "ru": "Связано",
-        "pt": "Vinculado", "fr": "Lié", "it": "Collegato", "ja": "リンク済み",
-        "eo": "Ligitas", "de": "Verknüpft", "ko": "연결됨", "tr": "Bağlı",
-        "vi": "Đã liên kết", "th": "เชื่อมโยงแล้ว", "nl": "Gekoppeld", "pl": "Połączone", "id": "Terhubung"
-    },
-    "应用瘦身": {
-        "en": "App Slimming", "zh-Hans": "应用瘦身", "zh-Hant": "應用程式瘦身",
-        "hi": "ऐप स्लिमिंग", "es": "Adelgazamiento de App", "ar": "تقليص التطبيق", "ru": "Оптимизация приложений",
-        "pt": "Otimização de App", "fr": "Amincissement d'app", "it": "Snellimento app", "ja": "アプリの軽量化",
-        "eo": "Aplikaĵa Maldikiĝo", "de": "App-Optimierung", "ko": "앱 슬리밍", "tr": "Uygulama Zayıflatma",
-        "vi": "Làm gọn ứng dụng", "th": "การลดขนาดแอป", "nl": "App afslanken", "pl": "Odchudzanie aplikacji", "id": "Pengecilan Aplikasi"
-    },
-    "应用运行中": {
-        "en": "App Running", "zh-Hans": "应用运行中", "zh-Hant": "應用程式執行中",
-        "hi": "ऐप चल रहा है", "es": "Aplicación en ejecución", "ar": "التطبيق قيد التشغيل", "ru": "Приложение запущен",
-        "pt": "App em execução", "fr": "Application en cours", "it": "App in esecuzione", "ja": "アプリ実行中",
-        "eo": "Aplikaĵo Ruzas", "de": "App läuft", "ko": "앱 실행 중", "tr": "Uygulama Çalışıyor",
-        "vi": "Ứng dụng đang chạy", "th": "แอปกำลังทำงาน", "nl": "App draait", "pl": "Aplikacja działa", "id": "Aplikasi Berjalan"
-    },
-    "应用需要读写 /Applications 目录才能工作。请在系统设置中开启。": {
-        "en": "App needs read/write access to /Applications. Please enable in System Settings.",
-        "zh-Hans": "应用需要读写 /Applications 目录才能工作。请在系统设置中开启。",
-        "zh-Hant": "應用程式需要讀寫 /Applications 目錄才能運作。請在系統設定中開啟。",
-        "hi": "ऐप को /Applications तक पहुंच की आवश्यकता है। कृपया सेटिंग्स में सक्षम करें।",
-        "es": "La app necesita acceso de lectura/escritura a /Applications. Habilítalo en Configuración.",
-        "ar": "يحتاج التطبيق إلى الوصول للقراءة/الكتابة إلى /Applications. يرجى التمكين في الإعدادات.",
-        "ru": "Приложению требуется доступ к /Applications. Включите в настройках.",
-        "pt": "O app precisa de acesso de leitura/gravação em /Applications. Ative nas Configurações.",
-        "fr": "L'app a besoin d'un accès lecture/écriture à /Applications. Activez dans les Réglages.",
-        "it": "L'app necessita di accesso lettura/scrittura a /Applications. Abilita nelle Impostazioni.",
-        "ja": "アプリには/Applicationsへの読み書きアクセスが必要です。設定で有効にしてください。",
-        "eo": "Aplikaĵo bezonas legi/skribi aliron al /Applications. Bonvolu ebligi en Sistemaj Agordoj.",
-        "de": "App benötigt Lese-/Schreibzugriff auf /Applications. Bitte in den Systemeinstellungen aktivieren.",
-        "ko": "앱에 /Applications에 대한 읽기/쓰기 액세스가 필요합니다. 시스템 설정에서 활성화하십시오.",
-        "tr": "Uygulamanın /Applications klasörüne okuma/yazma erişimine ihtiyacı var. Lütfen Sistem Ayarlarında etkinleştirin.",
-        "vi": "Ứng dụng cần quyền đọc/ghi vào /Applications. Vui lòng bật trong Cài đặt hệ thống.",
-        "th": "แอปต้องการสิทธิ์อ่าน/เขียนใน /Applications โปรดเปิดใช้งานในการตั้งค่าระบบ",
-        "nl": "App heeft lees-/schrijftoegang nodig tot /Applications. Schakel dit in bij Systeeminstellingen.",
-        "pl": "Aplikacja wymaga dostępu do odczytu/zapisu w /Applications. Włącz w Ustawieniach systemowych.",
-        "id": "Aplikasi memerlukan akses baca/tulis ke /Applications. Harap aktifkan di Pengaturan Sistem."
-    },
-    "感谢你使用本工具，外置硬盘拯救世界！": {
-        "en": "Thanks for using. External drives save the world!",
-        "zh-Hans": "感谢你使用本工具，外置硬盘拯救世界！",
-        "zh-Hant": "感謝你使用本工具，外接硬碟拯救世界！",
-        "hi": "उपयोग के लिए धन्यवाद। बाहरी ड्राइव दुनिया बचाते हैं!",
-        "es": "¡Gracias por usar! ¡Los discos externos salvan el mundo!",
-        "ar": "شكرا لاستخدامك. محركات الأقراص الخارجية تنقذ العالم!",
-        "ru": "Спасибо за использование. Внешние диски спасают мир!",
-        "pt": "Obrigado por usar. Unidades externas salvam o mundo!",
-        "fr": "Merci d'utiliser. Les disques externes sauvent le monde !",
-        "it": "Grazie per l'uso. Le unità esterne salvano il mondo!",
-        "ja": "ご利用ありがとうございます。外部ドライブが世界を救う！",
-        "eo": "Dankon pro uzado. Eksteraj diskoj savas la mondon!",
-        "de": "Danke für die Nutzung. Externe Laufwerke retten die Welt!",
-        "ko": "이용해 주셔서 감사합니다. 외부 드라이브가 세상을 구합니다!",
-        "tr": "Kullandığınız için teşekkürler. Harici sürücüler dünyayı kurtarır!",
-        "vi": "Cảm ơn bạn đã sử dụng. Ổ đĩa ngoài cứu thế giới!",
-        "th": "ขอบคุณที่ใช้บริการ ไดรฟ์ภายนอกกู้โลก!",
-        "nl": "Bedankt voor het gebruik. Externe schijven redden de wereld!",
-        "pl": "Dzięki za używanie. Dyski zewnętrzne ratują świat!",
-        "id": "Terima kasih telah menggunakan. Drive eksternal menyelamatkan dunia!"
-    },
-    "我已授权，开始使用": {
-        "en": "Authorized, Start Now", "zh-Hans": "我已授权，开始使用", "zh-Hant": "我已授權，開始使用",
-        "hi": "अधिकृत, अभी शुरू करें", "es": "Autorizado, Comencemos", "ar": "مصرح به، ابدأ الآن", "ru": "Авторизовано, Начать",
-        "pt": "Autorizado, Começar Agora", "fr": "Autorisé, Commencer", "it": "Autorizzato, Inizia Ora", "ja": "許可しました、開始",
-        "eo": "Rajtshavigita, Komenci Nu", "de": "Autorisiert, Jetzt starten", "ko": "승인됨, 지금 시작", "tr": "Yetkilendirildi, Şimdi Başla",
-        "vi": "Đã ủy quyền, Bắt đầu ngay", "th": "ได้รับอนุญาตแล้ว เริ่มเลย", "nl": "Geautoriseerd, Start nu", "pl": "Autoryzowano, Rozpocznij teraz", "id": "Diotorisasi, Mulai Sekarang"
-    },
-    "搜索应用名称": {
-        "en": "Search app name", "zh-Hans": "搜索应用名称", "zh-Hant": "搜尋應用程式名稱",
-        "hi": "ऐप का नाम खोजें", "es": "Buscar nombre de app", "ar": "البحث عن اسم التطبيق", "ru": "Поиск приложения",
-        "pt": "Buscar nome do app", "fr": "Rechercher une app", "it": "Cerca nome app", "ja": "アプリ名を検索",
-        "eo": "Serĉi aplikaĵan nomon", "de": "App-Namen suchen", "ko": "앱 이름 검색", "tr": "Uygulama adını ara",
-        "vi": "Tìm tên ứng dụng", "th": "ค้นหาชื่อแอป", "nl": "Zoek app-naam", "pl": "Szukaj nazwy aplikacji", "id": "Cari nama aplikasi"
-    },
-    "断开": {
-        "en": "Unlink", "zh-Hans": "断开", "zh-Hant": "斷開",
-        "hi": "अनलिंक करें", "es": "Desvincular", "ar": "فك الارتباط", "ru": "Отвязать",
-        "pt": "Desvincular", "fr": "Délier", "it": "Scollega", "ja": "リンク解除",
-        "eo": "Malkonekti", "de": "Trennen", "ko": "연결 해제", "tr": "Bağlantıyı Kes",
-        "vi": "Hủy liên kết", "th": "ยกเลิกการเชื่อมโยง", "nl": "Ontkoppelen", "pl": "Odłącz", "id": "Putuskan Tautan"
-    },
-    "断开此链接并删除文件": {
-        "en": "Disconnect and delete file", "zh-Hans": "断开此链接并删除文件", "zh-Hant": "斷開此連結並刪除檔案",
-        "hi": "डिस्कनेक्ट करें और फ़ाइल हटाएं", "es": "Desconectar y eliminar archivo", "ar": "قطع الاتصال وحذف الملف", "ru": "Отключить и удалить файл",
-        "pt": "Desconectar e excluir arquivo", "fr": "Déconnecter et supprimer le fichier", "it": "Disconnetti ed elimina file", "ja": "切断してファイルを削除",
-        "eo": "Malkonekti kaj forigi dosieron", "de": "Trennen und Datei löschen", "ko": "연결 해제 및 파일 삭제", "tr": "Bağlantıyı kes ve dosyayı sil",
-        "vi": "Ngắt kết nối và xóa tập tin", "th": "ตัดการเชื่อมต่อและลบไฟล์", "nl": "Verbinding verbreken en bestand verwijderen", "pl": "Rozłącz i usuń plik", "id": "Putuskan sambungan dan hapus file"
-    },
-    "无感链接": {
-        "en": "Seamless Linking", "zh-Hans": "无感链接", "zh-Hant": "無感連結",
-        "hi": "निर्बाध लिंकिंग", "es": "Vinculación perfecta", "ar": "ربط سلس", "ru": "Бесшовная связь",
-        "pt": "Vinculação Perfeita", "fr": "Liaison transparente", "it": "Collegamento continuo", "ja": "シームレスなリンク",
-        "eo": "Senjunta Ligado", "de": "Nahtlose Verknüpfung", "ko": "원활한 연결", "tr": "Kesintisiz Bağlantı",
-        "vi": "Liên kết liền mạch", "th": "การเชื่อมโยงที่ราบรื่น", "nl": "Naadloze koppeling", "pl": "Płynne łączenie", "id": "Penautan yang Mulus"
-    },
-    "未找到匹配应用": {
-        "en": "No matching apps found", "zh-Hans": "未找到匹配应用", "zh-Hant": "未找到相符的應用程式",
-        "hi": "कोई मेल खाने वाले ऐप्स नहीं मिले", "es": "No se encontraron apps", "ar": "لم يتم العثور على تطبيقات", "ru": "Приложения не найдены",
-        "pt": "Nenhum app encontrado", "fr": "Aucune application trouvée", "it": "Nessuna app trovata", "ja": "一致するアプリなし",
-        "eo": "Neniuj kongruaj aplikaĵoj trovitaj", "de": "Keine passenden Apps gefunden", "ko": "일치하는 앱을 찾을 수 없음", "tr": "Eşleşen uygulama bulunamadı",
-        "vi": "Không tìm thấy ứng dụng phù hợp", "th": "ไม่พบแอปที่ตรงกัน", "nl": "Geen overeenkomende apps gevonden", "pl": "Nie znaleziono pasujących aplikacji", "id": "Tidak ada aplikasi yang cocok ditemukan"
-    },
-    "未选择": {
-        "en": "Not Selected", "zh-Hans": "未选择", "zh-Hant": "未選擇",
-        "hi": "चयनित नहीं", "es": "No seleccionado", "ar": "لم يتم الاختيار", "ru": "Не выбрано",
-        "pt": "Não selecionado", "fr": "Non sélectionné", "it": "Non selezionato", "ja": "未選択",
-        "eo": "Ne elektita", "de": "Nicht ausgewählt", "ko": "선택되지 않음", "tr": "Seçilmedi",
-        "vi": "Chưa chọn", "th": "ไม่ได้เลือก", "nl": "Niet geselecteerd", "pl": "Nie wybrano", "id": "Tidak Dipilih"
-    },
-    "未链接": {
-        "en": "Not Linked", "zh-Hans": "未链接", "zh-Hant": "未連結",
-        "hi": "लिंक नहीं किया गया", "es": "No enlazado", "ar": "غير مرتبط", "ru": "Не связано",
-        "pt": "Não vinculado", "fr": "Non lié", "it": "Non collegato", "ja": "未リンク",
-        "eo": "Ne ligita", "de": "Nicht verknüpft", "ko": "연결되지 않음", "tr": "Bağlı Değil",
-        "vi": "Chưa liên kết", "th": "ไม่ได้เชื่อมโยง", "nl": "Niet gekoppeld", "pl": "Niepołączone", "id": "Tidak Terhubung"
-    },
-    "本地": {
-        "en": "Local", "zh-Hans": "本地", "zh-Hant": "本地",
-        "hi": "स्थानीय", "es": "Local", "ar": "محلي", "ru": "Локальный",
-        "pt": "Local", "fr": "Local", "it": "Locale", "ja": "ローカル",
-        "eo": "Loka", "de": "Lokal", "ko": "로컬", "tr": "Yerel",
-        "vi": "Cục bộ", "th": "ในเครื่อง", "nl": "Lokaal", "pl": "Lokalny", "id": "Lokal"
-    },
-    "本地已存在同名真实应用": {
-        "en": "Real app with same name exists locally",
-        "zh-Hans": "本地已存在同名真实应用", "zh-Hant": "本地已存在同名真實應用程式",
-        "hi": "समान नाम वाला वास्तविक ऐप स्थानीय रूप से मौजूद है",
-        "es": "La app real con el mismo nombre existe localmente",
-        "ar": "التطبيق الحقيقي بنفس الاسم موجود محلياً",
-        "ru": "Приложение с таким именем уже существует",
-        "pt": "App real com mesmo nome existe localmente",
-        "fr": "L'application réelle avec le même nom existe localement",
-        "it": "L'app reale con lo stesso nome esiste localmente",
-        "ja": "同名の実際のアプリがローカルに存在します",
-        "eo": "Reala aplikaĵo kun la sama nomo ekzistas loke",
-        "de": "Echte App mit gleichem Namen existiert lokal",
-        "ko": "동일한 이름의 실제 앱이 로컬에 존재합니다",
-        "tr": "Aynı isme sahip gerçek uygulama yerel olarak mevcut",
-        "vi": "Ứng dụng thực có cùng tên tồn tại cục bộ",
-        "th": "มีแอปจริงที่มีชื่อเดียวกันอยู่ในเครื่อง",
-        "nl": "Echte app met dezelfde naam bestaat lokaal",
-        "pl": "Prawdziwa aplikacja o tej samej nazwie istnieje lokalnie",
-        "id": "Aplikasi nyata dengan nama yang sama ada secara lokal"
-    },
-    "权限不足。请前往“系统设置 > 隐私与安全性 > 完全磁盘访问权限”，允许 AppPorts 访问磁盘，然后重启应用。": {
-        "en": "Permission denied. Please allow Full Disk Access in System Settings.",
-        "zh-Hans": "权限不足。请前往“系统设置 > 隐私与安全性 > 完全磁盘访问权限”，允许 AppPorts 访问磁盘，然后重启应用。",
-        "zh-Hant": "權限不足。請前往「系統設定 > 隱私權與安全性 > 完全磁碟存取權」，允許 AppPorts 存取磁碟，然後重新啟動應用程式。",
-        "hi": "अनुमति अस्वीकृत। कृपया सिस्टम सेटिंग्स में पूर्ण डिस्क एक्सेस की अनुमति दें।",
-        "es": "Permiso denegado. Permita el acceso total al disco en la configuración del sistema.",
-        "ar": "تم رفض الإذن. يرجى السماح بالوصول الكامل إلى القرص في إعدادات النظام.",
-        "ru": "Доступ запрещен. Разрешите полный доступ к диску в настройках системы.",
-        "pt": "Permissão negada. Permita o Acesso Total ao Disco nas Configurações do Sistema.",
-        "fr": "Permission refusée. Veuillez autoriser l'accès complet au disque dans les réglages système.",
-        "it": "Permesso negato. Consenti Accesso completo al disco nelle Impostazioni di sistema.",
-        "ja": "アクセス拒否。システム設定でフルディスクアクセスを許可してください。",
-        "eo": "Permeso rifuzita. Bonvolu permesi Plenan Diskan Aliron en Sistemaj Agordoj.",
-        "de": "Zugriff verweigert. Bitte erlauben Sie den vollen Festplattenzugriff in den Systemeinstellungen.",
-        "ko": "권한이 거부되었습니다. 시스템 설정에서 전체 디스크 액세스를 허용하십시오.",
-        "tr": "İzin reddedildi. Lütfen Sistem Ayarlarında Tam Disk Erişimine izin verin.",
-        "vi": "Quyền bị từ chối. Vui lòng cho phép Truy cập toàn bộ đĩa trong Cài đặt hệ thống.",
-        "th": "สิทธิ์ถูกปฏิเสธ โปรดอนุญาตการเข้าถึงดิสก์เต็มรูปแบบในการตั้งค่าระบบ",
-        "nl": "Toestemming geweigerd. Sta volledige schijftoegang toe in Systeeminstellingen.",
-        "pl": "Odmowa dostępu. Zezwól na pełny dostęp do dysku w Ustawieniach systemowych.",
-        "id": "Izin ditolak. Harap izinkan Akses Disk Penuh di Pengaturan Sistem."
-    },
-    "欢迎使用 AppPorts": {
-        "en": "Welcome to AppPorts", "zh-Hans": "欢迎使用 AppPorts", "zh-Hant": "歡迎使用 AppPorts",
-        "hi": "AppPorts में आपका स्वागत है", "es": "Bienvenido a AppPorts", "ar": "مرحبا بك في AppPorts", "ru": "Добро пожаловать в AppPorts",
-        "pt": "Bem-vindo ao AppPorts", "fr": "Bienvenue sur AppPorts", "it": "Benvenuto in AppPorts", "ja": "AppPortsへようこそ",
-        "eo": "Bonvenon al AppPorts", "de": "Willkommen bei AppPorts", "ko": "AppPorts에 오신 것을 환영합니다", "tr": "AppPorts'a Hoş Geldiniz",
-        "vi": "Chào mừng đến với AppPorts", "th": "ยินดีต้อนรับสู่ AppPorts", "nl": "Welkom bij AppPorts", "pl": "Witamy w AppPorts", "id": "Selamat datang di AppPorts"
-    },
-    "正在扫描...": {
-        "en": "Scanning...", "zh-Hans": "正在扫描...", "zh-Hant": "正在掃描...",
-        "hi": "स्कैनिंग...", "es": "Escaneando...", "ar": "يتم المسح...", "ru": "Сканирование...",
-        "pt": "Escaneando...", "fr": "Scan en cours...", "it": "Scansione...", "ja": "スキャン中...",
-        "eo": "Skanante...", "de": "Scannen...", "ko": "스캔 중...", "tr": "Taranıyor...",
-        "vi": "Đang quét...", "th": "กำลังสแกน...", "nl": "Scannen...", "pl": "Skanowanie...", "id": "Memindai..."
-    },
-    "目标已存在真实文件": {
-        "en": "Target real file exists", "zh-Hans": "目标已存在真实文件", "zh-Hant": "目標已存在真實檔案",
-        "hi": "लक्ष्य वास्तविक फ़ाइल मौजूद है", "es": "El archivo real de destino existe", "ar": "الملف الحقيقي المستهدف موجود", "ru": "Целевой файл существует",
-        "pt": "Arquivo real de destino existe", "fr": "Le fichier réel cible existe", "it": "Il file reale di destinazione esiste", "ja": "ターゲットの実ファイルが存在します",
-        "eo": "Cella reala dosiero ekzistas", "de": "Ziel-Echtdatei existiert", "ko": "대상 실제 파일이 존재합니다", "tr": "Hedef gerçek dosya mevcut",
-        "vi": "Tập tin thực đích tồn tại", "th": "มีไฟล์จริงเป้าหมายอยู่", "nl": "Doelbestand bestaat", "pl": "Docelowy plik rzeczywisty istnieje", "id": "File nyata target ada"
-    },
-    "空文件夹": {
-        "en": "Empty Folder", "zh-Hans": "空文件夹", "zh-Hant": "空檔案夾",
-        "hi": "खाली फ़ोल्डर", "es": "Carpeta vacía", "ar": "مجلد فارغ", "ru": "Пустая папка",
-        "pt": "Pasta vazia", "fr": "Dossier vide", "it": "Cartella vuota", "ja": "空のフォルダ",
-        "eo": "Malplena Dosierujo", "de": "Leerer Ordner", "ko": "빈 폴더", "tr": "Boş Klasör",
-        "vi": "Thư mục trống", "th": "โฟลเดอร์ว่าง", "nl": "Lege map", "pl": "Pusty folder", "id": "Folder Kosong"
-    },
-    "简体中文": {
-        "en": "Simplified Chinese", "zh-Hans": "简体中文", "zh-Hant": "簡體中文",
-        "hi": "सरलीकृत चीनी", "es": "Chino simplificado", "ar": "صينية مبسطة", "ru": "Упрощенный китайский",
-        "pt": "Chinês Simplificado", "fr": "Chinois simplifié", "it": "Cinese semplificato", "ja": "簡体字中国語",
-        "eo": "Simpligita Ĉina", "de": "Vereinfachtes Chinesisch", "ko": "중국어 간체", "tr": "Basitleştirilmiş Çince",
-        "vi": "Tiếng Trung giản thể", "th": "จีนตัวย่อ", "nl": "Vereenvoudigd Chinees", "pl": "Chiński uproszczony", "id": "Cina Sederhana"
-    },
-    "繁体中文": {
-        "en": "Traditional Chinese", "zh-Hans": "繁体中文", "zh-Hant": "繁體中文",
-        "hi": "पारंपरिक चीनी", "es": "Chino tradicional", "ar": "صينية تقليدية", "ru": "Традиционный китайский",
-        "pt": "Chinês Tradicional", "fr": "Chinois traditionnel", "it": "Cinese tradizionale", "ja": "繁体字中国語",
-        "eo": "Tradicia Ĉina", "de": "Traditionelles Chinesisch", "ko": "중국어 번체", "tr": "Geleneksel Çince",
-        "vi": "Tiếng Trung phồn thể", "th": "จีนตัวเต็ม", "nl": "Traditioneel Chinees", "pl": "Chiński tradycyjny", "id": "Cina Tradisional"
-    },
-    "系统": {
-        "en": "System", "zh-Hans": "系统", "zh-Hant": "系統",
-        "hi": "सिस्टम", "es": "Sistema", "ar": "نظام", "ru": "Система",
-        "pt": "Sistema", "fr": "Système", "it": "Sistema", "ja": "システム",
-        "eo": "Sistemo", "de": "System", "ko": "시스템", "tr": "Sistem",
-        "vi": "Hệ thống", "th": "ระบบ", "nl": "Systeem", "pl": "System", "id": "Sistem"
-    },
-    "系统应用": {
-        "en": "System App", "zh-Hans": "系统应用", "zh-Hant": "系統應用程式",
-        "hi": "सिस्टम ऐप", "es": "App del sistema", "ar": "تطبيق النظام", "ru": "Системное приложение",
-        "pt": "App do Sistema", "fr": "App système", "it": "App di sistema", "ja": "システムアプリ",
-        "eo": "Sistema Aplikaĵo", "de": "System-App", "ko": "시스템 앱", "tr": "Sistem Uygulaması",
-        "vi": "Ứng dụng hệ thống", "th": "แอประบบ", "nl": "Systeem-app", "pl": "Aplikacja systemowa", "id": "Aplikasi Sistem"
-    },
-    "计算中...": {
-        "en": "Calculating...", "zh-Hans": "计算中...", "zh-Hant": "計算中...",
-        "hi": "गणना हो रही है...", "es": "Calculando...", "ar": "جاري الحساب...", "ru": "Вычисление...",
-        "pt": "Calculando...", "fr": "Calcul...", "it": "Calcolo...", "ja": "計算中...",
-        "eo": "Kalkulante...", "de": "Berechnung...", "ko": "계산 중...", "tr": "Hesaplanıyor...",
-        "vi": "Đang tính toán...", "th": "กำลังคำนวณ...", "nl": "Berekenen...", "pl": "Obliczanie...", "id": "Menghitung..."
-    },
-    "该应用正在运行。请先退出应用，然后再试。": {
-        "en": "App is running. Please quit and try again.",
-        "zh-Hans": "该应用正在运行。请先退出应用，然后再试。",
-        "zh-Hant": "該應用程式正在執行。請先退出應用程式，然後再試。",
-        "hi": "ऐप चल रहा है। कृपया इसे बंद करें और पुनः प्रयास करें।",
-        "es": "La app se está ejecutando. Salga e inténtelo de nuevo.",
-        "ar": "التطبيق قيد التشغيل. يرجى الإنهاء والمحاولة مرة أخرى.",
-        "ru": "Приложение запущено. Выйдите и попробуйте снова.",
-        "pt": "O app está em execução. Saia e tente novamente.",
-        "fr": "L'application est en cours d'exécution. Veuillez quitter et réessayer.",
-        "it": "L'app è in esecuzione. Esci e riprova.",
-        "ja": "アプリが実行中です。終了してもう一度お試しください。",
-        "eo": "Aplikaĵo funkcias. Bonvolu forlasi kaj reprovi.",
-        "de": "App läuft. Bitte beenden und erneut versuchen.",
-        "ko": "앱이 실행 중입니다. 종료하고 다시 시도하십시오.",
-        "tr": "Uygulama çalışıyor. Lütfen çıkın ve tekrar deneyin.",
-        "vi": "Ứng dụng sedang chạy. Vui lòng thoát và thử lại.",
-        "th": "แอปกำลังทำงาน โปรดออกและลองอีกครั้ง",
-        "nl": "App is actief. Sluit af en probeer het opnieuw.",
-        "pl": "Aplikacja działa. Wyjdź i spróbuj ponownie.",
-        "id": "Aplikasi sedang berjalan. Silakan keluar dan coba lagi."
-    },
-    "请选择外部存储路径": {
-        "en": "Choose External Drive Path", "zh-Hans": "请选择外部存储路径", "zh-Hant": "請選擇外部儲存路徑",
-        "hi": "बाहरी ड्राइव पथ चुनें", "es": "Elegir ruta de unidad externa", "ar": "اختر مسار القرص الخارجي", "ru": "Выберите путь к внешнему диску",
-        "pt": "Escolher caminho da unidade externa", "fr": "Choisir le chemin du disque externe", "it": "Scegli percorso unità esterna", "ja": "外部ドライブのパスを選択",
-        "eo": "Elektu Eksteran Diskan Vojon", "de": "Wählen Sie den Pfad zum externen Laufwerk", "ko": "외부 드라이브 경로 선택", "tr": "Harici Sürücü Yolunu Seç",
-        "vi": "Chọn đường dẫn ổ đĩa ngoài", "th": "เลือกเส้นทางไดรฟ์ภายนอก", "nl": "Kies extern schijfpad", "pl": "Wybierz ścieżkę dysku zewnętrznego", "id": "Pilih Jalur Drive Eksternal"
-    },
-    "跟随系统 (System)": {
-        "en": "Follow System", "zh-Hans": "跟随系统 (System)", "zh-Hant": "跟隨系統 (System)",
-        "hi": "सिस्टम का पालन करें", "es": "Seguir el sistema", "ar": "اتبع النظام", "ru": "Как в системе",
-        "pt": "Seguir o Sistema", "fr": "Suivre le système", "it": "Segui il sistema", "ja": "システムに従う",
-        "eo": "Sekvi Sistemon", "de": "System folgen", "ko": "시스템 따르기", "tr": "Sistemi Takip Et",
-        "vi": "Theo hệ thống", "th": "ตามระบบ", "nl": "Volg Systeem", "pl": "Podążaj za systemem", "id": "Ikuti Sistem"
-    },
-    "迁移到外部": {
-        "en": "Move to External", "zh-Hans": "迁移到外部", "zh-Hant": "遷移到外部",
-        "hi": "बाहरी में ले जाएं", "es": "Mover a externo", "ar": "نقل إلى خارجي", "ru": "Переместить во внешний",
-        "pt": "Mover para Externo", "fr": "Déplacer vers externe", "it": "Sposta su esterno", "ja": "外部へ移動",
-        "eo": "Movi al Ekstera", "de": "Nach Extern verschieben", "ko": "외부로 이동", "tr": "Dışa Taşı",
-        "vi": "Di chuyển ra ngoài", "th": "ย้ายไปภายนอก", "nl": "Verplaats naar extern", "pl": "Przenieś na zewnątrz", "id": "Pindah ke Eksternal"
-    },
-    "迁移成功": {
-        "en": "Migration Successful", "zh-Hans": "迁移成功", "zh-Hant": "遷移成功",
-        "hi": "माइग्रेशन सफल", "es": "Migración exitosa", "ar": "تم النقل بنجاح", "ru": "Миграция успешна",
-        "pt": "Migração com Sucesso", "fr": "Migration réussie", "it": "Migrazione riuscita", "ja": "移行成功",
-        "eo": "Migrado Sukcesa", "de": "Migration erfolgreich", "ko": "마이그레이션 성공", "tr": "Taşıma Başarılı",
-        "vi": "Di chuyển thành công", "th": "การย้ายสำเร็จ", "nl": "Migratie succesvol", "pl": "Migracja zakończona sukcesem", "id": "Migrasi Berhasil"
-    },
-    "运行中": {
-        "en": "Running", "zh-Hans": "运行中", "zh-Hant": "執行中",
-        "hi": "चल रहा है", "es": "Ejecutando", "ar": "تشغيل", "ru": "Запущено",
-        "pt": "Executando", "fr": "En cours", "it": "In esecuzione", "ja": "実行中",
-        "eo": "Kuris", "de": "Läuft", "ko": "실행 중", "tr": "Çalışıyor",
-        "vi": "Đang chạy", "th": "กำลังทำงาน", "nl": "Actief", "pl": "Działa", "id": "Berjalan"
-    },
-    "还原": {
-        "en": "Restore", "zh-Hans": "还原", "zh-Hant": "還原",
-        "hi": "पुनर्स्थापित करें", "es": "Restaurar", "ar": "استعادة", "ru": "Восстановить",
-        "pt": "Restaurar", "fr": "Restaurer", "it": "Ripristina", "ja": "復元",
-        "eo": "Restarigi", "de": "Wiederherstellen", "ko": "복원", "tr": "Geri Yükle",
-        "vi": "Khôi phục", "th": "กู้คืน", "nl": "Herstellen", "pl": "Przywróć", "id": "Pulihkan"
-    },
-    "选择文件夹": {
-        "en": "Select Folder", "zh-Hans": "选择文件夹", "zh-Hant": "選擇檔案夾",
-        "hi": "फ़ोल्डर चुनें", "es": "Seleccionar carpeta", "ar": "اختر مجلد", "ru": "Выбрать папку",
-        "pt": "Selecionar Pasta", "fr": "Sélectionner un dossier", "it": "Seleziona cartella", "ja": "フォルダを選択",
-        "eo": "Elektu Dosierujon", "de": "Ordner auswählen", "ko": "폴더 선택", "tr": "Klasör Seç",
-        "vi": "Chọn thư mục", "th": "เลือกโฟลเดอร์", "nl": "Selecteer map", "pl": "Wybierz folder", "id": "Pilih Folder"
-    },
-    "链接回本地": {
-        "en": "Link Back to Local", "zh-Hans": "链接回本地", "zh-Hant": "連結回本地",
-        "hi": "स्थानीय से लिंक करें", "es": "Enlazar de nuevo a local", "ar": "الرابط العودة إلى المحلي", "ru": "Связать обратно с локальным",
-        "pt": "Vincular de volta ao local", "fr": "Lier à nouveau au local", "it": "Collega di nuovo al locale", "ja": "ローカルにリンクし直す",
-        "eo": "Ligi reen al Loka", "de": "Zurück zu Lokal verknüpfen", "ko": "로컬로 다시 연결", "tr": "Yerele Geri Bağla",
-        "vi": "Liên kết lại cục bộ", "th": "เชื่อมโยงกลับไปที่เครื่อง", "nl": "Link terug naar lokaal", "pl": "Połącz z powrotem z lokalnym", "id": "Tautkan Kembali ke Lokal"
-    },
-    "错误": {
-        "en": "Error", "zh-Hans": "错误", "zh-Hant": "錯誤",
-        "hi": "त्रुटि", "es": "Error", "ar": "خطأ", "ru": "Ошибка",
-        "pt": "Erro", "fr": "Erreur", "it": "Errore", "ja": "エラー",
-        "eo": "Eraro", "de": "Fehler", "ko": "오류", "tr": "Hata",
-        "vi": "Lỗi", "th": "ข้อผิดพลาด", "nl": "Fout", "pl": "Błąd", "id": "Kesalahan"
-    },
-    "随时还原": {
-        "en": "Restore Anytime", "zh-Hans": "随时还原", "zh-Hant": "隨時還原",
-        "hi": "कभी भी पुनर्स्थापित करें", "es": "Restaurar en cualquier momento", "ar": "استعادة في أي وقت", "ru": "Восстановить в любое время",
-        "pt": "Restaurar a Qualquer Momento", "fr": "Restaurer à tout moment", "it": "Ripristina in qualsiasi momento", "ja": "いつでも復元",
-        "eo": "Restarigi Iam ajn", "de": "Jederzeit wiederherstellen", "ko": "언제든지 복원", "tr": "Her Zaman Geri Yükle",
-        "vi": "Khôi phục bất cứ lúc nào", "th": "กู้คืนได้ทุกเวลา", "nl": "Op elk moment herstellen", "pl": "Przywróć w dowolnym momencie", "id": "Pulihkan Kapan Saja"
-    },
-    "需要“完全磁盘访问权限”": {
-        "en": "Full Disk Access Required", "zh-Hans": "需要“完全磁盘访问权限”", "zh-Hant": "需要「完全磁碟存取權」",
-        "hi": "पूर्ण डिस्क एक्सेस आवश्यक", "es": "Se requiere acceso total al disco", "ar": "مطلوب الوصول الكامل إلى القرص", "ru": "Требуется полный доступ к диску",
-        "pt": "Acesso Total ao Disco Necessário", "fr": "Accès complet au disque requis", "it": "Accesso completo al disco richiesto", "ja": "フルディスクアクセスが必要です",
-        "eo": "Plena Diska Aliro Bezonata", "de": "Voller Festplattenzugriff erforderlich", "ko": "전체 디스크 액세스 필요", "tr": "Tam Disk Erişimi Gerekli",
-        "vi": "Cần quyền truy cập toàn bộ đĩa", "th": "ต้องการการเข้าถึงดิสก์เต็มรูปแบบ", "nl": "Volledige schijftoegang vereist", "pl": "Wymagany pełny dostęp do dysku", "id": "Akses Disk Penuh Diperlukan"
-    },
-    "需要时，可随时将应用一键完整迁回本地 /Applications 目录。": {
-        "en": "Instantly move apps back to local /Applications whenever needed.",
-        "zh-Hans": "需要时，可随时将应用一键完整迁回本地 /Applications 目录。",
-        "zh-Hant": "需要時，可隨時將應用程式一鍵完整遷回本地 /Applications 目錄。",
-        "hi": "जब भी आवश्यकता हो ऐप्स को तुरंत स्थानीय /Applications में वापस ले जाएं।",
-        "es": "Mueve instantáneamente las apps de vuelta a /Applications local cuando sea necesario.",
-        "ar": "انقل التطبيقات فورًا إلى /Applications المحلي عند الحاجة.",
-        "ru": "Мгновенно переносите приложения обратно в /Applications при необходимости.",
-        "pt": "Mova instantaneamente apps de volta para /Applications local quando necessário.",
-        "fr": "Déplacez instantanément les applications vers /Applications localement si nécessaire.",
-        "it": "Sposta istantaneamente le app in /Applications locale quando necessario.",
-        "ja": "必要に応じて、いつでもアプリをローカルの/Applicationsディレクトリに戻せます。",
-        "eo": "Tuj movu aplikaĵojn reen al loka /Applications kiam necese.",
-        "de": "Verschieben Sie Apps bei Bedarf sofort zurück in den lokalen /Applications-Ordner.",
-        "ko": "필요할 때마다 앱을 즉시 로컬 /Applications로 다시 이동하십시오.",
-        "tr": "Gerektiğinde uygulamaları anında yerel /Applications klasörüne geri taşıyın.",
-        "vi": "Di chuyển ứng dụng ngay lập tức trở lại /Applications cục bộ bất cứ khi nào cần thiết.",
-        "th": "ย้ายแอปกลับไปที่ /Applications ในเครื่องได้ทันทีเมื่อจำเป็น",
-        "nl": "Verplaats apps indien nodig direct terug naar lokaal /Applications.",
-        "pl": "Natychmiast przenieś aplikacje z powrotem do lokalnego /Applications w razie potrzeby.",
-        "id": "Segera pindahkan aplikasi kembali ke /Applications lokal kapan pun diperlukan."
-    },
-    "项目地址": {
-        "en": "Project URL", "zh-Hans": "项目地址", "zh-Hant": "專案位址",
-        "hi": "प्रोजेक्ट URL", "es": "URL del proyecto", "ar": "رابط المشروع", "ru": "URL проекта",
-        "pt": "URL do Projeto", "fr": "URL du projet", "it": "URL del progetto", "ja": "プロジェクトURL",
-        "eo": "Projekta URL", "de": "Projekt-URL", "ko": "프로젝트 URL", "tr": "Proje URL'si",
-        "vi": "URL dự án", "th": "URL โครงการ", "nl": "Project-URL", "pl": "Adres URL projektu", "id": "URL Proyek"
-    },
-    "您的应用，随处安家。": {
-        "en": "Your apps, anywhere.", "zh-Hans": "您的应用，随处安家。", "zh-Hant": "您的應用程式，隨處安家。",
-        "hi": "आपके ऐप्स, कहीं भी।", "es": "Tus apps, donde sea.", "ar": "تطبيقاتك، في أي مكان.", "ru": "Ваши приложения, где угодно.",
-        "pt": "Seus apps, em qualquer lugar.", "fr": "Vos applications, partout.", "it": "Le tue app, ovunque.", "ja": "あなたのアプリ、どこでも。",
-        "eo": "Viaj aplikaĵoj, ie ajn.", "de": "Ihre Apps, überall.", "ko": "어디서나 당신의 앱.", "tr": "Uygulamalarınız, her yerde.",
-        "vi": "Ứng dụng của bạn, ở bất cứ đâu.", "th": "แอปของคุณ ทุกที่", "nl": "Uw apps, overal.", "pl": "Twoje aplikacje, gdziekolwiek.", "id": "Aplikasi Anda, di mana saja."
-    },
-    
-    # --- New Strings (2026-01-26) ---
-    
-    "搜索应用 (本地 / 外部)...": {
-        "en": "Search apps (Local / External)...", "zh-Hans": "搜索应用 (本地 / 外部)...", "zh-Hant": "搜尋應用程式 (本地 / 外部)...",
-        "hi": "ऐप्स खोजें (स्थानीय / बाहरी)...", "es": "Buscar apps (Local / Externo)...", "ar": "بحث عن التطبيقات (محلي / خارجي)...", "ru": "Поиск приложений (Локальные / Внешние)...",
-        "pt": "Buscar apps (Local / Externo)...", "fr": "Rechercher des apps (Local / Externe)...", "it": "Cerca app (Locale / Esterno)...", "ja": "アプリを検索 (ローカル / 外部)...",
-        "eo": "Serĉi aplikaĵojn (Loka / Ekstera)...", "de": "Apps suchen (Lokal / Extern)...", "ko": "앱 검색 (로컬 / 외부)...", "tr": "Uygulamaları ara (Yerel / Harici)...",
-        "vi": "Tìm kiếm ứng dụng (Cục bộ / Bên ngoài)...", "th": "ค้นหาแอป (ในเครื่อง / ภายนอก)...", "nl": "Apps zoeken (Lokaal / Extern)...", "pl": "Szukaj aplikacji (Lokalne / Zewnętrzne)...", "id": "Cari aplikasi (Lokal / Eksternal)..."
-    },
-    "排序": {
-        "en": "Sort", "zh-Hans": "排序", "zh-Hant": "排序",
-        "hi": "क्रमबद्ध करें", "es": "Ordenar", "ar": "فرز", "ru": "Сортировка",
-        "pt": "Ordenar", "fr": "Trier", "it": "Ordina", "ja": "並べ替え",
-        "eo": "Ordigu", "de": "Sortieren", "ko": "정렬", "tr": "Sırala",
-        "vi": "Sắp xếp", "th": "เรียงลำดับ", "nl": "Sorteren", "pl": "Sortuj", "id": "Urutkan"
-    },
-    "排序方式": {
-        "en": "Sort Order", "zh-Hans": "排序方式", "zh-Hant": "排序方式",
-        "hi": "क्रमबद्ध करने का तरीका", "es": "Orden de clasificación", "ar": "ترتيب الفرز", "ru": "Порядок сортировки",
-        "pt": "Ordem de classificação", "fr": "Ordre de tri", "it": "Ordine di cernita", "ja": "並べ替え順",
-        "eo": "Ordo de ordigo", "de": "Sortierreihenfolge", "ko": "정렬 순서", "tr": "Sıralama Düzeni",
-        "vi": "Thứ tự sắp xếp", "th": "ลำดับการเรียง", "nl": "Sorteervolgorde", "pl": "Kolejność sortowania", "id": "Urutan Sortir"
-    },
-    "按名称": {
-        "en": "By Name", "zh-Hans": "按名称", "zh-Hant": "按名稱",
-        "hi": "नाम के अनुसार", "es": "Por nombre", "ar": "بالاسم", "ru": "По имени",
-        "pt": "Por nome", "fr": "Par nom", "it": "Per nome", "ja": "名前順",
-        "eo": "Laŭ Nomo", "de": "Nach Name", "ko": "이름순", "tr": "İsme Göre",
-        "vi": "Theo tên", "th": "ตามชื่อ", "nl": "Op naam", "pl": "Według nazwy", "id": "Berdasarkan Nama"
-    },
-    "按大小": {
-        "en": "By Size", "zh-Hans": "按大小", "zh-Hant": "按大小",
-        "hi": "आकार के अनुसार", "es": "Por tamaño", "ar": "بالحجم", "ru": "По размеру",
-        "pt": "Por tamanho", "fr": "Par taille", "it": "Per dimensione", "ja": "サイズ順",
-        "eo": "Laŭ Grandeco", "de": "Nach Größe", "ko": "크기순", "tr": "Boyuta Göre",
-        "vi": "Theo kích thước", "th": "ตามขนาด", "nl": "Op grootte", "pl": "Według rozmiaru", "id": "Berdasarkan Ukuran"
-    },
-    "发现新版本": {
-        "en": "New Version Found", "zh-Hans": "发现新版本", "zh-Hant": "發現新版本",
-        "hi": "नया संस्करण मिला", "es": "Nueva versión encontrada", "ar": "تم العثور على إصدار جديد", "ru": "Найден новый версия",
-        "pt": "Nova versão encontrada", "fr": "Nouvelle version trouvée", "it": "Nuova versione trovata", "ja": "新しいバージョンが見つかりました",
-        "eo": "Nova Versio Trovita", "de": "Neue Version gefunden", "ko": "새 버전 발견", "tr": "Yeni Sürüm Bulundu",
-        "vi": "Đã tìm thấy phiên bản mới", "th": "พบเวอร์ชันใหม่", "nl": "Nieuwe versie gevonden", "pl": "Znaleziono nową wersję", "id": "Versi Baru Ditemukan"
-    },
-    "前往下载": {
-        "en": "Download Now", "zh-Hans": "前往下载", "zh-Hant": "前往下載",
-        "hi": "अभी डाउनलोड करें", "es": "Descargar ahora", "ar": "تحميل الآن", "ru": "Скачать сейчас",
-        "pt": "Baixar agora", "fr": "Télécharger maintenant", "it": "Scarica ora", "ja": "今すぐダウンロード",
-        "eo": "Elŝutu Nun", "de": "Jetzt herunterladen", "ko": "지금 다운로드", "tr": "Şimdi İndir",
-        "vi": "Tải xuống ngay", "th": "ดาวน์โหลดเดี๋ยวนี้", "nl": "Nu downloaden", "pl": "Pobierz teraz", "id": "Unduh Sekarang"
-    },
-    "以后再说": {
-        "en": "Later", "zh-Hans": "以后再说", "zh-Hant": "以後再說",
-        "hi": "बाद में", "es": "Más tarde", "ar": "لاحقاً", "ru": "Позже",
-        "pt": "Mais tarde", "fr": "Plus tard", "it": "Più tardi", "ja": "後で",
-        "eo": "Poste", "de": "Später", "ko": "나중에", "tr": "Daha Sonra",
-        "vi": "Để sau", "th": "ภายหลัง", "nl": "Later", "pl": "Później", "id": "Nanti"
-    },
-    
-    # --- New Strings (2026-02-02) Batch Migration & Progress ---
-    
-    "正在迁移应用...": {
-        "en": "Migrating apps...", "zh-Hans": "正在迁移应用...", "zh-Hant": "正在遷移應用程式...",
-        "hi": "ऐप्स माइग्रेट हो रहे हैं...", "es": "Migrando apps...", "ar": "جاري نقل التطبيقات...", "ru": "Перенос приложений...",
-        "pt": "Migrando apps...", "fr": "Migration des apps...", "it": "Migrazione app...", "ja": "アプリを移行中...",
-        "eo": "Migrante aplikaĵojn...", "de": "Apps werden migriert...", "ko": "앱 마이그레이션 중...", "tr": "Uygulamalar taşınıyor...",
-        "vi": "Đang di chuyển ứng dụng...", "th": "กำลังย้ายแอป...", "nl": "Apps migreren...", "pl": "Migrowanie aplikacji...", "id": "Memigrasikan aplikasi..."
-    },
-    "迁移 %lld 个应用": {
-        "en": "Move %lld Apps", "zh-Hans": "迁移 %lld 个应用", "zh-Hant": "遷移 %lld 個應用程式",
-        "hi": "%lld ऐप्स स्थानांतरित करें", "es": "Mover %lld apps", "ar": "نقل %lld تطبيقات", "ru": "Переместить %lld приложений",
-        "pt": "Mover %lld apps", "fr": "Déplacer %lld apps", "it": "Sposta %lld app", "ja": "%lld アプリを移動",
-        "eo": "Movi %lld aplikaĵojn", "de": "%lld Apps verschieben", "ko": "%lld개 앱 이동", "tr": "%lld Uygulama Taşı",
-        "vi": "Di chuyển %lld ứng dụng", "th": "ย้าย %lld แอป", "nl": "%lld apps verplaatsen", "pl": "Przenieś %lld aplikacji", "id": "Pindahkan %lld Aplikasi"
-    },
-    "链接 %lld 个应用": {
-        "en": "Link %lld Apps", "zh-Hans": "链接 %lld 个应用", "zh-Hant": "連結 %lld 個應用程式",
-        "hi": "%lld ऐप्स लिंक करें", "es": "Enlazar %lld apps", "ar": "ربط %lld تطبيقات", "ru": "Связать %lld приложений",
-        "pt": "Vincular %lld apps", "fr": "Lier %lld apps", "it": "Collega %lld app", "ja": "%lld アプリをリンク",
-        "eo": "Ligi %lld aplikaĵojn", "de": "%lld Apps verknüpfen", "ko": "%lld개 앱 연결", "tr": "%lld Uygulama Bağla",
-        "vi": "Liên kết %lld ứng dụng", "th": "เชื่อมโยง %lld แอป", "nl": "%lld apps koppelen", "pl": "Połącz %lld aplikacji", "id": "Tautkan %lld Aplikasi"
-    },
-    "迁移回本地": {
-        "en": "Move Back to Local", "zh-Hans": "迁移回本地", "zh-Hant": "遷移回本地",
-        "hi": "स्थानीय में वापस ले जाएं", "es": "Mover de vuelta a local", "ar": "نقل إلى المحلي", "ru": "Вернуть в локальное",
-        "pt": "Mover de volta ao local", "fr": "Déplacer vers local", "it": "Sposta di nuovo in locale", "ja": "ローカルに戻す",
-        "eo": "Renigi al Loka", "de": "Zurück nach lokal verschieben", "ko": "로컬로 되돌리기", "tr": "Yerele Geri Taşı",
-        "vi": "Di chuyển về cục bộ", "th": "ย้ายกลับไปในเครื่อง", "nl": "Terug naar lokaal verplaatsen", "pl": "Przenieś z powrotem na dysk lokalny", "id": "Pindahkan Kembali ke Lokal"
-    },
-    "部分迁移失败": {
-        "en": "Some migrations failed", "zh-Hans": "部分迁移失败", "zh-Hant": "部分遷移失敗",
-        "hi": "कुछ माइग्रेशन विफल", "es": "Algunas migraciones fallaron", "ar": "فشلت بعض عمليات النقل", "ru": "Некоторые миграции не удались",
-        "pt": "Algumas migrações falharam", "fr": "Certaines migrations ont échoué", "it": "Alcune migrazioni non riuscite", "ja": "一部の移行に失敗しました",
-        "eo": "Kelkaj migradoj malsukcesis", "de": "Einige Migrationen fehlgeschlagen", "ko": "일부 마이그레이션 실패", "tr": "Bazı taşımalar başarısız oldu",
-        "vi": "Một số di chuyển thất bại", "th": "บางการย้ายล้มเหลว", "nl": "Sommige migraties mislukt", "pl": "Niektóre migracje nie powiodły się", "id": "Beberapa migrasi gagal"
-    },
-    "部分链接失败": {
-        "en": "Some links failed", "zh-Hans": "部分链接失败", "zh-Hant": "部分連結失敗",
-        "hi": "कुछ लिंक विफल", "es": "Algunos enlaces fallaron", "ar": "فشلت بعض الروابط", "ru": "Некоторые связи не удались",
-        "pt": "Alguns links falharam", "fr": "Certains liens ont échoué", "it": "Alcuni collegamenti non riusciti", "ja": "一部のリンクに失敗しました",
-        "eo": "Kelkaj ligoj malsukcesis", "de": "Einige Verknüpfungen fehlgeschlagen", "ko": "일부 연결 실패", "tr": "Bazı bağlantılar başarısız oldu",
-        "vi": "Một số liên kết thất bại", "th": "บางการเชื่อมโยงล้มเหลว", "nl": "Sommige koppelingen mislukt", "pl": "Niektóre połączenia nie powiodły się", "id": "Beberapa tautan gagal"
-    },
-    "含系统应用": {
-        "en": "Contains System App", "zh-Hans": "含系统应用", "zh-Hant": "含系統應用程式",
-        "hi": "सिस्टम ऐप शामिल है", "es": "Contiene app del sistema", "ar": "يحتوي على تطبيق نظام", "ru": "Содержит системное приложение",
-        "pt": "Contém app do sistema", "fr": "Contient app système", "it": "Contiene app di sistema", "ja": "システムアプリを含む",
-        "eo": "Enhavas Sisteman Aplikaĵon", "de": "Enthält System-App", "ko": "시스템 앱 포함", "tr": "Sistem Uygulaması İçerir",
-        "vi": "Chứa ứng dụng hệ thống", "th": "มีแอประบบ", "nl": "Bevat systeem-app", "pl": "Zawiera aplikację systemową", "id": "Berisi Aplikasi Sistem"
-    },
-    "含运行中应用": {
-        "en": "Contains Running App", "zh-Hans": "含运行中应用", "zh-Hant": "含執行中應用程式",
-        "hi": "चल रहा ऐप शामिल है", "es": "Contiene app en ejecución", "ar": "يحتوي على تطبيق قيد التشغيل", "ru": "Содержит работающее приложение",
-        "pt": "Contém app em execução", "fr": "Contient app en cours", "it": "Contiene app in esecuzione", "ja": "実行中のアプリを含む",
-        "eo": "Enhavas Funkcianta Aplikaĵon", "de": "Enthält laufende App", "ko": "실행 중인 앱 포함", "tr": "Çalışan Uygulama İçerir",
-        "vi": "Chứa ứng dụng đang chạy", "th": "มีแอปที่กำลังทำงาน", "nl": "Bevat actieve app", "pl": "Zawiera działającą aplikację", "id": "Berisi Aplikasi yang Berjalan"
-    },
-    "App Store 应用": {
-        "en": "App Store App", "zh-Hans": "App Store 应用", "zh-Hant": "App Store 應用程式",
-        "hi": "App Store ऐप", "es": "App de App Store", "ar": "تطبيق متجر التطبيقات", "ru": "Приложение App Store",
-        "pt": "App da App Store", "fr": "Application App Store", "it": "App dell'App Store", "ja": "App Store アプリ",
-        "eo": "App Store Aplikaĵo", "de": "App Store App", "ko": "App Store 앱", "tr": "App Store Uygulaması",
-        "vi": "Ứng dụng App Store", "th": "แอป App Store", "nl": "App Store-app", "pl": "Aplikacja App Store", "id": "Aplikasi App Store"
-    },
-    "继续迁移": {
-        "en": "Continue Migration", "zh-Hans": "继续迁移", "zh-Hant": "繼續遷移",
-        "hi": "माइग्रेशन जारी रखें", "es": "Continuar migración", "ar": "متابعة النقل", "ru": "Продолжить миграцию",
-        "pt": "Continuar migração", "fr": "Continuer la migration", "it": "Continua migrazione", "ja": "移行を続ける",
-        "eo": "Daŭrigu Migradon", "de": "Migration fortsetzen", "ko": "마이그레이션 계속", "tr": "Taşımaya Devam Et",
-        "vi": "Tiếp tục di chuyển", "th": "ดำเนินการย้ายต่อ", "nl": "Migratie voortzetten", "pl": "Kontynuuj migrację", "id": "Lanjutkan Migrasi"
-    },
-    "取消": {
-        "en": "Cancel", "zh-Hans": "取消", "zh-Hant": "取消",
-        "hi": "रद्द करें", "es": "Cancelar", "ar": "إلغاء", "ru": "Отмена",
-        "pt": "Cancelar", "fr": "Annuler", "it": "Annulla", "ja": "キャンセル",
-        "eo": "Nuligi", "de": "Abbrechen", "ko": "취소", "tr": "İptal",
-        "vi": "Hủy", "th": "ยกเลิก", "nl": "Annuleren", "pl": "Anuluj", "id": "Batal"
-    },
-    
-    # --- New Strings (2026-02-02) Menu & Alerts ---
-    
-    "日志": {
-        "en": "Logs", "zh-Hans": "日志", "zh-Hant": "日誌",
-        "hi": "लॉग", "es": "Registros", "ar": "السجلات", "ru": "Журналы",
-        "pt": "Logs", "fr": "Journaux", "it": "Log", "ja": "ログ",
-        "eo": "Protokoloj", "de": "Protokolle", "ko": "로그", "tr": "Günlükler",
-        "vi": "Nhật ký", "th": "บันทึก", "nl": "Logs", "pl": "Dzienniki", "id": "Log"
-    },
-    "在 Finder 中查看日志": {
-        "en": "View Log in Finder", "zh-Hans": "在 Finder 中查看日志", "zh-Hant": "在 Finder 中查看日誌",
-        "hi": "Finder में लॉग देखें", "es": "Ver registro en Finder", "ar": "عرض السجل في Finder", "ru": "Просмотреть журнал в Finder",
-        "pt": "Ver log no Finder", "fr": "Voir le journal dans le Finder", "it": "Visualizza log nel Finder", "ja": "Finderでログを表示",
-        "eo": "Vidi protokolon en Finder", "de": "Protokoll im Finder anzeigen", "ko": "Finder에서 로그 보기", "tr": "Finder'da Günlüğü Görüntüle",
-        "vi": "Xem nhật ký trong Finder", "th": "ดูบันทึกใน Finder", "nl": "Log bekijken in Finder", "pl": "Zobacz dziennik w Finderze", "id": "Lihat Log di Finder"
-    },
-    "设置日志位置...": {
-        "en": "Set Log Location...", "zh-Hans": "设置日志位置...", "zh-Hant": "設定日誌位置...",
-        "hi": "लॉग स्थान सेट करें...", "es": "Establecer ubicación del registro...", "ar": "تعيين موقع السجل...", "ru": "Установить расположение журнала...",
-        "pt": "Definir local do log...", "fr": "Définir l'emplacement du journal...", "it": "Imposta posizione log...", "ja": "ログの場所を設定...",
-        "eo": "Agordi protokolan lokon...", "de": "Protokollspeicherort festlegen...", "ko": "로그 위치 설정...", "tr": "Günlük Konumunu Ayarla...",
-        "vi": "Đặt vị trí nhật ký...", "th": "ตั้งค่าตำแหน่งบันทึก...", "nl": "Loglocatie instellen...", "pl": "Ustaw lokalizację dziennika...", "id": "Atur Lokasi Log..."
-    },
-    "选择日志保存位置": {
-        "en": "Choose Log Location", "zh-Hans": "选择日志保存位置", "zh-Hant": "選擇日誌儲存位置",
-        "hi": "लॉग स्थान चुनें", "es": "Elegir ubicación del registro", "ar": "اختر موقع السجل", "ru": "Выберите расположение журнала",
-        "pt": "Escolher local do log", "fr": "Choisir l'emplacement du journal", "it": "Scegli posizione log", "ja": "ログの保存場所を選択",
-        "eo": "Elektu protokolan lokon", "de": "Protokollspeicherort auswählen", "ko": "로그 위치 선택", "tr": "Günlük Konumunu Seç",
-        "vi": "Chọn vị trí lưu nhật ký", "th": "เลือกตำแหน่งบันทึก", "nl": "Loglocatie kiezen", "pl": "Wybierz lokalizację dziennika", "id": "Pilih Lokasi Log"
-    },
-    "当前大小: %@": {
-        "en": "Current Size: %@", "zh-Hans": "当前大小: %@", "zh-Hant": "目前大小: %@",
-        "hi": "वर्तमान आकार: %@", "es": "Tamaño actual: %@", "ar": "الحجم الحالي: %@", "ru": "Текущий размер: %@",
-        "pt": "Tamanho atual: %@", "fr": "Taille actuelle : %@", "it": "Dimensione attuale: %@", "ja": "現在のサイズ: %@",
-        "eo": "Nuna grandeco: %@", "de": "Aktuelle Größe: %@", "ko": "현재 크기: %@", "tr": "Mevcut Boyut: %@",
-        "vi": "Kích thước hiện tại: %@", "th": "ขนาดปัจจุบัน: %@", "nl": "Huidige grootte: %@", "pl": "Bieżący rozmiar: %@", "id": "Ukuran Saat Ini: %@"
-    },
-    "清空日志": {
-        "en": "Clear Log", "zh-Hans": "清空日志", "zh-Hant": "清空日誌",
-        "hi": "लॉग साफ़ करें", "es": "Borrar registro", "ar": "مسح السجل", "ru": "Очистить журнал",
-        "pt": "Limpar log", "fr": "Effacer le journal", "it": "Cancella log", "ja": "ログを消去",
-        "eo": "Viŝi protokolon", "de": "Protokoll löschen", "ko": "로그 지우기", "tr": "Günlüğü Temizle",
-        "vi": "Xóa nhật ký", "th": "ล้างบันทึก", "nl": "Log wissen", "pl": "Wyczyść dziennik", "id": "Hapus Log"
-    },
-    "App Store App": {
-        "en": "App Store App", "zh-Hans": "App Store 应用", "zh-Hant": "App Store 應用程式",
-        "hi": "App Store ऐप", "es": "App de App Store", "ar": "تطبيق App Store", "ru": "Приложение App Store",
-        "pt": "App da App Store", "fr": "Application App Store", "it": "App dell'App Store", "ja": "App Store アプリ",
-        "eo": "App Store Aplikaĵo", "de": "App Store App", "ko": "App Store 앱", "tr": "App Store Uygulaması",
-        "vi": "Ứng dụng App Store", "th": "แอป App Store", "nl": "App Store-app", "pl": "Aplikacja App Store", "id": "Aplikasi App Store"
-    },
-    "Continue Migration": {
-        "en": "Continue Migration", "zh-Hans": "继续迁移", "zh-Hant": "繼續遷移",
-        "hi": "माइग्रेशन जारी रखें", "es": "Continuar migración", "ar": "متابعة النقل", "ru": "Продолжить миграцию",
-        "pt": "Continuar migração", "fr": "Continuer la migration", "it": "Continua migrazione", "ja": "移行を続ける",
-        "eo": "Daŭrigu Migradon", "de": "Migration fortsetzen", "ko": "마이그레이션 계속", "tr": "Taşımaya Devam Et",
-        "vi": "Tiếp tục di chuyển", "th": "ดำเนินการย้ายต่อ", "nl": "Migratie voortzetten", "pl": "Kontynuuj migrację", "id": "Lanjutkan Migrasi"
-    },
-    "Cancel": {
-        "en": "Cancel", "zh-Hans": "取消", "zh-Hant": "取消",
-        "hi": "रद्द करें", "es": "Cancelar", "ar": "إلغاء", "ru": "Отмена",
-        "pt": "Cancelar", "fr": "Annuler", "it": "Annulla", "ja": "キャンセル",
-        "eo": "Nuligi", "de": "Abbrechen", "ko": "취소", "tr": "İptal",
-        "vi": "Hủy", "th": "ยกเลิก", "nl": "Annuleren", "pl": "Anuluj", "id": "Batal"
-    },
-    "Link Back to Local": {
-        "en": "Link Back to Local", "zh-Hans": "链接回本地", "zh-Hant": "連結回本地",
-        "hi": "स्थानीय से लिंक करें", "es": "Enlazar de nuevo a local", "ar": "الرابط العودة إلى المحلي", "ru": "Связать обратно с локальным",
-        "pt": "Vincular de volta ao local", "fr": "Lier à nouveau au local", "it": "Collega di nuovo al locale", "ja": "ローカルにリンクし直す",
-        "eo": "Ligi reen al Loka", "de": "Zurück zu Lokal verknüpfen", "ko": "로컬로 다시 연결", "tr": "Yerele Geri Bağla",
-        "vi": "Liên kết lại cục bộ", "th": "เชื่อมโยงกลับไปที่เครื่อง", "nl": "Link terug naar lokaal", "pl": "Połącz z powrotem z lokalnym", "id": "Tautkan Kembali ke Lokal"
-    },
-    "Move Back to Local": {
-        "en": "Move Back to Local", "zh-Hans": "迁移回本地", "zh-Hant": "遷移回本地",
-        "hi": "स्थानीय में वापस ले जाएं", "es": "Mover de vuelta a local", "ar": "نقل إلى المحلي", "ru": "Вернуть в локальное",
-        "pt": "Mover de volta ao local", "fr": "Déplacer vers local", "it": "Sposta di nuovo in locale", "ja": "ローカルに戻す",
-        "eo": "Renigi al Loka", "de": "Zurück nach lokal verschieben", "ko": "로컬로 되돌리기", "tr": "Yerele Geri Taşı",
-        "vi": "Di chuyển về cục bộ", "th": "ย้ายกลับไปในเครื่อง", "nl": "Terug naar lokaal verplaatsen", "pl": "Przenieś z powrotem na dysk lokalny", "id": "Pindahkan Kembali ke Lokal"
-    },
-    "Link %lld Apps": {
-        "en": "Link %lld Apps", "zh-Hans": "链接 %lld 个应用", "zh-Hant": "連結 %lld 個應用程式",
-        "hi": "%lld ऐप्स लिंक करें", "es": "Enlazar %lld apps", "ar": "ربط %lld تطبيقات", "ru": "Связать %lld приложений",
-        "pt": "Vincular %lld apps", "fr": "Lier %lld apps", "it": "Collega %lld app", "ja": "%lld アプリをリンク",
-        "eo": "Ligi %lld aplikaĵojn", "de": "%lld Apps verknüpfen", "ko": "%lld개 앱 연결", "tr": "%lld Uygulama Bağla",
-        "vi": "Liên kết %lld ứng dụng", "th": "เชื่อมโยง %lld แอป", "nl": "%lld apps koppelen", "pl": "Połącz %lld aplikacji", "id": "Tautkan %lld Aplikasi"
-    },
-    
-    # --- New Strings (2026-02-06) Settings & Status ---
-    
-    "Auto": {
-        "en": "Auto", "zh-Hans": "自动", "zh-Hant": "自動",
-        "hi": "स्वचालित", "es": "Automático", "ar": "تلقائي", "ru": "Авто",
-        "pt": "Automático", "fr": "Auto", "it": "Auto", "ja": "自動",
-        "eo": "Aŭtomata", "de": "Auto", "ko": "자동", "tr": "Otomatik",
-        "vi": "Tự động", "th": "อัตโนมัติ", "nl": "Auto", "pl": "Auto", "id": "Otomatis"
-    },
-    "设置": {
-        "en": "Settings", "zh-Hans": "设置", "zh-Hant": "設定",
-        "hi": "सेटिंग्स", "es": "Configuración", "ar": "الإعدادات", "ru": "Настройки",
-        "pt": "Configurações", "fr": "Paramètres", "it": "Impostazioni", "ja": "設定",
-        "eo": "Agordoj", "de": "Einstellungen", "ko": "설정", "tr": "Ayarlar",
-        "vi": "Cài đặt", "th": "การตั้งค่า", "nl": "Instellingen", "pl": "Ustawienia", "id": "Pengaturan"
-    },
-    "默认情况下，来自 App Store 的应用不允许迁移，因为迁移后将无法通过 App Store 更新。": {
-        "en": "By default, App Store apps are not allowed to migrate because they cannot be updated via App Store after migration.",
-        "zh-Hans": "默认情况下，来自 App Store 的应用不允许迁移，因为迁移后将无法通过 App Store 更新。",
-        "zh-Hant": "預設情況下，來自 App Store 的應用程式不允許遷移，因為遷移後將無法透過 App Store 更新。",
-        "hi": "डिफ़ॉल्ट रूप से, ऐप स्टोर ऐप्स को माइग्रेट करने की अनुमति नहीं है क्योंकि माइग्रेशन के बाद उन्हें ऐप स्टोर के माध्यम से अपडेट नहीं किया जा सकता है।",
-        "es": "Por defecto, no se permite migrar apps de App Store porque no se pueden actualizar tras la migración.",
-        "ar": "افتراضيًا، لا يُسمح بترحيل تطبيقات App Store لأنه لا يمكن تحديثها عبر App Store بعد الترحيل.",
-        "ru": "По умолчанию миграция приложений App Store запрещена, так как они не обновляются через App Store после переноса.",
-        "pt": "Por padrão, apps da App Store não podem ser migrados pois não atualizam via App Store após migração.",
-        "fr": "Par défaut, la migration des apps App Store est interdite car elles ne peuvent plus être mises à jour via l'App Store après.",
-        "it": "Per impostazione predefinita, le app dell'App Store non possono essere migrate perché non aggiornabili dopo la migrazione.",
-        "ja": "デフォルトでは、App Storeアプリの移行は許可されていません。移行後はApp Store経由で更新できなくなるためです。",
-        "eo": "Defaŭlte, App Store-aplikaĵoj ne rajtas migri ĉar ili ne povas esti ĝisdatigitaj per App Store post migrado.",
-        "de": "Standardmäßig dürfen App Store-Apps nicht migriert werden, da sie nach der Migration nicht mehr über den App Store aktualisiert werden können.",
-        "ko": "기본적으로 App Store 앱은 마이그레이션 후 App Store를 통해 업데이트할 수 없으므로 마이그레이션이 허용되지 않습니다.",
-        "tr": "Varsayılan olarak, App Store uygulamalarının taşınmasına izin verilmez çünkü taşındıktan sonra App Store üzerinden güncellenemezler.",
-        "vi": "Theo mặc định, ứng dụng App Store không được phép di chuyển vì chúng không thể cập nhật qua App Store sau khi di chuyển.",
-        "th": "ตามค่าเริ่มต้น แอป App Store จะไม่ได้รับอนุญาตให้ย้ายเนื่องจากไม่สามารถอัปเดตผ่าน App Store ได้หลังจากย้าย",
-        "nl": "Standaard mogen App Store-apps niet worden gemigreerd omdat ze na migratie niet meer via de App Store kunnen worden bijgewerkt.",
-        "pl": "Domyślnie aplikacje z App Store nie mogą być migrowane, ponieważ po migracji nie można ich aktualizować przez App Store.",
-        "id": "Secara default, aplikasi App Store tidak diizinkan untuk migrasi karena tidak dapat diperbarui melalui App Store setelah migrasi."
-    },
-    "允许迁移 Mac App Store 应用": {
-        "en": "Allow Mac App Store App Migration",
-        "zh-Hans": "允许迁移 Mac App Store 应用",
-        "zh-Hant": "允許遷移 Mac App Store 應用程式",
-        "hi": "मैक ऐप स्टोर ऐप माइग्रेशन की अनुमति दें",
-        "es": "Permitir migración de apps de Mac App Store",
-        "ar": "السماح بترحيل تطبيقات Mac App Store",
-        "ru": "Разрешить миграцию приложений Mac App Store",
-        "pt": "Permitir migração de apps da Mac App Store",
-        "fr": "Autoriser la migration des apps Mac App Store",
-        "it": "Consenti migrazione app Mac App Store",
-        "ja": "Mac App Storeアプリの移行を許可",
-        "eo": "Permesi Migradon de Mac App Store Aplikaĵoj",
-        "de": "Migration von Mac App Store-Apps erlauben",
-        "ko": "Mac App Store 앱 마이그레이션 허용",
-        "tr": "Mac App Store Uygulama Taşımasına İzin Ver",
-        "vi": "Cho phép di chuyển ứng dụng Mac App Store",
-        "th": "อนุญาตให้ย้ายแอป Mac App Store",
-        "nl": "Migratie van Mac App Store-apps toestaan",
-        "pl": "Zezwalaj na migrację aplikacji Mac App Store",
-        "id": "Izinkan Migrasi Aplikasi Mac App Store"
-    },
-    "启用后可以迁移来自 Mac App Store 的原生 Mac 应用": {
-        "en": "Enable to migrate native Mac apps from Mac App Store",
-        "zh-Hans": "启用后可以迁移来自 Mac App Store 的原生 Mac 应用",
-        "zh-Hant": "啟用後可以遷移來自 Mac App Store 的原生 Mac 應用程式",
-        "hi": "मैक ऐप स्टोर से मूल मैक ऐप्स को माइग्रेट करने के लिए सक्षम करें",
-        "es": "Habilite para migrar apps nativas de Mac desde Mac App Store",
-        "ar": "قم بالتمكين لترحيل تطبيقات Mac الأصلية من Mac App Store",
-        "ru": "Включите для миграции нативных приложений Mac из Mac App Store",
-        "pt": "Ative para migrar apps nativos do Mac da Mac App Store",
-        "fr": "Activez pour migrer les apps Mac natives du Mac App Store",
-        "it": "Abilita per migrare app Mac native dal Mac App Store",
-        "ja": "有効にすると、Mac App StoreからネイティブMacアプリを移行できます",
-        "eo": "Ebligu por migri denaskajn Mac-aplikaĵojn de Mac App Store",
-        "de": "Aktivieren, um native Mac-Apps aus dem Mac App Store zu migrieren",
-        "ko": "Mac App Store에서 기본 Mac 앱을 마이그레이션하려면 활성화하세요",
-        "tr": "Mac App Store'dan yerel Mac uygulamalarını taşımak için etkinleştirin",
-        "vi": "Bật để di chuyển ứng dụng Mac gốc từ Mac App Store",
-        "th": "เปิดใช้งานเพื่อย้ายแอป Mac ดั้งเดิมจาก Mac App Store",
-        "nl": "Schakel in om native Mac-apps van Mac App Store te migreren",
-        "pl": "Włącz, aby migrować natywne aplikacje Mac z Mac App Store",
-        "id": "Aktifkan untuk memigrasikan aplikasi Mac asli dari Mac App Store"
-    },
-    "迁移后的 App Store 应用将无法自动更新，需要手动还原后才能更新": {
-        "en": "Migrated App Store apps cannot auto-update. Restore manually to update.",
-        "zh-Hans": "迁移后的 App Store 应用将无法自动更新，需要手动还原后才能更新",
-        "zh-Hant": "遷移後的 App Store 應用程式將無法自動更新，需要手動還原後才能更新",
-        "hi": "माइग्रेटेड ऐप स्टोर ऐप्स ऑटो-अपडेट नहीं हो सकते। अपडेट करने के लिए मैन्युअल रूप से पुनर्स्थापित करें।",
-        "es": "Las apps migradas no se actualizan automáticamente. Restaure manualmente para actualizar.",
-        "ar": "لا يمكن تحديث التطبيقات المنقولة تلقائيًا. استعد يدويًا للتحديث.",
-        "ru": "Мигрированные приложения не обновляются автом. Восстановите вручную для обновления.",
-        "pt": "Apps migrados não atualizam automaticamente. Restaure manualmente para atualizar.",
-        "fr": "Les apps migrées ne se mettent pas à jour auto. Restaurez manuellement pour mettre à jour.",
-        "it": "Le app migrate non si aggiornano automaticamente. Ripristina manualmente per aggiornare.",
-        "ja": "移行したアプリは自動更新されません。更新するには手動で復元してください。",
-        "eo": "Migritaj aplikaĵoj ne aŭtomate ĝisdatigas. Restarigu mane por ĝisdatigi.",
-        "de": "Migrierte Apps werden nicht automatisch aktualisiert. Zum Aktualisieren manuell wiederherstellen.",
-        "ko": "마이그레이션된 앱은 자동 업데이트되지 않습니다. 업데이트하려면 수동으로 복원하세요.",
-        "tr": "Taşınan uygulamalar otomatik güncellenmez. Güncellemek için manuel olarak geri yükleyin.",
-        "vi": "Ứng dụng đã di chuyển không tự cập nhật. Khôi phục thủ công để cập nhật.",
-        "th": "แอปที่ย้ายแล้วจะไม่อัปเดตอัตโนมัติ กู้คืนด้วยตนเองเพื่ออัปเดต",
-        "nl": "Gemigreerde apps updaten niet automatisch. Herstel handmatig om te updaten.",
-        "pl": "Migrowane aplikacje nie aktualizują się automatycznie. Przywróć ręcznie, aby zaktualizować.",
-        "id": "Aplikasi yang dimigrasikan tidak dapat diperbarui otomatis. Pulihkan secara manual untuk memperbarui."
-    },
-    "允许迁移非原生应用": {
-        "en": "Allow Non-Native App Migration",
-        "zh-Hans": "允许迁移非原生应用",
-        "zh-Hant": "允許遷移非原生應用程式",
-        "hi": "गैर-मूल ऐप माइग्रेशन की अनुमति दें",
-        "es": "Permitir migración de apps no nativas",
-        "ar": "السماح بترحيل التطبيقات غير الأصلية",
-        "ru": "Разрешить миграцию не нативных приложений",
-        "pt": "Permitir migração de apps não nativos",
-        "fr": "Autoriser la migration d'apps non natives",
-        "it": "Consenti migrazione app non native",
-        "ja": "非ネイティブアプリの移行を許可",
-        "eo": "Permesi Migradon de Ne-Denaskaj Aplikaĵoj",
-        "de": "Migration von nicht-nativen Apps erlauben",
-        "ko": "비기본 앱 마이그레이션 허용",
-        "tr": "Yerel Olmayan Uygulama Taşımasına İzin Ver",
-        "vi": "Cho phép di chuyển ứng dụng không phải gốc",
-        "th": "อนุญาตให้ย้ายแอปที่ไม่ใช่แอปดั้งเดิม",
-        "nl": "Migratie van niet-native apps toestaan",
-        "pl": "Zezwalaj na migrację aplikacji nienatywnych",
-        "id": "Izinkan Migrasi Aplikasi Non-Nativa"
-    },
-    "启用后可以迁移来自 iPhone/iPad 的非原生 Mac 应用（使用整体链接）": {
-        "en": "Enable to migrate iPhone/iPad apps (using seamless linking)",
-        "zh-Hans": "启用后可以迁移来自 iPhone/iPad 的非原生 Mac 应用（使用整体链接）",
-        "zh-Hant": "啟用後可以遷移來自 iPhone/iPad 的非原生 Mac 應用程式（使用整體連結）",
-        "hi": "iPhone/iPad ऐप्स को माइग्रेट करने के लिए सक्षम करें (सीमलेस लिंकिंग का उपयोग करके)",
-        "es": "Habilite para migrar apps de iPhone/iPad (usando enlace perfecto)",
-        "ar": "قم بالتمكين لترحيل تطبيقات iPhone/iPad (باستخدام الربط السلس)",
-        "ru": "Включите для миграции приложений iPhone/iPad (с использованием бесшовной связи)",
-        "pt": "Ative para migrar apps de iPhone/iPad (usando vinculação perfeita)",
-        "fr": "Activez pour migrer les apps iPhone/iPad (liaison transparente)",
-        "it": "Abilita per migrare app iPhone/iPad (collegamento continuo)",
-        "ja": "有効にすると、iPhone/iPadアプリを移行できます（シームレスリンクを使用）",
-        "eo": "Ebligu por migri iPhone/iPad-aplikaĵojn (uzante senjuntan ligadon)",
-        "de": "Aktivieren, um iPhone/iPad-Apps zu migrieren (mit nahtloser Verknüpfung)",
-        "ko": "iPhone/iPad 앱을 마이그레이션하려면 활성화하세요 (원활한 연결 사용)",
-        "tr": "iPhone/iPad uygulamalarını taşımak için etkinleştirin (kesintisiz bağlantı kullanarak)",
-        "vi": "Bật để di chuyển ứng dụng iPhone/iPad (sử dụng liên kết liền mạch)",
-        "th": "เปิดใช้งานเพื่อย้ายแอป iPhone/iPad (ใช้การเชื่อมโยงที่ราบรื่น)",
-        "nl": "Schakel in om iPhone/iPad-apps te migreren (met naadloze koppeling)",
-        "pl": "Włącz, aby migrować aplikacje iPhone/iPad (używając płynnego łączenia)",
-        "id": "Aktifkan untuk memigrasikan aplikasi iPhone/iPad (menggunakan penautan mulus)"
-    },
-    "由于 iOS 应用结构限制，迁移后 Finder 图标会显示箭头（macOS 系统行为）": {
-        "en": "Due to iOS app structure, Finder icon will show an arrow after migration (macOS system behavior).",
-        "zh-Hans": "由于 iOS 应用结构限制，迁移后 Finder 图标会显示箭头（macOS 系统行为）",
-        "zh-Hant": "由於 iOS 應用程式結構限制，遷移後 Finder 圖示會顯示箭頭（macOS 系統行為）",
-        "hi": "iOS ऐप संरचना के कारण, माइग्रेशन के बाद फाइंडर आइकन एक तीर दिखाएगा (macOS सिस्टम व्यवहार)।",
-        "es": "Debido a la estructura de la app iOS, el icono del Finder mostrará una flecha (comportamiento del sistema macOS).",
-        "ar": "بسبب هيكل تطبيق iOS، سيظهر رمز Finder سهمًا بعد الترحيل (سلوك نظام macOS).",
-        "ru": "Из-за структуры приложения iOS значок Finder будет показывать стрелку (системное поведение macOS).",
-        "pt": "Devido à estrutura do app iOS, o ícone do Finder mostrará uma seta (comportamento do sistema macOS).",
-        "fr": "En raison de la structure de l'app iOS, l'icône du Finder affichera une flèche (comportement système macOS).",
-        "it": "A causa della struttura dell'app iOS, l'icona del Finder mostrerà una freccia (comportamento di sistema macOS).",
-        "ja": "iOSアプリの構造上、移行後のFinderアイコンには矢印が表示されます（macOSの仕様）。",
-        "eo": "Pro strukturo de iOS-aplikaĵo, Finder-ikono montros sagon post migrado (sisteme konduto de macOS).",
-        "de": "Aufgrund der iOS-App-Struktur zeigt das Finder-Symbol nach der Migration einen Pfeil (macOS-Systemverhalten).",
-        "ko": "iOS 앱 구조로 인해 마이그레이션 후 Finder 아이콘에 화살표가 표시됩니다(macOS 시스템 동작).",
-        "tr": "iOS uygulama yapısı nedeniyle, Finder simgesi taşıma işleminden sonra bir ok gösterecektir (macOS sistem davranışı).",
-        "vi": "Do cấu trúc ứng dụng iOS, biểu tượng Finder sẽ hiển thị mũi tên sau khi di chuyển (hành vi hệ thống macOS).",
-        "th": "เนื่องจากโครงสร้างแอป iOS ไอคอน Finder จะแสดงลูกศรหลังจากย้าย (พฤติกรรมของระบบ macOS)",
-        "nl": "Vanwege de structuur van iOS-apps toont het Finder-pictogram een pijl na migratie (macOS-systeemgedrag).",
-        "pl": "Ze względu na strukturę aplikacji iOS, ikona Findera pokaże strzałkę po migracji (zachowanie systemu macOS).",
-        "id": "Karena struktur aplikasi iOS, ikon Finder akan menampilkan panah setelah migrasi (perilaku sistem macOS)."
-    },
-    "管理应用运行日志和诊断信息": {
-        "en": "Manage app logs and diagnostics.",
-        "zh-Hans": "管理应用运行日志和诊断信息",
-        "zh-Hant": "管理應用程式執行日誌和診斷資訊",
-        "hi": "ऐप लॉग और निदान प्रबंधित करें।",
-        "es": "Administrar registros y diagnósticos de la app.",
-        "ar": "إدارة سجلات التطبيق والتشخيصات.",
-        "ru": "Управление журналами и диагностикой.",
-        "pt": "Gerenciar logs e diagnósticos do app.",
-        "fr": "Gérer les journaux et diagnostics de l'app.",
-        "it": "Gestisci log e diagnostica dell'app.",
-        "ja": "アプリのログと診断情報を管理します。",
-        "eo": "Administri aplikaĵajn protokolojn kaj diagnozojn.",
-        "de": "App-Protokolle und Diagnosen verwalten.",
-        "ko": "앱 로그 및 진단을 관리합니다.",
-        "tr": "Uygulama günlüklerini ve tanılamayı yönetin.",
-        "vi": "Quản lý nhật ký và chẩn đoán ứng dụng.",
-        "th": "จัดการบันทึกและการวินิจฉัยแอป",
-        "nl": "Beheer app-logs en diagnostiek.",
-        "pl": "Zarządzaj dziennikami i diagnostyką aplikacji.",
-        "id": "Kelola log dan diagnostik aplikasi."
-    },
-
-    "日志设置": {
-        "en": "Log Settings", "zh-Hans": "日志设置", "zh-Hant": "日誌設定",
-        "hi": "लॉग सेटिंग्स", "es": "Configuración de registro", "ar": "إعدادات السجل", "ru": "Настройки журнала",
-        "pt": "Configurações de Log", "fr": "Paramètres du journal", "it": "Impostazioni log", "ja": "ログ設定",
-        "eo": "Protokolaj Agordoj", "de": "Protokolleinstellungen", "ko": "로그 설정", "tr": "Günlük Ayarları",
-        "vi": "Cài đặt nhật ký", "th": "การตั้งค่าบันทึก", "nl": "Loginstellingen", "pl": "Ustawienia dziennika", "id": "Pengaturan Log"
-    },
-    "启用日志记录": {
-        "en": "Enable Logging", "zh-Hans": "启用日志记录", "zh-Hant": "啟用日誌記錄",
-        "hi": "लॉगिंग सक्षम करें", "es": "Habilitar registro", "ar": "تمكين التسجيل", "ru": "Включить журналирование",
-        "pt": "Habilitar Log", "fr": "Activer la journalisation", "it": "Abilita registrazione", "ja": "ログ記録を有効にする",
-        "eo": "Ebligi Protokoladon", "de": "Protokollierung aktivieren", "ko": "로깅 활성화", "tr": "Günlüğe Kaydetmeyi Etkinleştir",
-        "vi": "Bật ghi nhật ký", "th": "เปิดใช้งานการบันทึก", "nl": "Loggen inschakelen", "pl": "Włącz logowanie", "id": "Aktifkan Pencatatan"
-    },
-    "最大日志大小": {
-        "en": "Max Log Size", "zh-Hans": "最大日志大小", "zh-Hant": "最大日誌大小",
-        "hi": "अधिकतम लॉग आकार", "es": "Tamaño máx. de registro", "ar": "أقصى حجم للسجل", "ru": "Макс. размер журнала",
-        "pt": "Tamanho máx. do log", "fr": "Taille max du journal", "it": "Dim. max log", "ja": "最大ログサイズ",
-        "eo": "Maksimuma Protokola Grandeco", "de": "Max. Protokollgröße", "ko": "최대 로그 크기", "tr": "Maks. Günlük Boyutu",
-        "vi": "Kích thước nhật ký tối đa", "th": "ขนาดบันทึกสูงสุด", "nl": "Max. loggrootte", "pl": "Maks. rozmiar dziennika", "id": "Ukuran Log Maks"
-    },
-    "在 Finder 中查看": {
-        "en": "View in Finder", "zh-Hans": "在 Finder 中查看", "zh-Hant": "在 Finder 中查看",
-        "hi": "Finder में देखें", "es": "Ver en Finder", "ar": "عرض في Finder", "ru": "Посмотреть в Finder",
-        "pt": "Ver no Finder", "fr": "Voir dans le Finder", "it": "Vedi nel Finder", "ja": "Finderで表示",
-        "eo": "Vidi en Finder", "de": "Im Finder anzeigen", "ko": "Finder에서 보기", "tr": "Finder'da Görüntüle",
-        "vi": "Xem trong Finder", "th": "ดูใน Finder", "nl": "Bekijk in Finder", "pl": "Zobacz w Finderze", "id": "Lihat di Finder"
-    },
-    "更改设置后，请刷新应用列表以查看效果": {
-        "en": "Please refresh the app list after changing settings.",
-        "zh-Hans": "更改设置后，请刷新应用列表以查看效果",
-        "zh-Hant": "更改設定後，請重新整理應用程式列表以查看效果",
-        "hi": "सेटिंग्स बदलने के बाद कृपया ऐप सूची को ताज़ा करें।",
-        "es": "Actualice la lista de apps después de cambiar la configuración.",
-        "ar": "يرجى تحديث قائمة التطبيقات بعد تغيير الإعدادات.",
-        "ru": "Пожалуйста, обновите список приложений после изменения настроек.",
-        "pt": "Atualize a lista de apps após alterar as configurações.",
-        "fr": "Veuillez actualiser la liste des apps après avoir modifié les paramètres.",
-        "it": "Aggiorna l'elenco delle app dopo aver modificato le impostazioni.",
-        "ja": "設定変更後、アプリリストを更新してください。",
-        "eo": "Bonvolu refreŝigi la aplikaĵan liston post ŝanĝo de agordoj.",
-        "de": "Bitte aktualisieren Sie die App-Liste nach Änderung der Einstellungen.",
-        "ko": "설정을 변경한 후 앱 목록을 새로 고치십시오.",
-        "tr": "Ayarları değiştirdikten sonra lütfen uygulama listesini yenileyin.",
-        "vi": "Vui lòng làm mới danh sách ứng dụng sau khi thay đổi cài đặt.",
-        "th": "โปรดรีเฟรชรายการแอปหลังจากเปลี่ยนการตั้งค่า",
-        "nl": "Vernieuw de app-lijst na het wijzigen van instellingen.",
-        "pl": "Odśwież listę aplikacji po zmianie ustawień.",
-        "id": "Harap segarkan daftar aplikasi setelah mengubah pengaturan."
-    },
-    "部分链接": {
-        "en": "Partially Linked", "zh-Hans": "部分链接", "zh-Hant": "部分連結",
-        "hi": "आंशिक रूप से लिंक किया गया", "es": "Parcialmente enlazado", "ar": "مرتبط جزئيا", "ru": "Частично связано",
-        "pt": "Parcialmente vinculado", "fr": "Partiellement lié", "it": "Parzialmente collegato", "ja": "部分的にリンク",
-        "eo": "Parte Ligita", "de": "Teilweise verknüpft", "ko": "부분적으로 연결됨", "tr": "Kısmen Bağlı",
-        "vi": "Liên kết một phần", "th": "เชื่อมโยงบางส่วน", "nl": "Gedeeltelijk gekoppeld", "pl": "Częściowo połączone", "id": "Tautan Sebagian"
-    },
-    "非原生": {
-        "en": "Non-Native", "zh-Hans": "非原生", "zh-Hant": "非原生",
-        "hi": "गैर-मूल", "es": "No nativo", "ar": "غير أصلي", "ru": "Не нативный",
-        "pt": "Não nativo", "fr": "Non natif", "it": "Non nativo", "ja": "非ネイティブ",
-        "eo": "Ne-Denaska", "de": "Nicht-nativ", "ko": "비기본", "tr": "Yerel Olmayan",
-        "vi": "Không phải gốc", "th": "ไม่ใช่แอปดั้งเดิม", "nl": "Niet-native", "pl": "Nienatywny", "id": "Non-Nativa"
-    },
-    "商店": {
-        "en": "Store", "zh-Hans": "商店", "zh-Hant": "商店",
-        "hi": "स्टोर", "es": "Tienda", "ar": "متجر", "ru": "Магазин",
-        "pt": "Loja", "fr": "Store", "it": "Store", "ja": "ストア",
-        "eo": "Vendejo", "de": "Store", "ko": "스토어", "tr": "Mağaza",
-        "vi": "Cửa hàng", "th": "ร้านค้า", "nl": "Store", "pl": "Sklep", "id": "Toko"
-    },
-    "选中的 %lld 个应用均来自 App Store，迁移时会使用 Finder 删除，您会听到垃圾桶的声音。\n\n这是正常的，应用会被安全地移动到外部存储。": {
-        "en": "All %lld selected apps are from App Store. They will be deleted via Finder during migration (you'll hear a trash sound).\n\nThis is normal, apps are safely moved to external drive.",
-        "zh-Hans": "选中的 %lld 个应用均来自 App Store，迁移时会使用 Finder 删除，您会听到垃圾桶的声音。\n\n这是正常的，应用会被安全地移动到外部存储。",
-        "zh-Hant": "選中的 %lld 個應用程式均來自 App Store，遷移時會使用 Finder 刪除，您會聽到垃圾桶的聲音。\n\n這是正常的，應用程式會被安全地移動到外部儲存。",
-        "hi": "सभी %lld चयनित ऐप्स ऐप स्टोर से हैं। माइग्रेशन के दौरान उन्हें फाइंडर के माध्यम से हटा दिया जाएगा (आपको कचरे की आवाज़ सुनाई देगी)।\n\nयह सामान्य है, ऐप्स सुरक्षित रूप से बाहरी ड्राइव में ले जाए जाते हैं।",
-        "es": "Las %lld apps seleccionadas son de App Store. Se eliminarán mediante Finder durante la migración (oirá un sonido de papelera).\n\nEsto es normal, las apps se mueven de forma segura.",
-        "ar": "جميع التطبيقات المحددة البالغ عددها %lld هي من App Store. سيتم حذفها عبر Finder أثناء الترحيل (ستسمع صوت سلة المهملات).\n\nهذا طبيعي، يتم نقل التطبيقات بأمان.",
-        "ru": "Все %lld выбранных приложений из App Store. Они будут удалены через Finder (вы услышите звук корзины).\n\nЭто нормально, приложения перемещаются на внешний диск.",
-        "pt": "Todos os %lld apps selecionados são da App Store. Serão excluídos via Finder durante a migração (som de lixo).\n\nIsso é normal, apps são movidos com segurança.",
-        "fr": "Les %lld apps sélectionnées proviennent de l'App Store. Elles seront supprimées via le Finder (son de corbeille).\n\nC'est normal, les apps sont déplacées en toute sécurité.",
-        "it": "Tutte le %lld app selezionate provengono dall'App Store. Verranno eliminate tramite Finder (sentirai un suono).\n\nÈ normale, le app vengono spostate in sicurezza.",
-        "ja": "選択された %lld 個のアプリはすべてApp Storeからのものです。移行中にFinder経由で削除されます（ゴミ箱の音がします）。\n\nこれは正常であり、アプリは安全に外部ドライブに移動されます。",
-        "eo": "Ĉiuj %lld elektitaj aplikaĵoj estas de App Store. Ili estos forigitaj per Finder dum migrado (vi aŭdos rubsonon).\n\nĈi tio estas normala, aplikaĵoj estas sekure movitaj.",
-        "de": "Alle %lld ausgewählten Apps stammen aus dem App Store. Sie werden während der Migration über den Finder gelöscht (Papierkorb-Geräusch).\n\nDas ist normal, Apps werden sicher verschoben.",
-        "ko": "선택된 %lld개 앱 모두 App Store 앱입니다. 마이그레이션 중 Finder를 통해 삭제됩니다(휴지통 소리가 들림).\n\n이는 정상이며 앱은 안전하게 이동됩니다.",
-        "tr": "Seçilen %lld uygulamanın tümü App Store'dandır. Taşıma sırasında Finder aracılığıyla silineceklerdir (çöp kutusu sesi duyacaksınız).\n\nBu normaldir.",
-        "vi": "Tất cả %lld ứng dụng đã chọn đều từ App Store. Chúng sẽ bị xóa qua Finder trong quá trình di chuyển (bạn sẽ nghe thấy tiếng rác).\n\nĐiều này là bình thường.",
-        "th": "แอปที่เลือกทั้งหมด %lld แอปมาจาก App Store จะถูกลบผ่าน Finder ระหว่างการย้าย (คุณจะได้ยินเสียงถังขยะ)\n\nนี่เป็นเรื่องปกติ แอปจะถูกย้ายอย่างปลอดภัย",
-        "nl": "Alle %lld geselecteerde apps komen uit de App Store. Ze worden verwijderd via Finder tijdens migratie (u hoort een prullenbakgeluid).\n\nDit is normaal.",
-        "pl": "Wszystkie wybrane aplikacje (%lld) pochodzą z App Store. Zostaną usunięte przez Finder podczas migracji (usłyszysz dźwięk kosza).\n\nTo normalne.",
-        "id": "Semua %lld aplikasi yang dipilih berasal dari App Store. Mereka akan dihapus melalui Finder selama migrasi (Anda akan mendengar suara sampah).\n\nIni normal."
-    },
-    "选中的 %lld 个应用包含 %lld 个 App Store 应用，迁移时会使用 Finder 删除，您会听到垃圾桶的声音。\n\n这是正常的，应用会被安全地移动到外部存储。": {
-        "en": "Selected %lld apps include %lld App Store apps. They will be deleted via Finder (trash sound).\n\nThis is normal, apps are safely moved.",
-        "zh-Hans": "选中的 %lld 个应用包含 %lld 个 App Store 应用，迁移时会使用 Finder 删除，您会听到垃圾桶的声音。\n\n这是正常的，应用会被安全地移动到外部存储。",
-        "id": "Dipilih %lld aplikasi termasuk %lld aplikasi App Store. Mereka akan dihapus melalui Finder.\n\nIni normal."
-    },
-    
-    # --- Data Directory Terms ---
-    "npm 缓存": {"en": "npm Cache", "zh-Hans": "npm 缓存", "zh-Hant": "npm 快取"},
-    "Node.js 包管理器本地缓存": {"en": "Node.js package manager local cache", "zh-Hans": "Node.js 包管理器本地缓存", "zh-Hant": "Node.js 套件管理員本地快取"},
-    "Maven 仓库": {"en": "Maven Repository", "zh-Hans": "Maven 仓库", "zh-Hant": "Maven 倉庫"},
-    "Java Maven 依赖仓库": {"en": "Java Maven dependency repository", "zh-Hans": "Java Maven 依赖仓库", "zh-Hant": "Java Maven 依賴倉庫"},
-    "Bun 运行时": {"en": "Bun Runtime", "zh-Hans": "Bun 运行时", "zh-Hant": "Bun 執行階段"},
-    "Bun JavaScript 运行时及缓存": {"en": "Bun JavaScript runtime and cache", "zh-Hans": "Bun JavaScript 运行时及缓存", "zh-Hant": "Bun JavaScript 執行階段及快取"},
-    "Conda 环境": {"en": "Conda Environments", "zh-Hans": "Conda 环境", "zh-Hant": "Conda 環境"},
-    "Anaconda/Miniconda 环境数据": {"en": "Anaconda/Miniconda environment data", "zh-Hans": "Anaconda/Miniconda 环境数据", "zh-Hant": "Anaconda/Miniconda 環境資料"},
-    "Nexus 数据": {"en": "Nexus Data", "zh-Hans": "Nexus 数据", "zh-Hant": "Nexus 資料"},
-    "Nexus 代理缓存": {"en": "Nexus proxy cache", "zh-Hans": "Nexus 代理缓存", "zh-Hant": "Nexus 代理快取"},
-    "Composer 包": {"en": "Composer Packages", "zh-Hans": "Composer 包", "zh-Hant": "Composer 套件"},
-    "PHP Composer 全局包": {"en": "PHP Composer global packages", "zh-Hans": "PHP Composer 全局包", "zh-Hant": "PHP Composer 全域套件"},
-    "Ollama 模型": {"en": "Ollama Models", "zh-Hans": "Ollama 模型", "zh-Hant": "Ollama 模型"},
-    "Ollama 本地大语言模型存储": {"en": "Ollama local LLM storage", "zh-Hans": "Ollama 本地大语言模型存储", "zh-Hant": "Ollama 本地大語言模型儲存"},
-    "PyTorch 模型缓存": {"en": "PyTorch Model Cache", "zh-Hans": "PyTorch 模型缓存", "zh-Hant": "PyTorch 模型快取"},
-    "PyTorch 预训练模型权重缓存": {"en": "PyTorch pre-trained model weight cache", "zh-Hans": "PyTorch 预训练模型权重缓存", "zh-Hant": "PyTorch 預訓練模型權重快取"},
-    "Whisper 语音模型": {"en": "Whisper Voice Models", "zh-Hans": "Whisper 语音模型", "zh-Hant": "Whisper 語音模型"},
-    "OpenAI Whisper 语音识别模型": {"en": "OpenAI Whisper speech recognition model", "zh-Hans": "OpenAI Whisper 语音识别模型", "zh-Hant": "OpenAI Whisper 語音辨識模型"},
-    "Keras 数据": {"en": "Keras Data", "zh-Hans": "Keras 数据", "zh-Hant": "Keras 資料"},
-    "Keras 模型和数据集": {"en": "Keras models and datasets", "zh-Hans": "Keras 模型和数据集", "zh-Hant": "Keras 模型和資料集"},
-    "灵码 (Lingma) 数据": {"en": "Lingma Data", "zh-Hans": "灵码 (Lingma) 数据", "zh-Hant": "靈碼 (Lingma) 資料"},
-    "阿里云灵码 AI 编程助手数据": {"en": "Alibaba Cloud Lingma AI coding assistant data", "zh-Hans": "阿里云灵码 AI 编程助手数据", "zh-Hant": "阿里雲靈碼 AI 編程助手資料"},
-    "Trae IDE 数据": {"en": "Trae IDE Data", "zh-Hans": "Trae IDE 数据", "zh-Hant": "Trae IDE 資料"},
-    "字节跳动 Trae IDE 运行数据": {"en": "ByteDance Trae IDE runtime data", "zh-Hans": "字节跳动 Trae IDE 运行数据", "zh-Hant": "字節跳動 Trae IDE 執行資料"},
-    "Trae CN 数据": {"en": "Trae CN Data", "zh-Hans": "Trae CN 数据", "zh-Hant": "Trae CN 資料"},
-    "字节跳动 Trae IDE 国内版数据": {"en": "ByteDance Trae IDE China version data", "zh-Hans": "字节跳动 Trae IDE 国内版数据", "zh-Hant": "字節跳動 Trae IDE 國內版資料"},
-    "Trae AICC 数据": {"en": "Trae AICC Data", "zh-Hans": "Trae AICC 数据", "zh-Hant": "Trae AICC 資料"},
-    "字节跳动 Trae AICC 数据": {"en": "ByteDance Trae AICC data", "zh-Hans": "字节跳动 Trae AICC 数据", "zh-Hant": "字節跳動 Trae AICC 資料"},
-    "MarsCode 数据": {"en": "MarsCode Data", "zh-Hans": "MarsCode 数据", "zh-Hant": "MarsCode 資料"},
-    "字节跳动 MarsCode IDE 数据": {"en": "ByteDance MarsCode IDE data", "zh-Hans": "字节跳动 MarsCode IDE 数据", "zh-Hant": "字節跳動 MarsCode IDE 資料"},
-    "CodeBuddy 数据": {"en": "CodeBuddy Data", "zh-Hans": "CodeBuddy 数据", "zh-Hant": "CodeBuddy 資料"},
-    "腾讯 CodeBuddy AI 助手数据": {"en": "Tencent CodeBuddy AI assistant data", "zh-Hans": "腾讯 CodeBuddy AI 助手数据", "zh-Hant": "騰訊 CodeBuddy AI 助手資料"},
-    "CodeBuddy CN 数据": {"en": "CodeBuddy CN Data", "zh-Hans": "CodeBuddy CN 数据", "zh-Hant": "CodeBuddy CN 資料"},
-    "腾讯 CodeBuddy 国内版 data": {"en": "Tencent CodeBuddy China version data", "zh-Hans": "腾讯 CodeBuddy 国内版数据", "zh-Hant": "騰訊 CodeBuddy 國內版資料"},
-    "Qwen 数据": {"en": "Qwen Data", "zh-Hans": "Qwen 数据", "zh-Hant": "Qwen 資料"},
-    "阿里通义千问相关数据": {"en": "Alibaba Qwen related data", "zh-Hans": "阿里通义千问相关数据", "zh-Hant": "阿里通義千問相關資料"},
-    "ClawBOT 数据": {"en": "ClawBOT Data", "zh-Hans": "ClawBOT 数据", "zh-Hant": "ClawBOT 資料"},
-    "ClawdBOT AI 工具数据": {"en": "ClawdBOT AI tool data", "zh-Hans": "ClawdBOT AI 工具数据", "zh-Hant": "ClawdBOT AI 工具資料"},
-    "Selenium 浏览器": {"en": "Selenium Browsers", "zh-Hans": "Selenium 浏览器", "zh-Hant": "Selenium 瀏覽器"},
-    "Selenium 自动下载的浏览器驱动": {"en": "Selenium auto-downloaded browser drivers", "zh-Hans": "Selenium 自动下载的浏览器驱动", "zh-Hant": "Selenium 自動下載的瀏覽器驅動"},
-    "Chromium 快照": {"en": "Chromium Snapshots", "zh-Hans": "Chromium 快照", "zh-Hant": "Chromium 快照"},
-    "Playwright/Selenium 使用的 Chromium 浏览器快照": {"en": "Chromium browser snapshots used by Playwright/Selenium", "zh-Hans": "Playwright/Selenium 使用的 Chromium 浏览器快照", "zh-Hant": "Playwright/Selenium 使用的 Chromium 瀏覽器快照"},
-    "WDM 浏览器驱动": {"en": "WDM Browser Drivers", "zh-Hans": "WDM 浏览器驱动", "zh-Hant": "WDM 瀏覽器驅動"},
-    "WebDriver Manager 下载的驱动程序": {"en": "Drivers downloaded by WebDriver Manager", "zh-Hans": "WebDriver Manager 下载的驱动程序", "zh-Hant": "WebDriver Manager 下載的驅動程式"},
-    "VSCode 数据": {"en": "VSCode Data", "zh-Hans": "VSCode 数据", "zh-Hant": "VSCode 資料"},
-    "Visual Studio Code 扩展及配置": {"en": "Visual Studio Code extensions and configurations", "zh-Hans": "Visual Studio Code 扩展及配置", "zh-Hant": "Visual Studio Code 擴充功能及設定"},
-    "Cursor 数据": {"en": "Cursor Data", "zh-Hans": "Cursor 数据", "zh-Hant": "Cursor 資料"},
-    "Cursor AI 编辑器数据": {"en": "Cursor AI editor data", "zh-Hans": "Cursor AI 编辑器数据", "zh-Hant": "Cursor AI 編輯器資料"},
-    "STS4 数据": {"en": "STS4 Data", "zh-Hans": "STS4 数据", "zh-Hant": "STS4 資料"},
-    "Spring Tool Suite 4 数据": {"en": "Spring Tool Suite 4 data", "zh-Hans": "Spring Tool Suite 4 数据", "zh-Hant": "Spring Tool Suite 4 資料"},
-    "Docker CLI 配置": {"en": "Docker CLI Config", "zh-Hans": "Docker CLI 配置", "zh-Hant": "Docker CLI 設定"},
-    "Docker Desktop CLI 配置和上下文": {"en": "Docker Desktop CLI config and contexts", "zh-Hans": "Docker Desktop CLI 配置和上下文", "zh-Hant": "Docker Desktop CLI 設定和上下文"},
-    "OpenClaw 数据": {"en": "OpenClaw Data", "zh-Hans": "OpenClaw 数据", "zh-Hant": "OpenClaw 資料"},
-    "OpenClaw 工具数据": {"en": "OpenClaw tool data", "zh-Hans": "OpenClaw 工具数据", "zh-Hant": "OpenClaw 工具資料"},
-    "Python NLTK 数据": {"en": "Python NLTK Data", "zh-Hans": "Python NLTK 数据", "zh-Hant": "Python NLTK 資料"},
-    "自然语言处理 NLTK 语料库": {"en": "NLP NLTK corpora", "zh-Hans": "自然语言处理 NLTK 语料库", "zh-Hant": "自然語言處理 NLTK 語料庫"},
-    ".local (系统工具)": {"en": ".local (System Tools)", "zh-Hans": ".local (系统工具)", "zh-Hant": ".local (系統工具)"},
-    "Python pip 等工具的用户级安装目录，内部结构复杂": {"en": "User-level installation directory for tools like Python pip, complex internal structure", "zh-Hans": "Python pip 等工具的用户级安装目录，内部结构复杂", "zh-Hant": "Python pip 等工具的用戶級安裝目錄，內部結構複雜"},
-    ".config (工具配置)": {"en": ".config (Tool Config)", "zh-Hans": ".config (工具配置)", "zh-Hant": ".config (工具設定)"},
-    "多个命令行工具的配置目录，包含硬编码路径": {"en": "Configuration directory for multiple CLI tools, contains hardcoded paths", "zh-Hans": "多个命令行工具的配置目录，包含硬编码路径", "zh-Hant": "多個命令列工具的設定目錄，包含硬編碼路徑"},
-    "应用核心数据 (设置、数据库等)": {"en": "App core data (Settings, Databases, etc.)", "zh-Hans": "应用核心数据 (设置、数据库等)", "zh-Hant": "應用程式核心資料 (設定、資料庫等)"},
-    "沙盒容器数据 (App Store 应用)": {"en": "Sandbox container data (App Store apps)", "zh-Hans": "沙盒容器数据 (App Store 应用)", "zh-Hant": "沙盒容器資料 (App Store 應用程式)"},
-    "应用组共享数据": {"en": "App group shared data", "zh-Hans": "应用组共享数据", "zh-Hant": "應用程式組共享資料"},
-    "应用缓存 (可重建)": {"en": "App cache (rebuildable)", "zh-Hans": "应用缓存 (可重建)", "zh-Hant": "應用程式快取 (可重建)"},
-    "窗口状态恢复数据": {"en": "Saved application state data", "zh-Hans": "窗口状态恢复数据", "zh-Hant": "視窗狀態恢復資料"},
-    "本地": {"en": "Local", "zh-Hans": "本地", "zh-Hant": "本地"},
-    "已链接": {"en": "Linked", "zh-Hans": "已链接", "zh-Hant": "已連結"},
-    "未找到": {"en": "Not Found", "zh-Hans": "未找到", "zh-Hant": "未找到"},
-    "工具目录": {"en": "Tool Directories", "zh-Hans": "工具目录", "zh-Hant": "工具目錄"},
-    "应用数据": {"en": "App Data", "zh-Hans": "应用数据", "zh-Hant": "應用程式資料"},
-    "未发现已知工具目录": {"en": "No known tool directories found", "zh-Hans": "未发现已知工具目录", "zh-Hant": "未發現已知工具目錄"},
-    "选择应用": {"en": "Select App", "zh-Hans": "选择应用", "zh-Hant": "選擇應用程式"},
-    "无本地应用": {"en": "No local apps", "zh-Hans": "无本地应用", "zh-Hant": "無本地應用程式"},
-    "%@ 的数据目录": {"en": "%@'s Data Directory", "zh-Hans": "%@ 的数据目录", "zh-Hant": "%@ 的資料目錄"},
-    "请从左侧选择应用": {"en": "Please select an app from the left", "zh-Hans": "请从左侧选择应用", "zh-Hant": "請從左側選擇應用程式"},
-    "从左侧选择一个应用": {"en": "Select an app from the left", "zh-Hans": "从左侧选择一个应用", "zh-Hant": "從左側選擇一個應用程式"},
-    "未找到关联数据目录": {"en": "No associated data directory found", "zh-Hans": "未找到关联数据目录", "zh-Hant": "未找到關聯資料目錄"},
-    "请先在「应用」页面选择外部存储路径": {"en": "Please select external drive path on Applications page first", "zh-Hans": "请先在「应用」页面选择外部存储路径", "zh-Hant": "請先在「應用程式」頁面選擇外部儲存路徑"},
-    "去选择": {"en": "Go select", "zh-Hans": "去选择", "zh-Hant": "前往選擇"},
-    "%lld 个目录": {"en": "%lld Directories", "zh-Hans": "%lld 个目录", "zh-Hant": "%lld 個目錄"},
-    " 可释放": {"en": " freeable", "zh-Hans": " 可释放", "zh-Hant": " 可釋放"},
-    "%lld 个已链接": {"en": "%lld Linked", "zh-Hans": "%lld 个已链接", "zh-Hant": "%lld 個已連結"},
-    "扫描中...": {"en": "Scanning...", "zh-Hans": "扫描中...", "zh-Hant": "掃描中..."},
-    "迁移数据目录": {"en": "Migrate Data Directory", "zh-Hans": "迁移数据目录", "zh-Hant": "遷移資料目錄"},
-    "还原数据目录": {"en": "Restore Data Directory", "zh-Hans": "还原数据目录", "zh-Hant": "還原資料目錄"},
-    "此目录不支持迁移": {"en": "This directory does not support migration", "zh-Hans": "此目录不支持迁移", "zh-Hant": "此目錄不支援遷移"},
-    "迁移": {"en": "Migrate", "zh-Hans": "迁移", "zh-Hant": "遷移"},
-    "还原": {"en": "Restore", "zh-Hans": "还原", "zh-Hant": "還原"},
-    "将数据目录还原到本地": {"en": "Restore data directory to local", "zh-Hans": "将数据目录还原到本地", "zh-Hant": "將資料目錄還原到本地"},
-    "将数据目录迁移到外部存储": {"en": "Migrate data directory to external storage", "zh-Hans": "将数据目录迁移到外部存储", "zh-Hant": "將資料目錄遷移到外部存儲"},
-    "重要": {"en": "Critical", "zh-Hans": "重要", "zh-Hant": "重要"},
-    "推荐": {"en": "Recommended", "zh-Hans": "推荐", "zh-Hant": "推薦"},
-    "可选": {"en": "Optional", "zh-Hans": "可选", "zh-Hant": "可選"},
-    "自定义": {"en": "Custom", "zh-Hans": "自定义", "zh-Hant": "自定義"},
-    "Application Support": {"en": "Application Support", "zh-Hans": "Application Support", "zh-Hant": "Application Support"},
-    "Containers": {"en": "Containers", "zh-Hans": "Containers", "zh-Hant": "Containers"},
-    "Group Containers": {"en": "Group Containers", "zh-Hans": "Group Containers", "zh-Hant": "Group Containers"},
-    "Caches": {"en": "Caches", "zh-Hans": "Caches", "zh-Hant": "Caches"},
-    "Saved State": {"en": "Saved State", "zh-Hans": "Saved State", "zh-Hant": "Saved State"},
-    "将「%@」迁移到外部存储": {"en": "Migrate \"%@\" to external storage", "zh-Hans": "将「%@」迁移到外部存储", "zh-Hant": "將「%@」遷移到外部存儲"},
-    "将「%@」从外部存储还原到本地": {"en": "Restore \"%@\" from external storage to local", "zh-Hans": "将「%@」从外部存储还原到本地", "zh-Hant": "將「%@」從外部存儲還原到本地"},
-    "正在迁移「%@」": {"en": "Migrating \"%@\"", "zh-Hans": "正在迁移「%@」", "zh-Hant": "正在遷移「%@」"},
-    "正在还原「%@」": {"en": "Restoring \"%@\"", "zh-Hans": "正在还原「%@」", "zh-Hant": "正在還原「%@」"},
-    "操作失败": {"en": "Operation Failed", "zh-Hans": "操作失败", "zh-Hant": "操作失敗"},
-    "扫描关联目录中...": {"en": "Scanning associated directories...", "zh-Hans": "扫描关联目录中...", "zh-Hant": "掃描觀聯目錄中..."},
-    "未发现关联数据目录": {"en": "No associated data directory found", "zh-Hans": "未发现关联数据目录", "zh-Hant": "未發現關聯資料目錄"},
-    "迁移完成后，原路径将自动变成符号链接，相关工具无需任何修改即可继续使用。": {
-        "en": "After migration, the original path will automatically become a symbolic link, and related tools can continue to be used without any modification.",
-        "zh-Hans": "迁移完成后，原路径将自动变成符号链接，相关工具无需任何修改即可继续使用。",
-        "zh-Hant": "遷移完成後，原路徑將自動變成符號連結，相關工具無需任何修改即可繼續使用。"
-    },
-    "还原完成后，外部存储中的副本将被删除。": {
-        "en": "After restoration, the copy in external storage will be deleted.",
-        "zh-Hans": "还原完成后，外部存储中的副本将被删除。",
-        "zh-Hant": "還原完成後，外部存儲中的副本將被刪除。"
-    },
-    
-    # --- Hardware Terms ---
-    "设备速率": {"en": "Device Speed", "zh-Hans": "设备速率", "zh-Hant": "設備速率"},
-    "总线速率": {"en": "Bus Speed", "zh-Hans": "总线速率", "zh-Hant": "總線速率"},
-    "链接速率": {"en": "Link Speed", "zh-Hans": "链接速率", "zh-Hant": "連結速率"},
-    "链接带宽": {"en": "Link Bandwidth", "zh-Hans": "链接带宽", "zh-Hant": "連結頻寬"},
-    "链接宽度": {"en": "Link Width", "zh-Hans": "链接宽度", "zh-Hant": "連結寬度"},
-    "连接类型": {"en": "Connection Type", "zh-Hans": "连接类型", "zh-Hant": "連接類型"},
-    "卷名称": {"en": "Volume Name", "zh-Hans": "卷名称", "zh-Hant": "卷名稱"},
-    "总容量": {"en": "Total Capacity", "zh-Hans": "总容量", "zh-Hant": "總容量"},
-    "可用空间": {"en": "Available Space", "zh-Hans": "可用空间", "zh-Hant": "可用空間"},
-    "文件系统": {"en": "File System", "zh-Hans": "文件系统", "zh-Hant": "文件系統"},
-    "可移除": {"en": "Removable", "zh-Hans": "可移除", "zh-Hant": "可移除"},
-    "可弹出": {"en": "Ejectable", "zh-Hans": "可弹出", "zh-Hant": "可彈出"},
-    "是": {"en": "Yes", "zh-Hans": "是", "zh-Hant": "是"},
-    "否": {"en": "No", "zh-Hans": "否", "zh-Hant": "否"},
-    "设备位置": {"en": "Device Location", "zh-Hans": "设备位置", "zh-Hant": "設備位置"},
-    "设备名称": {"en": "Device Name", "zh-Hans": "设备名称", "zh-Hant": "設備名稱"},
-    "块大小": {"en": "Block Size", "zh-Hans": "块大小", "zh-Hant": "塊大小"},
-    "接口协议": {"en": "Interface Protocol", "zh-Hans": "接口协议", "zh-Hant": "接口協議"},
-    "卷 UUID": {"en": "Volume UUID", "zh-Hans": "卷 UUID", "zh-Hant": "卷 UUID"},
-    "未知": {"en": "Unknown", "zh-Hans": "未知", "zh-Hant": "未知"},
-    "耗时: %@ 秒": {"en": "Duration: %@ seconds", "zh-Hans": "耗时: %@ 秒", "zh-Hant": "耗時: %@ 秒"},
-    "速度: %@ MB/s": {"en": "Speed: %@ MB/s", "zh-Hans": "速度: %@ MB/s", "zh-Hant": "速度: %@ MB/s"},
-    "大小: %@": {"en": "Size: %@", "zh-Hans": "大小: %@", "zh-Hant": "大小: %@"},
-    "应用: %@": {"en": "App: %@", "zh-Hans": "应用: %@", "zh-Hant": "應用程式: %@"},
-    "接口速率": {"en": "Interface Rate", "zh-Hans": "接口速率", "zh-Hant": "介面速率"},
-    "未检测到或内置存储": {"en": "Not detected or internal storage", "zh-Hans": "未检测到或内置存储", "zh-Hant": "未檢測到或內建儲存"},
-    "========== 迁移性能报告 ==========": {"en": "========== Migration Performance Report ==========", "zh-Hans": "========== 迁移性能报告 ==========", "zh-Hant": "========== 遷移性能報告 =========="},
-    
-    # --- Critical UI Terms ---
-    "应用": {
-        "en": "Apps", "zh-Hans": "应用", "zh-Hant": "應用程式",
-        "ja": "アプリ", "ko": "앱", "de": "Apps", "fr": "Apps",
-        "es": "Apps", "it": "App", "pt": "Apps", "ru": "Приложения",
-        "ar": "التطبيقات", "hi": "ऐप्स", "tr": "Uygulamalar", "vi": "Ứng dụng",
-        "th": "แอป", "nl": "Apps", "pl": "Aplikacje", "id": "Aplikasi",
-        "eo": "Aplikaĵoj"
-    },
-    "数据目录": {
-        "en": "Data Directories", "zh-Hans": "数据目录", "zh-Hant": "資料目錄",
-        "ja": "データディレクトリ", "ko": "데이터 디렉토리", "de": "Datenverzeichnisse", "fr": "Répertoires de données",
-        "es": "Directorios de datos", "it": "Directory dati", "pt": "Diretórios de dados", "ru": "Каталоги данных",
-        "ar": "دلائل البيانات", "hi": "डेटा डायरेक्ट्री", "tr": "Veri Dizinleri", "vi": "Thư mục dữ liệu",
-        "th": "ไดเรกทอรีข้อมูล", "nl": "Gegevensmappen", "pl": "Katalogi danych", "id": "Direktori Data",
-        "eo": "Datumaj Dosierujoj"
-    },
-    "工具目录": {
-        "en": "Tool Directories", "zh-Hans": "工具目录", "zh-Hant": "工具目錄",
-        "ja": "ツールディレクトリ", "ko": "도구 디렉토리", "de": "Tool-Verzeichnisse", "fr": "Répertoires d'outils",
-        "es": "Directorios de herramientas", "it": "Directory strumenti", "pt": "Diretórios de ferramentas", "ru": "Каталоги инструментов",
-        "ar": "دلائل الأدوات", "hi": "टूल डायरेक्ट्री", "tr": "Araç Dizinleri", "vi": "Thư mục công cụ",
-        "th": "ไดเรกทอรีเครื่องมือ", "nl": "Hulpmiddelmappen", "pl": "Katalogi narzędzi", "id": "Direktori Alat",
-        "eo": "Ilaj Dosierujoj"
-    },
-    "继续": {
-        "en": "Continue", "zh-Hans": "继续", "zh-Hant": "繼續",
-        "ja": "続行", "ko": "계속", "de": "Weiter", "fr": "Continuer",
-        "es": "Continuar", "it": "Continua", "pt": "Continuar", "ru": "Продолжить",
-        "ar": "متابعة", "hi": "जारी रखें", "tr": "Devam", "vi": "Tiếp tục",
-        "th": "ดำเนินการต่อ", "nl": "Doorgaan", "pl": "Kontynuuj", "id": "Lanjutkan",
-        "eo": "Daŭrigi"
-    },
-    "App Store 应用迁移设置": {
-        "en": "App Store Migration Settings", "zh-Hans": "App Store 应用迁移设置", "zh-Hant": "App Store 應用程式遷移設定",
-        "ja": "App Store アプリ移行設定", "ko": "App Store 앱 마이그레이션 설정", "de": "App Store Migrationseinstellungen",
-        "fr": "Paramètres de migration App Store", "es": "Ajustes de migración App Store",
-        "it": "Impostazioni migrazione App Store", "pt": "Configurações de migração da App Store",
-        "ru": "Настройки миграции App Store", "ar": "إعدادات نقل App Store",
-        "hi": "App Store माइग्रेशन सेटिंग्स", "tr": "App Store Taşıma Ayarları",
-        "vi": "Cài đặt di chuyển App Store", "th": "ตั้งค่าการย้าย App Store",
-        "nl": "App Store-migratie-instellingen", "pl": "Ustawienia migracji App Store",
-        "id": "Pengaturan Migrasi App Store", "eo": "App Store Migraj Agordoj"
-    },
-    "外部": {
-        "en": "External", "zh-Hans": "外部", "zh-Hant": "外部",
-        "ja": "外部", "ko": "외부", "de": "Extern", "fr": "Externe",
-        "es": "Externo", "it": "Esterno", "pt": "Externo", "ru": "Внешний",
-        "ar": "خارجي", "hi": "बाहरी", "tr": "Harici", "vi": "Bên ngoài",
-        "th": "ภายนอก", "nl": "Extern", "pl": "Zewnętrzny", "id": "Eksternal", "eo": "Ekstera"
-    },
-    "项目贡献者": {
-        "en": "Project Contributors", "zh-Hans": "项目贡献者", "zh-Hant": "專案貢獻者",
-        "ja": "プロジェクト貢献者", "ko": "프로젝트 기여자", "de": "Projektmitwirkende",
-        "fr": "Contributeurs du projet", "es": "Colaboradores del proyecto",
-        "it": "Collaboratori del progetto", "pt": "Contribuidores do projeto",
-        "ru": "Участники проекта", "ar": "المساهمين في المشروع",
-        "hi": "प्रोजेक्ट योगदानकर्ता", "tr": "Proje Katkıda Bulunanlar",
-        "vi": "Người đóng góp dự án", "th": "ผู้มีส่วนร่วมในโครงการ",
-        "nl": "Projectmedewerkers", "pl": "Współtwórcy projektu",
-        "id": "Kontributor Proyek", "eo": "Projekto-Kontribuantoj"
-    },
-    "请先选择外部存储路径": {
-        "en": "Please select an external storage path first",
-        "zh-Hans": "请先选择外部存储路径", "zh-Hant": "請先選擇外部儲存路徑",
-        "ja": "まず外部ストレージパスを選択してください",
-        "ko": "먼저 외부 저장소 경로를 선택하세요",
-        "de": "Bitte zuerst einen externen Speicherpfad auswählen",
-        "fr": "Veuillez d'abord sélectionner un chemin de stockage externe",
-        "es": "Seleccione primero una ruta de almacenamiento externo",
-        "it": "Seleziona prima un percorso di archiviazione esterna",
-        "pt": "Selecione primeiro um caminho de armazenamento externo",
-        "ru": "Сначала выберите путь к внешнему хранилищу",
-        "ar": "يرجى تحديد مسار التخزين الخارجي أولاً",
-        "hi": "कृपया पहले बाहरी संग्रहण पथ चुनें",
-        "tr": "Lütfen önce harici depolama yolunu seçin",
-        "vi": "Vui lòng chọn đường dẫn lưu trữ ngoài trước",
-        "th": "กรุณาเลือกพาธที่เก็บข้อมูลภายนอกก่อน",
-        "nl": "Selecteer eerst een extern opslagpad",
-        "pl": "Najpierw wybierz zewnętrzną ścieżkę przechowywania",
-        "id": "Harap pilih jalur penyimpanan eksternal terlebih dahulu",
-        "eo": "Bonvolu unue elekti eksteran stokadan vojon"
-    },
-    "，大小约 %@": {
-        "en": ", size about %@",
-        "zh-Hans": "，大小约 %@", "zh-Hant": "，大小約 %@",
-        "ja": "、サイズ約 %@",
-        "ko": "，크기 약 %@",
-        "de": ", Größe ca. %@",
-        "fr": ", taille env. %@",
-        "es": ", tamaño aprox. %@",
-        "it": ", dimensione circa %@",
-        "pt": ", tamanho aprox. %@",
-        "ru": ", размер ок. %@",
-        "ar": "، الحجم تقريباً %@",
-        "hi": ", आकार लगभग %@",
-        "tr": ", boyut yaklaşık %@",
-        "vi": ", kích thước khoảng %@",
-        "th": " ขนาดประมาณ %@",
-        "nl": ", grootte ca. %@",
-        "pl": ", rozmiar ok. %@",
-        "id": ", ukuran sekitar %@",
-        "eo": ", grandeco ĉirkaŭ %@"
-    },
-    "%@ (%lld 个应用)": {
-        "en": "%@ (%lld Apps)",
-        "zh-Hans": "%@ (%lld 个应用)", "zh-Hant": "%@ (%lld 個應用程式)",
-        "ja": "%@ (%lld 個のアプリ)",
-        "ko": "%@ (%lld 개 앱)",
-        "de": "%@ (%lld Apps)",
-        "fr": "%@ (%lld apps)",
-        "es": "%@ (%lld apps)",
-        "it": "%@ (%lld app)",
-        "pt": "%@ (%lld apps)",
-        "ru": "%@ (%lld приложений)",
-        "ar": "%@ (%lld تطبيقات)",
-        "hi": "%@ (%lld ऐप्स)",
-        "tr": "%@ (%lld uygulama)",
-        "vi": "%@ (%lld ứng dụng)",
-        "th": "%@ (%lld แอป)",
-        "nl": "%@ (%lld apps)",
-        "pl": "%@ (%lld aplikacji)",
-        "id": "%@ (%lld aplikasi)",
-        "eo": "%@ (%lld aplikaĵoj)"
-    },
-    "双击打开系统设置": {
-        "en": "Double-click to open System Settings", "zh-Hans": "双击打开系统设置", "zh-Hant": "雙擊打開系統設定",
-        "ja": "ダブルクリックしてシステム設定を開く", "ko": "더블 클릭하여 시스템 설정 열기"
-    },
-    "日志已清空": {
-        "en": "Log cleared", "zh-Hans": "日志已清空", "zh-Hant": "日誌已清空",
-        "ja": "ログをクリアしました", "ko": "로그 삭제됨"
-    },
-    "日志记录已启用": {
-        "en": "Logging enabled", "zh-Hans": "日志记录已启用", "zh-Hant": "日誌記錄已啟用",
-        "ja": "ログ記録が有効になりました", "ko": "로깅이 활성화됨"
-    },
-    "日志记录已禁用": {
-        "en": "Logging disabled", "zh-Hans": "日志记录已禁用", "zh-Hant": "日誌記錄已停用",
-        "ja": "ログ記録が無効になりました", "ko": "로깅이 비활성화됨"
-    },
-    "启用/禁用日志记录": {
-        "en": "Enable/Disable logging", "zh-Hans": "启用/禁用日志记录", "zh-Hant": "啟用/停用日誌記錄",
-        "ja": "ログ記録の有効/無効", "ko": "로깅 활성화/비활성화"
-    },
-    "GitHub API 响应无效": {
-        "en": "Invalid GitHub API response", "zh-Hans": "GitHub API 响应无效", "zh-Hant": "GitHub API 回應無效",
-        "ja": "GitHub API レスポンスが無効です", "ko": "GitHub API 응답이 잘못됨"
-    },
-    "Finder 删除失败": {
-        "en": "Finder deletion failed", "zh-Hans": "Finder 删除失败", "zh-Hant": "Finder 刪除失敗",
-        "ja": "Finderの削除に失敗しました", "ko": "Finder 삭제 실패"
-    },
-    "无法迁移": {
-        "en": "Cannot migrate", "zh-Hans": "无法迁移", "zh-Hant": "無法遷移",
-        "ja": "移行できません", "ko": "마이그레이션 불가"
-    },
-    "系统设置 > 隐私与安全性 > 完全磁盘访问权限": {
-        "en": "System Settings > Privacy & Security > Full Disk Access", "zh-Hans": "系统设置 > 隐私与安全性 > 完全磁盘访问权限",
-        "zh-Hant": "系統設定 > 隱私與安全性 > 完整磁碟存取權限",
-        "ja": "システム設定 > プライバシーとセキュリティ > フルディスクアクセス",
-        "ko": "시스템 설정 > 개인정보 및 보안 > 전체 디스크 접근"
-    },
-    "该目录包含可执行文件路径引用，整体迁移可能导致命令行工具失效": {
-        "en": "This directory contains executable file path references, migrating may cause CLI tools to fail",
-        "zh-Hans": "该目录包含可执行文件路径引用，整体迁移可能导致命令行工具失效",
-        "zh-Hant": "該目錄包含可執行檔案路徑引用，整體遷移可能導致命令列工具失效",
-        "ja": "このディレクトリには実行ファイルパス参照が含まれており、移行するとCLIツールが使用できなくなる可能性があります"
-    },
-    "本地已存在同名文件": {
-        "en": "A file with the same name already exists locally", "zh-Hans": "本地已存在同名文件",
-        "zh-Hant": "本地已存在同名檔案", "ja": "同名のファイルがローカルに既に存在します"
-    },
-    "本地已存在同名真实文件，无法覆盖": {
-        "en": "A real file with the same name already exists locally, cannot overwrite",
-        "zh-Hans": "本地已存在同名真实文件，无法覆盖", "zh-Hant": "本地已存在同名真實檔案，無法覆寫",
-        "ja": "同名の実ファイルがローカルに既に存在し、上書きできません"
-    },
-    "本地已存在同名文件，无法覆盖": {
-        "en": "A file with the same name already exists locally, cannot overwrite",
-        "zh-Hans": "本地已存在同名文件，无法覆盖", "zh-Hant": "本地已存在同名檔案，無法覆寫",
-        "ja": "同名のファイルがローカルに既に存在し、上書きできません"
-    },
-    " 或 ": {"en": " or ", "zh-Hans": " 或 ", "zh-Hant": " 或 ", "ja": " または ", "ko": " 또는 "},
-    "尝试删除非链接文件": {
-        "en": "Attempted to delete non-link file", "zh-Hans": "尝试删除非链接文件",
-        "zh-Hant": "嘗試刪除非連結檔案", "ja": "リンクでないファイルの削除を試みました"
-    },
-    "diskutil错误": {"en": "diskutil error", "zh-Hans": "diskutil错误", "zh-Hant": "diskutil錯誤", "ja": "diskutilエラー"},
-    "（未知）": {"en": "(Unknown)", "zh-Hans": "（未知）", "zh-Hant": "（未知）", "ja": "（不明）", "ko": "(알 수 없음)"},
-    "发现新版本 %@。\\n%@": {
-        "en": "New version %@ found.\\n%@", "zh-Hans": "发现新版本 %@。\\n%@", "zh-Hant": "發現新版本 %@。\\n%@",
-        "ja": "新しいバージョン %@ が見つかりました。\\n%@", "ko": "새 버전 %@을(를) 발견했습니다.\\n%@"
-    },
-    "App Store 应用不支持迁移，因为迁移后将无法通过 App Store 更新。\\n\\n如需强制迁移，请在设置中启用相应选项。": {
-        "en": "App Store apps cannot be migrated because they won't be updatable via App Store after migration.\\n\\nTo force migration, enable the option in Settings.",
-        "zh-Hans": "App Store 应用不支持迁移，因为迁移后将无法通过 App Store 更新。\\n\\n如需强制迁移，请在设置中启用相应选项。",
-        "zh-Hant": "App Store 應用程式不支援遷移，因為遷移後將無法透過 App Store 更新。\\n\\n如需強制遷移，請在設定中啟用相應選項。",
-        "ja": "App Storeアプリは移行後にApp Store経由で更新できなくなるため、移行できません。\\n\\n強制移行するには、設定で対応するオプションを有効にしてください。"
-    },
-    "非原生 (iPhone/iPad) 应用不支持迁移。\\n\\n如需迁移，请在设置中启用「允许迁移非原生应用」选项。": {
-        "en": "Non-native (iPhone/iPad) apps cannot be migrated.\\n\\nTo migrate, enable 'Allow non-native app migration' in Settings.",
-        "zh-Hans": "非原生 (iPhone/iPad) 应用不支持迁移。\\n\\n如需迁移，请在设置中启用「允许迁移非原生应用」选项。",
-        "zh-Hant": "非原生 (iPhone/iPad) 應用程式不支援遷移。\\n\\n如需遷移，請在設定中啟用「允許遷移非原生應用程式」選項。",
-        "ja": "ネイティブでない (iPhone/iPad) アプリは移行できません。\\n\\n移行するには、設定で「非ネイティブアプリの移行を許可」オプションを有効にしてください。"
-    },
-    "选中的应用包含 App Store 应用和非原生应用。\\n\\n如需迁移，请在设置中启用相应选项。": {
-        "en": "Selected apps include App Store apps and non-native apps.\\n\\nTo migrate, enable the corresponding options in Settings.",
-        "zh-Hans": "选中的应用包含 App Store 应用和非原生应用。\\n\\n如需迁移，请在设置中启用相应选项。",
-        "zh-Hant": "選中的應用程式包含 App Store 應用程式和非原生應用程式。\\n\\n如需遷移，請在設定中啟用相應選項。",
-        "ja": "選択されたアプリにはApp Storeアプリと非ネイティブアプリが含まれています。\\n\\n移行するには、設定で対応するオプションを有効にしてください。"
-    },
-    "选中的 %lld 个应用均来自 App Store，迁移时会使用 Finder 删除，您会听到垃圾桶的声音。\\n\\n这是正常的，应用会被安全地移动到外部存储。": {
-        "en": "All %lld selected apps are from the App Store. They will be deleted via Finder during migration (you'll hear the trash sound).\\n\\nThis is normal, apps are safely moved to external storage.",
-        "zh-Hans": "选中的 %lld 个应用均来自 App Store，迁移时会使用 Finder 删除，您会听到垃圾桶的声音。\\n\\n这是正常的，应用会被安全地移动到外部存储。",
-        "zh-Hant": "選中的 %lld 個應用程式均來自 App Store，遷移時會使用 Finder 刪除，您會聽到垃圾桶的聲音。\\n\\n這是正常的，應用程式會被安全地移動到外部儲存。",
-        "ja": "選択された %lld 個のアプリはすべてApp Storeからのものです。移行時にFinderで削除されます（ゴミ箱の音がします）。\\n\\nこれは正常な動作で、アプリは安全に外部ストレージに移動されます。"
-    },
-    "腾讯 CodeBuddy 国内版数据": {"en": "Tencent CodeBuddy China version data", "zh-Hans": "腾讯 CodeBuddy 国内版数据", "zh-Hant": "騰訊 CodeBuddy 國內版資料"},
-    "灵码（Lingma）数据": {"en": "Lingma Data", "zh-Hans": "灵码（Lingma）数据", "zh-Hant": "靈碼（Lingma）資料"},
-    "应用缓存（可重建）": {"en": "App cache (rebuildable)", "zh-Hans": "应用缓存（可重建）", "zh-Hant": "應用程式快取（可重建）", "ja": "アプリキャッシュ（再構築可能）"},
-    "应用核心数据（设置、数据库等）": {"en": "Application core data (settings, databases, etc.)", "zh-Hans": "应用核心数据（设置、数据库等）", "zh-Hant": "應用程式核心資料（設定、資料庫等）", "ja": "アプリコアデータ（設定、データベースなど）"},
-    "沙盒容器数据（App Store 应用）": {"en": "Sandbox container data (App Store apps)", "zh-Hans": "沙盒容器数据（App Store 应用）", "zh-Hant": "沙盒容器資料（App Store 應用程式）", "ja": "サンドボックスコンテナデータ（App Storeアプリ）"},
-    ".config（工具配置）": {"en": ".config (Tool Config)", "zh-Hans": ".config（工具配置）", "zh-Hant": ".config（工具設定）", "ja": ".config（ツール設定）"},
-    "========== 系统诊断信息 ==========": {"en": "========== System Diagnostics ==========", "zh-Hans": "========== 系统诊断信息 ==========", "zh-Hant": "========== 系統診斷資訊 =========="},
-    "========== 外接硬盘信息 ==========": {"en": "========== External Drive Diagnostics ==========", "zh-Hans": "========== 外接硬盘信息 ==========", "zh-Hant": "========== 外接硬碟資訊 =========="},
-    "Mac": {"en": "Mac", "zh-Hans": "Mac", "zh-Hant": "Mac"},
-    "容器内部拆分迁移的数据目录（如聊天记录、下载文件或运行时数据）": {
-        "en": "Data directories split out from inside the container for migration (such as chat history, downloads, or runtime data)",
-        "zh-Hans": "容器内部拆分迁移的数据目录（如聊天记录、下载文件或运行时数据）",
-        "zh-Hant": "容器內部拆分遷移的資料目錄（如聊天記錄、下載檔案或執行時資料）"
-    },
-    "整理": {"en": "Normalize", "zh-Hans": "整理", "zh-Hant": "整理"},
-    "将已接管的链接整理到 AppPorts 规范路径": {
-        "en": "Move managed links to the AppPorts canonical path",
-        "zh-Hans": "将已接管的链接整理到 AppPorts 规范路径",
-        "zh-Hant": "將已接管的連結整理到 AppPorts 規範路徑"
-    },
-    "链接详情": {"en": "Link Details", "zh-Hans": "链接详情", "zh-Hant": "連結詳情"},
-    "查看现有软链路径，并可将其纳入 AppPorts 管理": {
-        "en": "View the existing symlink target and optionally bring it under AppPorts management",
-        "zh-Hans": "查看现有软链路径，并可将其纳入 AppPorts 管理",
-        "zh-Hant": "查看現有軟連結路徑，並可將其納入 AppPorts 管理"
-    },
-    "检测到已有符号链接，非 AppPorts 迁移结果": {
-        "en": "An existing symbolic link was detected. It was not created by AppPorts",
-        "zh-Hans": "检测到已有符号链接，非 AppPorts 迁移结果",
-        "zh-Hant": "偵測到現有符號連結，並非 AppPorts 遷移結果"
-    },
-    "接回": {"en": "Relink", "zh-Hans": "接回", "zh-Hant": "接回"},
-    "外部目录已存在，在原路径补建符号链接": {
-        "en": "The external directory already exists. Recreate a symbolic link at the original path",
-        "zh-Hans": "外部目录已存在，在原路径补建符号链接",
-        "zh-Hant": "外部目錄已存在，於原路徑補建符號連結"
-    },
-    "确认规范化管理": {"en": "Confirm Normalization", "zh-Hans": "确认规范化管理", "zh-Hant": "確認規範化管理"},
-    "确认": {"en": "Confirm", "zh-Hans": "确认", "zh-Hant": "確認"},
-    "没有匹配当前筛选条件的数据目录": {
-        "en": "No data directories match the current filters",
-        "zh-Hans": "没有匹配当前筛选条件的数据目录",
-        "zh-Hant": "沒有符合目前篩選條件的資料目錄"
-    },
-    "%lld 个待整理": {"en": "%lld to normalize", "zh-Hans": "%lld 个待整理", "zh-Hant": "%lld 個待整理"},
-    "%lld 个现有软链": {"en": "%lld existing symlinks", "zh-Hans": "%lld 个现有软链", "zh-Hant": "%lld 個現有軟連結"},
-    "%lld 个待接回": {"en": "%lld pending relink", "zh-Hans": "%lld 个待接回", "zh-Hant": "%lld 個待接回"},
-    "无法读取现有软链的目标路径": {
-        "en": "Unable to read the target path of the existing symlink",
-        "zh-Hans": "无法读取现有软链的目标路径",
-        "zh-Hant": "無法讀取現有軟連結的目標路徑"
-    },
-    "现有软链": {"en": "Existing Symlink", "zh-Hans": "现有软链", "zh-Hant": "現有軟連結"},
-    "规范化管理": {"en": "Normalize", "zh-Hans": "规范化管理", "zh-Hant": "規範化管理"},
-    "无法读取已链接目录的目标路径": {
-        "en": "Unable to read the target path of the linked directory",
-        "zh-Hans": "无法读取已链接目录的目标路径",
-        "zh-Hant": "無法讀取已連結目錄的目標路徑"
-    },
-    "整理已链接目录": {"en": "Normalize Linked Directory", "zh-Hans": "整理已链接目录", "zh-Hant": "整理已連結目錄"},
-    "当前路径已经符合 AppPorts 的规范路径。": {
-        "en": "The current path already matches the AppPorts canonical path.",
-        "zh-Hans": "当前路径已经符合 AppPorts 的规范路径。",
-        "zh-Hant": "目前路徑已符合 AppPorts 的規範路徑。"
-    },
-    "当前路径与规范路径不同。本次操作会将外部数据移动到规范路径，并重建本地软链接。": {
-        "en": "The current path differs from the AppPorts canonical path. This operation will move the external data to the canonical path and recreate the local symlink.",
-        "zh-Hans": "当前路径与规范路径不同。本次操作会将外部数据移动到规范路径，并重建本地软链接。",
-        "zh-Hant": "目前路徑與規範路徑不同。本次操作會將外部資料移動到規範路徑，並重建本地軟連結。"
-    },
-    "无法读取外部目录路径": {"en": "Unable to read the external directory path", "zh-Hans": "无法读取外部目录路径", "zh-Hant": "無法讀取外部目錄路徑"},
-    "接回外部数据": {"en": "Relink External Data", "zh-Hans": "接回外部数据", "zh-Hant": "接回外部資料"},
-    "开机自动重签名": {
-        "en": "Auto Re-sign at Login", "zh-Hans": "开机自动重签名", "zh-Hant": "開機自動重簽名",
-        "hi": "लॉगिन पर ऑटो री-साइन", "es": "Re-firmado al iniciar sesión", "ar": "إعادة التوقيع التلقائي عند تسجيل الدخول", "ru": "Автопереподпись при входе",
-        "pt": "Re-assinatura ao fazer login", "fr": "Re-signature à la connexion", "it": "Firma automatica al login", "ja": "ログイン時自動再署名",
-        "eo": "Aŭtomata resubskribo ĉe ensaluto", "de": "Automatische Neuzeichnung bei Anmeldung", "ko": "로그인 시 자동 재서명", "tr": "Girişte Otomatik Yeniden İmzalama",
-        "vi": "Tự động ký lại khi đăng nhập", "th": "เซ็นใหม่อัตโนมัติเมื่อเข้าสู่ระบบ", "nl": "Auto-hertekening bij aanmelding", "pl": "Automatyczne podpisywanie przy logowaniu", "id": "Tanda Ulang Otomatis saat Login"
-    },
-    "macOS 重启后 Gatekeeper 可能使 Ad-hoc 签名失效。开启后每次登录自动对已迁移应用重新签名。": {
-        "en": "Gatekeeper may invalidate Ad-hoc signatures after macOS restart. When enabled, automatically re-signs migrated apps each time you log in.",
-        "zh-Hans": "macOS 重启后 Gatekeeper 可能使 Ad-hoc 签名失效。开启后每次登录自动对已迁移应用重新签名。",
-        "zh-Hant": "macOS 重啟後 Gatekeeper 可能使 Ad-hoc 簽名失效。開啟後每次登入自動對已遷移應用重新簽名。",
-        "hi": "macOS पुनरारंभ के बाद Gatekeeper Ad-hoc हस्ताक्षर अमान्य कर सकता है। सक्षम होने पर, लॉगिन करते समय माइग्रेट किए गए ऐप्स को स्वचालित रूप से फिर से साइन करता है।",
-        "es": "Gatekeeper puede invalidar las firmas Ad-hoc después del reinicio de macOS. Cuando está activado, re-firma automáticamente las apps migradas cada vez que inicias sesión.",
-        "ar": "قد يُلغي Gatekeeper توقيعات Ad-hoc بعد إعادة تشغيل macOS. عند التفعيل، يتم إعادة توقيع التطبيقات المُرحّلة تلقائياً عند كل تسجيل دخول.",
-        "ru": "Gatekeeper может аннулировать Ad-hoc подписи после перезагрузки macOS. При включении автоматически переподписывает мигрированные приложения при каждом входе.",
-        "pt": "O Gatekeeper pode invalidar assinaturas Ad-hoc após o reinício do macOS. Quando ativado, re-assina automaticamente os apps migrados cada vez que você faz login.",
-        "fr": "Gatekeeper peut invalider les signatures Ad-hoc après le redémarrage de macOS. Lorsqu'activé, re-signe automatiquement les applications migrées à chaque connexion.",
-        "it": "Gatekeeper potrebbe invalidare le firme Ad-hoc dopo il riavvio di macOS. Quando attivato, firma automaticamente le app migrate ad ogni accesso.",
-        "ja": "macOSの再起動後、GatekeeperがAd-hoc署名を無効にする場合があります。有効にすると、ログインするたびに移行済みアプリを自動的に再署名します。",
-        "eo": "Gatekeeper povas nuligi Ad-hoc subskribojn post macOS rekomenco. Kiam aktivigite, aŭtomate resubskribas migritajn aplikaĵojn ĉe ensaluto.",
-        "de": "Gatekeeper kann Ad-hoc-Signaturen nach einem macOS-Neustart ungültig machen. Wenn aktiviert, werden migrierte Apps bei jeder Anmeldung automatisch neu signiert.",
-        "ko": "macOS 재시작 후 Gatekeeper가 Ad-hoc 서명을 무효화할 수 있습니다. 활성화하면 로그인할 때마다 마이그레이션된 앱을 자동으로 재서명합니다.",
-        "tr": "Gatekeeper, macOS yeniden başlatıldıktan sonra Ad-hoc imzaları geçersiz kılabilir. Etkinleştirildiğinde, her giriş yaptığınızda taşınan uygulamaları otomatik olarak yeniden imzalar.",
-        "vi": "Gatekeeper có thể vô hiệu hóa chữ ký Ad-hoc sau khi macOS khởi động lại. Khi bật, tự động ký lại các ứng dụng đã di chuyển mỗi khi bạn đăng nhập.",
-        "th": "Gatekeeper อาจทำให้ลายเซ็น Ad-hoc ไม่ถูกต้องหลังจากรีสตาร์ท macOS เมื่อเปิดใช้งาน จะเซ็นใหม่แอปที่ย้ายแล้วโดยอัตโนมัติทุกครั้งที่เข้าสู่ระบบ",
-        "nl": "Gatekeeper kan Ad-hoc handtekeningen ongeldig maken na macOS herstart. Wanneer ingeschakeld, worden migreerde apps automatisch opnieuw ondertekend bij elke aanmelding.",
-        "pl": "Gatekeeper może unieważnić podpisy Ad-hoc po ponownym uruchomieniu macOS. Po włączeniu automatycznie podpisuje migrowane aplikacje przy każdym logowaniu.",
-        "id": "Gatekeeper dapat membatalkan tanda tangan Ad-hoc setelah macOS dimulai ulang. Saat diaktifkan, secara otomatis menandatangani ulang aplikasi yang dimigrasi setiap kali Anda login."
-    },
-    "找不到重签名脚本，安装失败": {
-        "en": "Re-sign script not found, installation failed", "zh-Hans": "找不到重签名脚本，安装失败", "zh-Hant": "找不到重簽名腳本，安裝失敗",
-        "hi": "री-साइन स्क्रिप्ट नहीं मिली, इंस्टॉलेशन विफल", "es": "Script de re-firmado no encontrado, instalación fallida", "ar": "نص إعادة التوقيع غير موجود، فشل التثبيت", "ru": "Скрипт переподписи не найден, установка не удалась",
-        "pt": "Script de re-assinatura não encontrado, instalação falhou", "fr": "Script de re-signature introuvable, échec de l'installation", "it": "Script di ri-firma non trovato, installazione non riuscita", "ja": "再署名スクリプトが見つかりません、インストール失敗",
-        "eo": "Resubskribo-skripto ne trovita, instalo malsukcesis", "de": "Neuzeichnungs-Skript nicht gefunden, Installation fehlgeschlagen", "ko": "재서명 스크립트를 찾을 수 없음, 설치 실패", "tr": "Yeniden imzalama betiği bulunamadı, yükleme başarısız",
-        "vi": "Không tìm thấy script ký lại, cài đặt thất bại", "th": "ไม่พบสคริปต์เซ็นใหม่ การติดตั้งล้มเหลว", "nl": "Hertekeningscript niet gevonden, installatie mislukt", "pl": "Nie znaleziono skryptu ponownego podpisywania, instalacja nie powiodła się", "id": "Skrip tanda ulang tidak ditemukan, instalasi gagal"
-    },
-    "LaunchAgent 加载失败": {
-        "en": "LaunchAgent failed to load", "zh-Hans": "LaunchAgent 加载失败", "zh-Hant": "LaunchAgent 載入失敗",
-        "hi": "LaunchAgent लोड होने में विफल", "es": "Error al cargar LaunchAgent", "ar": "فشل تحميل LaunchAgent", "ru": "Ошибка загрузки LaunchAgent",
-        "pt": "Falha ao carregar LaunchAgent", "fr": "Échec du chargement de LaunchAgent", "it": "Caricamento LaunchAgent non riuscito", "ja": "LaunchAgentの読み込みに失敗しました",
-        "eo": "LaunchAgent malsukcesis ŝargi", "de": "LaunchAgent konnte nicht geladen werden", "ko": "LaunchAgent 로드 실패", "tr": "LaunchAgent yüklenemedi",
-        "vi": "LaunchAgent tải thất bại", "th": "ไม่สามารถโหลด LaunchAgent ได้", "nl": "LaunchAgent laden mislukt", "pl": "Nie udało się załadować LaunchAgent", "id": "LaunchAgent gagal dimuat"
-    },
-}
+# Built-in translations live in DICT_PATH: a TSV with a `key` column followed by one
+# column per language (an empty cell means "no value"; \\ \t \n \r are escaped). The
+# table is never materialized at import. A binary index in the cache directory maps
+# each key hash to its row offset, so single-key lookups read one line.
+_DICT_INDEX_MAGIC = b"TDX1"
+_DICT_INDEX_HEADER = struct.Struct("<4sQqI")
+_TSV_ESCAPES = {"\\\\": "\\", "\\t": "\t", "\\n": "\n", "\\r": "\r"}
+_TSV_ESCAPE_RE = re.compile(r"\\[\\tnr]")
+
+def tsv_escape(value):
+    return value.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+def tsv_unescape(value):
+    return _TSV_ESCAPE_RE.sub(lambda m: _TSV_ESCAPES[m.group()], value) if "\\" in value else value
+
+def _hash64(data):
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+class DictionaryTable:
+    """Read-only mapping of key -> {lang: value} backed by DICT_PATH."""
+
+    def __init__(self, path, index_path):
+        self.path = path
+        self.index_path = index_path
+        # Read-only callers (check) turn this off so a missing index is built in memory only
+        self.write_index = True
+        self._loaded = False
+        self._file = None
+
+    def refresh(self):
+        # Drops everything loaded if the TSV changed on disk since (long-running callers)
+        if self._loaded and self._stat != self._current_stat():
+            self._loaded = False
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    def _current_stat(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return 0, 0
+        return st.st_size, st.st_mtime_ns
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._rows = {}
+        self._stat = self._current_stat()
+        if not self._read_index():
+            self._build_index()
+        self._column_names = []
+        if self._stat != (0, 0):
+            self._file = open(self.path, "rb")
+            self._column_names = self._file.readline().decode("utf-8").rstrip("\n").split("\t")[1:]
+        self._loaded = True
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, "rb") as f:
+                raw = f.read()
+        except OSError:
+            return False
+        if len(raw) < _DICT_INDEX_HEADER.size:
+            return False
+        magic, size, mtime, count = _DICT_INDEX_HEADER.unpack_from(raw)
+        if magic != _DICT_INDEX_MAGIC or (size, mtime) != self._stat:
+            return False
+        pos = _DICT_INDEX_HEADER.size
+        arrays = []
+        for _ in range(3):
+            arr = array("Q")
+            arr.frombytes(raw[pos:pos + 8 * count])
+            arrays.append(arr)
+            pos += 8 * count
+        self._hashes, self._offsets, self._digests = arrays
+        self._key_blob = raw[pos:]
+        self._keys = None
+        return True
+
+    def _build_index(self):
+        entries = []
+        keys = []
+        if self._stat != (0, 0):
+            with open(self.path, "rb") as f:
+                f.readline()  # header
+                offset = f.tell()
+                for line in f:
+                    tab = line.find(b"\t")
+                    key = tsv_unescape((line[:tab] if tab >= 0 else line.rstrip(b"\n")).decode("utf-8"))
+                    keys.append(key)
+                    entries.append((_hash64(key.encode("utf-8")), offset, _hash64(line)))
+                    offset += len(line)
+        entries.sort()
+        self._hashes = array("Q", (e[0] for e in entries))
+        self._offsets = array("Q", (e[1] for e in entries))
+        self._digests = array("Q", (e[2] for e in entries))
+        self._key_blob = "\0".join(keys).encode("utf-8")
+        self._keys = keys
+        if not self.write_index:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+            tmp_path = self.index_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(_DICT_INDEX_HEADER.pack(_DICT_INDEX_MAGIC, self._stat[0], self._stat[1], len(entries)))
+                for arr in (self._hashes, self._offsets, self._digests):
+                    f.write(arr.tobytes())
+                f.write(self._key_blob)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            pass  # the in-memory index still serves this run
+
+
+    def _find(self, key):
+        # (index position, raw cells) of key's row, or (-1, None)
+        h = _hash64(key.encode("utf-8"))
+        i = bisect.bisect_left(self._hashes, h)
+        while i < len(self._hashes) and self._hashes[i] == h:
+            self._file.seek(self._offsets[i])
+            cells = self._file.readline().decode("utf-8").rstrip("\n").split("\t")
+            if tsv_unescape(cells[0]) == key:
+                return i, cells[1:]
+            i += 1
+        return -1, None
+
+    def get(self, key, default=None):
+        self._load()
+        row = self._rows.get(key)
+        if row is None:
+            _, cells = self._find(key)
+            if cells is None:
+                return default
+            row = self._rows[key] = {lang: tsv_unescape(v) for lang, v in zip(self._column_names, cells) if v}
+        return row
+
+    def row_digest(self, key):
+        """Hash of the key's raw row (None when absent), without parsing the row."""
+        self._load()
+        i = self._find(key)[0]
+        return self._digests[i] if i >= 0 else None
+
+    def keys(self):
+        self._load()
+        if self._keys is None:
+            self._keys = self._key_blob.decode("utf-8").split("\0") if self._key_blob else []
+        return list(self._keys)
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def __getitem__(self, key):
+        row = self.get(key)
+        if row is None:
+            raise KeyError(key)
+        return row
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        self._load()
+        return len(self._hashes)
+
+DICT = DictionaryTable(DICT_PATH, DICT_INDEX_PATH)
 
 
 # Braille logic
+# Unified English Braille. Grade 1 spells every letter; grade 2 adds the common whole-word
+# and part-word contractions. Format placeholders (%@, %1$lld) are kept verbatim so the
+# "br" column stays a valid format string.
+BRAILLE_LETTERS = dict(zip("abcdefghijklmnopqrstuvwxyz", "⠁⠃⠉⠙⠑⠋⠛⠓⠊⠚⠅⠇⠍⠝⠕⠏⠟⠗⠎⠞⠥⠧⠺⠭⠽⠵"))
+BRAILLE_DIGITS = dict(zip("1234567890", "⠁⠃⠉⠙⠑⠋⠛⠓⠊⠚"))
+BRAILLE_PUNCTUATION = {
+    ".": "⠲", ",": "⠂", "!": "⠖", "?": "⠦", "'": "⠄", "-": "⠤",
+    "/": "⠌", "(": "⠐⠣", ")": "⠐⠜", ":": "⠒", ";": "⠆",
+}
+# Grade 2: standalone words, then letter groups usable anywhere inside a word
+BRAILLE_WORDSIGNS = {
+    "and": "⠯", "for": "⠿", "of": "⠷", "the": "⠮", "with": "⠾",
+    "but": "⠃", "can": "⠉", "do": "⠙", "every": "⠑", "from": "⠋", "go": "⠛", "have": "⠓",
+    "just": "⠚", "knowledge": "⠅", "like": "⠇", "more": "⠍", "not": "⠝", "people": "⠏",
+    "quite": "⠟", "rather": "⠗", "so": "⠎", "that": "⠞", "us": "⠥", "very": "⠧", "will": "⠺",
+    "it": "⠭", "you": "⠽", "as": "⠵", "child": "⠡", "shall": "⠩", "this": "⠹", "which": "⠱",
+    "out": "⠳", "still": "⠌",
+}
+BRAILLE_GROUPSIGNS = {
+    "and": "⠯", "for": "⠿", "of": "⠷", "the": "⠮", "with": "⠾", "ing": "⠬",
+    "ch": "⠡", "gh": "⠣", "sh": "⠩", "th": "⠹", "wh": "⠱", "ed": "⠫", "er": "⠻",
+    "ou": "⠳", "ow": "⠪", "st": "⠌", "ar": "⠜",
+}
+BRAILLE_CAPITAL = "⠠"
+BRAILLE_CAPITAL_WORD = "⠠⠠"
+BRAILLE_CAPITAL_TERMINATOR = "⠠⠄"
+BRAILLE_NUMBER = "⠼"
+BRAILLE_GRADE1 = "⠰"  # a letter a-j right after a number would read as a digit
+BRAILLE_GRADE = 1
+_FORMAT_SPECIFIER = r"%(?:\d+\$)?[-+#0 ]*(?:\*|\d+)?(?:\.(?:\*|\d+))?(?:hh|h|ll|l|L|z|t|j|q)?[@diuoxXfFeEgGaAcCsSp%]"
+_FORMAT_SPECIFIER_RE = re.compile(_FORMAT_SPECIFIER)
+
+class BrailleEngine:
+    """Compiles the tables above once; transcribe() is memoized per text. Extend it beyond
+    ASCII by passing extra letters (lowercase -> cells) or punctuation."""
+
+    def __init__(self, letters, digits, punctuation, wordsigns=None, groupsigns=None, grade=1):
+        self.letters = dict(letters)
+        self.grade = grade
+        self.wordsigns = dict(wordsigns or {})
+        # Grade 1 letters and punctuation in one translate table, upper case without its sign
+        table = {ord(c): cells for c, cells in punctuation.items()}
+        for c, cells in self.letters.items():
+            table[ord(c)] = table[ord(c.upper())] = cells
+        self._letter_table = table
+        self._digit_table = {ord(c): cells for c, cells in digits.items()}
+        self._digit_table.update({ord("."): punctuation.get(".", "."), ord(","): punctuation.get(",", ",")})
+        self._digit_cells = set(digits.values())
+        self._groupsign_trie = {}
+        for group, cells in (groupsigns or {}).items():
+            node = self._groupsign_trie
+            for c in group:
+                node = node.setdefault(c, {})
+            node[""] = cells
+        letter_class = "".join(re.escape(c) for c in sorted(set(self.letters) | {c.upper() for c in self.letters}))
+        self._token_re = re.compile(
+            f"({_FORMAT_SPECIFIER})|(\\d+(?:[.,]\\d+)*)|([{letter_class}]+)")
+        self._memo = {}
+        self._word_memo = {}
+
+    def _contract(self, word):
+        # Longest-match groupsigns over a lower-case run
+        if self.grade < 2:
+            return word.translate(self._letter_table)
+        trie = self._groupsign_trie
+        out = []
+        i, n = 0, len(word)
+        while i < n:
+            node, match, end = trie, None, i + 1
+            j = i
+            while j < n and word[j] in node:
+                node = node[word[j]]
+                j += 1
+                if "" in node:
+                    match, end = node[""], j
+            out.append(match if match is not None else word[i].translate(self._letter_table))
+            i = end
+        return "".join(out)
+
+    def _word(self, word):
+        # Words repeat across keys far more than whole strings do
+        cells = self._word_memo.get(word)
+        if cells is None:
+            cells = self._word_memo[word] = self._transcribe_word(word)
+        return cells
+
+    def _transcribe_word(self, word):
+        lower = word.lower()
+        if self.grade >= 2 and lower in self.wordsigns:
+            body = self.wordsigns[lower]
+            if word.isupper() and len(word) > 1:
+                return BRAILLE_CAPITAL_WORD + body
+            return (BRAILLE_CAPITAL if word[0].isupper() else "") + body
+        if word == lower:
+            return self._contract(word)
+        if word.isupper() and len(word) > 1:
+            return BRAILLE_CAPITAL_WORD + self._contract(lower)
+        # Mixed case: one sign per capital, a word sign for runs of two or more that are
+        # terminated when lower case letters follow
+        out = []
+        i, n = 0, len(word)
+        while i < n:
+            j = i
+            if word[i].isupper():
+                while j < n and word[j].isupper():
+                    j += 1
+                if j - i == 1:
+                    out.append(BRAILLE_CAPITAL + self._contract(word[i].lower()))
+                else:
+                    out.append(BRAILLE_CAPITAL_WORD + self._contract(word[i:j].lower()))
+                    if j < n:
+                        out.append(BRAILLE_CAPITAL_TERMINATOR)
+            else:
+                while j < n and not word[j].isupper():
+                    j += 1
+                out.append(self._contract(word[i:j]))
+            i = j
+        return "".join(out)
+
+    def transcribe(self, text):
+        out = self._memo.get(text)
+        if out is not None:
+            return out
+        parts = []
+        pos = 0
+        after_number = False
+        for m in self._token_re.finditer(text):
+            if m.start() > pos:
+                parts.append(text[pos:m.start()].translate(self._letter_table))
+                after_number = False
+            placeholder, number, word = m.groups()
+            if placeholder:
+                parts.append(placeholder)
+                after_number = False
+            elif number:
+                # One number sign per run of digits, decimal points and separators included
+                parts.append(BRAILLE_NUMBER + number.translate(self._digit_table))
+                after_number = True
+            else:
+                cells = self._word(word)
+                if after_number and cells[:1] in self._digit_cells:
+                    cells = BRAILLE_GRADE1 + cells
+                parts.append(cells)
+                after_number = False
+            pos = m.end()
+        parts.append(text[pos:].translate(self._letter_table))
+        out = self._memo[text] = "".join(parts)
+        return out
+
+BRAILLE = BrailleEngine(BRAILLE_LETTERS, BRAILLE_DIGITS, BRAILLE_PUNCTUATION,
+                        BRAILLE_WORDSIGNS, BRAILLE_GROUPSIGNS, grade=BRAILLE_GRADE)
+
 def to_braille(text):
-    mapping = {
-        'a': '⠁', 'b': '⠃', 'c': '⠉', 'd': '⠙', 'e': '⠑', 'f': '⠋', 'g': '⠛', 'h': '⠓', 'i': '⠊', 'j': '⠚',
-        'k': '⠅', 'l': '⠇', 'm': '⠍', 'n': '⠝', 'o': '⠕', 'p': '⠏', 'q': '⠟', 'r': '⠗', 's': '⠎', 't': '⠞',
-        'u': '⠥', 'v': '⠧', 'w': '⠺', 'x': '⠭', 'y': '⠽', 'z': '⠵',
-        'A': '⠠⠁', 'B': '⠠⠃', 'C': '⠠⠉', 'D': '⠠⠙', 'E': '⠠⠑', 'F': '⠠⠋', 'G': '⠠⠛', 'H': '⠠⠓', 'I': '⠠⠊', 'J': '⠠⠚',
-        'K': '⠠⠅', 'L': '⠠⠇', 'M': '⠠⠍', 'N': '⠠⠝', 'O': '⠠⠕', 'P': '⠠⠏', 'Q': '⠠⠟', 'R': '⠠⠗', 'S': '⠠⠎', 'T': '⠠⠞',
-        'U': '⠠⠥', 'V': '⠠⠧', 'W': '⠠⠺', 'X': '⠠⠭', 'Y': '⠠⠽', 'Z': '⠠⠵',
-        '1': '⠼⠁', '2': '⠼⠃', '3': '⠼⠉', '4': '⠼⠙', '5': '⠼⠑', '6': '⠼⠋', '7': '⠼⠛', '8': '⠼⠓', '9': '⠼⠊', '0': '⠼⠚',
-        ' ': ' ', '.': '⠲', ',': '⠂', '!': '⠖', '?': '⠦', '\'': '⠄', '-': '⠤',
-        '/': '⠌', '(': '⠐⠣', ')': '⠐⠜', ':': '⠒', ';': '⠆'
-    }
-    return "".join(mapping.get(char, char) for char in text)
+    return BRAILLE.transcribe(text)
+
+# Swift string-literal tokenizer
+HAN_RE = re.compile(r'[一-龥]')
+
+# Every token of interest starts with one of these characters; searching for a bare
+# character class lets the regex engine skip plain code without returning to Python
+_SWIFT_TOKEN_RE = re.compile(r'[/#"()]')
+_HASHES_RE = re.compile(r'#*')
+# Main loop tokens; a parenthesised group without literals or comments inside (`foo()`,
+# `x.path(a, b)`) can never be the context of a literal and is consumed in one match
+# Each branch starts with a literal character so the regex engine can skip ahead by prefix
+_MAIN_TOKEN_RE = re.compile(r'/(?:/[^\n]*)?|\((?:[^()"/#]*\))?|\)|"|#')
+_BLOCK_COMMENT_RE = re.compile(r"/\*|\*/")
+_SIMPLE_STRING_RE = re.compile(r'(?:[^"\\\n]|\\[^(])*"')
+_LOCALIZED_SUFFIX_RE = re.compile(r"[ \t]*\.[ \t]*localized\b")
+# Callees and argument labels are matched on the reversed text just before a token, which
+# is a single anchored match instead of a search over every possible start position
+_REV_CALLEE_RE = re.compile(r"[ \t]*(\w+(?:[ \t]*\.[ \t]*\w+)*\.?)")
+_REV_LABEL_RE = re.compile(r"[ \t]*:[ \t]*(\w+)")
+_SWIFT_ESCAPES = {"0": "\0", "\\": "\\", "t": "\t", "n": "\n", "r": "\r", '"': '"', "'": "'"}
+
+# Innermost call -> call-site kind of a literal argument
+CALL_SITE_KINDS = {
+    "Text": "text", "Button": "button", "Label": "label",
+    "NSLocalizedString": "nslocalized", "LocalizedStringKey": "lskey",
+    "Toggle": "view", "Picker": "view", "Menu": "view", "Section": "view", "TextField": "view",
+    "SecureField": "view", "Link": "view", "GroupBox": "view", "navigationTitle": "view", "help": "view",
+    "alert": "view", "confirmationDialog": "view",
+}
+LOG_CALLS = {"print", "debugPrint", "NSLog", "os_log", "fatalError", "assert", "assertionFailure", "precondition"}
+# Literals in these contexts are never catalog keys
+NON_KEY_KINDS = {"log", "verbatim"}
+
+def _is_log_call(callee):
+    parts = callee.lstrip(".").split(".")
+    return (parts[-1] in LOG_CALLS or parts[-1].startswith("log")
+            or any("Logger" in p or p == "logger" for p in parts[:-1]))
+
+def _skip_block_comment(text, pos):
+    # Swift block comments nest
+    depth = 1
+    while depth:
+        m = _BLOCK_COMMENT_RE.search(text, pos)
+        if not m:
+            return len(text)
+        depth += 1 if m.group() == "/*" else -1
+        pos = m.end()
+    return pos
+
+def _next_swift_token(text, pos):
+    """Returns (kind, start, end) of the next comment, string opener or parenthesis."""
+    search = _SWIFT_TOKEN_RE.search
+    while True:
+        m = search(text, pos)
+        if not m:
+            return None, len(text), len(text)
+        start = m.start()
+        c = text[start]
+        if c == "(":
+            return "lparen", start, start + 1
+        if c == ")":
+            return "rparen", start, start + 1
+        if c == '"':
+            end = start + 3 if text.startswith('"""', start) else start + 1
+            return "string", start, end
+        if c == "#":
+            end = _HASHES_RE.match(text, start).end()
+            if text.startswith('"', end):
+                return "string", start, end + 3 if text.startswith('"""', end) else end + 1
+            pos = end
+            continue
+        nxt = text[start + 1:start + 2]
+        if nxt == "/":
+            end = text.find("\n", start)
+            pos = len(text) if end < 0 else end
+        elif nxt == "*":
+            pos = _skip_block_comment(text, start + 2)
+        else:
+            pos = start + 1
+
+def _scan_string_body(text, pos, hashes, multiline):
+    """Returns (end, raw_body, interpolations) for a literal whose opening delimiter ends at pos,
+    where interpolations lists the (start, end) span of each `\\(...)` expression."""
+    closing = ('"""' if multiline else '"') + hashes
+    if not hashes and not multiline:
+        m = _SIMPLE_STRING_RE.match(text, pos)
+        if m:
+            return m.end(), text[pos:m.end() - 1], []
+    escape = "\\" + hashes
+    interpolations = []
+    i = pos
+    n = len(text)
+    while i < n:
+        if text.startswith(closing, i):
+            return i + len(closing), text[pos:i], interpolations
+        if text.startswith(escape, i):
+            j = i + len(escape)
+            if j < n and text[j] == "(":
+                # Interpolation: skip the balanced expression, including nested literals
+                depth, j = 1, j + 1
+                expr_start = j
+                while j < n and depth:
+                    kind, start, j = _next_swift_token(text, j)
+                    if kind == "string":
+                        inner_hashes = text[start:j].rstrip('"')
+                        j, _, _ = _scan_string_body(text, j, inner_hashes, text[start:j].endswith('"""'))
+                    elif kind == "lparen":
+                        depth += 1
+                    elif kind == "rparen":
+                        depth -= 1
+                interpolations.append((expr_start, j - 1 if not depth else j))
+                i = j
+            else:
+                i = j + 1
+            continue
+        if text[i] == "\n" and not multiline:
+            break
+        i += 1
+    return i, text[pos:i], interpolations
+
+def decode_swift_literal(body, hashes="", multiline=False):
+    if multiline:
+        lines = body.split("\n")
+        # The closing delimiter's indentation is stripped from every content line
+        indent = lines[-1] if not lines[-1].strip() else ""
+        lines = lines[1:-1] if len(lines) > 1 else lines
+        body = "\n".join(l[len(indent):] if l.startswith(indent) else l.lstrip() for l in lines)
+    escape = "\\" + hashes
+    if escape not in body:
+        return body
+    out = []
+    i = 0
+    n = len(body)
+    while i < n:
+        j = body.find(escape, i)
+        if j < 0:
+            out.append(body[i:])
+            break
+        out.append(body[i:j])
+        k = j + len(escape)
+        c = body[k:k + 1]
+        if c in _SWIFT_ESCAPES:
+            out.append(_SWIFT_ESCAPES[c])
+            i = k + 1
+        elif c == "u" and body[k + 1:k + 2] == "{":
+            end = body.find("}", k)
+            out.append(chr(int(body[k + 2:end], 16)))
+            i = end + 1
+        elif multiline and c == "\n":
+            # Line continuation
+            i = k + 1
+        else:
+            out.append(body[j:k + 1])
+            i = k + 1
+    return "".join(out)
+
+def _resolve_frame(text, frames, contexts, i):
+    # Returns (callee, in_log) for frames[i], the position of an open parenthesis.
+    # Callees are only looked up when a literal needs them, and then memoized
+    paren = frames[i]
+    context = contexts.get(paren)
+    if context is None:
+        m = _REV_CALLEE_RE.match(text[max(0, paren - 96):paren][::-1])
+        callee = m.group(1)[::-1].replace(" ", "").replace("\t", "") if m else None
+        parent_log = _resolve_frame(text, frames, contexts, i - 1)[1] if i else False
+        context = contexts[paren] = (callee, parent_log or bool(callee and _is_log_call(callee)))
+    return context
+
+def tokenize_swift_strings(text, only_han=False):
+    """Yields (value, line, kind, interpolated) for every string literal in a Swift source text.
+    Literals inside an interpolation (`"\\(n) \\("个".localized)"`) follow the literal holding them.
+
+    With only_han, literals without Han characters are skipped before any context work.
+    """
+    return _tokenize_swift_range(text, 0, len(text), [], {}, 1, 0, only_han)
+
+def _tokenize_swift_range(text, pos, n, frames, contexts, line, last, only_han):
+    search = _MAIN_TOKEN_RE.search
+    while pos < n:
+        m = search(text, pos, n)
+        if not m:
+            break
+        start, pos = m.span()
+        c = text[start]
+        if c == "(":
+            if pos - start == 1:
+                frames.append(start)
+            continue
+        if c == ")":
+            if frames:
+                frames.pop()
+            continue
+        if c == "/":
+            if pos - start == 1 and text.startswith("*", pos):
+                pos = _skip_block_comment(text, pos + 1)
+            continue
+        if c == "#":
+            pos = _HASHES_RE.match(text, start).end()
+            if not text.startswith('"', pos):
+                continue
+            hashes = text[start:pos]
+        else:
+            hashes = ""
+            pos = start
+        multiline = text.startswith('"""', pos)
+        pos += 3 if multiline else 1
+        line += text.count("\n", last, start)
+        last = start
+        pos, body, interpolations = _scan_string_body(text, pos, hashes, multiline)
+        if only_han and not HAN_RE.search(body):
+            continue
+        callee, in_log = _resolve_frame(text, frames, contexts, len(frames) - 1) if frames else (None, False)
+        label = _REV_LABEL_RE.match(text[max(0, start - 32):start][::-1])
+        label = label.group(1)[::-1] if label else None
+        # An explicit .localized wins even inside a logging call
+        if _LOCALIZED_SUFFIX_RE.match(text, pos) or label == "localized":
+            site = "localized"
+        elif in_log:
+            site = "log"
+        elif label == "verbatim":
+            site = "verbatim"
+        elif label == "format" and callee and callee.endswith("String"):
+            site = "format"
+        elif label is not None:
+            site = "other"
+        elif callee:
+            site = CALL_SITE_KINDS.get(callee.lstrip(".").rsplit(".", 1)[-1], "other")
+        else:
+            site = "other"
+        yield decode_swift_literal(body, hashes, multiline), line, site, bool(interpolations)
+        # Each expression is tokenized like code inside a call whose opening parenthesis is `\\(`
+        for expr_start, expr_end in interpolations:
+            yield from _tokenize_swift_range(text, expr_start, expr_end, frames + [expr_start - 1], contexts,
+                                             line, start, only_han)
+
+def extract_swift_strings(text):
+    strings = set()
+    for value, _, site, interpolated in tokenize_swift_strings(text, only_han=True):
+        if interpolated or site in NON_KEY_KINDS or not HAN_RE.search(value):
+            continue
+        strings.add(value)
+    return sorted(strings)
+
+_INTERPOLATION_START_RE = re.compile(r"\\#*\(")
+
+def literal_shape(value):
+    # A decoded literal with each `\(expr)` replaced by \x00; key_shape() maps a catalog key's
+    # format specifiers the same way, so Text("\(n)%") matches the key "%lld%%"
+    out = []
+    pos = 0
+    m = _INTERPOLATION_START_RE.search(value)
+    while m:
+        depth, j = 1, m.end()
+        while j < len(value) and depth:
+            depth += {"(": 1, ")": -1}.get(value[j], 0)
+            j += 1
+        out.append(value[pos:m.start()])
+        out.append("\x00")
+        pos = j
+        m = _INTERPOLATION_START_RE.search(value, pos)
+    out.append(value[pos:])
+    return "".join(out)
+
+def extract_swift_literals(text):
+    """(catalog keys, references) of a Swift source text. References are every literal of any
+    kind, interpolated ones as their literal_shape(); stale tracking checks keys against them."""
+    return literals_of_uses(list(index_swift_literals(text)))
 
-def scan_swift_strings():
+def literals_of_uses(uses):
+    # (catalog keys, references) of the index_swift_literals() rows of one file
+    return sorted({ref for ref, _, _, is_key in uses if is_key}), sorted({ref for ref, _, _, _ in uses})
+
+def load_scan_cache():
+    try:
+        with open(SCAN_CACHE_PATH, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get("version") != SCAN_CACHE_VERSION or cache.get("root") != SWIFT_SCAN_DIR:
+        return {}
+    return cache.get("files", {})
+
+def save_scan_cache(files):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = SCAN_CACHE_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        files = {path: {k: v for k, v in record.items() if k != "uses"} for path, record in files.items()}
+        json.dump({"version": SCAN_CACHE_VERSION, "root": SWIFT_SCAN_DIR, "files": files}, f, ensure_ascii=False)
+    os.replace(tmp_path, SCAN_CACHE_PATH)
+
+def scan_swift_file(path, st, cached):
+    # Unchanged size and mtime: trust the cached result without reading the file
+    if cached and cached["size"] == st.st_size and cached["mtime"] == st.st_mtime_ns:
+        return cached
+    with open(path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha1(raw).hexdigest()
+    # Files touched within the last two seconds may still change without an mtime bump,
+    # so their stat is not recorded and the next run re-checks them by hash
+    mtime = st.st_mtime_ns if time.time_ns() - st.st_mtime_ns > 2_000_000_000 else -1
+    if cached and cached["sha1"] == digest:
+        return {**cached, "size": st.st_size, "mtime": mtime}
+    try:
+        uses = list(index_swift_literals(raw.decode("utf-8")))
+    except UnicodeDecodeError:
+        uses = []
+    strings, refs = literals_of_uses(uses)
+    # "uses" feeds update_source_index() so a changed file is tokenized once; it is not saved
+    # in the scan cache, which would triple in size
+    return {"size": st.st_size, "mtime": mtime, "sha1": digest, "strings": strings, "refs": refs, "uses": uses}
+
+def is_excluded(rel_path, excludes):
+    name = os.path.basename(rel_path)
+    return any(fnmatch.fnmatch(name, g) or fnmatch.fnmatch(rel_path, g) for g in excludes)
+
+def iter_swift_files(root_dir=None, excludes=None):
+    root_dir = root_dir or SWIFT_SCAN_DIR
+    excludes = SCAN_EXCLUDE_GLOBS if excludes is None else excludes
+    for root, dirs, names in os.walk(root_dir):
+        rel_root = os.path.relpath(root, root_dir)
+        rel = lambda n: n if rel_root == "." else os.path.join(rel_root, n)
+        # Pruning in place keeps os.walk from descending into excluded directories
+        dirs[:] = sorted(d for d in dirs if not is_excluded(rel(d), excludes))
+        for name in sorted(names):
+            if name.endswith(".swift") and not is_excluded(rel(name), excludes):
+                yield os.path.join(root, name)
+
+def _scan_swift_job(job):
+    path, st, cached = job
+    try:
+        return path, scan_swift_file(path, st, cached)
+    except OSError:
+        return path, None
+
+def scan_swift_records(use_cache=True, workers=None, executor=None, excludes=None, stats=None, update_cache=True):
+    """{path: scan record} for every Swift file under SWIFT_SCAN_DIR, in path order."""
+    workers = SCAN_WORKERS if workers is None else max(1, workers)
+    executor = executor or SCAN_EXECUTOR
+    cached_files = load_scan_cache() if use_cache else {}
+    files = {}
+    jobs = []
+    for path in iter_swift_files(excludes=excludes):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        cached = cached_files.get(path)
+        if cached and cached["size"] == st.st_size and cached["mtime"] == st.st_mtime_ns:
+            files[path] = cached
+        else:
+            jobs.append((path, st, cached))
+
+    if executor == "serial" or workers == 1 or len(jobs) < SCAN_PARALLEL_MIN_FILES:
+        results = map(_scan_swift_job, jobs)
+    else:
+        pool_cls = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+        with pool_cls(max_workers=workers) as pool:
+            chunksize = max(1, len(jobs) // (workers * 4))
+            results = list(pool.map(_scan_swift_job, jobs, chunksize=chunksize))
+    for path, record in results:
+        if record is not None:
+            files[path] = record
+    if stats is not None:
+        stats.count("files_scanned", len(files))
+        stats.count("scan_cache_hits", len(files) - len(jobs))
+        stats.count("files_read", len(jobs))
+
+    # Merge in path order so the result and the cache file do not depend on completion order
+    files = {path: files[path] for path in sorted(files)}
+    # Files missing from this walk were deleted; rebuilding `files` drops their strings
+    if use_cache and update_cache:
+        if files != cached_files:
+            save_scan_cache(files)
+        indexed = update_source_index(files)
+        if stats is not None:
+            stats.count("files_indexed", indexed)
+    return files
+
+def scan_swift_strings(use_cache=True, workers=None, executor=None, excludes=None, stats=None, update_cache=True):
+    return scan_swift_sources(use_cache, workers, executor, excludes, stats, update_cache)[0]
+
+def scan_swift_sources(use_cache=True, workers=None, executor=None, excludes=None, stats=None, update_cache=True):
+    """(catalog keys, references) over every Swift file; see extract_swift_literals()."""
     strings = set()
-    pattern = re.compile(r'"([^"]*[\u4e00-\u9fa5]+[^"]*)"')
-    for root, _, files in os.walk(SWIFT_SCAN_DIR):
-        for file in files:
-            if file.endswith(".swift"):
+    refs = set()
+    for record in scan_swift_records(use_cache, workers, executor, excludes, stats, update_cache).values():
+        strings.update(record["strings"])
+        refs.update(record["refs"])
+    return strings, refs
+
+# Source index
+# SOURCE_INDEX_PATH maps every literal to its file, line and call-site kind. Each file's rows
+# are tagged with the sha1 of the text they came from; update_source_index() takes the rows a
+# scan just produced for each file whose sha1 differs, and re-reads a file only when its record
+# came from the scan cache (the index was deleted), so refreshing it costs one query when
+# nothing changed.
+_SOURCE_INDEX_SCHEMA = """
+CREATE TABLE meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE files (path TEXT PRIMARY KEY, sha1 TEXT NOT NULL);
+CREATE TABLE uses (
+    path TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    ref TEXT NOT NULL,  -- the literal, interpolated ones as literal_shape()
+    is_key INTEGER NOT NULL  -- extracted as a catalog key
+);
+CREATE INDEX uses_ref ON uses (ref);
+CREATE INDEX uses_path ON uses (path, line);
+"""
+
+def index_swift_literals(text):
+    """(ref, line, kind, is_key) for every literal of a Swift source text."""
+    for value, line, site, interpolated in tokenize_swift_strings(text):
+        is_key = not interpolated and site not in NON_KEY_KINDS and HAN_RE.search(value) is not None
+        yield literal_shape(value) if interpolated else value, line, site, int(is_key)
+
+def open_source_index(path=None):
+    # ":memory:" gives an empty index that lives as long as the connection
+    path = path or SOURCE_INDEX_PATH
+    if path != ":memory:":
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    conn = sqlite3.connect(path)
+    try:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        root = conn.execute("SELECT value FROM meta WHERE name = 'root'").fetchone() if version else None
+    except sqlite3.DatabaseError:
+        version, root = None, None
+    if version != SOURCE_INDEX_VERSION or root != (SWIFT_SCAN_DIR,):
+        if path != ":memory:":
+            conn.close()
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+            conn = sqlite3.connect(path)
+        with conn:
+            conn.executescript(_SOURCE_INDEX_SCHEMA)
+            conn.execute("INSERT INTO meta VALUES ('root', ?)", (SWIFT_SCAN_DIR,))
+            conn.execute(f"PRAGMA user_version = {SOURCE_INDEX_VERSION}")
+    return conn
+
+def update_source_index(files, path=None):
+    """Brings the index in line with scan records {path: record}; returns the files re-indexed."""
+    conn = open_source_index(path)
+    try:
+        return fill_source_index(conn, files)
+    finally:
+        conn.close()
+
+def fill_source_index(conn, files):
+    updated = 0
+    with conn:
+        indexed = dict(conn.execute("SELECT path, sha1 FROM files"))
+        for gone in indexed.keys() - files.keys():
+            conn.execute("DELETE FROM uses WHERE path = ?", (gone,))
+            conn.execute("DELETE FROM files WHERE path = ?", (gone,))
+        for swift_path, record in files.items():
+            if indexed.get(swift_path) == record["sha1"]:
+                continue
+            rows, digest = record.get("uses"), record["sha1"]
+            if rows is None:
                 try:
-                    with open(os.path.join(root, file), "r", encoding="utf-8") as f:
-                        for line in f:
-                            line = line.strip()
-                            if line.startswith("//"): continue
-                            if any(x in line for x in ["AppLogger", "print(", ".log(", "level:"]): continue
-                            matches = pattern.findall(line)
-                            for m in matches:
-                                if "\\(" in m: continue
-                                strings.add(m)
-                except: continue
-    return strings
-
-def manage():
-    if os.path.exists(XCSTRINGS_PATH):
-        with open(XCSTRINGS_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
+                    with open(swift_path, "rb") as f:
+                        raw = f.read()
+                    rows = list(index_swift_literals(raw.decode("utf-8")))
+                except (OSError, UnicodeDecodeError):
+                    raw, rows = b"", []
+                # The sha1 of what was indexed: a file saved again since the scan is re-read next time
+                digest = hashlib.sha1(raw).hexdigest()
+            conn.execute("DELETE FROM uses WHERE path = ?", (swift_path,))
+            conn.executemany("INSERT INTO uses VALUES (?, ?, ?, ?, ?)",
+                             [(swift_path, line, kind, ref, is_key) for ref, line, kind, is_key in rows])
+            conn.execute("INSERT OR REPLACE INTO files VALUES (?, ?)", (swift_path, digest))
+            updated += 1
+    return updated
+
+def find_key_uses(conn, key):
+    """(path, line, kind) of every literal that can produce the catalog key `key`."""
+    refs = {key, key_shape(key)} if "%" in key else {key}
+    marks = ", ".join("?" * len(refs))
+    return conn.execute(f"SELECT path, line, kind FROM uses WHERE ref IN ({marks}) ORDER BY path, line",
+                        sorted(refs)).fetchall()
+
+def find_file_keys(conn, swift_path, all_literals=False):
+    """(line, kind, literal) of the catalog keys (or every literal) of one indexed file."""
+    query = "SELECT line, kind, ref FROM uses WHERE path = ?" + ("" if all_literals else " AND is_key")
+    return conn.execute(query + " ORDER BY line", (swift_path,)).fetchall()
+
+def resolve_indexed_path(conn, name):
+    # Accepts the path as scanned, relative to SWIFT_SCAN_DIR, or any unique path suffix
+    paths = [row[0] for row in conn.execute("SELECT path FROM files")]
+    name = os.path.normpath(name)
+    for candidate in (name, os.path.join(SWIFT_SCAN_DIR, name)):
+        if candidate in paths:
+            return candidate
+    matches = [p for p in paths if p.endswith(os.sep + name)]
+    return matches[0] if len(matches) == 1 else None
+
+# Catalog IO
+# Xcode writes string catalogs with NSJSONSerialization-style pretty printing: two-space
+# indent, `"key" : value`, unescaped slashes, `{\n\n}` for empty objects and keys ordered
+# like Finder (localizedStandardCompare: numeric runs, case-insensitive, punctuation
+# before digits before letters). Matching it keeps our writes and Xcode's byte-identical.
+_COLLATION_PUNCT = "_-‐‑‒–—―,、;:!¡?¿.…。·'‘’‚\"“”„«»‹›()[]{}〔〕「」『』【】《》〈〉§¶@*/\\&#%‰†‡•`´˜^¯¨°©®+±÷×<=>¬|¦~¤¢$£¥€"
+_COLLATION_PUNCT_RANK = {c: i for i, c in enumerate(_COLLATION_PUNCT)}
+_COLLATION_RUN_RE = re.compile(r"\d+|\D")
+_collation_cache = {}
+
+def _collation_weight(c):
+    w = _collation_cache.get(c)
+    if w is None:
+        base = "".join(b for b in unicodedata.normalize("NFKD", c) if not unicodedata.combining(b)) or c
+        b = base[0]
+        if b.isspace():
+            w = (0, ord(b))
+        elif unicodedata.category(b)[0] in "PS":
+            rank = _COLLATION_PUNCT_RANK.get(b)
+            w = (1, rank) if rank is not None else (2, ord(b))
+        else:
+            w = (4, ord(b.casefold()[0]))
+        _collation_cache[c] = w
+    return w
+
+def xcode_sort_key(s):
+    # Primary weights first, then the original code points to break ties (case, width)
+    primary = []
+    for run in _COLLATION_RUN_RE.findall(s):
+        primary.append((3, int(run)) if run[0].isdigit() else _collation_weight(run))
+    return primary, [ord(c) for c in s]
+
+_sorted_keys_cache = {}
+
+def _sorted_keys(obj):
+    # Nested objects repeat the same small key sets (language codes, stringUnit fields)
+    keys = tuple(obj)
+    ordered = _sorted_keys_cache.get(keys)
+    if ordered is None:
+        ordered = _sorted_keys_cache[keys] = sorted(keys, key=xcode_sort_key)
+    return ordered
+
+def merge_key_order(previous_keys, keys):
+    """Orders `keys` for writing: keys that were already in the file keep their relative order
+    (Xcode sorts Han by radical-stroke, which xcode_sort_key only approximates), new keys are
+    merged in by xcode_sort_key."""
+    keys = set(keys)
+    kept = [k for k in previous_keys if k in keys]
+    kept_set = set(kept)
+    added = sorted((k for k in keys if k not in kept_set), key=xcode_sort_key)
+    if not added:
+        return kept
+    out = []
+    i = 0
+    for key in added:
+        sort_key = xcode_sort_key(key)
+        while i < len(kept) and xcode_sort_key(kept[i]) <= sort_key:
+            out.append(kept[i])
+            i += 1
+        out.append(key)
+    out.extend(kept[i:])
+    return out
+
+def _xcode_json(obj, indent, out, key_order=None):
+    if isinstance(obj, dict):
+        if not obj:
+            out.append("{\n\n" + "  " * indent + "}")
+            return
+        pad = "  " * (indent + 1)
+        keys = key_order if key_order is not None else _sorted_keys(obj)
+        out.append("{\n")
+        for i, key in enumerate(keys):
+            out.append(pad + encode_basestring(key) + " : ")
+            _xcode_json(obj[key], indent + 1, out)
+            out.append(",\n" if i < len(keys) - 1 else "\n")
+        out.append("  " * indent + "}")
+    elif isinstance(obj, list):
+        if not obj:
+            out.append("[\n\n" + "  " * indent + "]")
+            return
+        pad = "  " * (indent + 1)
+        out.append("[\n")
+        for i, item in enumerate(obj):
+            out.append(pad)
+            _xcode_json(item, indent + 1, out)
+            out.append(",\n" if i < len(obj) - 1 else "\n")
+        out.append("  " * indent + "]")
+    elif isinstance(obj, str):
+        out.append(encode_basestring(obj))
     else:
-        data = {"sourceLanguage": "zh-Hans", "strings": {}, "version": "1.1"}
+        out.append(json.dumps(obj))
+
+def xcode_dumps(data, previous_keys=()):
+    out = ["{\n"]
+    top_keys = sorted(data, key=xcode_sort_key)
+    for i, key in enumerate(top_keys):
+        out.append("  " + json.dumps(key, ensure_ascii=False) + " : ")
+        if key == "strings":
+            _xcode_json(data[key], 1, out, merge_key_order(previous_keys, data[key]))
+        else:
+            _xcode_json(data[key], 1, out)
+        out.append(",\n" if i < len(top_keys) - 1 else "\n")
+    out.append("}")
+    return "".join(out)
+
+def load_catalog(path=None):
+    path = path or XCSTRINGS_PATH
+    if not os.path.exists(path):
+        return {"sourceLanguage": "zh-Hans", "strings": {}, "version": "1.1"}, b""
+    with open(path, "rb") as f:
+        raw = f.read()
+    return json.loads(raw), raw
+
+def write_catalog(data, previous_raw=b"", previous_keys=(), path=None):
+    """Writes the catalog in Xcode's format; returns False without touching the file when
+    the serialized bytes equal previous_raw."""
+    path = path or XCSTRINGS_PATH
+    encoded = xcode_dumps(data, previous_keys).encode("utf-8")
+    if encoded == previous_raw:
+        return False
+    write_bytes_atomic(path, encoded)
+    return True
+
+def write_bytes_atomic(path, encoded):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(encoded)
+    os.replace(tmp_path, path)
+
+# Catalog model
+# In memory a catalog is a Catalog of Entry objects. Each Entry keeps its localizations in a
+# list indexed by the catalog's language table; a plain translated stringUnit is a single
+# Localization, anything else (variations, substitutions, extra fields) stays as parsed.
+# Conversion from and to the xcstrings JSON happens only in load_catalog_model() and
+# catalog_dumps().
+TRANSLATED = sys.intern("translated")
+
+class Localization:
+    __slots__ = ("state", "value")
+
+    def __init__(self, state, value):
+        self.state = state
+        self.value = value
+
+    def to_json(self):
+        return {"stringUnit": {"state": self.state, "value": self.value}}
+
+def _plain_json(obj):
+    # Localizations nested in variations/substitutions back to JSON objects
+    if isinstance(obj, Localization):
+        return obj.to_json()
+    if isinstance(obj, dict):
+        return {k: _plain_json(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_plain_json(v) for v in obj]
+    return obj
+
+def _catalog_object_hook(pairs):
+    # {"stringUnit": {"state": ..., "value": ...}} becomes a Localization while parsing, so the
+    # two dicts per cell never coexist for the whole catalog
+    if len(pairs) == 1 and pairs[0][0] == "stringUnit":
+        unit = pairs[0][1]
+        if type(unit) is dict and len(unit) == 2 and "state" in unit and "value" in unit:
+            return Localization(sys.intern(unit["state"]), unit["value"])
+    return dict(pairs)
+
+class Entry:
+    # fields: the entry's other members, shared between entries with equal ones (treat as
+    # read-only); locs: Localization, raw localization object or None per language id, or
+    # None when the entry has no "localizations" member at all
+    __slots__ = ("fields", "locs")
+
+    def __init__(self, fields, locs):
+        self.fields = fields
+        self.locs = locs
+
+class Catalog:
+    __slots__ = ("fields", "langs", "lang_ids", "entries", "shared_fields")
+
+    def __init__(self, fields=None, langs=()):
+        self.fields = dict(fields or {})  # top-level members other than "strings"
+        self.langs = []
+        self.lang_ids = {}
+        self.entries = {}  # key -> Entry, in file order
+        # One dict per distinct set of entry fields; it goes away with the catalog, so a watch
+        # session that reloads the catalog does not keep the old ones alive
+        self.shared_fields = {}
+        for lang in langs:
+            self.lang_id(lang)
+
+    def lang_id(self, lang):
+        i = self.lang_ids.get(lang)
+        if i is None:
+            i = self.lang_ids[sys.intern(lang)] = len(self.langs)
+            self.langs.append(lang)
+        return i
+
+    @classmethod
+    def from_json(cls, data):
+        catalog = cls({k: v for k, v in data.items() if k != "strings"}, LANGS)
+        for key, obj in data.get("strings", {}).items():
+            catalog.entries[key] = catalog.entry_from_json(obj)
+        return catalog
+
+    def entry_from_json(self, obj):
+        fields = {k: v for k, v in obj.items() if k != "localizations"}
+        try:
+            fields = self.shared_fields.setdefault(tuple(sorted(fields.items())), fields)
+        except TypeError:
+            pass  # unhashable members (comments with structure); keep a private dict
+        locs = None
+        if "localizations" in obj:
+            locs = [None] * len(self.langs)
+            seen = {}
+            for lang, loc in obj["localizations"].items():
+                if type(loc) is dict:
+                    loc = _catalog_object_hook(list(loc.items())) if list(loc) == ["stringUnit"] else loc
+                if isinstance(loc, Localization):
+                    # Fallback values repeat across languages; keep one string object per entry
+                    loc.value = seen.setdefault(loc.value, loc.value)
+                i = self.lang_id(lang)
+                if i >= len(locs):
+                    locs.extend([None] * (i + 1 - len(locs)))
+                locs[i] = loc
+        return Entry(fields, locs)
+
+    def new_entry(self):
+        return self.entry_from_json({"extractionState": "manual", "localizations": {}})
+
+    def set_field(self, entry, name, value):
+        # entry.fields may be shared with other entries: swap in another dict, never mutate it
+        fields = dict(entry.fields)
+        fields[name] = value
+        try:
+            fields = self.shared_fields.setdefault(tuple(sorted(fields.items())), fields)
+        except TypeError:
+            pass
+        entry.fields = fields
+
+    def entry_json(self, entry):
+        obj = dict(entry.fields)
+        if entry.locs is not None:
+            obj["localizations"] = {self.langs[i]: _plain_json(loc) for i, loc in enumerate(entry.locs) if loc is not None}
+        return obj
+
+    def to_json(self):
+        data = dict(self.fields)
+        data["strings"] = {key: self.entry_json(entry) for key, entry in self.entries.items()}
+        return data
+
+    def existing_values(self, entry):
+        # {lang: stringUnit value} as resolve_values() expects
+        existing = {}
+        for lang, loc in zip(self.langs, entry.locs or ()):
+            if loc is None:
+                continue
+            if isinstance(loc, Localization):
+                existing[lang] = loc.value
+            elif "stringUnit" in loc:
+                existing[lang] = _plain_json(loc["stringUnit"]).get("value")
+        return existing
+
+    def cell(self, entry, lang):
+        i = self.lang_ids.get(lang)
+        if i is None or entry.locs is None or i >= len(entry.locs):
+            return None
+        return entry.locs[i]
+
+    def set_cell(self, entry, lang, loc):
+        i = self.lang_id(lang)
+        if entry.locs is None:
+            entry.locs = []
+        if i >= len(entry.locs):
+            entry.locs.extend([None] * (i + 1 - len(entry.locs)))
+        entry.locs[i] = loc
+
+def load_catalog_model(path=None):
+    path = path or XCSTRINGS_PATH
+    if not os.path.exists(path):
+        return Catalog({"sourceLanguage": "zh-Hans", "version": "1.1"}, LANGS), b""
+    with open(path, "rb") as f:
+        raw = f.read()
+    return parse_catalog_model(raw), raw
+
+def parse_catalog_model(raw):
+    data = json.loads(raw, object_pairs_hook=_catalog_object_hook)
+    strings = data.pop("strings", {})
+    catalog = Catalog(data, LANGS)
+    # Entries are converted (and their parsed dicts dropped) one at a time
+    for key in list(strings):
+        catalog.entries[key] = catalog.entry_from_json(strings.pop(key))
+    return catalog
+
+_localization_templates = {}
+
+def _localization_template(indent):
+    # The exact text _xcode_json writes for a plain stringUnit at this indent
+    t = _localization_templates.get(indent)
+    if t is None:
+        pad, pad1, pad2 = "  " * indent, "  " * (indent + 1), "  " * (indent + 2)
+        t = _localization_templates[indent] = (
+            "{\n" + pad1 + '"stringUnit" : {\n' + pad2 + '"state" : ',
+            ",\n" + pad2 + '"value" : ',
+            "\n" + pad1 + "}\n" + pad + "}",
+        )
+    return t
+
+def _entry_xcode_json(catalog, entry, indent, out):
+    members = list(entry.fields)
+    if entry.locs is not None:
+        members.append("localizations")
+    if not members:
+        out.append("{\n\n" + "  " * indent + "}")
+        return
+    pad = "  " * (indent + 1)
+    keys = _sorted_keys(members)
+    out.append("{\n")
+    for n, name in enumerate(keys):
+        out.append(pad + encode_basestring(name) + " : ")
+        if name != "localizations":
+            _xcode_json(entry.fields[name], indent + 1, out)
+        else:
+            present = {catalog.langs[i]: loc for i, loc in enumerate(entry.locs) if loc is not None}
+            if not present:
+                out.append("{\n\n" + pad + "}")
+            else:
+                lang_pad = "  " * (indent + 2)
+                head, mid, tail = _localization_template(indent + 2)
+                langs = _sorted_keys(present)
+                out.append("{\n")
+                for m, lang in enumerate(langs):
+                    loc = present[lang]
+                    out.append(lang_pad + encode_basestring(lang) + " : ")
+                    if isinstance(loc, Localization):
+                        out.append(head + encode_basestring(loc.state) + mid + encode_basestring(loc.value) + tail)
+                    else:
+                        _xcode_json(_plain_json(loc), indent + 2, out)
+                    out.append(",\n" if m < len(langs) - 1 else "\n")
+                out.append(pad + "}")
+        out.append(",\n" if n < len(keys) - 1 else "\n")
+    out.append("  " * indent + "}")
+
+def catalog_dumps(catalog, previous_keys=()):
+    """Same bytes as xcode_dumps(catalog.to_json(), previous_keys), without building the dicts."""
+    fields = dict(catalog.fields)
+    fields["strings"] = None
+    out = ["{\n"]
+    top_keys = sorted(fields, key=xcode_sort_key)
+    for i, name in enumerate(top_keys):
+        out.append("  " + json.dumps(name, ensure_ascii=False) + " : ")
+        if name != "strings":
+            _xcode_json(fields[name], 1, out)
+        elif not catalog.entries:
+            out.append("{\n\n  }")
+        else:
+            keys = merge_key_order(previous_keys, catalog.entries)
+            out.append("{\n")
+            for n, key in enumerate(keys):
+                out.append("    " + encode_basestring(key) + " : ")
+                _entry_xcode_json(catalog, catalog.entries[key], 2, out)
+                out.append(",\n" if n < len(keys) - 1 else "\n")
+            out.append("  }")
+        out.append(",\n" if i < len(top_keys) - 1 else "\n")
+    out.append("}")
+    return "".join(out)
+
+def write_catalog_model(catalog, previous_raw=b"", previous_keys=(), path=None):
+    """write_catalog() for a Catalog."""
+    path = path or XCSTRINGS_PATH
+    encoded = catalog_dumps(catalog, previous_keys).encode("utf-8")
+    if encoded == previous_raw:
+        return False
+    write_bytes_atomic(path, encoded)
+    return True
+
+# Resolution
+class ZhHantConverter:
+    """OpenCC-style zh-Hans -> zh-Hant conversion: every table entry goes into one trie and
+    each string is converted in a single left-to-right pass, taking the longest match at each
+    position. The cost per character is bounded by the longest phrase, not the table size."""
+
+    _VALUE = ""  # trie slot holding the replacement of the path so far
+
+    def __init__(self, paths):
+        self.paths = paths
+        self._trie = None
+        self._memo = {}
+
+    def _compile(self):
+        trie = {}
+        for path in self.paths:
+            try:
+                f = open(path, "r", encoding="utf-8")
+            except OSError:
+                continue
+            with f:
+                f.readline()  # header
+                for line in f:
+                    source, _, target = line.rstrip("\n").partition("\t")
+                    if not source or not target:
+                        continue
+                    node = trie
+                    for c in source:
+                        node = node.setdefault(c, {})
+                    node[self._VALUE] = target
+        self._trie = trie
+
+    def digest(self):
+        # Changes whenever a table does, so cached zh-Hant results can be invalidated
+        h = hashlib.sha1()
+        for path in self.paths:
+            try:
+                with open(path, "rb") as f:
+                    h.update(f.read())
+            except OSError:
+                pass
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def convert(self, text):
+        out = self._memo.get(text)
+        if out is not None:
+            return out
+        if self._trie is None:
+            self._compile()
+        trie, value = self._trie, self._VALUE
+        parts = []
+        i, n = 0, len(text)
+        while i < n:
+            node = trie.get(text[i])
+            if node is None:
+                parts.append(text[i])
+                i += 1
+                continue
+            match, match_end = node.get(value), i + 1
+            j = i + 1
+            while j < n:
+                node = node.get(text[j])
+                if node is None:
+                    break
+                j += 1
+                if value in node:
+                    match, match_end = node[value], j
+            parts.append(match if match is not None else text[i])
+            i = match_end
+        out = self._memo[text] = "".join(parts)
+        return out
+
+ZH_HANT = ZhHantConverter(ZH_HANT_TABLES)
+
+def to_zh_hant(text):
+    return ZH_HANT.convert(text)
+
+# Fallback graph
+# When DICT has no value for a cell, its language's entry says which value the catalog keeps
+# ("translation": any value, unless it is Han for a Han key; "edited": any value but the key;
+# None: none) and otherwise derives it: DERIVATIONS[name](key, *resolved values of the sources),
+# as in pt-BR <- pt <- en or br = braille(en). Languages not listed use DEFAULT_FALLBACK.
+# Adding a locale or a derivation only touches these tables.
+
+def _derive_key(key):
+    return key
+
+def _derive_first(key, *values):
+    # The first source value that translates the key; a Han value is no translation of a Han key
+    for value in values:
+        if value and not (HAN_RE.search(value) and HAN_RE.search(key)):
+            return value
+    return key
+
+def _derive_braille(key, english=None):
+    return to_braille(english or key)
+
+def _derive_zh_hant(key):
+    return to_zh_hant(key)
+
+# name -> function(key, *source values)
+DERIVATIONS = {
+    "key": _derive_key,
+    "first": _derive_first,
+    "braille": _derive_braille,
+    "zh-Hant": _derive_zh_hant,
+}
+
+# lang -> (keep, derivation, sources)
+DEFAULT_FALLBACK = ("translation", "first", ("en",))
+LANG_FALLBACKS = {
+    "en": ("translation", "first", ()),
+    "zh-Hans": ("edited", "key", ()),
+    "zh-Hant": ("edited", "zh-Hant", ()),
+    "br": (None, "braille", ("en",)),
+}
+
+# "translation" languages written with Han characters: there a Han value is a translation (ja
+# 設定 for 设置), so only a copy of the key counts as untranslated, as for "edited"
+HAN_SCRIPT_LANGS = {"ja"}
+
+def fallback_of(lang):
+    return LANG_FALLBACKS.get(lang, DEFAULT_FALLBACK)
+
+def translated_languages(langs=None):
+    # Languages of LANGS (or of `langs`) whose cells hold real translations rather than derived text
+    return [lang for lang in LANGS if (langs is None or lang in langs) and fallback_of(lang)[0] == "translation"]
+
+class ResolvePlan:
+    """The fallback graph of `langs` (default LANGS) and every language they derive from, each
+    after its sources; build once per run and pass to resolve_columns()."""
+
+    def __init__(self, langs=None):
+        self.langs = [lang for lang in LANGS if langs is None or lang in langs]
+        self.order = []  # (lang, keep, derivation name, function, sources)
+        done = {}  # lang -> False while its sources are being ordered
+        for lang in self.langs:
+            self._visit(lang, done, [])
+
+    def _visit(self, lang, done, path):
+        if done.get(lang):
+            return
+        if lang in done:
+            raise ValueError("fallback cycle: " + " <- ".join(path[path.index(lang):] + [lang]))
+        done[lang] = False
+        keep, name, sources = fallback_of(lang)
+        for source in sources:
+            self._visit(source, done, path + [lang])
+        done[lang] = True
+        self.order.append((lang, keep, name, DERIVATIONS[name], tuple(sources)))
+
+def resolve_plan(langs=None):
+    return ResolvePlan(langs)
+
+def resolve_columns(keys, existing, plan=None, stats=None):
+    """{lang: [value per key]} for a list of keys and their {lang: current value} dicts. Each
+    language is one pass over the batch; a derived column is computed once per (derivation,
+    sources) and shared by every language using it."""
+    plan = plan or resolve_plan()
+    rows = [(n, row) for n, row in enumerate(map(DICT.get, keys)) if row]
+    has_han = [HAN_RE.search(key) is not None for key in keys]
+    columns, derived = {}, {}
+    for lang, keep, name, derive, sources in plan.order:
+        column = derived.get((name, sources))
+        if column is None:
+            column = derived[name, sources] = list(map(derive, keys, *[columns[source] for source in sources]))
+        current = [values.get(lang) for values in existing]
+        if keep == "translation" and lang not in HAN_SCRIPT_LANGS:
+            out = [cur if cur and not (han and HAN_RE.search(cur)) else val for cur, han, val in zip(current, has_han, column)]
+        elif keep in ("translation", "edited"):
+            out = [cur if cur and cur != key else val for cur, key, val in zip(current, keys, column)]
+        else:
+            out = column[:]
+        fixed = {n: row[lang] for n, row in rows if lang in row}  # DICT values always win
+        if stats is not None:
+            if keep == "translation":
+                # A kept value equals the current one, so these are the fallbacks that change a cell
+                for n, (val, cur, key) in enumerate(zip(out, current, keys)):
+                    if val != cur and n not in fixed:
+                        stats.count("cells_fallback_key" if val == key else "cells_fallback_source")
+            elif keep == "edited":
+                stats.count("cells_" + name, sum(1 for n, (cur, key) in enumerate(zip(current, keys))
+                                                 if not (cur and cur != key) and n not in fixed))
+            else:
+                stats.count("cells_" + name, len(keys) - len(fixed))
+        for n, value in fixed.items():
+            out[n] = value
+        columns[lang] = out
+    return {lang: columns[lang] for lang in plan.langs}
+
+def resolve_key(key, locs, plan=None, stats=None):
+    """{lang: value} for one key given its xcstrings `localizations` object."""
+    existing = {lang: loc["stringUnit"].get("value") for lang, loc in locs.items() if "stringUnit" in loc}
+    return resolve_values(key, existing, plan, stats)
+
+def resolve_values(key, existing, plan=None, stats=None):
+    return {lang: column[0] for lang, column in resolve_columns([key], [existing], plan, stats).items()}
+
+# Dirty-key tracking
+def load_resolve_state():
+    try:
+        with open(RESOLVE_STATE_PATH, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if state.get("salt") != resolve_salt() or state.get("catalog") != XCSTRINGS_PATH:
+        return {}
+    return state.get("fingerprints", {})
+
+def save_resolve_state(fingerprints):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = RESOLVE_STATE_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"salt": resolve_salt(), "catalog": XCSTRINGS_PATH, "fingerprints": fingerprints}, f)
+    os.replace(tmp_path, RESOLVE_STATE_PATH)
+
+def resolve_salt():
+    # Anything that changes how every key resolves invalidates all fingerprints at once
+    return hashlib.sha1(json.dumps([RESOLVE_STATE_VERSION, LANGS, DEFAULT_FALLBACK, sorted(LANG_FALLBACKS.items()), sorted(HAN_SCRIPT_LANGS), BRAILLE.grade, ZH_HANT.digest()]).encode("utf-8")).hexdigest()
+
+def key_fingerprint(key, catalog, entry, in_sources):
+    # Inputs of one key's resolution: its DICT row, whether the sources still use it and the
+    # cells currently in the catalog. Entry fields are not read by the resolver; plain cells
+    # are hashed from their state and value, so only variations and the like go through JSON
+    parts = [str(DICT.row_digest(key)), "1" if in_sources else "0"]
+    for lang, loc in zip(catalog.langs, entry.locs or ()):
+        if loc is None:
+            continue
+        if loc.__class__ is Localization:
+            parts += (lang, loc.state, loc.value)
+        else:
+            parts += (lang, "", json.dumps(_plain_json(loc), sort_keys=True, ensure_ascii=False))
+    return hashlib.sha1("\x00".join(parts).encode("utf-8")).hexdigest()
+
+# Stale keys
+# A catalog key is live while some Swift literal could produce it: the same text, or the same
+# shape with format specifiers standing for interpolations. Other keys get Xcode's
+# "extractionState": "stale" and a record in STALE_KEYS_PATH ({"since": first day missing,
+# "extractionState": the state to restore if the key comes back}); sync --prune-stale drops
+# them once the record is older than the grace period. Both are opt-in: a plain sync leaves
+# extractionState alone, as LocalizationAuditTests expects no stale entries in the catalog.
+STALE = "stale"
+
+def key_shape(key):
+    return _FORMAT_SPECIFIER_RE.sub(lambda m: "%" if m.group() == "%%" else "\x00", key)
+
+def is_referenced(key, refs):
+    return key in refs or ("%" in key and key_shape(key) in refs)
+
+def today():
+    return datetime.datetime.now(datetime.timezone.utc).date().isoformat()
+
+def load_stale_records(path=None):
+    try:
+        with open(path or STALE_KEYS_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_stale_records(records, path=None):
+    path = path or STALE_KEYS_PATH
+    if not records and not os.path.exists(path):
+        return
+    _dump_shard(path, {key: records[key] for key in sorted(records, key=xcode_sort_key)})
+
+def expired_stale_keys(records, refs, grace_days=STALE_GRACE_DAYS, day=None):
+    """Recorded keys still unreferenced whose record is at least grace_days old."""
+    day = datetime.date.fromisoformat(day or today())
+    expired = set()
+    for key, record in records.items():
+        if (day - datetime.date.fromisoformat(record["since"])).days >= grace_days and not is_referenced(key, refs):
+            expired.add(key)
+    return expired
+
+def mark_stale(catalog, key, entry, refs, records, new_records, day, on_stale=None):
+    """Marks one Entry stale (or restores it) and adds its record to new_records if it stays
+    stale; returns whether the entry changed. on_stale(key, old_state, new_state)."""
+    state = entry.fields.get("extractionState")
+    if is_referenced(key, refs):
+        if state != STALE:
+            return False
+        restored = records.get(key, {}).get("extractionState", "manual")
+        catalog.set_field(entry, "extractionState", restored)
+        if on_stale:
+            on_stale(key, state, restored)
+        return True
+    record = dict(records.get(key) or {"since": day})
+    record.pop("pruned", None)
+    new_records[key] = record
+    if state == STALE:
+        return False
+    if state is not None:
+        record["extractionState"] = state
+    catalog.set_field(entry, "extractionState", STALE)
+    if on_stale:
+        on_stale(key, state, STALE)
+    return True
+
+def track_stale(catalog, refs, records, day=None, on_stale=None):
+    """mark_stale() over every entry; returns (new records, keys whose entry changed). Records of
+    pruned DICT keys are kept so later syncs do not add them back."""
+    day = day or today()
+    new_records = {}
+    changed = [key for key, entry in catalog.entries.items()
+               if mark_stale(catalog, key, entry, refs, records, new_records, day, on_stale)]
+    for key, record in records.items():
+        if record.get("pruned") and key not in catalog.entries and key in DICT and not is_referenced(key, refs):
+            new_records[key] = record
+    return new_records, changed
+
+def prune_stale(catalog, refs, records, grace_days=None, stats=None):
+    """Drops the keys stale for at least grace_days (None: drops nothing) from the Catalog and
+    flags their records as pruned; returns the pruned keys sync must not add back."""
+    expired = expired_stale_keys(records, refs, grace_days) if grace_days is not None else ()
+    for key in expired:
+        records[key] = dict(records[key], pruned=True)
+        if catalog.entries.pop(key, None) is not None and stats is not None:
+            stats.count("keys_pruned")
+    return {key for key, record in records.items()
+            if record.get("pruned") and key not in catalog.entries and not is_referenced(key, refs)}
+
+def sync_keys(catalog, found_strings, excluded):
+    # The keys sync_strings() visits by default, minus pruned ones (None when nothing is excluded)
+    if not excluded:
+        return None
+    return (set(catalog.entries) | found_strings | set(DICT.keys())) - excluded
+
+# Translation memory
+# Every catalog key with real translations is a segment. Segments are numbered by length, so
+# the lengths a match can have (score = 1 - edit distance / longer length >= min_score) are one
+# id range, and each n-gram's posting list is an ascending array sliced to that range. Segments
+# sharing too few n-grams to reach min_score are dropped before any edit distance is computed.
+def edit_distance(a, b, limit):
+    """Levenshtein distance of a and b, or limit + 1 once it is certain to exceed limit."""
+    # A shared prefix or suffix never costs an edit
+    n = min(len(a), len(b))
+    prefix = 0
+    while prefix < n and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < n - prefix and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+    a, b = a[prefix:len(a) - suffix], b[prefix:len(b) - suffix]
+    if len(a) < len(b):
+        a, b = b, a
+    if len(a) - len(b) > limit:
+        return limit + 1
+    if not b:
+        return len(a)
+    # Only cells within `limit` of the diagonal can stay within limit
+    big = limit + 1
+    previous = [j if j <= limit else big for j in range(len(b) + 1)]
+    for i, ca in enumerate(a, 1):
+        lo = max(1, i - limit)
+        hi = min(len(b), i + limit)
+        current = [big] * (len(b) + 1)
+        current[0] = i if i <= limit else big
+        best = current[0]
+        for j in range(lo, hi + 1):
+            d = previous[j - 1] + (ca != b[j - 1])
+            if previous[j] + 1 < d:
+                d = previous[j] + 1
+            if current[j - 1] + 1 < d:
+                d = current[j - 1] + 1
+            current[j] = d
+            if d < best:
+                best = d
+        if best > limit:
+            return big
+        previous = current
+    return min(previous[-1], big)
+
+class TranslationMemory:
+    def __init__(self, n=TM_NGRAM):
+        self.n = n
+        self._pending = []
+        self.sources = []
+        self.texts = []
+        self.translations = []
+        self.lengths = array("I")
+        self.postings = {}
+
+    @staticmethod
+    def normalize(text):
+        # Placeholders compare equal whatever their type or position
+        return key_shape(text).casefold()
+
+    def grams(self, text):
+        padded = "\x02" + text + "\x03"
+        return {padded[i:i + self.n] for i in range(len(padded) - self.n + 1)}
+
+    def add(self, source, translations):
+        self._pending.append((source, translations))
+
+    def __len__(self):
+        return len(self.sources) + len(self._pending)
+
+    def build(self):
+        if not self._pending:
+            return
+        segments = list(zip(self.sources, self.translations)) + self._pending
+        self._pending = []
+        normalized = sorted(((self.normalize(source), source, translations) for source, translations in segments),
+                            key=lambda s: len(s[0]))
+        self.texts = [text for text, _, _ in normalized]
+        self.sources = [source for _, source, _ in normalized]
+        self.translations = [translations for _, _, translations in normalized]
+        self.lengths = array("I", (len(text) for text in self.texts))
+        postings = {}
+        for sid, text in enumerate(self.texts):
+            for gram in self.grams(text):
+                ids = postings.get(gram)
+                if ids is None:
+                    ids = postings[gram] = array("I")
+                ids.append(sid)
+        self.postings = postings
+
+    def lookup(self, text, min_score=TM_MIN_SCORE, candidates=TM_CANDIDATES):
+        """[(score, segment id)] of the segments at least min_score similar to text, best first."""
+        self.build()
+        query = self.normalize(text)
+        grams = self.grams(query)
+        la = len(query)
+        if not self.texts or la == 0:
+            return []
+        # Length filter: the id range of segments whose length allows min_score
+        lo = bisect.bisect_left(self.lengths, math.ceil(la * min_score))
+        hi = bisect.bisect_right(self.lengths, int(la / min_score))
+        counts = collections.Counter()
+        for gram in grams:
+            ids = self.postings.get(gram)
+            if ids:
+                counts.update(ids[bisect.bisect_left(ids, lo):bisect.bisect_left(ids, hi)])
+        matches = []
+        for sid, shared in counts.most_common(candidates):
+            longer = max(la, self.lengths[sid])
+            limit_edits = int((1 - min_score) * longer)
+            # Count filter: an edit destroys at most n of the query's n-grams
+            if shared < len(grams) - self.n * limit_edits:
+                continue
+            distance = edit_distance(query, self.texts[sid], limit_edits)
+            if distance <= limit_edits:
+                matches.append((1 - distance / longer, sid))
+        matches.sort(key=lambda m: (-m[0], m[1]))
+        return matches
+
+def memory_translations(key, existing):
+    """{lang: value} of the cells of one key that hold a real translation: translated_languages(),
+    minus fallbacks (the key itself, a copy of English, Han for a Han key outside HAN_SCRIPT_LANGS)."""
+    has_han = HAN_RE.search(key) is not None
+    english = existing.get("en")
+    out = {}
+    for lang in translated_languages():
+        value = existing.get(lang)
+        if not value or value == key:
+            continue
+        if (has_han and lang not in HAN_SCRIPT_LANGS and HAN_RE.search(value)) or (lang != "en" and value == english):
+            continue
+        out[lang] = value
+    return out
+
+def build_translation_memory(catalog):
+    tm = TranslationMemory()
+    for key, entry in catalog.entries.items():
+        translations = memory_translations(key, catalog.existing_values(entry))
+        if key and translations:
+            tm.add(key, translations)
+    return tm
+
+def suggest_translations(tm, catalog, key, min_score=TM_MIN_SCORE, limit=TM_SUGGESTIONS, langs=None):
+    """{lang: [(score, value, source key)]} for the languages `key` has no real translation in.
+    Similarity ignores placeholder types, so sources and values whose format specifiers differ
+    from the key's (%@ for %lld, or any for none) are left out."""
+    entry = catalog.entries.get(key)
+    have = memory_translations(key, catalog.existing_values(entry)) if entry is not None else {}
+    missing = [lang for lang in translated_languages(langs) if lang not in have]
+    suggestions = {}
+    if not missing:
+        return suggestions
+    signature = placeholder_signature(key)
+    for score, sid in tm.lookup(key, min_score):
+        source = tm.sources[sid]
+        if source == key or placeholder_signature(source) != signature:
+            continue
+        for lang in missing:
+            value = tm.translations[sid].get(lang)
+            found = suggestions.setdefault(lang, [])
+            if value is not None and len(found) < limit and placeholder_signature(value) == signature:
+                found.append((score, value, source))
+    return {lang: found for lang, found in suggestions.items() if found}
+
+def untranslated_keys(catalog, keys=None):
+    # Han keys (of `keys`, default all) without a DICT row that still fall back somewhere, in file order
+    translated_langs = set(translated_languages())
+    untranslated = []
+    for key in catalog.entries if keys is None else keys:
+        entry = catalog.entries.get(key)
+        if entry is not None and HAN_RE.search(key) and key not in DICT and \
+                set(memory_translations(key, catalog.existing_values(entry))) != translated_langs:
+            untranslated.append(key)
+    return untranslated
+
+# Machine translation
+# translate fills the cells of Han keys that neither DICT nor the catalog translates. Format
+# specifiers are sent as {0}, {1}, ..., so each distinct masked text is requested once per language
+# however many keys share it. Texts already in the MT cache are never sent; the rest go out in
+# per-language batches, at most `concurrency` in flight and `rate` started per second, and each
+# batch is committed to the cache as it arrives, so an interrupted run resumes where it stopped.
+# Accepted values are written to DICT_PATH, where they are reviewed like any other row.
+# asyncio and urllib are imported where used: they would double every other command's start-up.
+_MT_TOKEN_RE = re.compile(r"\{(\d+)\}")
+
+class TranslationBackendError(Exception):
+    def __init__(self, message, retryable=True, retry_after=None):
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+class TranslationBackend:
+    """A machine-translation service. translate() returns the translations of one batch of texts,
+    in order, or raises TranslationBackendError; `name` is part of every cache key."""
+    name = "backend"
+
+    async def translate(self, texts, source, target):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+class HttpTranslationBackend(TranslationBackend):
+    """POSTs {"source", "target", "texts"} as JSON and expects {"translations"} in the same order.
+    408, 429 and 5xx responses and network errors are retryable (Retry-After is honoured)."""
+
+    def __init__(self, endpoint, api_key=None, timeout=MT_TIMEOUT, concurrency=MT_CONCURRENCY):
+        if not endpoint:
+            raise TranslationBackendError(f"no endpoint: pass --endpoint or set {MT_ENDPOINT_ENV}", retryable=False)
+        self.endpoint = endpoint
+        self.api_key = api_key
+        self.timeout = timeout
+        self.name = "http:" + endpoint
+        # urllib blocks; one thread per request in flight
+        self._executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    async def translate(self, texts, source, target):
+        import asyncio
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._post, texts, source, target)
+
+    def _post(self, texts, source, target):
+        import urllib.request
+        import urllib.error
+        body = json.dumps({"source": source, "target": target, "texts": texts}, ensure_ascii=False).encode("utf-8")
+        headers = {"Content-Type": "application/json; charset=utf-8"}
+        if self.api_key:
+            headers["Authorization"] = "Bearer " + self.api_key
+        request = urllib.request.Request(self.endpoint, body, headers, method="POST")
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                reply = json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            try:
+                retry_after = float(e.headers.get("Retry-After"))
+            except (AttributeError, TypeError, ValueError):
+                retry_after = None
+            raise TranslationBackendError(f"HTTP {e.code} from {self.endpoint}", e.code in (408, 429) or e.code >= 500, retry_after)
+        except OSError as e:  # URLError, timeouts, resets
+            raise TranslationBackendError(f"{self.endpoint}: {getattr(e, 'reason', e)}")
+        except ValueError:
+            raise TranslationBackendError(f"{self.endpoint} did not return JSON", retryable=False)
+        translations = reply.get("translations") if isinstance(reply, dict) else None
+        if not isinstance(translations, list) or len(translations) != len(texts) or \
+                not all(isinstance(t, str) for t in translations):
+            raise TranslationBackendError(f"{self.endpoint} did not return {len(texts)} translations", retryable=False)
+        return translations
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+# translate --backend NAME -> class taking (endpoint, api_key, timeout=, concurrency=)
+MT_BACKENDS = {
+    "http": HttpTranslationBackend,
+}
+
+class TranslationCache:
+    """(backend, language, source text) -> translation in SQLite, least recently used rows evicted
+    first once the stored text passes max_bytes. ":memory:" keeps nothing between runs."""
+
+    def __init__(self, path=None):
+        path = path or MT_CACHE_PATH
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS translations (backend TEXT, lang TEXT, source TEXT, value TEXT, "
+                          "size INTEGER, used REAL, PRIMARY KEY (backend, lang, source)) WITHOUT ROWID")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS translations_used ON translations (used)")
+
+    def get_many(self, backend, lang, texts):
+        found = {}
+        texts = list(texts)
+        for i in range(0, len(texts), 500):
+            chunk = texts[i:i + 500]
+            found.update(self.conn.execute(
+                f"SELECT source, value FROM translations WHERE backend = ? AND lang = ? AND source IN ({','.join('?' * len(chunk))})",
+                [backend, lang, *chunk]))
+        if found:
+            now = time.time()
+            self.conn.executemany("UPDATE translations SET used = ? WHERE backend = ? AND lang = ? AND source = ?",
+                                  [(now, backend, lang, text) for text in found])
+            self.conn.commit()
+        return found
+
+    def put_many(self, backend, lang, pairs):
+        now = time.time()
+        self.conn.executemany("INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?, ?)",
+                              [(backend, lang, source, value, len(source.encode("utf-8")) + len(value.encode("utf-8")), now)
+                               for source, value in pairs])
+        self.conn.commit()
+
+    def evict(self, max_bytes=None):
+        """Deletes least recently used rows until the rest fit in max_bytes; returns how many."""
+        max_bytes = MT_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        excess = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM translations").fetchone()[0] - max_bytes
+        doomed = []
+        if excess > 0:
+            for backend, lang, source, size in self.conn.execute("SELECT backend, lang, source, size FROM translations ORDER BY used"):
+                doomed.append((backend, lang, source))
+                excess -= size
+                if excess <= 0:
+                    break
+            self.conn.executemany("DELETE FROM translations WHERE backend = ? AND lang = ? AND source = ?", doomed)
+            self.conn.commit()
+        return len(doomed)
+
+    def close(self):
+        self.conn.close()
+
+def mt_mask(key):
+    """(text sent to the backend, the key's format specifiers or None when nothing is masked)."""
+    if "{" in key or "}" in key:
+        return key, None
+    specs = []
+
+    def token(m):
+        if m.group() == "%%":
+            return m.group()
+        specs.append(m.group())
+        return "{%d}" % (len(specs) - 1)
+    return _FORMAT_SPECIFIER_RE.sub(token, key), specs
+
+def mt_unmask(text, specs):
+    """The translation with its tokens back as the key's specifiers, or None when a token was lost
+    or repeated. Reordered specifiers without a position get one (%@ ... %@ -> %2$@ ... %1$@)."""
+    if specs is None:
+        return text
+    order = [int(m.group(1)) for m in _MT_TOKEN_RE.finditer(text)]
+    if sorted(order) != list(range(len(specs))):
+        return None
+    reordered = order != sorted(order)
+
+    def spec(m):
+        i = int(m.group(1))
+        if reordered and not _AUDIT_POSITION_RE.match(specs[i]):
+            return f"%{i + 1}$" + specs[i][1:]
+        return specs[i]
+    return _MT_TOKEN_RE.sub(spec, text)
+
+def mt_batches(texts, size=MT_BATCH_SIZE, chars=MT_BATCH_CHARS):
+    batch, batch_chars = [], 0
+    for text in texts:
+        if batch and (len(batch) >= size or batch_chars + len(text) > chars):
+            yield batch
+            batch, batch_chars = [], 0
+        batch.append(text)
+        batch_chars += len(text)
+    if batch:
+        yield batch
+
+class TranslationScheduler:
+    """Sends {lang: [texts]} through a backend in batches; run() returns {lang: {text: translation}}.
+    Batches that still fail after the retries are listed in `failures` as (lang, number of texts,
+    error)."""
+
+    def __init__(self, backend, cache, source_lang, stats=None, batch_size=MT_BATCH_SIZE, batch_chars=MT_BATCH_CHARS,
+                 concurrency=MT_CONCURRENCY, rate=MT_RATE_LIMIT, retries=MT_RETRIES, backoff=MT_BACKOFF):
+        self.backend = backend
+        self.cache = cache
+        self.source_lang = source_lang
+        self.stats = stats or RunStats()
+        self.batch_size = batch_size
+        self.batch_chars = batch_chars
+        self.concurrency = concurrency
+        self.interval = 1 / rate if rate else 0
+        self.retries = retries
+        self.backoff = backoff
+        self.failures = []
+
+    def run(self, jobs):
+        import asyncio
+        return asyncio.run(self._run(jobs)) if jobs else {}
+
+    async def _run(self, jobs):
+        import asyncio
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._rate_lock = asyncio.Lock()
+        self._next_start = 0.0
+        tasks = [(lang, asyncio.create_task(self._batch(lang, batch)))
+                 for lang, texts in jobs.items() for batch in mt_batches(texts, self.batch_size, self.batch_chars)]
+        results = {}
+        for lang, task in tasks:
+            results.setdefault(lang, {}).update(await task)
+        return results
+
+    async def _throttle(self, delay=0.0):
+        # Request starts are spaced `interval` apart; a Retry-After pushes back every later start
+        import asyncio
+        loop = asyncio.get_running_loop()
+        async with self._rate_lock:
+            now = loop.time()
+            start = max(now + delay, self._next_start)
+            self._next_start = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def _batch(self, lang, texts):
+        import asyncio
+        for attempt in range(self.retries + 1):
+            async with self._slots:
+                await self._throttle()
+                self.stats.count("mt_requests")
+                try:
+                    translations = await self.backend.translate(texts, self.source_lang, lang)
+                except TranslationBackendError as e:
+                    error = e
+                else:
+                    self.cache.put_many(self.backend.name, lang, zip(texts, translations))
+                    self.stats.count("mt_texts_translated", len(texts))
+                    return dict(zip(texts, translations))
+            if not error.retryable or attempt == self.retries:
+                break
+            self.stats.count("mt_retries")
+            if error.retry_after is not None:
+                await self._throttle(error.retry_after)
+            else:
+                await asyncio.sleep(self.backoff * 2 ** attempt * random.uniform(0.5, 1))
+        self.failures.append((lang, len(texts), str(error)))
+        return {}
+
+def pending_translations(catalog, keys=None, langs=None):
+    """{key: [languages]} translate fills: Han keys (of `keys`, default every non-stale catalog key)
+    in the translated_languages() that have no DICT value and no real translation."""
+    targets = translated_languages(langs)
+    pending = {}
+    for key in catalog.entries if keys is None else keys:
+        entry = catalog.entries.get(key)
+        if not HAN_RE.search(key) or (keys is None and entry.fields.get("extractionState") == STALE):
+            continue
+        have = memory_translations(key, catalog.existing_values(entry)) if entry is not None else {}
+        row = DICT.get(key) or {}
+        missing = [lang for lang in targets if lang not in have and not row.get(lang)]
+        if missing:
+            pending[key] = missing
+    return pending
+
+def translate_pending(pending, backend, cache, source_lang="zh-Hans", stats=None, **options):
+    """Machine-translates {key: [languages]}; returns ({key: {lang: value}}, rejected (key, lang)
+    pairs whose placeholders did not survive, failed batches). options go to TranslationScheduler."""
+    stats = stats or RunStats()
+    masked = {key: mt_mask(key) for key in pending}
+    jobs = {}  # lang -> distinct masked texts in first-use order
+    for key, langs in pending.items():
+        for lang in langs:
+            jobs.setdefault(lang, {})[masked[key][0]] = None
+    translated = {}
+    missing = {}
+    for lang, texts in jobs.items():
+        translated[lang] = cache.get_many(backend.name, lang, texts)
+        stats.count("mt_texts", len(texts))
+        stats.count("mt_cache_hits", len(translated[lang]))
+        missing[lang] = [text for text in texts if text not in translated[lang]]
+    scheduler = TranslationScheduler(backend, cache, source_lang, stats, **options)
+    for lang, found in scheduler.run({lang: texts for lang, texts in missing.items() if texts}).items():
+        translated[lang].update(found)
+    rows, rejected = {}, []
+    for key, langs in pending.items():
+        text, specs = masked[key]
+        for lang in langs:
+            value = translated[lang].get(text)
+            if value is None:
+                continue
+            value = mt_unmask(value.strip(), specs)
+            if not value or placeholder_signature(value) != placeholder_signature(key):
+                rejected.append((key, lang))
+                continue
+            rows.setdefault(key, {})[lang] = value
+    stats.count("mt_cells", sum(len(values) for values in rows.values()))
+    stats.count("mt_rejected", len(rejected))
+    return rows, rejected, scheduler.failures
+
+def write_dictionary_rows(rows, path=None):
+    """Adds {key: {lang: value}} to the DICT TSV: empty cells of existing rows are filled (values
+    already there win), new keys are appended and missing language columns added. Returns the
+    number of cells written."""
+    path = path or DICT_PATH
+    try:
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            lines = f.read().split("\n")
+    except FileNotFoundError:
+        lines = ["key"]
+    if len(lines) > 1 and lines[-1] == "":
+        lines.pop()
+    header = lines[0].split("\t")
+    used = {lang for values in rows.values() for lang in values}
+    header.extend(lang for lang in LANGS if lang in used and lang not in header)
+    header.extend(sorted(used - set(header)))
+    columns = {lang: i for i, lang in enumerate(header)}
+    index = {tsv_unescape(line.split("\t", 1)[0]): n for n, line in enumerate(lines) if n}
+    written = 0
+    for key, values in rows.items():
+        n = index.get(key)
+        if n is None:
+            lines.append(tsv_escape(key))
+            n = index[key] = len(lines) - 1
+        cells = lines[n].split("\t")
+        cells.extend([""] * (len(header) - len(cells)))
+        for lang, value in values.items():
+            if not cells[columns[lang]]:
+                cells[columns[lang]] = tsv_escape(value)
+                written += 1
+        lines[n] = "\t".join(cells)
+    if written:
+        lines[0] = "\t".join(header)
+        write_bytes_atomic(path, ("\n".join(lines) + "\n").encode("utf-8"))
+        DICT.refresh()
+    return written
+
+# Instrumentation
+def _peak_rss_bytes():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return peak if sys.platform == "darwin" else peak * 1024
+
+class RunStats:
+    """Wall/CPU time per phase and event counters for one manage() run."""
+
+    def __init__(self):
+        self.phases = {}
+        self.counters = {}
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            spent = self.phases.setdefault(name, {"wall": 0.0, "cpu": 0.0})
+            spent["wall"] += time.perf_counter() - wall
+            spent["cpu"] += time.process_time() - cpu
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def as_dict(self):
+        out = {
+            "phases": {name: {k: round(v, 6) for k, v in spent.items()} for name, spent in self.phases.items()},
+            "counters": dict(sorted(self.counters.items())),
+            "peak_rss_bytes": _peak_rss_bytes(),
+        }
+        if tracemalloc.is_tracing():
+            out["tracemalloc_peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        return out
+
+def resolve_entries(catalog, items, plan, stats, on_change=None, langs=None, added=()):
+    """Writes the resolved cells of [(key, Entry)] in place, resolving the batch a language column
+    at a time. Keys in `added` are reported to on_change as new just before their cells."""
+    if not items:
+        return
+    columns = resolve_columns([key for key, _ in items], [catalog.existing_values(entry) for _, entry in items],
+                              plan, stats)
+    columns = [(lang, catalog.lang_id(lang), column) for lang, column in columns.items()
+               if langs is None or lang in langs]
+    width = len(catalog.langs)
+    for n, (key, entry) in enumerate(items):
+        if on_change and key in added:
+            on_change(key, None, None, None)
+        locs = entry.locs
+        if locs is None:
+            locs = entry.locs = []
+        if len(locs) < width:
+            locs.extend([None] * (width - len(locs)))
+        changed = 0
+        for lang, i, column in columns:
+            val = column[n]
+            loc = locs[i]
+            if loc.__class__ is Localization:
+                if loc.value == val and loc.state == TRANSLATED:
+                    continue
+                old = loc.value
+            else:
+                unit = _plain_json(loc.get("stringUnit")) if loc is not None else None
+                old = unit.get("value") if unit else None
+                if unit is not None and old == val and unit.get("state") == TRANSLATED:
+                    # Same text; the cell is still rewritten as a plain stringUnit
+                    locs[i] = Localization(TRANSLATED, val)
+                    continue
+            changed += 1
+            if on_change:
+                on_change(key, lang, old, val)
+            locs[i] = Localization(TRANSLATED, val)
+        if changed:
+            stats.count("cells_changed", changed)
+            stats.count("keys_changed")
+
+def new_entry(catalog, key, stats, on_change=None):
+    stats.count("keys_added")
+    if on_change:
+        on_change(key, None, None, None)
+    return catalog.new_entry()
+
+def sync_strings(catalog, found_strings, fingerprints, stats, on_change=None, keys=None, langs=None):
+    """Resolves every key (or only `keys`) into the Catalog in place; returns (visited keys,
+    their new fingerprints, skipped count). on_change(key, lang, old, new) is called for every
+    cell that changes (lang and old are None for a key new to the catalog). With `langs` only
+    those cells are written; the languages they derive from are still resolved.
+    fingerprints=None resolves every key and computes no fingerprints."""
+    entries = catalog.entries
+    all_keys = set(entries) | found_strings | set(DICT.keys()) if keys is None else set(keys)
+    new_fingerprints = {}
+    skipped = 0
+    plan = resolve_plan(langs)
+    dirty, added = [], set()
+    # Sorted so resolution order never depends on the hash seed
+    for key in sorted(all_keys, key=xcode_sort_key):
+        if not key: continue
+        entry = entries.get(key)
+        if entry is not None:
+            if fingerprints and key in fingerprints and fingerprints[key] == key_fingerprint(key, catalog, entry, key in found_strings):
+                new_fingerprints[key] = fingerprints[key]
+                skipped += 1
+                continue
+        else:
+            entry = entries[key] = new_entry(catalog, key, stats)
+            added.add(key)
+        dirty.append((key, entry))
+    resolve_entries(catalog, dirty, plan, stats, on_change, langs, added)
+    if fingerprints is not None:
+        for key, entry in dirty:
+            new_fingerprints[key] = key_fingerprint(key, catalog, entry, key in found_strings)
+    stats.count("keys_total", len(all_keys))
+    stats.count("keys_skipped", skipped)
+    return all_keys, new_fingerprints, skipped
+
+def manage(scan_options=None, use_cache=True, stats=None, grace_days=None, mark=False):
+    """sync. With mark, unreferenced keys are marked stale; with grace_days (which implies mark),
+    keys stale for at least that many days are pruned."""
+    stats = stats or RunStats()
+    mark = mark or grace_days is not None
+    with stats.phase("load"):
+        catalog, previous_raw = load_catalog_model()
+        previous_keys = list(catalog.entries)
+        # Read without mark too: the records of pruned keys keep sync from adding them back
+        records = load_stale_records()
     
-    found_strings = scan_swift_strings()
-    all_keys = set(data["strings"].keys()) | found_strings | set(DICT.keys())
+    with stats.phase("scan"):
+        found_strings, refs = scan_swift_sources(**(scan_options or {}), stats=stats)
     
-    for key in all_keys:
-        if not key: continue
-        entry = data["strings"].get(key, {"extractionState": "manual", "localizations": {}})
-        locs = entry.get("localizations", {})
-        
-        has_chinese_key = bool(re.search(r'[\u4e00-\u9fa5]', key))
-        
-        for lang in LANGS:
-            val = None
-            # 1. Explicit DICT entry takes priority
-            if key in DICT and lang in DICT[key]:
-                val = DICT[key][lang]
-            elif lang == "br":
-                # Braille: use English from DICT, or existing English, or key
-                source = DICT.get(key, {}).get("en") or locs.get("en", {}).get("stringUnit", {}).get("value") or key
-                val = to_braille(source)
-            elif lang == "zh-Hans":
-                val = DICT.get(key, {}).get("zh-Hans", key)
-            elif lang == "zh-Hant":
-                if key in DICT and "zh-Hant" in DICT[key]:
-                    val = DICT[key]["zh-Hant"]
+    with stats.phase("resolve"):
+        fingerprints = load_resolve_state() if use_cache else None
+        new_records = dict(records)
+        excluded = prune_stale(catalog, refs, new_records, grace_days, stats)
+        all_keys, new_fingerprints, skipped = sync_strings(catalog, found_strings, fingerprints, stats,
+                                                           keys=sync_keys(catalog, found_strings, excluded))
+        marked = ()
+        if mark:
+            new_records, marked = track_stale(catalog, refs, new_records)
+        # extractionState is no input of the fingerprints, so marking leaves them valid
+        if marked:
+            stats.count("keys_stale_changed", len(marked))
+
+    with stats.phase("write"):
+        written = write_catalog_model(catalog, previous_raw, previous_keys)
+        if new_records != records:
+            save_stale_records(new_records)
+        if use_cache and new_fingerprints != fingerprints:
+            save_resolve_state(new_fingerprints)
+    stats.count("catalog_written", int(written))
+    stale = sum(1 for record in new_records.values() if not record.get("pruned"))
+    pruned = stats.counters.get("keys_pruned", 0)
+    print(f"Localization complete. {len(all_keys)} keys processed, {skipped} unchanged keys skipped"
+          + (f", {stale} stale" if stale else "") + (f", {pruned} pruned" if pruned else "")
+          + ("." if written else ", catalog unchanged."))
+    # New keys that only got fallbacks; the translation memory is built only by `suggest`
+    previous = set(previous_keys)
+    added = untranslated_keys(catalog, [key for key in catalog.entries if key not in previous])
+    if added:
+        print(f"{len(added)} new keys have no translation; run manage_translations.py suggest for "
+              "close translations already in the catalog.")
+    return stats
+
+def check(scan_options=None, use_cache=True, stats=None, grace_days=None, mark=False):
+    """Computes what manage() would write without writing the catalog or any cache.
+    Returns (cell changes as (key, lang, old, new), extractionState changes as
+    (key, old, new) with new None for a pruned key, whether the file bytes would differ)."""
+    stats = stats or RunStats()
+    mark = mark or grace_days is not None
+    changes = []
+    stale_changes = []
+    write_index, DICT.write_index = DICT.write_index, False
+    try:
+        with stats.phase("load"):
+            catalog, previous_raw = load_catalog_model()
+            previous_keys = list(catalog.entries)
+            records = load_stale_records()
+        with stats.phase("scan"):
+            found_strings, refs = scan_swift_sources(**(scan_options or {}), stats=stats, update_cache=False)
+        with stats.phase("resolve"):
+            # A key whose fingerprint matches was left exactly as the last sync wrote it
+            fingerprints = load_resolve_state() if use_cache else None
+            new_records = dict(records)
+            excluded = prune_stale(catalog, refs, new_records, grace_days, stats)
+            sync_strings(catalog, found_strings, fingerprints, stats,
+                         on_change=lambda *change: changes.append(change),
+                         keys=sync_keys(catalog, found_strings, excluded))
+            if mark:
+                track_stale(catalog, refs, new_records, on_stale=lambda *change: stale_changes.append(change))
+            stale_changes.extend((key, STALE, None) for key in previous_keys if key not in catalog.entries)
+        with stats.phase("write"):
+            drift = catalog_dumps(catalog, previous_keys).encode("utf-8") != previous_raw
+    finally:
+        DICT.write_index = write_index
+    return changes, stale_changes, drift
+
+def print_check_report(changes, stale_changes, drift):
+    added = [key for key, lang, _, _ in changes if lang is None]
+    cells = [c for c in changes if c[1] is not None]
+    for key, lang, old, new in changes:
+        if lang is None:
+            print(f"+ {json.dumps(key, ensure_ascii=False)}")
+        else:
+            print(f"~ {json.dumps(key, ensure_ascii=False)} [{lang}]: "
+                  f"{json.dumps(old, ensure_ascii=False)} -> {json.dumps(new, ensure_ascii=False)}")
+    for key, old, new in stale_changes:
+        if new is None:
+            print(f"- {json.dumps(key, ensure_ascii=False)}")
+        else:
+            print(f"~ {json.dumps(key, ensure_ascii=False)} [extractionState]: "
+                  f"{json.dumps(old, ensure_ascii=False)} -> {json.dumps(new, ensure_ascii=False)}")
+    if not drift:
+        print("Catalog is up to date.")
+        return
+    keys = {c[0] for c in changes}
+    langs = {c[1] for c in cells}
+    if changes or stale_changes:
+        marked = sum(1 for c in stale_changes if c[2] == STALE)
+        restored = sum(1 for c in stale_changes if c[1] == STALE and c[2] is not None)
+        pruned = sum(1 for c in stale_changes if c[2] is None)
+        print(f"Catalog is out of date: {len(keys)} keys ({len(added)} new), {len(langs)} languages, "
+              f"{len(cells)} cells would change"
+              + (f", {marked} keys would be marked stale" if marked else "")
+              + (f", {restored} stale keys are used again" if restored else "")
+              + (f", {pruned} stale keys pruned" if pruned else "")
+              + ". Run manage_translations.py to update it.")
+    else:
+        print("Catalog is out of date: formatting or key order differs. Run manage_translations.py to update it.")
+
+# Audit
+# The catalog and source checks of AppPortsTests/LocalizationAuditTests.swift, with the same
+# patterns and rules, in one pass over the catalog and the Swift files (no Xcode needed).
+# Placeholder signatures: every specifier after dropping %%, positions stripped, sorted.
+_AUDIT_POSITION_RE = re.compile(r"^%\d+\$")
+# The test's list plus messageText, which its `.message\s*=` never matched
+_AUDIT_PROPERTY_RE = re.compile(r'\.(prompt|message|messageText|informativeText|title|toolTip|placeholderString)\s*=\s*"((?:[^"\\]|\\.)*)"')
+_AUDIT_RETURN_RE = re.compile(r'return\s+"((?:[^"\\]|\\.)*)"')
+_AUDIT_LOCALIZED_RES = [
+    re.compile(r'"((?:[^"\\]|\\.)*)"\.localized'),
+    re.compile(r'NSLocalizedString\(\s*"((?:[^"\\]|\\.)*)"'),
+]
+_AUDIT_IDENTIFIER_RE = re.compile(r"^[A-Za-z0-9_./:-]+$")
+_AUDIT_CODE_RE = re.compile(r'AppLanguageOption\(\s*code:\s*"([^"]*)"')
+AUDIT_CHECKS = [
+    "language-codes", "catalog-coverage", "catalog-clean", "catalog-stale", "placeholders",
+    "imperative-strings", "localized-keys", "localized-not-stale", "protected-warnings", "dictionary-keys",
+]
+
+def supported_locales(path=None):
+    """Language codes of AppLanguageCatalog.selectableLanguages, in registry order."""
+    with open(path or LANGUAGE_REGISTRY_PATH, "r", encoding="utf-8") as f:
+        return _AUDIT_CODE_RE.findall(f.read())
+
+def _has_translated_value(node):
+    if isinstance(node, dict):
+        unit = node.get("stringUnit")
+        if isinstance(unit, dict) and isinstance(unit.get("value"), str) and unit["value"]:
+            return True
+        for name in ("variations", "substitutions"):
+            if isinstance(node.get(name), dict) and any(_has_translated_value(v) for v in node[name].values()):
+                return True
+    if isinstance(node, list):
+        return any(_has_translated_value(v) for v in node)
+    return False
+
+def _string_value(node):
+    if isinstance(node, dict):
+        unit = node.get("stringUnit")
+        if isinstance(unit, dict) and isinstance(unit.get("value"), str):
+            return unit["value"]
+        for name in ("variations", "substitutions"):
+            if isinstance(node.get(name), dict):
+                return next((v for v in map(_string_value, node[name].values()) if v is not None), None)
+    if isinstance(node, list):
+        return next((v for v in map(_string_value, node) if v is not None), None)
+    return None
+
+def placeholder_signature(value):
+    return sorted(_AUDIT_POSITION_RE.sub("%", spec) for spec in _FORMAT_SPECIFIER_RE.findall(value.replace("%%", ""))
+                  if not spec.endswith("%"))
+
+def _decode_audit_literal(raw):
+    # decodeSwiftStringLiteralContent(): the test's four replacements, in its order
+    return raw.replace("\\n", "\n").replace("\\t", "\t").replace('\\"', '"').replace("\\\\", "\\")
+
+def _contains_cjk(text):
+    return any(0x3400 <= ord(c) <= 0x4DBF or 0x4E00 <= ord(c) <= 0x9FFF or 0xF900 <= ord(c) <= 0xFAFF for c in text)
+
+def looks_user_facing(literal):
+    if not literal or "\\(" in literal:
+        return False
+    if not any(c.isalnum() for c in literal) and not _contains_cjk(literal):
+        return False
+    if literal.startswith("/") or "://" in literal or _AUDIT_IDENTIFIER_RE.match(literal):
+        return False
+    return (_contains_cjk(literal) or " " in literal or "\n" in literal or "..." in literal
+            or "…" in literal or not literal.isascii())
+
+def _is_explicitly_localized(line):
+    return ".localized" in line or "NSLocalizedString(" in line or "LocalizedStringKey(" in line
+
+def audit_catalog(strings, locales, findings):
+    supported = set(locales)
+    if "" in strings:
+        findings["catalog-clean"].append("catalog contains an empty key")
+    for key in sorted(strings):
+        entry = strings[key]
+        if not isinstance(entry, dict):
+            if key:
+                findings["catalog-coverage"].append(f"unparseable entry: {key}")
+            continue
+        localizations = entry.get("localizations") if isinstance(entry.get("localizations"), dict) else None
+        if localizations is not None:
+            for locale in sorted(set(localizations) - supported):
+                findings["catalog-clean"].append(f"unsupported locale: [{locale}] {key}")
+        if entry.get("extractionState") == STALE:
+            findings["catalog-stale"].append(key)
+        if not key or entry.get("shouldTranslate") is False:
+            continue
+        localizations = localizations or {}
+        for locale in sorted(supported):
+            if locale not in localizations or not _has_translated_value(localizations[locale]):
+                findings["catalog-coverage"].append(f"missing translation: [{locale}] {key}")
+        source = _string_value(localizations.get("zh-Hans"))
+        if source is None:
+            source = _string_value(localizations.get("en"))
+        if source is None:
+            continue
+        expected = placeholder_signature(source)
+        for locale in dict.fromkeys(locales):  # a duplicate code is reported once, under language-codes
+            value = _string_value(localizations.get(locale))
+            if value is not None and placeholder_signature(value) != expected:
+                findings["placeholders"].append(
+                    f"placeholder mismatch: [{locale}] {key} expected {expected}, got {placeholder_signature(value)}")
+    non_english = sorted(supported - {"en"})
+    for key in AUDIT_PROTECTED_KEYS:
+        entry = strings.get(key)
+        localizations = entry.get("localizations") if isinstance(entry, dict) else None
+        english = _string_value(localizations.get("en")) if isinstance(localizations, dict) else None
+        if english is None:
+            findings["protected-warnings"].append(f"no English value -> {key}")
+            continue
+        for locale in non_english:
+            value = _string_value(localizations.get(locale))
+            if value is None:
+                findings["protected-warnings"].append(f"missing translation: [{locale}] {key}")
+            elif value == english:
+                findings["protected-warnings"].append(f"English placeholder: [{locale}] {key}")
+
+def audit_source(rel_path, text, strings, findings):
+    ui_file = rel_path in AUDIT_UI_FILES or rel_path.startswith(AUDIT_UI_PREFIXES)
+    check_imperative = rel_path not in AUDIT_NON_LOCALIZED_FILES
+    for number, raw_line in enumerate(text.splitlines(), 1):
+        line = raw_line.strip(" \t")
+        if not line or line.startswith("//"):
+            continue
+        where = f"{rel_path}:{number}"
+        if check_imperative and not _is_explicitly_localized(line):
+            m = _AUDIT_PROPERTY_RE.search(line)
+            if m and looks_user_facing(m.group(2)):
+                findings["imperative-strings"].append(f"{where} unlocalized property assignment -> {m.group(2)}")
+            m = _AUDIT_RETURN_RE.search(line) if ui_file else None
+            if m and looks_user_facing(m.group(1)):
+                findings["imperative-strings"].append(f"{where} unlocalized UI return value -> {m.group(1)}")
+        for pattern in _AUDIT_LOCALIZED_RES:
+            for m in pattern.finditer(line):
+                raw = m.group(1)
+                if not raw:
+                    continue
+                if "\\(" in raw:
+                    findings["localized-keys"].append(f"{where} localizing an interpolated string -> {raw}")
+                    continue
+                key = _decode_audit_literal(raw)
+                entry = strings.get(key)
+                if entry is None:
+                    findings["localized-keys"].append(f"{where} key missing from the catalog -> {key}")
+                elif isinstance(entry, dict) and entry.get("extractionState") == STALE:
+                    findings["localized-not-stale"].append(f"{where} key is marked stale -> {key}")
+
+def audit(checks=None, excludes=None):
+    """{check: [finding]} for the LocalizationAuditTests checks (AUDIT_CHECKS, or `checks`) over
+    the Swift files not matching `excludes` (default AUDIT_EXCLUDE_GLOBS), plus placeholders and
+    dictionary-keys, which the Swift test does not have."""
+    findings = {name: [] for name in AUDIT_CHECKS}
+    locales = supported_locales()
+    duplicates = sorted({code for code in locales if locales.count(code) > 1})
+    findings["language-codes"].extend(f"duplicate language code: {code}" for code in duplicates)
+    strings = load_catalog()[0].get("strings", {})
+    audit_catalog(strings, locales, findings)
+    refs = set()
+    for path in iter_swift_files(excludes=AUDIT_EXCLUDE_GLOBS if excludes is None else excludes):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+        except (OSError, UnicodeDecodeError):
+            continue
+        audit_source(os.path.relpath(path, SWIFT_SCAN_DIR).replace(os.sep, "/"), text, strings, findings)
+        if checks is None or "dictionary-keys" in checks:
+            refs.update(extract_swift_literals(text)[1])
+    # Not in the Swift test: sync adds every DICT key to the catalog, so a row whose key no
+    # literal produces (an escape left undecoded, an edited source text) becomes a dead key
+    if checks is None or "dictionary-keys" in checks:
+        findings["dictionary-keys"].extend(f"dictionary key no Swift literal produces: {key}"
+                                           for key in DICT.keys() if not is_referenced(key, refs))
+    return {name: found for name, found in findings.items() if checks is None or name in checks}
+
+def print_audit_report(findings, limit=40):
+    for name, found in findings.items():
+        print(f"{name}: " + (f"{len(found)} findings" if found else "ok"))
+        for line in found[:limit] if limit else found:
+            print(f"  {line}")
+        if limit and len(found) > limit:
+            print(f"  ... {len(found) - limit} more")
+    failed = [name for name, found in findings.items() if found]
+    print(f"Audit failed: {len(failed)} of {len(findings)} checks have findings." if failed
+          else f"Audit passed: {len(findings)} checks.")
+
+# Streaming
+class CatalogReader:
+    """Incremental reader for a string catalog: yields the top-level fields and the `strings`
+    entries one at a time, holding one entry plus one read chunk in memory."""
+
+    def __init__(self, f, chunk_size=STREAM_CHUNK_SIZE):
+        self._file = f
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder(object_pairs_hook=_catalog_object_hook)
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self.digest = hashlib.sha1()  # of the raw bytes read, to detect no-op writes
+
+    def _fill(self):
+        raw = self._file.read(self._chunk_size)
+        self.digest.update(raw)
+        self._eof = not raw
+        self._buf = self._buf[self._pos:] + self._decoder.decode(raw, final=self._eof)
+        self._pos = 0
+        return not self._eof
+
+    def _skip_ws(self):
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf) or not self._fill():
+                return
+
+    def _peek(self):
+        self._skip_ws()
+        if self._pos >= len(self._buf):
+            raise ValueError("unexpected end of catalog")
+        return self._buf[self._pos]
+
+    def _expect(self, c):
+        if self._peek() != c:
+            raise ValueError(f"expected {c!r} at offset {self._pos} of the current chunk")
+        self._pos += 1
+
+    def _value(self):
+        self._skip_ws()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number that ends with the buffer may continue in the next chunk
+            if end == len(self._buf) and not self._eof and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _members(self):
+        # (key, value-reader) for each member of the object at the current position
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            self._expect(":")
+            yield key
+            c = self._peek()
+            self._pos += 1
+            if c == "}":
+                return
+            if c != ",":
+                raise ValueError(f"expected ',' or '}}' after {key!r}")
+
+    def __iter__(self):
+        """("field", name, value) for top-level fields, ("entry", key, entry) for strings."""
+        for name in self._members():
+            if name == "strings":
+                for key in self._members():
+                    yield "entry", key, self._value()
+            else:
+                yield "field", name, self._value()
+        self._skip_ws()
+
+def scan_catalog_keys(path):
+    """First pass of sync --stream: the catalog's top-level fields and key set."""
+    fields, keys = {}, set()
+    with open(path, "rb") as f:
+        for kind, name, value in CatalogReader(f):
+            if kind == "field":
+                fields[name] = value
+            else:
+                keys.add(name)
+    return fields, keys
+
+def write_catalog_stream(catalog, fields, entries, source_digest, path=None):
+    """Writes the top-level `fields` and the (key, Entry) pairs `entries` yields in Xcode's format
+    through a temporary file. The catalog is replaced only when the bytes differ from the file
+    entries were read from (source_digest() returns its sha1 once entries is exhausted); returns
+    whether it was."""
+    path = path or XCSTRINGS_PATH
+    tmp_path = path + ".tmp"
+    digest = hashlib.sha1()
+    with open(tmp_path, "wb") as out:
+        def emit(text):
+            raw = text.encode("utf-8")
+            digest.update(raw)
+            out.write(raw)
+
+        top = sorted(set(fields) | {"strings"}, key=xcode_sort_key)
+        emit("{\n")
+        for i, name in enumerate(top):
+            emit("  " + json.dumps(name, ensure_ascii=False) + " : ")
+            if name != "strings":
+                parts = []
+                _xcode_json(fields[name], 1, parts)
+                emit("".join(parts))
+            else:
+                emit("{\n")
+                for n, (key, entry) in enumerate(entries):
+                    parts = []
+                    _entry_xcode_json(catalog, entry, 2, parts)
+                    emit(("" if n == 0 else ",\n") + "    " + encode_basestring(key) + " : " + "".join(parts))
+                emit("\n  }")
+            emit(",\n" if i < len(top) - 1 else "\n")
+        emit("}")
+    if digest.digest() != source_digest():
+        os.replace(tmp_path, path)
+        return True
+    os.remove(tmp_path)
+    return False
+
+def manage_streaming(scan_options=None, stats=None, grace_days=None, mark=False):
+    """sync for catalogs too large to hold in memory. Pass one collects the key set, pass two
+    resolves each entry as it is read and writes it straight out, so memory stays bounded by
+    one entry plus the key sets. Key fingerprints are not used: every key is re-resolved."""
+    stats = stats or RunStats()
+    path = XCSTRINGS_PATH
+    if not os.path.exists(path):
+        return manage(scan_options, False, stats, grace_days, mark)
+    mark = mark or grace_days is not None
+    with stats.phase("load"):
+        fields, catalog_keys = scan_catalog_keys(path)
+        previous_records = load_stale_records()
+    with stats.phase("scan"):
+        found_strings, refs = scan_swift_sources(**(scan_options or {}), stats=stats)
+    plan = resolve_plan()
+    catalog = Catalog(fields, LANGS)  # language table only; entries pass through one at a time
+    # prune_stale() and track_stale() without the entries in memory
+    day = today()
+    records = dict(previous_records)
+    expired = expired_stale_keys(records, refs, grace_days, day) if grace_days is not None else set()
+    for key in expired:
+        records[key] = dict(records[key], pruned=True)
+    kept_keys = len(catalog_keys - expired)
+    excluded = {key for key, record in records.items() if record.get("pruned") and not is_referenced(key, refs)}
+    new_records = {} if mark else dict(records)
+    # New keys are merged into the existing order exactly like merge_key_order()
+    added = sorted((k for k in found_strings | set(DICT.keys()) if k and k not in catalog_keys and k not in excluded),
+                   key=xcode_sort_key)
+    stats.count("keys_total", kept_keys + len(added))
+    with stats.phase("resolve"), open(path, "rb") as src:
+        reader = CatalogReader(src)
+        pending = [0]  # next index into added
+
+        def emit_added(before=None):
+            sort_key = xcode_sort_key(before) if before is not None else None
+            while pending[0] < len(added) and (sort_key is None or xcode_sort_key(added[pending[0]]) < sort_key):
+                key = added[pending[0]]
+                yield key, new_entry(catalog, key, stats)
+                pending[0] += 1
+
+        def read_entries():
+            for kind, key, obj in reader:
+                if kind != "entry":
+                    continue
+                if key in expired:
+                    stats.count("keys_pruned")
+                    continue
+                yield from emit_added(key)
+                yield key, catalog.entry_from_json(obj)
+            yield from emit_added()
+
+        def resolved(batch):
+            resolve_entries(catalog, [(key, entry) for key, entry in batch if key], plan, stats)
+            for key, entry in batch:
+                if mark:
+                    mark_stale(catalog, key, entry, refs, records, new_records, day)
+                yield key, entry
+
+        def entries():
+            batch = []
+            for item in read_entries():
+                batch.append(item)
+                if len(batch) == STREAM_RESOLVE_BATCH:
+                    yield from resolved(batch)
+                    batch = []
+            yield from resolved(batch)
+
+        written = write_catalog_stream(catalog, fields, entries(), lambda: reader.digest.digest(), path)
+    with stats.phase("write"):
+        for key in excluded:
+            if key in DICT and (key not in catalog_keys or key in expired):
+                new_records[key] = records[key]
+        if new_records != previous_records:
+            save_stale_records(new_records)
+    stats.count("catalog_written", int(written))
+    stale = sum(1 for record in new_records.values() if not record.get("pruned"))
+    pruned = stats.counters.get("keys_pruned", 0)
+    print(f"Localization complete (streamed). {kept_keys + len(added)} keys processed"
+          + (f", {stale} stale" if stale else "") + (f", {pruned} pruned" if pruned else "")
+          + ("." if written else ", catalog unchanged."))
+    return stats
+
+# XLIFF
+# export writes one XLIFF file per language while reading the catalog entry by entry; import
+# reads XLIFF files unit by unit and applies them in one streaming pass over the catalog. Each
+# unit carries the digest of the catalog value it was exported with, so a cell edited in the
+# catalog since the export is reported as a conflict instead of being overwritten. Only plain
+# stringUnit cells are exchanged: sync rewrites any other cell as one.
+_XLIFF_NS = {"1.2": "urn:oasis:names:tc:xliff:document:1.2", "2.0": "urn:oasis:names:tc:xliff:document:2.0"}
+_XLIFF_EXT_NS = "urn:appports:xcstrings"
+_XLIFF_BASE_ATTR = "{%s}base" % _XLIFF_EXT_NS
+_XML_TEXT_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "\r": "&#13;"})
+_XML_ATTR_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "\r": "&#13;", '"': "&quot;", "\n": "&#10;", "\t": "&#9;"})
+
+def xliff_digest(value):
+    # "" for a cell without a value
+    return hashlib.sha1(value.encode("utf-8")).hexdigest()[:12] if value is not None else ""
+
+def _xliff_text(value):
+    return value.translate(_XML_TEXT_ESCAPES)
+
+def _xliff_attr(value):
+    return '"' + value.translate(_XML_ATTR_ESCAPES) + '"'
+
+def _xliff_unit(version, n, key, source, value, translated, comment):
+    base = f"xcs:base={_xliff_attr(xliff_digest(value))}"
+    if version == "1.2":
+        out = [f"      <trans-unit id={_xliff_attr(key)} xml:space=\"preserve\" {base}>\n",
+               f"        <source>{_xliff_text(source)}</source>\n"]
+        if translated:
+            out.append(f"        <target state=\"translated\">{_xliff_text(value)}</target>\n")
+        if comment:
+            out.append(f"        <note>{_xliff_text(comment)}</note>\n")
+        out.append("      </trans-unit>\n")
+        return "".join(out)
+    out = [f"    <unit id=\"u{n}\" name={_xliff_attr(key)} {base}>\n"]
+    if comment:
+        out.append(f"      <notes><note>{_xliff_text(comment)}</note></notes>\n")
+    out.append(f"      <segment state=\"{'translated' if translated else 'initial'}\">\n"
+               f"        <source xml:space=\"preserve\">{_xliff_text(source)}</source>\n")
+    if translated:
+        out.append(f"        <target xml:space=\"preserve\">{_xliff_text(value)}</target>\n")
+    out.append("      </segment>\n    </unit>\n")
+    return "".join(out)
+
+def export_xliff(lang, out_path, version="1.2", missing_only=False, path=None):
+    """Writes `lang` of the catalog as an XLIFF file, one entry in memory at a time; returns the
+    number of units. Stale keys, shouldTranslate: false and non-plain cells are left out; cells
+    holding a fallback rather than a translation become units without a target."""
+    path = path or XCSTRINGS_PATH
+    translated_lang = fallback_of(lang)[0] == "translation"
+    catalog = Catalog((), LANGS)
+    fields = {}
+    units = 0
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    tmp_path = out_path + ".tmp"
+    with open(path, "rb") as src, open(tmp_path, "w", encoding="utf-8", newline="\n") as out:
+        def header():
+            source_lang = _xliff_attr(fields.get("sourceLanguage", "zh-Hans"))
+            out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            if version == "1.2":
+                out.write(f'<xliff xmlns="{_XLIFF_NS[version]}" xmlns:xcs="{_XLIFF_EXT_NS}" version="1.2">\n'
+                          f'  <file original={_xliff_attr(os.path.basename(path))} source-language={source_lang} '
+                          f'target-language={_xliff_attr(lang)} datatype="plaintext">\n'
+                          '    <header><tool tool-id="manage_translations" tool-name="manage_translations.py"/></header>\n'
+                          '    <body>\n')
+            else:
+                out.write(f'<xliff xmlns="{_XLIFF_NS[version]}" xmlns:xcs="{_XLIFF_EXT_NS}" version="2.0" '
+                          f'srcLang={source_lang} trgLang={_xliff_attr(lang)}>\n'
+                          f'  <file id="f1" original={_xliff_attr(os.path.basename(path))}>\n')
+
+        started = False
+        for kind, key, obj in CatalogReader(src):
+            if kind == "field":
+                fields[key] = obj
+                continue
+            if not started:
+                header()
+                started = True
+            entry = catalog.entry_from_json(obj)
+            if not key or entry.fields.get("extractionState") == STALE or entry.fields.get("shouldTranslate") is False:
+                continue
+            loc = catalog.cell(entry, lang)
+            if loc is not None and not isinstance(loc, Localization) and set(loc) != {"stringUnit"}:
+                continue
+            existing = catalog.existing_values(entry)
+            value = existing.get(lang)
+            if translated_lang:
+                translated = lang in memory_translations(key, existing)
+            else:
+                translated = value is not None
+            if missing_only and translated:
+                continue
+            units += 1
+            comment = entry.fields.get("comment")
+            out.write(_xliff_unit(version, units, key, existing.get("zh-Hans") or key, value, translated,
+                                  comment if isinstance(comment, str) else None))
+        if not started:
+            header()
+        out.write("    </body>\n  </file>\n</xliff>\n" if version == "1.2" else "  </file>\n</xliff>\n")
+    os.replace(tmp_path, out_path)
+    return units
+
+def read_xliff(path):
+    """{(lang, key): (target, exported digest or None)} of the units of an XLIFF 1.2 or 2.0 file
+    that have a non-empty target, read element by element."""
+    units = {}
+    lang = None
+    for event, elem in ElementTree.iterparse(path, events=("start", "end")):
+        tag = elem.tag.rpartition("}")[2]
+        if event == "start":
+            if tag == "xliff" and elem.get("trgLang"):
+                lang = elem.get("trgLang")
+            elif tag == "file" and elem.get("target-language"):
+                lang = elem.get("target-language")
+            continue
+        if tag not in ("trans-unit", "unit"):
+            continue
+        key = elem.get("id") if tag == "trans-unit" else elem.get("name") or elem.get("id")
+        # 2.0 units may hold several segments; their targets are joined
+        target = "".join("".join(child.itertext()) for child in elem.iter() if child.tag.rpartition("}")[2] == "target")
+        if key is not None and lang and target:
+            units[lang, key] = (target, elem.get(_XLIFF_BASE_ATTR))
+        elem.clear()
+    return units
+
+def import_xliff(paths, force=False, dry_run=False, stats=None):
+    """Applies the targets of XLIFF files to the catalog in one streaming pass; untouched entries
+    are written back byte for byte and the file is not replaced when nothing changed. Returns
+    (changes [(key, lang, old, new)], conflicts [(key, lang, reason)]). A cell edited in the
+    catalog since the export is a conflict unless force; so is a value sync would replace."""
+    stats = stats or RunStats()
+    path = XCSTRINGS_PATH
+    imported = {}
+    with stats.phase("read"):
+        for xliff_path in paths:
+            for (lang, key), unit in read_xliff(xliff_path).items():
+                imported.setdefault(key, {})[lang] = unit
+    stats.count("xliff_units", sum(len(units) for units in imported.values()))
+    changes, conflicts = [], []
+    with stats.phase("load"):
+        fields, _ = scan_catalog_keys(path)
+    catalog = Catalog(fields, LANGS)
+
+    def apply(key, entry):
+        existing = catalog.existing_values(entry)
+        for lang, (target, base) in imported.pop(key).items():
+            loc = catalog.cell(entry, lang)
+            current = existing.get(lang)
+            if loc is not None and not isinstance(loc, Localization) and set(loc) != {"stringUnit"}:
+                conflicts.append((key, lang, "the catalog cell has variations"))
+            elif target == current:
+                stats.count("xliff_unchanged")
+            elif base is not None and base != xliff_digest(current) and not force:
+                conflicts.append((key, lang, f"changed in the catalog since the export: "
+                                             f"{json.dumps(current, ensure_ascii=False)} here, "
+                                             f"{json.dumps(target, ensure_ascii=False)} in the XLIFF"))
+            else:
+                resolved = resolve_values(key, dict(existing, **{lang: target}), resolve_plan({lang}))
+                if lang in resolved and resolved[lang] != target:
+                    conflicts.append((key, lang, f"sync would replace it with {json.dumps(resolved[lang], ensure_ascii=False)}"
+                                                 + (" (DICT row)" if (DICT.get(key) or {}).get(lang) else "")))
+                    continue
+                catalog.set_cell(entry, lang, Localization(TRANSLATED, target))
+                existing[lang] = target
+                changes.append((key, lang, current, target))
+
+    with stats.phase("apply"), open(path, "rb") as src:
+        reader = CatalogReader(src)
+
+        def entries():
+            for kind, key, obj in reader:
+                if kind != "entry":
+                    continue
+                entry = catalog.entry_from_json(obj)
+                if key in imported:
+                    apply(key, entry)
+                yield key, entry
+
+        if dry_run:
+            for _ in entries():
+                pass
+            written = False
+        else:
+            written = write_catalog_stream(catalog, fields, entries(), lambda: reader.digest.digest(), path)
+    for key, units in imported.items():
+        for lang in units:
+            conflicts.append((key, lang, "not in the catalog"))
+    stats.count("xliff_cells_changed", len(changes))
+    stats.count("xliff_conflicts", len(conflicts))
+    stats.count("catalog_written", int(written))
+    return changes, conflicts
+
+# Shards
+# catalog.json holds the top-level fields, every key in file order with its non-localization
+# fields, and the shard list. With layout "language" each <lang>.json maps key -> that
+# language's localization (a bare string for a plain translated stringUnit); with layout
+# "module" each <module>.json holds the full entries of the keys that module's sources use.
+SHARD_BASE_NAME = "catalog.json"
+SHARD_UNUSED = "_unused"
+
+def _dump_shard(path, obj):
+    # One key per line: small diffs, and much faster than json.dumps(indent=...)
+    lines = [f"  {encode_basestring(k)} : {json.dumps(v, ensure_ascii=False)}" for k, v in obj.items()]
+    body = "{\n" + ",\n".join(lines) + "\n}\n" if lines else "{}\n"
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    write_bytes_atomic(path, body.encode("utf-8"))
+
+def _load_json(path):
+    with open(path, "rb") as f:
+        return json.loads(f.read())
+
+def _shard_cell(loc):
+    unit = loc.get("stringUnit")
+    if len(loc) == 1 and unit and set(unit) == {"state", "value"} and unit["state"] == "translated":
+        return unit["value"]
+    return loc
+
+def _unshard_cell(cell):
+    return {"stringUnit": {"state": "translated", "value": cell}} if isinstance(cell, str) else cell
+
+def module_of(path):
+    rel = os.path.relpath(path, SWIFT_SCAN_DIR).split(os.sep)
+    return rel[0] if len(rel) > 1 else os.path.splitext(rel[0])[0]
+
+def split_catalog(shard_dir=None, layout="language", scan_options=None):
+    """Writes the catalog as shards; returns the shard names."""
+    shard_dir = shard_dir or SHARD_DIR
+    data, _ = load_catalog()
+    strings = data.get("strings", {})
+    base = {k: v for k, v in data.items() if k != "strings"}
+    keys = {}
+    shards = {}
+    if layout == "language":
+        for key, entry in strings.items():
+            keys[key] = {k: ({} if k == "localizations" else v) for k, v in entry.items()}
+            for lang, loc in entry.get("localizations", {}).items():
+                shards.setdefault(lang, {})[key] = _shard_cell(loc)
+    else:
+        # A key belongs to the first module (in path order) whose sources use it
+        owner = {}
+        for path, record in scan_swift_records(**(scan_options or {})).items():
+            for string in record["strings"]:
+                owner.setdefault(string, module_of(path))
+        for key, entry in strings.items():
+            module = owner.get(key, SHARD_UNUSED)
+            keys[key] = module
+            shards.setdefault(module, {})[key] = entry
+    base_path = os.path.join(shard_dir, SHARD_BASE_NAME)
+    try:
+        previous = _load_json(base_path).get("shards", [])
+    except (OSError, ValueError):
+        previous = []
+    for name in sorted(shards):
+        _dump_shard(os.path.join(shard_dir, name + ".json"), shards[name])
+    # Only files this layout wrote before are removed, never anything else in the directory
+    for name in set(previous) - set(shards):
+        try:
+            os.remove(os.path.join(shard_dir, name + ".json"))
+        except OSError:
+            pass
+    _dump_shard(base_path, {"layout": layout, "catalog": base, "shards": sorted(shards), "keys": keys})
+    return sorted(shards)
+
+def load_shard_base(shard_dir=None):
+    return _load_json(os.path.join(shard_dir or SHARD_DIR, SHARD_BASE_NAME))
+
+def merge_shards(shard_dir=None):
+    """Rebuilds the catalog dict from shards; returns (data, key order)."""
+    shard_dir = shard_dir or SHARD_DIR
+    base = load_shard_base(shard_dir)
+    shards = {name: _load_json(os.path.join(shard_dir, name + ".json")) for name in base["shards"]}
+    strings = {}
+    if base["layout"] == "language":
+        for key, fields in base["keys"].items():
+            entry = dict(fields)
+            locs = {lang: _unshard_cell(shard[key]) for lang, shard in shards.items() if key in shard}
+            if locs or "localizations" in entry:
+                entry["localizations"] = locs
+            strings[key] = entry
+    else:
+        for key, module in base["keys"].items():
+            strings[key] = shards[module][key]
+    data = dict(base["catalog"])
+    data["strings"] = strings
+    return data, list(base["keys"])
+
+def merge_catalog(shard_dir=None):
+    """Writes the catalog back from shards; returns whether the file changed."""
+    data, key_order = merge_shards(shard_dir)
+    _, previous_raw = load_catalog()
+    return write_catalog(data, previous_raw, key_order)
+
+def manage_shard(lang, shard_dir=None, scan_options=None, stats=None):
+    """sync for one language shard of a "language" layout: reads catalog.json, <lang>.json and the
+    shards of every language its fallbacks derive from (pt-BR <- pt <- en reads all three); writes
+    only <lang>.json and, for new keys, catalog.json. Other shards pick up new keys on their own
+    sync or the next full sync."""
+    shard_dir = shard_dir or SHARD_DIR
+    stats = stats or RunStats()
+    with stats.phase("load"):
+        base = load_shard_base(shard_dir)
+        if base["layout"] != "language":
+            raise SystemExit(f"{shard_dir} is split by {base['layout']}; single-shard sync needs a language layout")
+        lang_path = os.path.join(shard_dir, lang + ".json")
+        cells = {lang: _load_json(lang_path) if lang in base["shards"] else {}}
+        for source, _, _, _, _ in resolve_plan([lang]).order:
+            if source not in cells and source in base["shards"]:
+                cells[source] = _load_json(os.path.join(shard_dir, source + ".json"))
+        catalog = Catalog({}, LANGS)
+        for key, fields in base["keys"].items():
+            entry = {k: v for k, v in fields.items() if k != "localizations"}
+            entry["localizations"] = {l: _unshard_cell(c[key]) for l, c in cells.items() if key in c}
+            catalog.entries[key] = catalog.entry_from_json(entry)
+    with stats.phase("scan"):
+        found_strings, refs = scan_swift_sources(**(scan_options or {}), stats=stats)
+    with stats.phase("resolve"):
+        # Stale marks live in catalog.json and are left to the next full sync
+        excluded = prune_stale(catalog, refs, load_stale_records())
+        all_keys, _, _ = sync_strings(catalog, found_strings, None, stats,
+                                      keys=sync_keys(catalog, found_strings, excluded), langs=[lang])
+    with stats.phase("write"):
+        shard = {}
+        for key, entry in catalog.entries.items():
+            loc = catalog.cell(entry, lang)
+            if loc is not None:
+                shard[key] = _shard_cell(_plain_json(loc))
+        _dump_shard(lang_path, shard)
+        added = [key for key in catalog.entries if key not in base["keys"]]
+        if added or lang not in base["shards"]:
+            keys = base["keys"]
+            previous_keys = list(keys)
+            for key in added:
+                keys[key] = dict(catalog.entries[key].fields, localizations={})
+            base["keys"] = {key: keys[key] for key in merge_key_order(previous_keys, keys)}
+            base["shards"] = sorted(set(base["shards"]) | {lang})
+            _dump_shard(os.path.join(shard_dir, SHARD_BASE_NAME), base)
+    print(f"Shard {lang} synced. {len(all_keys)} keys processed, {stats.counters.get('cells_changed', 0)} cells changed"
+          + (f", {len(added)} keys added to {SHARD_BASE_NAME}." if added else "."))
+    return stats
+
+# Merge driver
+# git merges the catalog through `merge-driver` (see .gitattributes): base, ours and theirs are
+# compared cell by cell, where a cell is one top-level field, one entry field or one language of
+# one key, so only a cell both sides changed differently is a conflict. Conflicting cells keep
+# our value and are listed. An Xcode-formatted file is split into one text chunk per entry;
+# only the entries whose text differs between the three versions are parsed and re-serialized,
+# the rest are copied, which gives the same bytes catalog_dumps() would write.
+
+def split_catalog_text(text):
+    """(top-level fields, {key: entry chunk} in file order) of a catalog in Xcode's format, where a
+    chunk is the entry's `    "key" : {...}` text; None when text is not laid out that way."""
+    start = text.find('\n  "strings" : {\n') + 17
+    # Deeper lines are indented further, so the first two-space "}" closes `strings`
+    end = text.find("\n  }", start - 1)
+    if start < 17 or end < 0 or not text.startswith("{\n"):
+        return None
+    try:
+        fields = json.loads(text[:start] + text[end:])
+    except ValueError:
+        return None
+    body = text[start:end]
+    fields.pop("strings", None)
+    chunks = {}
+    if body:
+        if not body.startswith('    "'):
+            return None
+        starts = [0]
+        pos = body.find('\n    "')
+        while pos >= 0:
+            starts.append(pos + 1)
+            pos = body.find('\n    "', pos + 1)
+        decoder = json.JSONDecoder()
+        for start, end in zip(starts, starts[1:] + [len(body) + 2]):
+            chunk = body[start:end - 2]
+            try:
+                key, pos = decoder.raw_decode(chunk, 4)
+            except ValueError:
+                return None
+            if chunk[pos:pos + 4] != " : {" or body[end - 2:end] not in (",\n", "") or key in chunks:
+                return None
+            chunks[key] = chunk
+    return fields, chunks
+
+def load_catalog_chunks(path):
+    with open(path, "rb") as f:
+        return catalog_chunks(f.read())
+
+def catalog_chunks(raw):
+    # split_catalog_text() of catalog bytes; other layouts are normalized with catalog_dumps() first
+    if not raw.strip():
+        return {}, {}  # git passes an empty base for add/add conflicts
+    split = split_catalog_text(raw.decode("utf-8"))
+    if split is None:
+        catalog = parse_catalog_model(raw)
+        split = split_catalog_text(catalog_dumps(catalog, list(catalog.entries)))
+    return split
+
+def _chunk_entry(catalog, chunk):
+    return catalog.entry_from_json(json.loads(chunk[chunk.index(" : {") + 3:], object_pairs_hook=_catalog_object_hook))
+
+def _same_cell(a, b):
+    if a is b:
+        return True
+    if a.__class__ is Localization and b.__class__ is Localization:
+        return a.state == b.state and a.value == b.value
+    if a is None or b is None:
+        return False
+    return _plain_json(a) == _plain_json(b)
+
+def _entry_cells(catalog, entry):
+    # (kind, name) -> value: ("field", name) for the entry's members, ("lang", lang) per localization
+    if entry is None:
+        return None
+    cells = {("field", name): value for name, value in entry.fields.items()}
+    if entry.locs is not None:
+        cells["field", "localizations"] = True  # the member exists, even when empty
+        for lang, loc in zip(catalog.langs, entry.locs):
+            if loc is not None:
+                cells["lang", lang] = loc
+    return cells
+
+def merge_cells(base, ours, theirs):
+    """Three-way merge of {name: value} maps (a missing name is an absent cell); returns (merged,
+    names of the conflicting cells, which keep our value)."""
+    merged, conflicts = {}, []
+    for name in dict.fromkeys([*ours, *theirs]):
+        b, o, t = base.get(name), ours.get(name), theirs.get(name)
+        if _same_cell(o, t) or _same_cell(t, b):
+            value = o
+        elif _same_cell(o, b):
+            value = t
+        else:
+            conflicts.append(name)
+            value = o
+        if value is not None:
+            merged[name] = value
+    return merged, conflicts
+
+def _cell_text(value):
+    if value is None:
+        return "(none)"
+    return json.dumps(value.value if isinstance(value, Localization) else _plain_json(value), ensure_ascii=False)
+
+def merge_entry(catalog, key, base, ours, theirs):
+    """Cell-level merge of one key's base, ours and theirs Entry objects (None where absent), all
+    in `catalog`'s language table; returns (merged Entry or None when deleted, conflicts
+    [(key, cell, ours, theirs)] where cell is a language or an entry field)."""
+    b = _entry_cells(catalog, base) or {}
+    o = _entry_cells(catalog, ours)
+    t = _entry_cells(catalog, theirs)
+    conflicts = []
+    if o is None or t is None:
+        # Added on one side, or deleted on one side: the deletion wins unless the other side changed the entry
+        kept = t if o is None else o
+        if b and kept.keys() == b.keys() and all(_same_cell(b[name], kept[name]) for name in b):
+            return None, conflicts
+        if b:
+            conflicts.append((key, "deleted in " + ("ours" if o is None else "theirs"),
+                              "(deleted)" if o is None else "(changed)", "(deleted)" if t is None else "(changed)"))
+        cells = kept
+    else:
+        cells, conflicting = merge_cells(b, o, t)
+        conflicts.extend((key, name, _cell_text(o.get((kind, name))), _cell_text(t.get((kind, name))))
+                         for kind, name in conflicting)
+    entry = Entry({name: value for (kind, name), value in cells.items() if kind == "field" and name != "localizations"}, None)
+    if ("field", "localizations") in cells:
+        entry.locs = []
+        for (kind, lang), loc in cells.items():
+            if kind == "lang":
+                catalog.set_cell(entry, lang, loc)
+    return entry, conflicts
+
+def merge_catalog_chunks(base, ours, theirs, stats=None):
+    """Merges three load_catalog_chunks() results; returns (catalog text, conflicts). Entries with
+    the same text on two sides are decided without parsing them."""
+    stats = stats or RunStats()
+    fields, conflicting = merge_cells(base[0], ours[0], theirs[0])
+    conflicts = [(None, name, _cell_text(ours[0].get(name)), _cell_text(theirs[0].get(name))) for name in conflicting]
+    catalog = Catalog(fields, LANGS)
+    (_, b), (_, o), (_, t) = base, ours, theirs
+    merged = {}
+    for key in dict.fromkeys([*o, *t]):
+        bc, oc, tc = b.get(key), o.get(key), t.get(key)
+        if oc == tc or bc == tc:
+            chunk = oc
+        elif bc == oc:
+            chunk = tc
+        else:
+            stats.count("merge_entries_parsed")
+            entries = [_chunk_entry(catalog, c) if c is not None else None for c in (bc, oc, tc)]
+            entry, entry_conflicts = merge_entry(catalog, key, *entries)
+            conflicts.extend(entry_conflicts)
+            chunk = None
+            if entry is not None:
+                out = ["    " + encode_basestring(key) + " : "]
+                _entry_xcode_json(catalog, entry, 2, out)
+                chunk = "".join(out)
+        if chunk is not None:
+            merged[key] = chunk
+    # Same layout as catalog_dumps()
+    out = ["{\n"]
+    top = sorted([*fields, "strings"], key=xcode_sort_key)
+    for i, name in enumerate(top):
+        out.append("  " + json.dumps(name, ensure_ascii=False) + " : ")
+        if name != "strings":
+            _xcode_json(fields[name], 1, out)
+        elif not merged:
+            out.append("{\n\n  }")
+        else:
+            out.append("{\n" + ",\n".join(merged[key] for key in merge_key_order(list(o), merged)) + "\n  }")
+        out.append(",\n" if i < len(top) - 1 else "\n")
+    out.append("}")
+    return "".join(out), conflicts
+
+def merge_driver(base_path, ours_path, theirs_path, stats=None):
+    """git merge driver: merges into ours_path; returns the conflicts."""
+    stats = stats or RunStats()
+    with stats.phase("load"):
+        versions = [load_catalog_chunks(path) for path in (base_path, ours_path, theirs_path)]
+    with stats.phase("merge"):
+        text, conflicts = merge_catalog_chunks(*versions, stats=stats)
+    with stats.phase("write"):
+        write_bytes_atomic(ours_path, text.encode("utf-8"))
+    stats.count("keys_total", text.count("\n    \""))
+    stats.count("merge_conflicts", len(conflicts))
+    return conflicts
+
+# Diff
+# diff compares two revisions of the catalog. Every entry is reduced to its Xcode-formatted text
+# (for a file Xcode wrote, the file's own bytes), so the entries two revisions share are matched
+# with one dict lookup each and only added, removed and changed entries are ever parsed. Changes
+# are reported per cell, as in the merge driver. A removed and an added key holding the same
+# non-empty set of real translations (memory_translations()) are a rename when neither has another
+# candidate. --stream reads each side with CatalogReader instead of holding it: one pass over the
+# old side keeps a 64-bit digest per key, one over the new side collects the changes, and a second
+# pass over the old side fetches the old values of the changed and removed keys.
+
+@contextlib.contextmanager
+def _git_show(obj):
+    import subprocess
+    proc = subprocess.Popen(["git", "show", obj], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        yield proc.stdout
+    finally:
+        proc.stdout.close()
+        err = proc.stderr.read().decode("utf-8", "replace").strip()
+        # A reader that stops early kills git with SIGPIPE, which leaves nothing on stderr
+        if proc.wait() and err:
+            raise SystemExit(f"git show {obj}: {err}")
+
+class DiffSide:
+    """One side of a diff: a catalog file, `REV:PATH`, or a git revision of XCSTRINGS_PATH."""
+
+    def __init__(self, spec, stream=False):
+        if os.path.exists(spec):
+            self.label = spec
+            self._open = lambda: open(spec, "rb")
+        else:
+            self.label = spec if ":" in spec else f"{spec}:{XCSTRINGS_PATH}"
+            obj = spec if ":" in spec else f"{spec}:./{XCSTRINGS_PATH}"
+            self._open = lambda: _git_show(obj)
+        self.fields = {}
+        self._chunks = None
+        if not stream:
+            with self._open() as f:
+                self.fields, self._chunks = catalog_chunks(f.read())
+
+    def entries(self, catalog, digests=True):
+        """(key, digest, entry) in file order; entry is a text chunk or, streamed without digests, the
+        parsed JSON (see _diff_entry())."""
+        if self._chunks is not None:
+            for key, chunk in self._chunks.items():
+                yield key, chunk, chunk
+            return
+        with self._open() as f:
+            for kind, name, value in CatalogReader(f):
+                if kind == "field":
+                    self.fields[name] = value
+                    continue
+                if not digests:
+                    yield name, None, value
+                    continue
+                entry = catalog.entry_from_json(value)
+                out = []
+                _entry_xcode_json(catalog, entry, 2, out)
+                yield name, _hash64("".join(out).encode("utf-8")), entry
+
+def _diff_entry(catalog, entry):
+    if isinstance(entry, str):
+        return _chunk_entry(catalog, entry)
+    return catalog.entry_from_json(entry) if isinstance(entry, dict) else entry
+
+def _diff_value(value):
+    # A plain translated cell as its string, anything else as its JSON
+    if isinstance(value, Localization) and value.state == TRANSLATED:
+        return value.value
+    return _plain_json(value)
+
+def _rename_signature(catalog, key, entry):
+    return tuple(sorted(memory_translations(key, catalog.existing_values(entry)).items())) or None
+
+def diff_catalogs(old, new, stats=None):
+    """Compares two DiffSides; returns {"added": [key], "removed": [key], "renamed": [(old key,
+    new key)], "changed": [(key, kind, cell, old value, new value)]}, where kind is "language" or
+    "field" and key is None for the catalog's top-level fields."""
+    stats = stats or RunStats()
+    catalog = Catalog({}, LANGS)
+    with stats.phase("old"):
+        digests = {key: digest for key, digest, _ in old.entries(catalog)}
+    total = len(digests)
+    added, changed = {}, {}
+    with stats.phase("new"):
+        for key, digest, entry in new.entries(catalog):
+            previous = digests.pop(key, None)
+            if previous is None:
+                added[key] = entry
+            elif previous != digest:
+                changed[key] = [None, entry]
+    removed = dict.fromkeys(digests)
+    if changed or removed:
+        with stats.phase("old values"):
+            for key, _, entry in old.entries(catalog, digests=False):
+                if key in changed:
+                    changed[key][0] = entry
+                elif key in removed:
+                    removed[key] = entry
+    stats.count("diff_entries_compared", len(added) + len(removed) + 2 * len(changed))
+    result = {"added": [], "removed": [], "renamed": [], "changed": []}
+    with stats.phase("compare"):
+        # Renames: removed and added keys whose translation sets match one to one
+        by_signature = collections.defaultdict(list)
+        for key, entry in removed.items():
+            removed[key] = entry = _diff_entry(catalog, entry)
+            by_signature[_rename_signature(catalog, key, entry)].append(key)
+        candidates = collections.defaultdict(list)
+        for key, entry in added.items():
+            added[key] = entry = _diff_entry(catalog, entry)
+            signature = _rename_signature(catalog, key, entry)
+            if signature is not None and len(by_signature.get(signature, ())) == 1:
+                candidates[signature].append(key)
+        renamed = {keys[0]: by_signature[signature][0] for signature, keys in candidates.items() if len(keys) == 1}
+        result["added"] = [key for key in added if key not in renamed]
+        result["renamed"] = [(old_key, key) for key, old_key in renamed.items()]
+        gone = set(renamed.values())
+        result["removed"] = [key for key in removed if key not in gone]
+        # Cell changes
+        for name in dict.fromkeys([*old.fields, *new.fields]):
+            a, b = old.fields.get(name), new.fields.get(name)
+            if a != b:
+                result["changed"].append((None, "field", name, a, b))
+        for key, (a, b) in changed.items():
+            a = _entry_cells(catalog, _diff_entry(catalog, a))
+            b = _entry_cells(catalog, _diff_entry(catalog, b))
+            for kind, name in dict.fromkeys([*a, *b]):
+                if (kind, name) == ("field", "localizations"):
+                    continue
+                x, y = a.get((kind, name)), b.get((kind, name))
+                if not _same_cell(x, y):
+                    result["changed"].append((key, "language" if kind == "lang" else kind, name,
+                                              None if x is None else _diff_value(x), None if y is None else _diff_value(y)))
+    stats.count("keys_total", total - len(removed) + len(added))
+    return result
+
+def diff_summary(result):
+    languages = collections.Counter(cell for _, kind, cell, _, _ in result["changed"] if kind == "language")
+    return {
+        "added": len(result["added"]),
+        "removed": len(result["removed"]),
+        "renamed": len(result["renamed"]),
+        "keys_changed": len({key for key, _, _, _, _ in result["changed"] if key is not None}),
+        "cells_changed": len(result["changed"]),
+        "languages": dict(sorted(languages.items(), key=lambda item: (-item[1], item[0]))),
+    }
+
+# Watch mode
+class PollingWatcher:
+    """Detects changes by re-walking the tree and comparing (size, mtime) every interval."""
+
+    def __init__(self, root, excludes, extra_paths=(), interval=WATCH_POLL_INTERVAL):
+        self.root = root
+        self.excludes = excludes
+        self.extra_paths = list(extra_paths)
+        self.interval = interval
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self):
+        snapshot = {}
+        for path in list(iter_swift_files(self.root, self.excludes)) + self.extra_paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            snapshot[path] = (st.st_size, st.st_mtime_ns)
+        return snapshot
+
+    def wait(self, timeout):
+        """Changed paths (created, modified or deleted), or an empty set after timeout."""
+        deadline = time.monotonic() + timeout
+        while True:
+            snapshot = self._take_snapshot()
+            changed = {p for p in snapshot.keys() | self._snapshot.keys() if snapshot.get(p) != self._snapshot.get(p)}
+            self._snapshot = snapshot
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self.interval, remaining))
+
+    def close(self):
+        pass
+
+class InotifyWatcher:
+    """Linux inotify through ctypes: one watch per directory, new directories are added as
+    they appear. Reports the directory entries that changed."""
+
+    IN_MODIFY, IN_MOVED_FROM, IN_MOVED_TO, IN_CREATE, IN_DELETE = 0x2, 0x40, 0x80, 0x100, 0x200
+    IN_CLOSE_WRITE, IN_DELETE_SELF, IN_ISDIR, IN_Q_OVERFLOW = 0x8, 0x400, 0x40000000, 0x4000
+    IN_NONBLOCK, IN_CLOEXEC = 0o4000, 0o2000000
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self, root, excludes, extra_paths=()):
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.root = root
+        self.excludes = excludes
+        self.mask = (self.IN_CLOSE_WRITE | self.IN_MODIFY | self.IN_MOVED_FROM | self.IN_MOVED_TO
+                     | self.IN_CREATE | self.IN_DELETE | self.IN_DELETE_SELF)
+        self._dirs = {}
+        self._add_tree(root)
+        for path in extra_paths:
+            self._add_dir(os.path.dirname(path) or ".")
+
+    def _add_dir(self, path):
+        if path in self._dirs.values():
+            return
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), self.mask)
+        if wd >= 0:
+            self._dirs[wd] = path
+
+    def _add_tree(self, top):
+        # Returns the Swift files already inside (a directory moved or unpacked into place)
+        found = []
+        for root, dirs, names in os.walk(top):
+            rel_root = os.path.relpath(root, self.root)
+            if rel_root != "." and is_excluded(rel_root, self.excludes):
+                dirs[:] = []
+                continue
+            dirs[:] = [d for d in dirs if not is_excluded(d if rel_root == "." else os.path.join(rel_root, d), self.excludes)]
+            self._add_dir(root)
+            found.extend(os.path.join(root, n) for n in names if n.endswith(".swift"))
+        return found
+
+    def wait(self, timeout):
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed = set()
+        while True:
+            try:
+                buf = os.read(self.fd, 65536)
+            except BlockingIOError:
+                break
+            pos = 0
+            while pos < len(buf):
+                wd, mask, _, size = self._EVENT.unpack_from(buf, pos)
+                pos += self._EVENT.size
+                name = buf[pos:pos + size].rstrip(b"\0").decode("utf-8", "surrogateescape")
+                pos += size
+                if mask & self.IN_Q_OVERFLOW:
+                    changed.update(iter_swift_files(self.root, self.excludes))
+                    continue
+                directory = self._dirs.get(wd)
+                if directory is None:
+                    continue
+                if mask & self.IN_DELETE_SELF:
+                    del self._dirs[wd]
+                    continue
+                path = os.path.join(directory, name)
+                if mask & self.IN_ISDIR:
+                    if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                        changed.update(self._add_tree(path))
+                    elif mask & self.IN_MOVED_FROM:
+                        # Everything below moved away; the caller drops records under it
+                        changed.add(path + os.sep)
                 else:
-                    # Preserve existing zh-Hant or generate from simplified
-                    existing = locs.get(lang, {}).get("stringUnit", {}).get("value")
-                    if existing and existing != key:
-                        val = existing
-                    else:
-                        val = key.replace("数据", "資料").replace("缓存", "快取").replace("设置", "設定").replace("应用", "應用程式").replace("运行", "執行").replace("迁移", "遷移").replace("链接", "連結").replace("目录", "目錄").replace("还原", "還原")
+                    changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+def make_watcher(root, excludes, extra_paths=(), poll=False, interval=WATCH_POLL_INTERVAL):
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(root, excludes, extra_paths)
+        except (OSError, AttributeError):
+            pass  # no inotify (old libc, seccomp): fall back to polling
+    return PollingWatcher(root, excludes, extra_paths, interval)
+
+class WatchSession:
+    """Catalog, DICT, per-file scan records and key fingerprints kept in memory between
+    batches, so a batch of saves only re-extracts the touched files and re-resolves the keys
+    whose source usage changed."""
+
+    def __init__(self, scan_options=None):
+        self.scan_options = dict(scan_options or {})
+        self.excludes = self.scan_options.get("excludes") or SCAN_EXCLUDE_GLOBS
+        stats = RunStats()
+        self.files = scan_swift_records(**self.scan_options, stats=stats)
+        self.usage = {}
+        for record in self.files.values():
+            self._count(record["strings"], 1)
+        self.fingerprints = load_resolve_state() if self.scan_options.get("use_cache", True) else {}
+        self._load_catalog()
+        self._sync(None, stats)
+
+    def _load_catalog(self):
+        self.catalog, self.raw = load_catalog_model()
+        self.previous_keys = list(self.catalog.entries)
+        self.catalog_stat = self._stat(XCSTRINGS_PATH)
+        self.dict_stat = self._stat(DICT_PATH)
+
+    @staticmethod
+    def _stat(path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    def _count(self, strings, delta):
+        # Number of files using each string; returns the strings whose in-sources state flipped
+        flipped = set()
+        for string in strings:
+            n = self.usage.get(string, 0) + delta
+            if n > 0:
+                self.usage[string] = n
             else:
-                # For all other languages (en, ja, ko, etc.)
-                existing = locs.get(lang, {}).get("stringUnit", {}).get("value")
-                if existing:
-                    # Keep existing if it's NOT Chinese (for non-CJK langs)
-                    if lang not in ("zh-Hans", "zh-Hant") and has_chinese_key and re.search(r'[\u4e00-\u9fa5]', existing):
-                        # Existing value is Chinese for a non-Chinese language - replace it
-                        val = None
-                    else:
-                        val = existing
-                
-                # If still no value, use English fallback (from DICT or existing)
-                if val is None:
-                    en_val = DICT.get(key, {}).get("en") or locs.get("en", {}).get("stringUnit", {}).get("value")
-                    if en_val and not (has_chinese_key and re.search(r'[\u4e00-\u9fa5]', en_val)):
-                        val = en_val
-                    elif not has_chinese_key:
-                        val = key  # Non-Chinese key can safely be used as fallback
-                    else:
-                        # Last resort: keep key but only for zh-Hans/zh-Hant
-                        val = key if lang in ("zh-Hans", "zh-Hant") else key
-                        # If we really have nothing, use the key (at least it won't crash)
-            
-            locs[lang] = {"stringUnit": {"state": "translated", "value": val}}
-        
-        entry["localizations"] = locs
-        data["strings"][key] = entry
-
-    with open(XCSTRINGS_PATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    print(f"Localization complete. {len(all_keys)} keys processed.")
+                self.usage.pop(string, None)
+            if (n > 0) != (n - delta > 0):
+                flipped.add(string)
+        return flipped
+
+    def _sync(self, keys, stats):
+        found_strings = set(self.usage)
+        visit = keys
+        if keys is None:
+            # Stale marks are left to sync; pruned keys just must not come back
+            refs = set()
+            for record in self.files.values():
+                refs.update(record["refs"])
+            visit = sync_keys(self.catalog, found_strings, prune_stale(self.catalog, refs, load_stale_records()))
+        visited, fingerprints, _ = sync_strings(self.catalog, found_strings, self.fingerprints, stats, keys=visit)
+        self.fingerprints.update(fingerprints)
+        written = False
+        if keys is None or stats.counters.get("keys_changed"):
+            encoded = catalog_dumps(self.catalog, self.previous_keys).encode("utf-8")
+            written = encoded != self.raw
+        if written:
+            write_bytes_atomic(XCSTRINGS_PATH, encoded)
+            self.raw = encoded
+            self.previous_keys = merge_key_order(self.previous_keys, self.catalog.entries)
+            self.catalog_stat = self._stat(XCSTRINGS_PATH)
+        if self.scan_options.get("use_cache", True):
+            save_scan_cache(self.files)
+            update_source_index(self.files)
+            save_resolve_state(self.fingerprints)
+        return visited, written
+
+    def apply(self, paths):
+        """Applies one batch of changed paths; returns a one-line summary (None if nothing to do)."""
+        stats = RunStats()
+        full = False
+        if self._stat(DICT_PATH) != self.dict_stat:
+            DICT.refresh()
+            full = True
+        if self._stat(XCSTRINGS_PATH) != self.catalog_stat:
+            # Edited outside this session (Xcode, git checkout): start from the file again
+            full = True
+        if full:
+            self._load_catalog()
+        touched = set()
+        flipped = set()
+        for path in sorted(paths):
+            if path.endswith(os.sep):
+                moved = [p for p in self.files if p.startswith(path)]
+            elif path.endswith(".swift"):
+                moved = [path]
+            else:
+                continue
+            for swift_path in moved:
+                rel = os.path.relpath(swift_path, SWIFT_SCAN_DIR)
+                old = self.files.pop(swift_path, None)
+                try:
+                    st = os.stat(swift_path)
+                    record = None if is_excluded(rel, self.excludes) else scan_swift_file(swift_path, st, old)
+                except OSError:
+                    record = None
+                if old:
+                    flipped |= self._count(old["strings"], -1)
+                if record:
+                    self.files[swift_path] = record
+                    flipped |= self._count(record["strings"], 1)
+                touched.add(swift_path)
+        self.files = {p: self.files[p] for p in sorted(self.files)}
+        if not full and not touched:
+            return None  # our own catalog write, or a non-Swift file
+        if not full and not flipped:
+            return f"{len(touched)} files changed, no keys affected."
+        visited, written = self._sync(None if full else flipped, stats)
+        changed = stats.counters.get("keys_changed", 0)
+        return (f"{len(touched)} files changed, {len(visited)} keys re-resolved, {changed} updated"
+                + (", catalog written." if written else ", catalog unchanged."))
+
+def watch(scan_options=None, debounce=WATCH_DEBOUNCE, poll=False, interval=WATCH_POLL_INTERVAL):
+    session = WatchSession(scan_options)
+    watcher = make_watcher(SWIFT_SCAN_DIR, session.excludes, [DICT_PATH, XCSTRINGS_PATH], poll, interval)
+    print(f"Watching {SWIFT_SCAN_DIR} ({type(watcher).__name__}, {len(session.files)} Swift files). Ctrl-C to stop.")
+    try:
+        while True:
+            changed = watcher.wait(3600)
+            if not changed:
+                continue
+            # Saves arrive in bursts (format-on-save, git checkout): wait for a quiet period
+            while True:
+                more = watcher.wait(debounce)
+                if not more:
+                    break
+                changed |= more
+            summary = session.apply(changed)
+            if summary:
+                print(time.strftime("[%H:%M:%S] ") + summary, flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+def run_instrumented(args, fn):
+    # --stats/--profile/--tracemalloc around one command; returns fn's result
+    if args.tracemalloc:
+        tracemalloc.start()
+    profiler = cProfile.Profile() if args.profile else None
+    stats = RunStats()
+    # Keep stdout pure JSON when the stats go there
+    summary_out = sys.stderr if args.stats == "-" else sys.stdout
+    with contextlib.redirect_stdout(summary_out):
+        if profiler:
+            profiler.enable()
+        result = fn(stats)
+        if profiler:
+            profiler.disable()
+    if profiler:
+        profiler.dump_stats(args.profile)
+    report = stats.as_dict()
+    if args.tracemalloc:
+        tracemalloc.take_snapshot().dump(args.tracemalloc)
+        tracemalloc.stop()
+    if args.stats == "-":
+        print(json.dumps(report, indent=2))
+    elif args.stats:
+        with open(args.stats, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return result
+
+def run_check(args, scan_options):
+    grace_days = getattr(args, "grace_days", None)
+    mark = getattr(args, "mark_stale", False)
+    changes, stale_changes, drift = run_instrumented(
+        args, lambda stats: check(scan_options, not args.no_cache, stats, grace_days, mark))
+    with contextlib.redirect_stdout(sys.stderr if args.stats == "-" else sys.stdout):
+        print_check_report(changes, stale_changes, drift)
+    return 1 if drift else 0
+
+def run_audit(args, scan_options):
+    findings = run_instrumented(args, lambda stats: audit(args.only, AUDIT_EXCLUDE_GLOBS + args.exclude))
+    with contextlib.redirect_stdout(sys.stderr if args.stats == "-" else sys.stdout):
+        if args.json:
+            print(json.dumps(findings, ensure_ascii=False, indent=2))
+        else:
+            print_audit_report(findings, 0 if args.all else 40)
+    return 1 if any(findings.values()) else 0
+
+def run_query(args, scan_options):
+    # where/keys: refresh the index (cheap when the scan cache is warm), then one query per argument.
+    # --no-cache indexes the fresh scan in memory rather than trusting or rewriting the file
+    if scan_options["use_cache"]:
+        scan_swift_records(**scan_options)
+        conn = open_source_index()
+    else:
+        files = scan_swift_records(**scan_options)
+        conn = open_source_index(":memory:")
+        fill_source_index(conn, files)
+    results = {}
+    try:
+        if args.command == "where":
+            for key in args.key:
+                results[key] = [{"path": p, "line": line, "kind": kind} for p, line, kind in find_key_uses(conn, key)]
+        else:
+            swift_path = resolve_indexed_path(conn, args.file)
+            if swift_path is None:
+                raise SystemExit(f"{args.file} is not an indexed Swift file under {SWIFT_SCAN_DIR}")
+            # Interpolations shown as \(…) instead of literal_shape()'s marker
+            results[swift_path] = [{"line": line, "kind": kind, "literal": ref.replace("\x00", "\\(…)")}
+                                   for line, kind, ref in find_file_keys(conn, swift_path, args.all)]
+    finally:
+        conn.close()
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    elif args.command == "where":
+        for key, uses in results.items():
+            if not uses:
+                print(f"{json.dumps(key, ensure_ascii=False)}: not used in {SWIFT_SCAN_DIR}")
+            for use in uses:
+                print(f"{use['path']}:{use['line']}: {use['kind']}" + (f" {json.dumps(key, ensure_ascii=False)}" if len(args.key) > 1 else ""))
+    else:
+        for swift_path, uses in results.items():
+            for use in uses:
+                # Quoted like the Swift source: \(…) keeps a single backslash
+                literal = json.dumps(use["literal"], ensure_ascii=False).replace("\\\\(…)", "\\(…)")
+                print(f"{swift_path}:{use['line']}: {use['kind']} {literal}")
+    return 0 if all(results.values()) else 1
+
+def run_suggest(args, stats):
+    with stats.phase("load"):
+        catalog, _ = load_catalog_model()
+        keys = args.key or untranslated_keys(catalog)
+    with stats.phase("index"):
+        tm = build_translation_memory(catalog)
+        tm.build()
+    with stats.phase("lookup"):
+        results = {key: suggest_translations(tm, catalog, key, args.min_score, args.limit, args.lang) for key in keys}
+    stats.count("tm_segments", len(tm))
+    stats.count("tm_lookups", len(keys))
+    if args.json:
+        print(json.dumps({key: {lang: [{"score": round(score, 4), "value": value, "source": source}
+                                       for score, value, source in found] for lang, found in suggestions.items()}
+                          for key, suggestions in results.items()}, ensure_ascii=False, indent=2))
+        return
+    for key, suggestions in results.items():
+        if not suggestions:
+            continue
+        print(json.dumps(key, ensure_ascii=False))
+        for lang, found in suggestions.items():
+            for score, value, source in found:
+                print(f"  {lang:<8} {score:4.0%}  {json.dumps(value, ensure_ascii=False)}  <- {json.dumps(source, ensure_ascii=False)}")
+    with_suggestions = sum(1 for suggestions in results.values() if suggestions)
+    print(f"{with_suggestions} of {len(results)} keys have suggestions ({len(tm)} segments in memory).")
+
+def run_translate(args, stats):
+    with stats.phase("load"):
+        catalog, _ = load_catalog_model()
+        pending = pending_translations(catalog, args.key or None, args.lang)
+    cells = sum(len(langs) for langs in pending.values())
+    if not pending:
+        print("Nothing to translate: every cell has a DICT value or a translation.")
+        return 0
+    try:
+        backend = MT_BACKENDS[args.backend](args.endpoint or os.environ.get(MT_ENDPOINT_ENV),
+                                            os.environ.get(MT_API_KEY_ENV), concurrency=args.concurrency)
+    except TranslationBackendError as e:
+        raise SystemExit(f"translate: {e}")
+    cache = TranslationCache(":memory:" if args.no_cache else None)
+    try:
+        with stats.phase("translate"):
+            rows, rejected, failures = translate_pending(
+                pending, backend, cache, catalog.fields.get("sourceLanguage", "zh-Hans"), stats,
+                batch_size=args.batch_size, concurrency=args.concurrency, rate=args.rate)
+        with stats.phase("write"):
+            written = 0 if args.dry_run else write_dictionary_rows(rows)
+            stats.count("mt_cache_evicted", cache.evict())
+    finally:
+        backend.close()
+        cache.close()
+    if args.dry_run:
+        for key, values in rows.items():
+            print(json.dumps(key, ensure_ascii=False))
+            for lang, value in values.items():
+                print(f"  {lang:<8} {json.dumps(value, ensure_ascii=False)}")
+    for key, lang in rejected:
+        print(f"rejected {lang} {json.dumps(key, ensure_ascii=False)}: placeholders changed")
+    for lang, count, error in failures:
+        print(f"failed {lang}: {count} texts: {error}")
+    translated = sum(len(values) for values in rows.values())
+    counters = stats.counters
+    print(f"Translated {translated} of {cells} cells for {len(rows)} keys "
+          f"({counters.get('mt_requests', 0)} requests, {counters.get('mt_cache_hits', 0)} of {counters.get('mt_texts', 0)} texts cached)"
+          + (f"; {written} cells written to {DICT_PATH}, run sync to apply them." if written else "."))
+    return 1 if failures else 0
+
+def run_export(args, stats):
+    langs = args.lang or translated_languages()
+    for lang in langs:
+        out_path = os.path.join(args.output, f"{lang}.xliff")
+        with stats.phase("export"):
+            units = export_xliff(lang, out_path, args.xliff_version, args.missing)
+        stats.count("xliff_units", units)
+        print(f"{out_path}: {units} units")
+
+def run_import(args, stats):
+    changes, conflicts = import_xliff(args.file, args.force, args.dry_run, stats)
+    for key, lang, old, new in changes:
+        print(f"{lang} {json.dumps(key, ensure_ascii=False)}: {json.dumps(old, ensure_ascii=False)} -> {json.dumps(new, ensure_ascii=False)}")
+    for key, lang, reason in conflicts:
+        print(f"conflict {lang} {json.dumps(key, ensure_ascii=False)}: {reason}")
+    unchanged = stats.counters.get("xliff_unchanged", 0)
+    verb = "Would import" if args.dry_run else "Imported"
+    print(f"{verb} {len(changes)} changed cells from {len(args.file)} files ({unchanged} unchanged"
+          + (f", {len(conflicts)} conflicts" if conflicts else "") + ")"
+          + ("" if args.dry_run or stats.counters.get("catalog_written") else ", catalog unchanged") + ".")
+    return 1 if conflicts else 0
+
+def run_merge_driver(args, stats):
+    conflicts = merge_driver(args.base, args.ours, args.theirs, stats)
+    name = args.path or args.ours
+    for key, cell, ours, theirs in conflicts:
+        where = json.dumps(key, ensure_ascii=False) + f" [{cell}]" if key is not None else f"[{cell}]"
+        print(f"{name}: conflict {where}: ours {ours}, theirs {theirs}")
+    if conflicts:
+        print(f"{name}: {len(conflicts)} conflicting cells kept our value; fix them and `git add` the file.")
+    return 1 if conflicts else 0
+
+def run_diff(args, stats):
+    with stats.phase("load"):
+        old = DiffSide(args.old, args.stream)
+        new = DiffSide(args.new or XCSTRINGS_PATH, args.stream)
+    result = diff_catalogs(old, new, stats)
+    summary = diff_summary(result)
+    if args.json:
+        print(json.dumps({
+            "old": old.label,
+            "new": new.label,
+            "summary": summary,
+            "added": result["added"],
+            "removed": result["removed"],
+            "renamed": [{"old": a, "new": b} for a, b in result["renamed"]],
+            "changed": [{"key": key, kind: cell, "old": a, "new": b} for key, kind, cell, a, b in result["changed"]],
+        }, ensure_ascii=False, indent=2))
+        return
+    q = lambda value: "(none)" if value is None else json.dumps(value, ensure_ascii=False)
+    for key in result["added"]:
+        print(f"+ {q(key)}")
+    for key in result["removed"]:
+        print(f"- {q(key)}")
+    for a, b in result["renamed"]:
+        print(f"R {q(a)} -> {q(b)}")
+    for key, _, cell, a, b in result["changed"]:
+        print(("~ " if key is None else f"~ {q(key)} ") + f"[{cell}]: {q(a)} -> {q(b)}")
+    if not any(result.values()):
+        print(f"No differences between {old.label} and {new.label}.")
+        return
+    languages = ", ".join(f"{lang} {n}" for lang, n in summary["languages"].items())
+    print(f"{old.label} -> {new.label}: {summary['added']} keys added, {summary['removed']} removed, "
+          f"{summary['renamed']} renamed, {summary['cells_changed']} cells changed in {summary['keys_changed']} keys"
+          + (f" ({languages})" if languages else "") + ".")
+
+def main(argv=None):
+    global XCSTRINGS_PATH
+    argv = sys.argv[1:] if argv is None else list(argv)
+    parser = argparse.ArgumentParser(description="Maintain Localizable.xcstrings from the Swift sources and DICT.")
+    sub = parser.add_subparsers(dest="command", metavar="COMMAND")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--catalog", metavar="PATH", help=f"string catalog to work on (default: {XCSTRINGS_PATH})")
+    common.add_argument("--no-cache", action="store_true",
+                        help="ignore and do not update the scan cache and key fingerprints")
+    common.add_argument("--stats", metavar="PATH",
+                        help="write per-phase timings, counters and peak memory as JSON ('-' for stdout)")
+    common.add_argument("--profile", metavar="PATH", help="dump cProfile stats of the run (read with pstats)")
+    common.add_argument("--tracemalloc", metavar="PATH",
+                        help="trace allocations and dump the final snapshot (read with tracemalloc.Snapshot.load)")
+    # Options of the commands that scan the Swift sources
+    scan_common = argparse.ArgumentParser(add_help=False, parents=[common])
+    scan_common.add_argument("-j", "--jobs", type=int, default=None,
+                             help=f"worker count for Swift extraction (default: {SCAN_WORKERS})")
+    scan_common.add_argument("--executor", choices=["process", "thread", "serial"], default=None,
+                             help=f"pool used for Swift extraction (default: {SCAN_EXECUTOR})")
+    scan_common.add_argument("--exclude", action="append", default=[], metavar="GLOB",
+                             help="extra glob of directories/files to skip while scanning (repeatable)")
+    p = sync_parser = sub.add_parser("sync", parents=[scan_common], help="update the catalog (default command)")
+    p.add_argument("--check", action="store_true", help="same as the check command")
+    p.add_argument("--stream", action="store_true",
+                   help="resolve entries while reading the catalog; memory stays bounded for very large catalogs")
+    p.add_argument("--shard", metavar="LANG", help="sync only this language's shard (see split)")
+    p.add_argument("--shard-dir", default=SHARD_DIR, help=f"shard directory (default: {SHARD_DIR})")
+    p.add_argument("--mark-stale", action="store_true",
+                   help="mark keys no Swift source uses as extractionState stale (restored when used again)")
+    p.add_argument("--prune-stale", dest="grace_days", nargs="?", type=int, const=STALE_GRACE_DAYS, metavar="DAYS",
+                   help=f"drop keys marked stale at least DAYS days ago (default: {STALE_GRACE_DAYS}); implies --mark-stale")
+    p = sub.add_parser("check", parents=[scan_common],
+                       help="report what sync would change without writing anything; exit 1 on drift")
+    p.add_argument("--mark-stale", action="store_true", help="include the stale marking of sync --mark-stale")
+    p = sub.add_parser("audit", parents=[common],
+                       help="run the LocalizationAuditTests catalog and source checks without Xcode; exit 1 on findings")
+    p.add_argument("--exclude", action="append", default=[], metavar="GLOB",
+                   help="extra glob of directories/files to skip (repeatable)")
+    p.add_argument("--only", action="append", choices=AUDIT_CHECKS, metavar="CHECK",
+                   help=f"run only this check (repeatable): {', '.join(AUDIT_CHECKS)}")
+    p.add_argument("--all", action="store_true", help="list every finding (default: the first 40 per check)")
+    p.add_argument("--json", action="store_true", help="print the findings as JSON")
+    p = sub.add_parser("split", parents=[scan_common], help="write the catalog as per-language or per-module shards")
+    p.add_argument("--by", choices=["language", "module"], default="language")
+    p.add_argument("--shard-dir", default=SHARD_DIR, help=f"output directory (default: {SHARD_DIR})")
+    p = sub.add_parser("merge", parents=[common], help="rebuild the catalog from its shards")
+    p.add_argument("--shard-dir", default=SHARD_DIR, help=f"shard directory (default: {SHARD_DIR})")
+    p = sub.add_parser("export", parents=[common], help="write the catalog as one XLIFF file per language")
+    p.add_argument("--lang", action="append", help="language to export (repeatable; default: every translated language)")
+    p.add_argument("--xliff-version", choices=sorted(_XLIFF_NS), default=XLIFF_VERSION)
+    p.add_argument("--output", default=XLIFF_DIR, help=f"output directory (default: {XLIFF_DIR})")
+    p.add_argument("--missing", action="store_true", help="only cells that hold no translation yet")
+    p = sub.add_parser("import", parents=[common], help="apply translated XLIFF files to the catalog; exit 1 on conflicts")
+    p.add_argument("file", nargs="+")
+    p.add_argument("--force", action="store_true", help="also overwrite cells changed in the catalog since the export")
+    p.add_argument("--dry-run", action="store_true", help="report the changes and conflicts without writing")
+    p = sub.add_parser("merge-driver", parents=[common],
+                       help="git merge driver: three-way merge of the catalog per key and language; exit 1 on conflicts")
+    p.add_argument("base", help="common ancestor (%%O)")
+    p.add_argument("ours", help="current version, overwritten with the result (%%A)")
+    p.add_argument("theirs", help="other branch's version (%%B)")
+    p.add_argument("path", nargs="?", help="path of the merged file, for messages (%%P)")
+    p = sub.add_parser("diff", parents=[common],
+                       help="keys added, removed and renamed and cells changed between two revisions of the catalog")
+    p.add_argument("old", nargs="?", default="HEAD",
+                   help="catalog file, git revision of the catalog, or REV:PATH (default: HEAD)")
+    p.add_argument("new", nargs="?", help="same forms (default: the catalog file)")
+    p.add_argument("--stream", action="store_true",
+                   help="read each side entry by entry instead of holding it; for very large catalogs")
+    p.add_argument("--json", action="store_true", help="print the differences as JSON")
+    p = sub.add_parser("where", parents=[scan_common], help="list the file, line and call-site kind of each use of a key")
+    p.add_argument("key", nargs="+")
+    p.add_argument("--json", action="store_true", help="print the uses as JSON")
+    p = sub.add_parser("keys", parents=[scan_common], help="list the catalog keys a Swift file uses")
+    p.add_argument("file", help="path as scanned, relative to the scan directory, or a unique suffix")
+    p.add_argument("--all", action="store_true", help="every string literal, not only catalog keys")
+    p.add_argument("--json", action="store_true", help="print the literals as JSON")
+    p = sub.add_parser("suggest", parents=[common],
+                       help="closest existing translations for keys without a DICT row (translation memory)")
+    p.add_argument("key", nargs="*", help="keys to look up (default: every key still falling back somewhere)")
+    p.add_argument("--lang", action="append", help="only this language (repeatable)")
+    p.add_argument("--min-score", type=float, default=TM_MIN_SCORE,
+                   help=f"lowest similarity to report, 0-1 (default: {TM_MIN_SCORE})")
+    p.add_argument("--limit", type=int, default=TM_SUGGESTIONS,
+                   help=f"suggestions per language (default: {TM_SUGGESTIONS})")
+    p.add_argument("--json", action="store_true", help="print the suggestions as JSON")
+    p = sub.add_parser("translate", parents=[common],
+                       help="machine-translate the cells no DICT row or catalog value covers into the DICT")
+    p.add_argument("key", nargs="*", help="keys to translate (default: every Han key still falling back somewhere)")
+    p.add_argument("--lang", action="append", help="only this language (repeatable)")
+    p.add_argument("--backend", choices=sorted(MT_BACKENDS), default=MT_BACKEND)
+    p.add_argument("--endpoint", help=f"backend URL (default: ${MT_ENDPOINT_ENV}; API key from ${MT_API_KEY_ENV})")
+    p.add_argument("--batch-size", type=int, default=MT_BATCH_SIZE, help=f"texts per request (default: {MT_BATCH_SIZE})")
+    p.add_argument("--concurrency", type=int, default=MT_CONCURRENCY,
+                   help=f"requests in flight (default: {MT_CONCURRENCY})")
+    p.add_argument("--rate", type=float, default=MT_RATE_LIMIT,
+                   help=f"requests started per second, 0 for no limit (default: {MT_RATE_LIMIT})")
+    p.add_argument("--dry-run", action="store_true", help="print the translations instead of writing the DICT")
+    p = sub.add_parser("watch", parents=[scan_common], help="keep the catalog in sync while Swift files are edited")
+    p.add_argument("--debounce", type=float, default=WATCH_DEBOUNCE,
+                   help=f"seconds without changes that end a batch (default: {WATCH_DEBOUNCE})")
+    p.add_argument("--poll", action="store_true", help="poll file stats instead of using inotify")
+    p.add_argument("--interval", type=float, default=WATCH_POLL_INTERVAL,
+                   help=f"polling interval in seconds (default: {WATCH_POLL_INTERVAL})")
+    # Plain `manage_translations.py [options]` keeps meaning sync
+    if not argv or (argv[0] not in sub.choices and argv[0] not in ("-h", "--help")):
+        argv = ["sync"] + argv
+    args = parser.parse_args(argv)
+    if args.command == "sync":
+        # Each of these would silently drop one of the flags
+        if args.shard and args.stream:
+            sync_parser.error("--shard cannot be combined with --stream")
+        if args.shard and (args.mark_stale or args.grace_days is not None):
+            sync_parser.error("--shard cannot be combined with --mark-stale or --prune-stale; stale keys need a full sync")
+        if args.check and (args.shard or args.stream):
+            sync_parser.error("--check cannot be combined with --shard or --stream; it always checks the whole catalog")
+    if args.catalog:
+        XCSTRINGS_PATH = args.catalog
+    scan_options = {
+        "use_cache": not args.no_cache,
+        "workers": getattr(args, "jobs", None),
+        "executor": getattr(args, "executor", None),
+        "excludes": SCAN_EXCLUDE_GLOBS + getattr(args, "exclude", []),
+    }
+    if args.command == "check" or getattr(args, "check", False):
+        sys.exit(run_check(args, scan_options))
+    if args.command == "audit":
+        sys.exit(run_audit(args, scan_options))
+    if args.command in ("where", "keys"):
+        sys.exit(run_query(args, scan_options))
+    if args.command == "suggest":
+        return run_instrumented(args, lambda stats: run_suggest(args, stats))
+    if args.command == "translate":
+        sys.exit(run_instrumented(args, lambda stats: run_translate(args, stats)))
+    if args.command == "watch":
+        return watch(scan_options, args.debounce, args.poll, args.interval)
+    if args.command == "export":
+        return run_instrumented(args, lambda stats: run_export(args, stats))
+    if args.command == "import":
+        sys.exit(run_instrumented(args, lambda stats: run_import(args, stats)))
+    if args.command == "diff":
+        return run_instrumented(args, lambda stats: run_diff(args, stats))
+    if args.command == "merge-driver":
+        sys.exit(run_instrumented(args, lambda stats: run_merge_driver(args, stats)))
+    if args.command == "split":
+        names = split_catalog(args.shard_dir, args.by, scan_options)
+        print(f"Split into {len(names)} shards by {args.by} in {args.shard_dir}.")
+        return
+    if args.command == "merge":
+        written = merge_catalog(args.shard_dir)
+        print(f"Merged {args.shard_dir} into {XCSTRINGS_PATH}" + ("." if written else ", catalog unchanged."))
+        return
+    if args.stream:
+        run_instrumented(args, lambda stats: manage_streaming(scan_options, stats, args.grace_days, args.mark_stale))
+        return
+    if args.shard:
+        run_instrumented(args, lambda stats: manage_shard(args.shard, args.shard_dir, scan_options, stats))
+        return
+    run_instrumented(args, lambda stats: manage(scan_options, not args.no_cache, stats, args.grace_days, args.mark_stale))
 
 if __name__ == "__main__":
-    manage()
+    main()
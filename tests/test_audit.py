@@ -0,0 +1,48 @@
+import contextlib
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import manage_translations as mt
+from workspace import WorkspaceTestCase, unit
+
+
+class CatalogAuditTests(WorkspaceTestCase):
+    files = {mt.LANGUAGE_REGISTRY_PATH: 'AppLanguageOption(code: "en")\nAppLanguageOption(code: "ja")\n'
+                                        'AppLanguageOption(code: "ja")\n'}
+    strings = {
+        "迁移": {"extractionState": "manual", "localizations": {"en": unit("Migrate"), "ja": unit("移行")}},
+        "已迁移 %lld 个应用": {"extractionState": "manual", "localizations": {
+            "en": unit("Migrated %lld apps"), "ja": unit("%@ 個のアプリを移行しました")}},
+        "还原": {"extractionState": "manual", "localizations": {"en": unit("Restore"), "fr": unit("Restaurer")}},
+        "旧按钮": {"extractionState": "stale", "localizations": {"en": unit("Old button"), "ja": unit("古いボタン")}},
+        "AppPorts": {"shouldTranslate": False},
+    }
+
+    def test_catalog_checks(self):
+        findings = mt.audit(["language-codes", "catalog-coverage", "catalog-clean", "catalog-stale", "placeholders"])
+        self.assertEqual(findings, {
+            "language-codes": ["duplicate language code: ja"],
+            "catalog-coverage": ["missing translation: [ja] 还原"],
+            "catalog-clean": ["unsupported locale: [fr] 还原"],
+            "catalog-stale": ["旧按钮"],
+            "placeholders": ["placeholder mismatch: [ja] 已迁移 %lld 个应用 expected ['%lld'], got ['%@']"],
+        })
+
+    def test_findings_exit_non_zero(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out), self.assertRaises(SystemExit) as raised:
+            mt.main(["audit", "--only", "catalog-stale", "--only", "language-codes"])
+        self.assertEqual(raised.exception.code, 1)
+        self.assertEqual(out.getvalue().splitlines(), [
+            "language-codes: 1 findings", "  duplicate language code: ja",
+            "catalog-stale: 1 findings", "  旧按钮",
+            "Audit failed: 2 of 2 checks have findings.",
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import manage_translations as mt
+
+
+class CatalogModelTests(unittest.TestCase):
+    data = {"sourceLanguage": "zh-Hans", "version": "1.0", "strings": {
+        "迁移": {"extractionState": "manual", "localizations": {}},
+        "还原": {"extractionState": "manual", "localizations": {}},
+    }}
+
+    def test_equal_entry_fields_share_one_dict(self):
+        catalog = mt.Catalog.from_json(self.data)
+        self.assertIs(catalog.entries["迁移"].fields, catalog.entries["还原"].fields)
+        self.assertEqual(len(catalog.shared_fields), 1)
+
+    def test_interned_fields_go_away_with_the_catalog(self):
+        first = mt.Catalog.from_json(self.data)
+        first.set_field(first.entries["迁移"], "extractionState", "stale")
+        second = mt.Catalog.from_json(self.data)
+        self.assertEqual(len(first.shared_fields), 2)
+        self.assertEqual(len(second.shared_fields), 1)
+        self.assertFalse(hasattr(mt.Catalog, "_shared_fields"))
+
+
+class FingerprintTests(unittest.TestCase):
+    def setUp(self):
+        self.catalog = mt.Catalog.from_json({"sourceLanguage": "zh-Hans", "version": "1.0", "strings": {
+            "迁移": {"extractionState": "manual", "localizations": {
+                "en": {"stringUnit": {"state": "translated", "value": "Migrate"}}}},
+        }})
+        self.entry = self.catalog.entries["迁移"]
+
+    def fingerprint(self):
+        return mt.key_fingerprint("迁移", self.catalog, self.entry, True)
+
+    def test_plain_cells_are_not_serialized(self):
+        with mock.patch.object(mt.json, "dumps", side_effect=AssertionError("json.dumps called")):
+            self.fingerprint()
+
+    def test_only_cells_change_the_fingerprint(self):
+        before = self.fingerprint()
+        self.catalog.set_field(self.entry, "extractionState", "stale")
+        self.assertEqual(self.fingerprint(), before)
+        self.catalog.set_cell(self.entry, "fr", mt.Localization(mt.TRANSLATED, "Migrer"))
+        after = self.fingerprint()
+        self.assertNotEqual(after, before)
+        self.catalog.set_cell(self.entry, "fr", mt.Localization("needs_review", "Migrer"))
+        self.assertNotEqual(self.fingerprint(), after)
+        self.assertNotEqual(mt.key_fingerprint("迁移", self.catalog, self.entry, False), self.fingerprint())
+
+
+if __name__ == "__main__":
+    unittest.main()
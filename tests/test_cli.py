@@ -0,0 +1,32 @@
+import contextlib
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import manage_translations as mt
+
+
+class SyncOptionTests(unittest.TestCase):
+    def assertRejected(self, argv, message):
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr), self.assertRaises(SystemExit) as raised:
+            mt.main(argv)
+        self.assertEqual(raised.exception.code, 2)
+        self.assertIn(message, stderr.getvalue())
+
+    def test_shard_and_stream_are_exclusive(self):
+        self.assertRejected(["sync", "--shard", "fr", "--stream"], "--shard cannot be combined with --stream")
+
+    def test_shard_sync_does_not_touch_stale_keys(self):
+        for flag in (["--mark-stale"], ["--prune-stale"], ["--prune-stale", "7"]):
+            self.assertRejected(["--shard", "fr"] + flag, "--shard cannot be combined with --mark-stale or --prune-stale")
+
+    def test_check_reads_the_whole_catalog(self):
+        self.assertRejected(["sync", "--check", "--stream"], "--check cannot be combined with --shard or --stream")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import manage_translations as mt
+from workspace import WorkspaceTestCase, unit
+
+
+class DictionaryKeyTests(WorkspaceTestCase):
+    sources = 'Text("发现新版本 %@。\\n%@")\nText("迁移")\n'
+    # One key with a real line break (the TSV escape), one with a backslash and an n
+    dictionary = "key\ten\n发现新版本 %@。\\n%@\tNew version %@ found.\\n%@\n迁移\\\\n\tMigrate\n"
+    files = {mt.LANGUAGE_REGISTRY_PATH: 'AppLanguageOption(code: "en")\n'}
+
+    def test_escaped_line_break_is_a_real_newline(self):
+        self.assertEqual(mt.DICT.get("发现新版本 %@。\n%@"), {"en": "New version %@ found.\n%@"})
+        self.assertIn("迁移\\n", mt.DICT)
+
+    def test_sync_uses_the_row_of_a_multiline_key(self):
+        strings = self.sync()
+        self.assertEqual(strings["发现新版本 %@。\n%@"]["localizations"]["en"], unit("New version %@ found.\n%@"))
+
+    def test_audit_reports_keys_no_literal_produces(self):
+        findings = mt.audit(["dictionary-keys"])
+        self.assertEqual(findings, {"dictionary-keys": ["dictionary key no Swift literal produces: 迁移\\n"]})
+
+
+class RepositoryDictionaryTests(unittest.TestCase):
+    def test_no_key_keeps_an_escape_the_tokenizer_decodes(self):
+        table = mt.DictionaryTable(os.path.join(ROOT, mt.DICT_PATH), os.devnull)
+        table.write_index = False
+        self.assertEqual([key for key in table.keys() if "\\n" in key or "\\t" in key or '\\"' in key], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
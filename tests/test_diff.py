@@ -0,0 +1,63 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import manage_translations as mt
+from workspace import WorkspaceTestCase, unit
+
+
+def translated(en, fr):
+    return {"extractionState": "manual", "localizations": {"en": unit(en), "fr": unit(fr)}}
+
+
+OLD = {
+    "迁移应用": translated("Migrate", "Migrer"),
+    "打开": translated("Open", "Ouvrir"),
+    "打开文件": translated("Open", "Ouvrir"),
+    "删除": translated("Delete", "Supprimer"),
+    "设置": {"extractionState": "manual", "localizations": {}},
+}
+NEW = {
+    # One removed key with the same translations: a rename
+    "迁移": translated("Migrate", "Migrer"),
+    # Two removed keys share these translations: no rename
+    "打开应用": translated("Open", "Ouvrir"),
+    "删除": translated("Delete", "Supprimer définitivement"),
+    # An empty entry never matches
+    "设置项": {"extractionState": "manual", "localizations": {}},
+}
+
+
+class RenameTests(WorkspaceTestCase):
+    files = {
+        "old.xcstrings": mt.xcode_dumps({"sourceLanguage": "zh-Hans", "strings": OLD, "version": "1.0"}),
+        "new.xcstrings": mt.xcode_dumps({"sourceLanguage": "zh-Hans", "strings": NEW, "version": "1.0"}),
+    }
+
+    def diff(self, stream):
+        return mt.diff_catalogs(mt.DiffSide("old.xcstrings", stream), mt.DiffSide("new.xcstrings", stream))
+
+    def test_renames(self):
+        for stream in (False, True):
+            with self.subTest(stream=stream):
+                result = self.diff(stream)
+                self.assertEqual(result["renamed"], [("迁移应用", "迁移")])
+                self.assertEqual(sorted(result["added"]), ["打开应用", "设置项"])
+                self.assertEqual(sorted(result["removed"]), ["打开", "打开文件", "设置"])
+                self.assertEqual(result["changed"], [("删除", "language", "fr", "Supprimer", "Supprimer définitivement")])
+
+    def test_copied_key_values_are_no_rename(self):
+        # Values that only repeat the key are no translations (memory_translations())
+        old = {"迁移应用": {"extractionState": "manual", "localizations": {"ja": unit("迁移应用")}}}
+        new = {"迁移": {"extractionState": "manual", "localizations": {"ja": unit("迁移应用")}}}
+        for name, strings in (("old.xcstrings", old), ("new.xcstrings", new)):
+            with open(name, "w", encoding="utf-8") as f:
+                f.write(mt.xcode_dumps({"sourceLanguage": "zh-Hans", "strings": strings, "version": "1.0"}))
+        result = self.diff(False)
+        self.assertEqual((result["renamed"], result["added"], result["removed"]), ([], ["迁移"], ["迁移应用"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import manage_translations as mt
+from workspace import WorkspaceTestCase, unit
+
+
+class KeepTranslationsTests(WorkspaceTestCase):
+    sources = 'Text("设置")\nText("迁移")\nlet title = "data_dir_resign_alert_title".localized\n'
+    dictionary = "key\ten\n迁移\tMigrate\n"
+    strings = {
+        "设置": {"extractionState": "manual", "localizations": {"en": unit("Settings"), "ja": unit("設定")}},
+        # Japanese that only copies the Chinese key is no translation
+        "迁移": {"extractionState": "manual", "localizations": {"ja": unit("迁移")}},
+        "data_dir_resign_alert_title": {"extractionState": "manual", "localizations": {
+            "en": unit("Re-sign the app?"), "zh-Hans": unit("重新签名应用？")}},
+    }
+
+    def test_kanji_ja_value_survives_sync(self):
+        strings = self.sync()
+        self.assertEqual(strings["设置"]["localizations"]["ja"], unit("設定"))
+        self.assertEqual(strings["迁移"]["localizations"]["ja"], unit("Migrate"))
+
+    def test_hand_written_zh_hans_value_survives_sync(self):
+        strings = self.sync()
+        localizations = strings["data_dir_resign_alert_title"]["localizations"]
+        self.assertEqual(localizations["zh-Hans"], unit("重新签名应用？"))
+        self.assertEqual(strings["设置"]["localizations"]["zh-Hans"], unit("设置"))
+
+    def test_kanji_ja_value_is_a_translation(self):
+        translations = mt.memory_translations("设置", {"en": "Settings", "ja": "設定", "fr": "设置"})
+        self.assertEqual(translations, {"en": "Settings", "ja": "設定"})
+
+
+class ShardChainTests(WorkspaceTestCase):
+    # pt-BR <- pt <- en: a shard sync of pt-BR must see the pt and en shards
+    langs = ["en", "zh-Hans", "pt", "pt-BR"]
+    fallbacks = {"pt-BR": ("translation", "first", ("pt",))}
+    sources = 'Text("迁移")\nText("还原")\nText("链接")\nText("缓存")\n'
+    dictionary = "key\ten\tpt\n迁移\tMigrate\t\n还原\t\tRestaurar\n"
+    strings = {
+        "迁移": {"extractionState": "manual", "localizations": {}},
+        "还原": {"extractionState": "manual", "localizations": {"en": unit("Restore")}},
+        # Only the pt shard knows this translation; English alone would give "Link"
+        "链接": {"extractionState": "manual", "localizations": {"en": unit("Link"), "pt": unit("Vincular")}},
+    }
+
+    def test_shard_sync_matches_full_sync(self):
+        scan_options = {"use_cache": False}
+        with mock.patch("builtins.print"):
+            mt.split_catalog("shards")
+            mt.manage_shard("pt-BR", "shards", scan_options)
+        shard_strings = mt.merge_shards("shards")[0]["strings"]
+        full_strings = self.sync()
+        self.assertEqual(set(shard_strings), set(full_strings))
+        shard_cells = {key: entry["localizations"].get("pt-BR") for key, entry in shard_strings.items()}
+        full_cells = {key: entry["localizations"].get("pt-BR") for key, entry in full_strings.items()}
+        self.assertEqual(shard_cells, full_cells)
+        self.assertEqual(full_cells["链接"]["stringUnit"]["value"], "Vincular")
+        self.assertEqual(full_cells["还原"]["stringUnit"]["value"], "Restaurar")
+        self.assertEqual(full_cells["迁移"]["stringUnit"]["value"], "Migrate")
+
+
+if __name__ == "__main__":
+    unittest.main()
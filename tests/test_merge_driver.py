@@ -0,0 +1,69 @@
+import contextlib
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import manage_translations as mt
+from workspace import WorkspaceTestCase, unit
+
+
+def catalog(strings):
+    return {"sourceLanguage": "zh-Hans", "strings": strings, "version": "1.0"}
+
+
+BASE = {
+    "迁移": {"extractionState": "manual", "localizations": {"en": unit("Migrate"), "fr": unit("Migrer")}},
+    "还原": {"extractionState": "manual", "localizations": {"ja": unit("復元")}},
+    "删除": {"extractionState": "manual", "localizations": {"en": unit("Delete")}},
+}
+
+
+class MergeDriverTests(WorkspaceTestCase):
+    def merge(self, ours, theirs, base=BASE):
+        for name, strings in (("base", base), ("ours", ours), ("theirs", theirs)):
+            with open(name, "w", encoding="utf-8") as f:
+                f.write(mt.xcode_dumps(catalog(strings)))
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out), self.assertRaises(SystemExit) as raised:
+            mt.main(["merge-driver", "base", "ours", "theirs", mt.XCSTRINGS_PATH])
+        with open("ours", encoding="utf-8") as f:
+            return raised.exception.code, f.read(), out.getvalue()
+
+    def test_changes_to_different_cells_merge_cleanly(self):
+        ours = dict(BASE, 迁移={"extractionState": "manual", "localizations": {
+            "en": unit("Migrate app"), "fr": unit("Migrer")}})
+        del ours["删除"]
+        theirs = dict(BASE, 迁移={"extractionState": "manual", "localizations": {
+            "en": unit("Migrate"), "fr": unit("Migrer l'app")}}, 链接={"extractionState": "manual", "localizations": {}})
+        code, text, out = self.merge(ours, theirs)
+        self.assertEqual(code, 0)
+        self.assertEqual(out, "")
+        expected = dict(ours, 迁移={"extractionState": "manual", "localizations": {
+            "en": unit("Migrate app"), "fr": unit("Migrer l'app")}}, 链接=theirs["链接"])
+        self.assertEqual(text, mt.xcode_dumps(catalog(expected), list(ours)))
+
+    def test_conflicting_cell_keeps_our_value_and_is_reported(self):
+        ours = dict(BASE, 还原={"extractionState": "manual", "localizations": {"ja": unit("元に戻す")}})
+        theirs = dict(BASE, 还原={"extractionState": "manual", "localizations": {"ja": unit("リストア")}})
+        code, text, out = self.merge(ours, theirs)
+        self.assertEqual(code, 1)
+        self.assertEqual(text, mt.xcode_dumps(catalog(ours)))
+        self.assertEqual(out.splitlines(), [
+            f'{mt.XCSTRINGS_PATH}: conflict "还原" [ja]: ours "元に戻す", theirs "リストア"',
+            f"{mt.XCSTRINGS_PATH}: 1 conflicting cells kept our value; fix them and `git add` the file.",
+        ])
+
+    def test_deleted_key_changed_on_the_other_side_is_a_conflict(self):
+        ours = {key: entry for key, entry in BASE.items() if key != "删除"}
+        theirs = dict(BASE, 删除={"extractionState": "manual", "localizations": {"en": unit("Remove")}})
+        code, text, out = self.merge(ours, theirs)
+        self.assertEqual(code, 1)
+        self.assertIn('"删除" [deleted in ours]: ours (deleted), theirs (changed)', out)
+        self.assertIn('"Remove"', text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import manage_translations as mt
+from workspace import WorkspaceTestCase, unit
+
+
+class SplitMergeTests(WorkspaceTestCase):
+    sources = 'Text("迁移")\n'
+    files = {
+        "AppPorts/Settings/SettingsView.swift": 'Text("设置")\nText("语言 %@")\n',
+        "AppPorts/Migration/MigrationView.swift": 'Text("迁移")\nText("还原")\n',
+    }
+    strings = {
+        "迁移": {"extractionState": "manual", "localizations": {"en": unit("Migrate"), "ja": unit("移行")}},
+        "还原": {"comment": "undo a migration", "extractionState": "manual", "localizations": {
+            "en": unit("Restore"), "fr": {"stringUnit": {"state": "needs_review", "value": "Restaurer"}}}},
+        "设置": {"extractionState": "manual", "localizations": {}},
+        "语言 %@": {"localizations": {"en": {"variations": {"plural": {
+            "one": unit("%@ language"), "other": unit("%@ languages")}}}}},
+        "旧按钮": {"extractionState": "stale", "localizations": {"en": unit("Old button")}},
+        "无本地化": {"extractionState": "manual"},
+    }
+
+    def assertRoundTrip(self, layout):
+        with open(mt.XCSTRINGS_PATH, "rb") as f:
+            original = f.read()
+        shards = mt.split_catalog("shards", layout, {"use_cache": False})
+        with open(mt.XCSTRINGS_PATH, "wb") as f:
+            f.write(mt.xcode_dumps({"sourceLanguage": "en", "strings": {}, "version": "1.0"}).encode("utf-8"))
+        self.assertTrue(mt.merge_catalog("shards"))
+        with open(mt.XCSTRINGS_PATH, "rb") as f:
+            self.assertEqual(f.read(), original)
+        self.assertFalse(mt.merge_catalog("shards"))
+        return shards
+
+    def test_language_layout_round_trip(self):
+        self.assertEqual(self.assertRoundTrip("language"), ["en", "fr", "ja"])
+        with open(os.path.join("shards", "fr.json"), encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["还原"]["stringUnit"]["state"], "needs_review")
+
+    def test_module_layout_round_trip(self):
+        # A key belongs to the first module in path order that uses it
+        self.assertEqual(self.assertRoundTrip("module"), ["Migration", "Settings", mt.SHARD_UNUSED])
+        base = mt.load_shard_base("shards")
+        self.assertEqual(base["keys"]["迁移"], "Migration")
+        self.assertEqual(base["keys"]["语言 %@"], "Settings")
+        self.assertEqual(base["keys"]["旧按钮"], mt.SHARD_UNUSED)
+
+    def test_resplit_removes_shards_of_the_old_layout_only(self):
+        mt.split_catalog("shards", "language")
+        with open(os.path.join("shards", "notes.txt"), "w") as f:
+            f.write("kept")
+        mt.split_catalog("shards", "module", {"use_cache": False})
+        self.assertEqual(sorted(os.listdir("shards")),
+                         ["Migration.json", "Settings.json", mt.SHARD_UNUSED + ".json", "catalog.json", "notes.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
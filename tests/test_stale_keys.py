@@ -0,0 +1,76 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import manage_translations as mt
+from workspace import WorkspaceTestCase, unit
+
+
+class StaleKeyTests(WorkspaceTestCase):
+    sources = 'Text("迁移")\n'
+    dictionary = "key\ten\n迁移\tMigrate\n删除\tDelete\n"
+    strings = {
+        "迁移": {"extractionState": "manual", "localizations": {"en": unit("Migrate")}},
+        "删除": {"extractionState": "manual", "localizations": {"en": unit("Delete")}},
+        "旧按钮": {"extractionState": "extracted_with_value", "localizations": {"en": unit("Old button")}},
+    }
+
+    def sync_on(self, day, **options):
+        with mock.patch.object(mt, "today", return_value=day), mock.patch("builtins.print"):
+            mt.manage({"use_cache": False}, use_cache=False, **options)
+        return mt.load_catalog()[0]["strings"]
+
+    def states(self, strings):
+        return {key: entry.get("extractionState") for key, entry in strings.items()}
+
+    def use(self, *keys):
+        with open(os.path.join(mt.SWIFT_SCAN_DIR, "View.swift"), "w", encoding="utf-8") as f:
+            f.write("".join(f'Text("{key}")\n' for key in keys))
+
+    def test_plain_sync_leaves_unused_keys_alone(self):
+        strings = self.sync_on("2026-01-01")
+        self.assertEqual(self.states(strings), {"迁移": "manual", "删除": "manual", "旧按钮": "extracted_with_value"})
+        self.assertEqual(mt.load_stale_records(), {})
+
+    def test_mark_stale_records_and_restores_keys(self):
+        strings = self.sync_on("2026-01-01", mark=True)
+        self.assertEqual(self.states(strings), {"迁移": "manual", "删除": mt.STALE, "旧按钮": mt.STALE})
+        self.assertEqual(mt.load_stale_records(), {
+            "删除": {"since": "2026-01-01", "extractionState": "manual"},
+            "旧按钮": {"since": "2026-01-01", "extractionState": "extracted_with_value"},
+        })
+        # A second run keeps the first day; a key used again gets its old state back
+        self.use("迁移", "旧按钮")
+        strings = self.sync_on("2026-01-05", mark=True)
+        self.assertEqual(self.states(strings), {"迁移": "manual", "删除": mt.STALE, "旧按钮": "extracted_with_value"})
+        self.assertEqual(mt.load_stale_records(), {"删除": {"since": "2026-01-01", "extractionState": "manual"}})
+
+    def test_prune_stale_after_the_grace_period(self):
+        self.sync_on("2026-01-01", mark=True)
+        strings = self.sync_on("2026-01-10", grace_days=10)
+        self.assertEqual(set(strings), {"迁移", "删除", "旧按钮"})
+        strings = self.sync_on("2026-01-11", grace_days=10)
+        self.assertEqual(set(strings), {"迁移"})
+        # The DICT row of a pruned key does not bring it back
+        self.assertTrue(mt.load_stale_records()["删除"]["pruned"])
+        self.assertEqual(set(self.sync_on("2026-02-01", mark=True)), {"迁移"})
+        self.assertEqual(set(self.sync_on("2026-02-01")), {"迁移"})
+        with mock.patch("builtins.print"):
+            mt.manage_streaming({"use_cache": False})
+        self.assertEqual(set(mt.load_catalog()[0]["strings"]), {"迁移"})
+
+    def test_pruned_key_used_again_is_added_back(self):
+        self.sync_on("2026-01-01", mark=True)
+        self.sync_on("2026-02-01", grace_days=10)
+        self.use("迁移", "删除")
+        strings = self.sync_on("2026-02-02", mark=True)
+        self.assertEqual(strings["删除"]["localizations"]["en"], unit("Delete"))
+        self.assertNotEqual(strings["删除"].get("extractionState"), mt.STALE)
+        self.assertNotIn("删除", mt.load_stale_records())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import contextlib
+import io
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import manage_translations as mt
+from workspace import WorkspaceTestCase
+
+
+class LiteralTests(unittest.TestCase):
+    SOURCE = (
+        '// Text("注释")\n'
+        '/* Text("块注释") */\n'
+        'Text("设置")\n'
+        'Text(#"原始 "引号" \\n"#)\n'
+        'let m = """\n    多行\n    第二行\n    """\n'
+        'Text("转义\\"引号\\"\\t制表")\n'
+        'print("日志")\n'
+        'let u = "\\u{4E2D}文"\n'
+    )
+
+    def test_literal_forms(self):
+        self.assertEqual(list(mt.tokenize_swift_strings(self.SOURCE)), [
+            ("设置", 3, "text", False),
+            ('原始 "引号" \\n', 4, "text", False),
+            ("多行\n第二行", 5, "other", False),
+            ('转义"引号"\t制表', 9, "text", False),
+            ("日志", 10, "log", False),
+            ("中文", 11, "other", False),
+        ])
+
+    def test_comments_and_log_calls_are_no_keys(self):
+        self.assertEqual(mt.extract_swift_strings(self.SOURCE),
+                         ["中文", '原始 "引号" \\n', "多行\n第二行", "设置", '转义"引号"\t制表'])
+
+
+class NestedInterpolationTests(unittest.TestCase):
+    def test_literal_inside_interpolation_is_a_key(self):
+        text = 'let s = "\\(base) + \\(n) \\("个目录".localized)"\n'
+        keys, refs = mt.extract_swift_literals(text)
+        self.assertEqual(keys, ["个目录"])
+        self.assertIn("个目录", refs)
+        self.assertIn("\x00 + \x00 \x00", refs)
+
+    def test_nested_literal_kind_and_line(self):
+        text = 'let a = 1\nText("前\\(f("内层"))后")\n'
+        tokens = list(mt.tokenize_swift_strings(text))
+        self.assertEqual(tokens[0][1:], (2, "text", True))
+        self.assertEqual(tokens[1], ("内层", 2, "other", False))
+
+    def test_nested_literal_in_log_call_stays_a_log(self):
+        text = 'print("x \\(label("日志"))")\n'
+        self.assertEqual(mt.extract_swift_strings(text), [])
+        self.assertEqual([t[2] for t in mt.tokenize_swift_strings(text)], ["log", "log"])
+
+    def test_deeper_nesting(self):
+        text = 'Text("\\(a ? "\\("外".localized) \\(b)" : "内")")\n'
+        values = [t[0] for t in mt.tokenize_swift_strings(text, only_han=True)]
+        self.assertEqual(values[1:], ['\\("外".localized) \\(b)', "外", "内"])
+        self.assertEqual(mt.extract_swift_strings(text), ["内", "外"])
+
+
+class SourceIndexTests(unittest.TestCase):
+    def test_index_takes_the_rows_of_the_scan(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            swift_path = os.path.join(tmp, "View.swift")
+            with open(swift_path, "w", encoding="utf-8") as f:
+                f.write('Text("你好")\nprint("日志 \\(n)")\n')
+            record = mt.scan_swift_file(swift_path, os.stat(swift_path), None)
+            self.assertEqual(record["strings"], ["你好"])
+            # Indexing must not read the file again
+            os.remove(swift_path)
+            index_path = os.path.join(tmp, "index.sqlite")
+            self.assertEqual(mt.update_source_index({swift_path: record}, index_path), 1)
+            conn = mt.open_source_index(index_path)
+            try:
+                self.assertEqual(mt.find_file_keys(conn, swift_path), [(1, "text", "你好")])
+                self.assertEqual(mt.find_file_keys(conn, swift_path, all_literals=True),
+                                 [(1, "text", "你好"), (2, "log", "日志 \x00")])
+                self.assertEqual(mt.update_source_index({swift_path: record}, index_path), 0)
+            finally:
+                conn.close()
+
+
+class QueryTests(WorkspaceTestCase):
+    sources = 'Text("迁移")\n'
+
+    def where(self, *argv):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out), self.assertRaises(SystemExit):
+            mt.main(["where", *argv])
+        return out.getvalue()
+
+    def test_no_cache_answers_from_the_sources_not_the_index(self):
+        view = os.path.join(mt.SWIFT_SCAN_DIR, "View.swift")
+        self.assertEqual(self.where("迁移"), f"{view}:1: text\n")
+        with open(view, "w", encoding="utf-8") as f:
+            f.write('let a = 1\nText("迁移")\n')
+        self.assertEqual(self.where("迁移", "--no-cache"), f"{view}:2: text\n")
+        # The index file is left as it was
+        conn = mt.open_source_index()
+        try:
+            self.assertEqual(mt.find_key_uses(conn, "迁移"), [(view, 1, "text")])
+        finally:
+            conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
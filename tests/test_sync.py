@@ -0,0 +1,115 @@
+import contextlib
+import io
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import manage_translations as mt
+from workspace import WorkspaceTestCase, unit
+
+
+class StreamingSyncTests(WorkspaceTestCase):
+    sources = 'Text("迁移")\nText("还原")\nText("链接 %@")\nText("添加")\nText("Settings")\n'
+    dictionary = "key\ten\tja\n迁移\tMigrate\t移行\n还原\tRestore\t\n删除\tDelete\t削除\n"
+    strings = {
+        "还原": {"extractionState": "manual", "localizations": {"en": unit("Restore"), "ja": unit("復元")}},
+        "链接 %@": {"comment": "link target", "extractionState": "manual", "localizations": {"en": unit("Link %@")}},
+        "旧按钮": {"extractionState": "manual", "localizations": {"en": unit("Old button"), "fr": unit("Ancien bouton")}},
+        "Settings": {"localizations": {"en": {"variations": {"plural": {
+            "one": unit("Setting"), "other": unit("Settings")}}}}},
+    }
+
+    def synced_bytes(self, run):
+        with open(mt.XCSTRINGS_PATH, "rb") as f:
+            original = f.read()
+        try:
+            with mock.patch("builtins.print"):
+                run()
+            with open(mt.XCSTRINGS_PATH, "rb") as f:
+                return f.read()
+        finally:
+            with open(mt.XCSTRINGS_PATH, "wb") as f:
+                f.write(original)
+            if os.path.exists(mt.STALE_KEYS_PATH):
+                os.remove(mt.STALE_KEYS_PATH)
+
+    def assertSameOutput(self, **options):
+        scan_options = {"use_cache": False}
+        full = self.synced_bytes(lambda: mt.manage(scan_options, use_cache=False, **options))
+        streamed = self.synced_bytes(lambda: mt.manage_streaming(scan_options, **options))
+        self.assertEqual(streamed, full)
+        return full
+
+    def test_streamed_sync_writes_the_same_bytes(self):
+        # New keys land between existing ones, and the written file is not a no-op
+        written = self.assertSameOutput()
+        self.assertIn("添加".encode("utf-8"), written)
+        self.assertIn("删除".encode("utf-8"), written)
+
+    def test_streamed_sync_marks_the_same_keys_stale(self):
+        written = self.assertSameOutput(mark=True)
+        self.assertIn(b'"extractionState" : "stale"', written)
+
+
+class FingerprintSkipTests(WorkspaceTestCase):
+    sources = 'Text("迁移")\nText("还原")\n'
+    dictionary = "key\ten\n迁移\tMigrate\n还原\tRestore\n"
+
+    def cached_sync(self):
+        with mock.patch("builtins.print"):
+            stats = mt.manage({"use_cache": False})
+        return stats.counters["keys_skipped"], mt.load_catalog()[0]["strings"]
+
+    def test_only_changed_keys_are_resolved_again(self):
+        self.assertEqual(self.cached_sync()[0], 0)
+        self.assertEqual(self.cached_sync()[0], 2)
+        with open(mt.DICT_PATH, "w", encoding="utf-8") as f:
+            f.write("key\ten\n迁移\tMigrate app\n还原\tRestore\n")
+        mt.DICT = mt.DictionaryTable(mt.DICT_PATH, mt.DICT_INDEX_PATH)
+        skipped, strings = self.cached_sync()
+        self.assertEqual(skipped, 1)
+        self.assertEqual(strings["迁移"]["localizations"]["en"], unit("Migrate app"))
+
+    def test_edited_cell_is_resolved_again(self):
+        self.cached_sync()
+        data, _ = mt.load_catalog()
+        data["strings"]["还原"]["localizations"]["en"] = unit("Undo")
+        with open(mt.XCSTRINGS_PATH, "w", encoding="utf-8") as f:
+            f.write(mt.xcode_dumps(data))
+        skipped, strings = self.cached_sync()
+        self.assertEqual(skipped, 1)
+        self.assertEqual(strings["还原"]["localizations"]["en"], unit("Restore"))
+
+
+class CheckTests(WorkspaceTestCase):
+    sources = 'Text("迁移")\n'
+    dictionary = "key\ten\n迁移\tMigrate\n"
+    strings = {"迁移": {"extractionState": "manual", "localizations": {"en": unit("Move")}}}
+
+    def check(self):
+        with open(mt.XCSTRINGS_PATH, "rb") as f:
+            before = f.read()
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out), self.assertRaises(SystemExit) as raised:
+            mt.main(["check", "--no-cache"])
+        with open(mt.XCSTRINGS_PATH, "rb") as f:
+            self.assertEqual(f.read(), before)
+        return raised.exception.code, out.getvalue()
+
+    def test_drift_exits_non_zero(self):
+        code, out = self.check()
+        self.assertEqual(code, 1)
+        self.assertIn('~ "迁移" [en]: "Move" -> "Migrate"', out)
+
+    def test_synced_catalog_passes(self):
+        self.sync()
+        cache = sorted(os.listdir(mt.CACHE_DIR)) if os.path.isdir(mt.CACHE_DIR) else []
+        self.assertEqual(self.check()[0], 0)
+        self.assertEqual(sorted(os.listdir(mt.CACHE_DIR)) if os.path.isdir(mt.CACHE_DIR) else [], cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
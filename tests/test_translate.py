@@ -0,0 +1,147 @@
+import http.server
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import manage_translations as mt
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    # Each request pops the next scripted reply: an HTTP status, or a function of the request
+    # returning the translations; an empty script translates every text as "<target>:<text>"
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server = self.server
+        server.requests.append(request)
+        reply = server.script.pop(0) if server.script else None
+        if isinstance(reply, int):
+            self.send_response(reply)
+            if reply == 429:
+                self.send_header("Retry-After", "0")
+            self.end_headers()
+            return
+        translate = reply or (lambda request: [f"{request['target']}:{text}" for text in request["texts"]])
+        body = json.dumps({"translations": translate(request)}, ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubBackendTestCase(unittest.TestCase):
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.script = []
+        self.server.requests = []
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+        self.backend = mt.HttpTranslationBackend(f"http://127.0.0.1:{self.server.server_port}/translate", timeout=5)
+        self.cache = mt.TranslationCache(":memory:")
+
+    def tearDown(self):
+        self.backend.close()
+        self.cache.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def translate(self, pending, **options):
+        options = {"rate": 0, "backoff": 0.01, **options}
+        stats = mt.RunStats()
+        return mt.translate_pending(pending, self.backend, self.cache, stats=stats, **options) + (stats.counters,)
+
+
+class RetryTests(StubBackendTestCase):
+    def test_429_and_5xx_are_retried(self):
+        # 429 waits for its Retry-After, 503 backs off
+        self.server.script = [429, 503]
+        rows, rejected, failures, counters = self.translate({"迁移": ["en"]})
+        self.assertEqual(rows, {"迁移": {"en": "en:迁移"}})
+        self.assertEqual((rejected, failures), ([], []))
+        self.assertEqual(counters["mt_requests"], 3)
+        self.assertEqual(counters["mt_retries"], 2)
+
+    def test_batch_fails_once_retries_run_out(self):
+        self.server.script = [500, 502, 504]
+        rows, _, failures, counters = self.translate({"迁移": ["en"], "还原": ["en"]}, retries=2)
+        self.assertEqual(rows, {})
+        self.assertEqual(failures, [("en", 2, "HTTP 504 from " + self.backend.endpoint)])
+        self.assertEqual(counters["mt_requests"], 3)
+
+    def test_client_errors_are_not_retried(self):
+        self.server.script = [400]
+        _, _, failures, counters = self.translate({"迁移": ["en"]})
+        self.assertEqual(len(failures), 1)
+        self.assertEqual(counters["mt_requests"], 1)
+        self.assertNotIn("mt_retries", counters)
+
+
+class CacheTests(StubBackendTestCase):
+    def test_interrupted_run_resumes_from_the_cache(self):
+        pending = {"迁移": ["en", "fr"], "还原": ["en", "fr"]}
+        # The backend goes away after the first batch: what it answered is already committed
+        self.server.script = [None, 400, 400, 400]
+        rows, _, failures, _ = self.translate(pending, batch_size=1, concurrency=1)
+        self.assertEqual(rows, {"迁移": {"en": "en:迁移"}})
+        self.assertEqual(len(failures), 3)
+        del self.server.requests[:]
+        rows, _, failures, counters = self.translate(pending, batch_size=1, concurrency=1)
+        self.assertEqual(failures, [])
+        self.assertEqual(rows, {key: {lang: f"{lang}:{key}" for lang in langs} for key, langs in pending.items()})
+        self.assertEqual(counters["mt_cache_hits"], 1)
+        self.assertEqual(sorted((r["target"], r["texts"]) for r in self.server.requests),
+                         [("en", ["还原"]), ("fr", ["迁移"]), ("fr", ["还原"])])
+
+    def test_cached_texts_are_not_sent(self):
+        self.translate({"迁移": ["en"]})
+        rows, _, _, counters = self.translate({"迁移": ["en"]})
+        self.assertEqual(rows, {"迁移": {"en": "en:迁移"}})
+        self.assertEqual(counters["mt_cache_hits"], 1)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_eviction_drops_least_recently_used_rows(self):
+        cache = self.cache
+        cache.put_many("b", "en", [("旧", "old"), ("新", "new")])
+        time.sleep(0.01)
+        self.assertEqual(cache.get_many("b", "en", ["旧"]), {"旧": "old"})
+        # Each row holds 3 + 3 bytes of UTF-8: room for one
+        self.assertEqual(cache.evict(max_bytes=7), 1)
+        self.assertEqual(cache.get_many("b", "en", ["旧", "新"]), {"旧": "old"})
+        self.assertEqual(cache.evict(max_bytes=7), 0)
+
+
+class PlaceholderTests(StubBackendTestCase):
+    def test_mask_unmask_round_trip(self):
+        key = "已迁移 %lld 个应用到 %@（100%%）"
+        text, specs = mt.mt_mask(key)
+        self.assertEqual(text, "已迁移 {0} 个应用到 {1}（100%%）")
+        self.assertEqual(specs, ["%lld", "%@"])
+        self.assertEqual(mt.mt_unmask(text, specs), key)
+        # Reordered by the translation: positions keep each argument in place
+        self.assertEqual(mt.mt_unmask("{1} : {0}", specs), "%2$@ : %1$lld")
+        self.assertEqual(mt.mt_unmask("{0} {0}", specs), None)
+        self.assertEqual(mt.mt_mask("{name} 的数据"), ("{name} 的数据", None))
+
+    def test_specifiers_travel_masked(self):
+        rows, rejected, _, _ = self.translate({"%@ 的数据目录": ["en"]})
+        self.assertEqual(self.server.requests[0]["texts"], ["{0} 的数据目录"])
+        self.assertEqual(rows, {"%@ 的数据目录": {"en": "en:%@ 的数据目录"}})
+        self.assertEqual(rejected, [])
+
+    def test_translation_that_drops_a_placeholder_is_rejected(self):
+        self.server.script = [lambda request: [text.replace(" {1}", "") for text in request["texts"]]]
+        rows, rejected, failures, counters = self.translate({"%lld 个应用到 %@": ["fr"], "迁移": ["fr"]})
+        self.assertEqual(rows, {"迁移": {"fr": "迁移"}})
+        self.assertEqual(rejected, [("%lld 个应用到 %@", "fr")])
+        self.assertEqual((failures, counters["mt_rejected"]), ([], 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
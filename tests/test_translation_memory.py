@@ -0,0 +1,39 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import manage_translations as mt
+
+
+def unit(value):
+    return {"stringUnit": {"state": "translated", "value": value}}
+
+
+class SuggestionTests(unittest.TestCase):
+    def setUp(self):
+        self.catalog = mt.Catalog.from_json({"sourceLanguage": "zh-Hans", "version": "1.0", "strings": {
+            "%@ 的数据目录": {"localizations": {"en": unit("Data directories of %@"), "fr": unit("Répertoires de données pour %@")}},
+            "应用的数据目录": {"localizations": {"en": unit("App data directories"), "fr": unit("Répertoires de données de l'app")}},
+            ")) 的数据目录": {"localizations": {}},
+            "%lld 的数据目录": {"localizations": {}},
+        }})
+        self.tm = mt.build_translation_memory(self.catalog)
+
+    def suggested_sources(self, key):
+        suggestions = mt.suggest_translations(self.tm, self.catalog, key, min_score=0.5, langs=["en", "fr"])
+        return {source for found in suggestions.values() for _, _, source in found}
+
+    def test_key_without_specifiers_gets_no_specifier_suggestions(self):
+        self.assertEqual(self.suggested_sources(")) 的数据目录"), {"应用的数据目录"})
+
+    def test_specifier_types_must_match(self):
+        self.assertNotIn("%@ 的数据目录", self.suggested_sources("%lld 的数据目录"))
+
+    def test_matching_specifiers_are_suggested(self):
+        self.assertIn("%@ 的数据目录", self.suggested_sources("%@ 的缓存目录"))
+
+
+if __name__ == "__main__":
+    unittest.main()
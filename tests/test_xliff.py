@@ -0,0 +1,95 @@
+import contextlib
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import manage_translations as mt
+from workspace import WorkspaceTestCase, unit
+
+TARGETS = {
+    "1.2": '<target state="translated">{}</target>',
+    "2.0": '<target xml:space="preserve">{}</target>',
+}
+
+
+class ImportConflictTests(WorkspaceTestCase):
+    dictionary = "key\ten\tfr\n删除\tDelete\tSupprimer\n"
+    strings = {
+        "迁移": {"extractionState": "manual", "localizations": {"en": unit("Migrate"), "fr": unit("Migrer")}},
+        "还原": {"extractionState": "manual", "localizations": {"en": unit("Restore"), "fr": unit("Restaurer")}},
+        "删除": {"extractionState": "manual", "localizations": {"en": unit("Delete"), "fr": unit("Supprimer")}},
+        "链接": {"extractionState": "manual", "localizations": {"en": unit("Link"), "fr": unit("Lien")}},
+        "缓存": {"extractionState": "manual", "localizations": {"en": {"variations": {"plural": {
+            "one": unit("Cache"), "other": unit("Caches")}}}, "fr": unit("Cache")}},
+    }
+
+    def translated_export(self, version):
+        # Exports fr, then a translator edits every target
+        mt.export_xliff("fr", "fr.xliff", version)
+        with open("fr.xliff", encoding="utf-8") as f:
+            text = f.read()
+        for old, new in [("Migrer", "Migrer l'app"), ("Restaurer", "Rétablir"), ("Supprimer", "Effacer"),
+                         ("Lien", "Lien web"), ("Cache", "Mémoire cache")]:
+            text = text.replace(TARGETS[version].format(old), TARGETS[version].format(new))
+        with open("fr.xliff", "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def edit_catalog(self):
+        # Changes made to the catalog after the export
+        data, _ = mt.load_catalog()
+        data["strings"]["还原"]["localizations"]["fr"] = unit("Annuler")
+        del data["strings"]["链接"]
+        data["strings"]["缓存"]["localizations"]["fr"] = {"variations": {"plural": {
+            "one": unit("Cache"), "other": unit("Caches")}}}
+        with open(mt.XCSTRINGS_PATH, "w", encoding="utf-8") as f:
+            f.write(mt.xcode_dumps(data))
+
+    def assertConflicts(self, version):
+        self.translated_export(version)
+        self.edit_catalog()
+        changes, conflicts = mt.import_xliff(["fr.xliff"])
+        self.assertEqual(changes, [("迁移", "fr", "Migrer", "Migrer l'app")])
+        reasons = {key: reason for key, _, reason in conflicts}
+        self.assertEqual(set(reasons), {"还原", "删除", "链接", "缓存"})
+        self.assertEqual(reasons["还原"], 'changed in the catalog since the export: "Annuler" here, "Rétablir" in the XLIFF')
+        self.assertEqual(reasons["删除"], 'sync would replace it with "Supprimer" (DICT row)')
+        self.assertEqual(reasons["链接"], "not in the catalog")
+        self.assertEqual(reasons["缓存"], "the catalog cell has variations")
+        strings = mt.load_catalog()[0]["strings"]
+        self.assertEqual(strings["迁移"]["localizations"]["fr"], unit("Migrer l'app"))
+        self.assertEqual(strings["还原"]["localizations"]["fr"], unit("Annuler"))
+
+    def test_xliff_1_2_conflicts(self):
+        self.assertConflicts("1.2")
+
+    def test_xliff_2_0_conflicts(self):
+        self.assertConflicts("2.0")
+
+    def test_force_overwrites_cells_changed_since_the_export(self):
+        self.translated_export("1.2")
+        self.edit_catalog()
+        changes, conflicts = mt.import_xliff(["fr.xliff"], force=True)
+        self.assertIn(("还原", "fr", "Annuler", "Rétablir"), changes)
+        self.assertNotIn("还原", [key for key, _, _ in conflicts])
+        # DICT rows still win over a forced import
+        self.assertIn("删除", [key for key, _, _ in conflicts])
+
+    def test_conflicts_exit_non_zero_without_writing(self):
+        self.translated_export("2.0")
+        self.edit_catalog()
+        with open(mt.XCSTRINGS_PATH, "rb") as f:
+            before = f.read()
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out), self.assertRaises(SystemExit) as raised:
+            mt.main(["import", "--dry-run", "fr.xliff"])
+        self.assertEqual(raised.exception.code, 1)
+        self.assertIn('conflict fr "链接": not in the catalog', out.getvalue())
+        with open(mt.XCSTRINGS_PATH, "rb") as f:
+            self.assertEqual(f.read(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
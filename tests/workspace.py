@@ -0,0 +1,53 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import manage_translations as mt
+
+
+def unit(value):
+    return {"stringUnit": {"state": "translated", "value": value}}
+
+
+class WorkspaceTestCase(unittest.TestCase):
+    # A throwaway checkout: Swift sources, DICT and catalog under a temporary working directory
+    langs = mt.LANGS
+    fallbacks = {}
+    sources = ""
+    dictionary = "key\ten\n"
+    strings = {}
+    files = {}  # other files, by path relative to the checkout
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        self.addCleanup(self.tmp.cleanup)
+        self.addCleanup(os.chdir, self.cwd)
+        for target, value in [("LANGS", list(self.langs)),
+                              ("LANG_FALLBACKS", dict(mt.LANG_FALLBACKS, **self.fallbacks)),
+                              ("DICT", mt.DictionaryTable(mt.DICT_PATH, mt.DICT_INDEX_PATH))]:
+            patcher = mock.patch.object(mt, target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        os.makedirs(mt.SWIFT_SCAN_DIR)
+        with open(os.path.join(mt.SWIFT_SCAN_DIR, "View.swift"), "w", encoding="utf-8") as f:
+            f.write(self.sources)
+        os.makedirs(os.path.dirname(mt.DICT_PATH))
+        with open(mt.DICT_PATH, "w", encoding="utf-8") as f:
+            f.write(self.dictionary)
+        with open(mt.XCSTRINGS_PATH, "w", encoding="utf-8") as f:
+            f.write(mt.xcode_dumps({"sourceLanguage": "zh-Hans", "strings": self.strings, "version": "1.0"}))
+        for path, text in self.files.items():
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+
+    def sync(self):
+        with mock.patch("builtins.print"):
+            mt.manage({"use_cache": False}, use_cache=False)
+        return mt.load_catalog()[0]["strings"]